@@ -1,6 +1,7 @@
 # used for /metrics endpoint on LiteLLM Proxy
 #### What this does ####
 #    On success, log events to Prometheus
+import os
 import sys
 from datetime import datetime, timedelta
 from typing import (
@@ -18,6 +19,8 @@ from typing import (
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import MAX_PROMETHEUS_BOUND_METRICS
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.proxy._types import LiteLLM_TeamTable, UserAPIKeyAuth
 from litellm.types.integrations.prometheus import *
@@ -32,6 +35,21 @@ else:
 
 class PrometheusLogger(CustomLogger):
     # Class variables or attributes
+    standard_logging_payload_fields = {
+        "api_base",
+        "completion_tokens",
+        "custom_llm_provider",
+        "hidden_params",
+        "metadata",
+        "model_group",
+        "model_id",
+        "prompt_tokens",
+        "request_tags",
+        "response_cost",
+        "stream",
+        "total_tokens",
+    }
+
     def __init__(
         self,
         **kwargs,
@@ -43,6 +61,12 @@ class PrometheusLogger(CustomLogger):
 
             # Always initialize label_filters, even for non-premium users
             self.label_filters = self._parse_prometheus_config()
+            self._bound_metrics: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+                max_size=MAX_PROMETHEUS_BOUND_METRICS
+            )
+            self._last_request_label_values: Tuple[
+                Optional[UserAPIKeyLabelValues], dict
+            ] = (None, {})
 
             if premium_user is not True:
                 verbose_logger.warning(
@@ -769,6 +793,47 @@ class PrometheusLogger(CustomLogger):
 
         return filtered_labels
 
+    def _get_bound_metric(
+        self,
+        metric: Any,
+        metric_name: DEFINED_PROMETHEUS_METRICS,
+        enum_values: UserAPIKeyLabelValues,
+    ) -> Any:
+        """
+        Returns `metric.labels(...)` for a request's label values.
+
+        Bound children are cached per label values, so repeat label combinations skip `labels()` (label validation + the metric's lock).
+        """
+        request_label_values = self._get_request_label_values(enum_values)
+        _labels = {
+            label: request_label_values.get(label)
+            for label in self.get_labels_for_metric(metric_name=metric_name)
+        }
+        key = (id(metric), tuple(_labels.values()))
+        # the entry holds `metric` too, so its id isn't reused while the entry exists
+        _, bound_metric = self._bound_metrics.get(key, (None, None))
+        if bound_metric is None:
+            bound_metric = metric.labels(**_labels)
+            self._bound_metrics[key] = (metric, bound_metric)
+        return bound_metric
+
+    def _get_request_label_values(self, enum_values: UserAPIKeyLabelValues) -> dict:
+        """
+        All label values of a request - built once per request, instead of once per metric.
+        """
+        last_enum_values, last_label_values = self._last_request_label_values
+        if last_enum_values is enum_values:
+            return last_label_values
+        supported_enum_labels = list(UserAPIKeyLabelValues.model_fields.keys())
+        supported_enum_labels.extend(enum_values.custom_metadata_labels.keys())
+        supported_enum_labels.extend(get_custom_labels_from_tags(enum_values.tags))
+        label_values = prometheus_label_factory(
+            supported_enum_labels=supported_enum_labels,
+            enum_values=enum_values,
+        )
+        self._last_request_label_values = (enum_values, label_values)
+        return label_values
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         # Define prometheus client
         from litellm.types.utils import StandardLoggingPayload
@@ -925,13 +990,11 @@ class PrometheusLogger(CustomLogger):
         if (
             standard_logging_payload["stream"] is True
         ):  # log successful streaming requests from logging event hook.
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_proxy_total_requests_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_proxy_total_requests_metric,
+                metric_name="litellm_proxy_total_requests_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_proxy_total_requests_metric.labels(**_labels).inc()
+            ).inc()
 
     def _increment_token_metrics(
         self,
@@ -953,41 +1016,27 @@ class PrometheusLogger(CustomLogger):
         ):
             _tags = standard_logging_payload["request_tags"]
 
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_proxy_total_requests_metric"
-            ),
-            enum_values=enum_values,
-        )
-
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_total_tokens_metric"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_tokens_metric,
+            metric_name="litellm_total_tokens_metric",
             enum_values=enum_values,
-        )
-        self.litellm_tokens_metric.labels(**_labels).inc(
+        ).inc(
             standard_logging_payload["total_tokens"]
         )
 
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_input_tokens_metric"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_input_tokens_metric,
+            metric_name="litellm_input_tokens_metric",
             enum_values=enum_values,
-        )
-        self.litellm_input_tokens_metric.labels(**_labels).inc(
+        ).inc(
             standard_logging_payload["prompt_tokens"]
         )
 
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_output_tokens_metric"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_output_tokens_metric,
+            metric_name="litellm_output_tokens_metric",
             enum_values=enum_values,
-        )
-
-        self.litellm_output_tokens_metric.labels(**_labels).inc(
+        ).inc(
             standard_logging_payload["completion_tokens"]
         )
 
@@ -1041,21 +1090,11 @@ class PrometheusLogger(CustomLogger):
         response_cost: float,
         enum_values: UserAPIKeyLabelValues,
     ):
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_requests_metric"
-            ),
-            enum_values=enum_values,
-        )
-
-        self.litellm_requests_metric.labels(**_labels).inc()
-
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_proxy_total_requests_metric"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_requests_metric,
+            metric_name="litellm_requests_metric",
             enum_values=enum_values,
-        )
+        ).inc()
 
         self.litellm_spend_metric.labels(
             end_user_id,
@@ -1141,13 +1180,11 @@ class PrometheusLogger(CustomLogger):
             end_time=end_time,
         )
         if api_call_total_time_seconds is not None:
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_llm_api_latency_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_llm_api_latency_metric,
+                metric_name="litellm_llm_api_latency_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_llm_api_latency_metric.labels(**_labels).observe(
+            ).observe(
                 api_call_total_time_seconds
             )
 
@@ -1157,13 +1194,11 @@ class PrometheusLogger(CustomLogger):
             end_time=end_time,
         )
         if total_time_seconds is not None:
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_request_total_latency_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_request_total_latency_metric,
+                metric_name="litellm_request_total_latency_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_request_total_latency_metric.labels(**_labels).observe(
+            ).observe(
                 total_time_seconds
             )
 
@@ -1255,21 +1290,17 @@ class PrometheusLogger(CustomLogger):
                 tags=_tags,
                 route=user_api_key_dict.request_route,
             )
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_proxy_failed_requests_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_proxy_failed_requests_metric,
+                metric_name="litellm_proxy_failed_requests_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_proxy_failed_requests_metric.labels(**_labels).inc()
+            ).inc()
 
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_proxy_total_requests_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_proxy_total_requests_metric,
+                metric_name="litellm_proxy_total_requests_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_proxy_total_requests_metric.labels(**_labels).inc()
+            ).inc()
 
         except Exception as e:
             verbose_logger.exception(
@@ -1303,13 +1334,11 @@ class PrometheusLogger(CustomLogger):
                     data.get("metadata", {}), data.get("proxy_server_request", {})
                 ),
             )
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_proxy_total_requests_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_proxy_total_requests_metric,
+                metric_name="litellm_proxy_total_requests_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_proxy_total_requests_metric.labels(**_labels).inc()
+            ).inc()
 
         except Exception as e:
             verbose_logger.exception(
@@ -1381,21 +1410,17 @@ class PrometheusLogger(CustomLogger):
             )
             if exception is not None:
 
-                _labels = prometheus_label_factory(
-                    supported_enum_labels=self.get_labels_for_metric(
-                        metric_name="litellm_deployment_failure_responses"
-                    ),
+                self._get_bound_metric(
+                    metric=self.litellm_deployment_failure_responses,
+                    metric_name="litellm_deployment_failure_responses",
                     enum_values=enum_values,
-                )
-                self.litellm_deployment_failure_responses.labels(**_labels).inc()
+                ).inc()
 
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_deployment_total_requests"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_deployment_total_requests,
+                metric_name="litellm_deployment_total_requests",
                 enum_values=enum_values,
-            )
-            self.litellm_deployment_total_requests.labels(**_labels).inc()
+            ).inc()
 
             pass
         except Exception as e:
@@ -1447,13 +1472,11 @@ class PrometheusLogger(CustomLogger):
             if litellm_overhead_time_ms := standard_logging_payload[
                 "hidden_params"
             ].get("litellm_overhead_time_ms"):
-                _labels = prometheus_label_factory(
-                    supported_enum_labels=self.get_labels_for_metric(
-                        metric_name="litellm_overhead_latency_metric"
-                    ),
+                self._get_bound_metric(
+                    metric=self.litellm_overhead_latency_metric,
+                    metric_name="litellm_overhead_latency_metric",
                     enum_values=enum_values,
-                )
-                self.litellm_overhead_latency_metric.labels(**_labels).observe(
+                ).observe(
                     litellm_overhead_time_ms / 1000
                 )  # set as seconds
 
@@ -1464,24 +1487,20 @@ class PrometheusLogger(CustomLogger):
                 "api_base",
                 "litellm_model_name"
                 """
-                _labels = prometheus_label_factory(
-                    supported_enum_labels=self.get_labels_for_metric(
-                        metric_name="litellm_remaining_requests_metric"
-                    ),
+                self._get_bound_metric(
+                    metric=self.litellm_remaining_requests_metric,
+                    metric_name="litellm_remaining_requests_metric",
                     enum_values=enum_values,
-                )
-                self.litellm_remaining_requests_metric.labels(**_labels).set(
+                ).set(
                     remaining_requests
                 )
 
             if remaining_tokens:
-                _labels = prometheus_label_factory(
-                    supported_enum_labels=self.get_labels_for_metric(
-                        metric_name="litellm_remaining_tokens_metric"
-                    ),
+                self._get_bound_metric(
+                    metric=self.litellm_remaining_tokens_metric,
+                    metric_name="litellm_remaining_tokens_metric",
                     enum_values=enum_values,
-                )
-                self.litellm_remaining_tokens_metric.labels(**_labels).set(
+                ).set(
                     remaining_tokens
                 )
 
@@ -1496,21 +1515,17 @@ class PrometheusLogger(CustomLogger):
                 api_provider=llm_provider or "",
             )
 
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_deployment_success_responses"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_deployment_success_responses,
+                metric_name="litellm_deployment_success_responses",
                 enum_values=enum_values,
-            )
-            self.litellm_deployment_success_responses.labels(**_labels).inc()
+            ).inc()
 
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_deployment_total_requests"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_deployment_total_requests,
+                metric_name="litellm_deployment_total_requests",
                 enum_values=enum_values,
-            )
-            self.litellm_deployment_total_requests.labels(**_labels).inc()
+            ).inc()
 
             # Track deployment Latency
             response_ms: timedelta = end_time - start_time
@@ -1535,14 +1550,10 @@ class PrometheusLogger(CustomLogger):
             latency_per_token = None
             if output_tokens is not None and output_tokens > 0:
                 latency_per_token = _latency_seconds / output_tokens
-                _labels = prometheus_label_factory(
-                    supported_enum_labels=self.get_labels_for_metric(
-                        metric_name="litellm_deployment_latency_per_output_token"
-                    ),
+                self._get_bound_metric(
+                    metric=self.litellm_deployment_latency_per_output_token,
+                    metric_name="litellm_deployment_latency_per_output_token",
                     enum_values=enum_values,
-                )
-                self.litellm_deployment_latency_per_output_token.labels(
-                    **_labels
                 ).observe(latency_per_token)
 
         except Exception as e:
@@ -1607,13 +1618,11 @@ class PrometheusLogger(CustomLogger):
             exception_class=self._get_exception_class_name(original_exception),
             tags=_tags,
         )
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_deployment_successful_fallbacks"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_deployment_successful_fallbacks,
+            metric_name="litellm_deployment_successful_fallbacks",
             enum_values=enum_values,
-        )
-        self.litellm_deployment_successful_fallbacks.labels(**_labels).inc()
+        ).inc()
 
     async def log_failure_fallback_event(
         self, original_model_group: str, kwargs: dict, original_exception: Exception
@@ -1652,13 +1661,11 @@ class PrometheusLogger(CustomLogger):
             tags=_tags,
         )
 
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_deployment_failed_fallbacks"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_deployment_failed_fallbacks,
+            metric_name="litellm_deployment_failed_fallbacks",
             enum_values=enum_values,
-        )
-        self.litellm_deployment_failed_fallbacks.labels(**_labels).inc()
+        ).inc()
 
     def set_litellm_deployment_state(
         self,
@@ -2000,13 +2007,11 @@ class PrometheusLogger(CustomLogger):
             team_alias=team.team_alias or "",
         )
 
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_remaining_team_budget_metric"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_remaining_team_budget_metric,
+            metric_name="litellm_remaining_team_budget_metric",
             enum_values=enum_values,
-        )
-        self.litellm_remaining_team_budget_metric.labels(**_labels).set(
+        ).set(
             self._safe_get_remaining_budget(
                 max_budget=team.max_budget,
                 spend=team.spend,
@@ -2014,22 +2019,18 @@ class PrometheusLogger(CustomLogger):
         )
 
         if team.max_budget is not None:
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_team_max_budget_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_team_max_budget_metric,
+                metric_name="litellm_team_max_budget_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_team_max_budget_metric.labels(**_labels).set(team.max_budget)
+            ).set(team.max_budget)
 
         if team.budget_reset_at is not None:
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_team_budget_remaining_hours_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_team_budget_remaining_hours_metric,
+                metric_name="litellm_team_budget_remaining_hours_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_team_budget_remaining_hours_metric.labels(**_labels).set(
+            ).set(
                 self._get_remaining_hours_for_budget_reset(
                     budget_reset_at=team.budget_reset_at
                 )
@@ -2047,13 +2048,11 @@ class PrometheusLogger(CustomLogger):
             hashed_api_key=user_api_key_dict.token,
             api_key_alias=user_api_key_dict.key_alias or "",
         )
-        _labels = prometheus_label_factory(
-            supported_enum_labels=self.get_labels_for_metric(
-                metric_name="litellm_remaining_api_key_budget_metric"
-            ),
+        self._get_bound_metric(
+            metric=self.litellm_remaining_api_key_budget_metric,
+            metric_name="litellm_remaining_api_key_budget_metric",
             enum_values=enum_values,
-        )
-        self.litellm_remaining_api_key_budget_metric.labels(**_labels).set(
+        ).set(
             self._safe_get_remaining_budget(
                 max_budget=user_api_key_dict.max_budget,
                 spend=user_api_key_dict.spend,
@@ -2061,18 +2060,20 @@ class PrometheusLogger(CustomLogger):
         )
 
         if user_api_key_dict.max_budget is not None:
-            _labels = prometheus_label_factory(
-                supported_enum_labels=self.get_labels_for_metric(
-                    metric_name="litellm_api_key_max_budget_metric"
-                ),
+            self._get_bound_metric(
+                metric=self.litellm_api_key_max_budget_metric,
+                metric_name="litellm_api_key_max_budget_metric",
                 enum_values=enum_values,
-            )
-            self.litellm_api_key_max_budget_metric.labels(**_labels).set(
+            ).set(
                 user_api_key_dict.max_budget
             )
 
         if user_api_key_dict.budget_reset_at is not None:
-            self.litellm_api_key_budget_remaining_hours_metric.labels(**_labels).set(
+            self._get_bound_metric(
+                metric=self.litellm_api_key_budget_remaining_hours_metric,
+                metric_name="litellm_api_key_budget_remaining_hours_metric",
+                enum_values=enum_values,
+            ).set(
                 self._get_remaining_hours_for_budget_reset(
                     budget_reset_at=user_api_key_dict.budget_reset_at
                 )
@@ -2210,7 +2211,15 @@ class PrometheusLogger(CustomLogger):
             )
 
         # Create metrics ASGI app
-        metrics_app = make_asgi_app()
+        if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+            # multiple uvicorn workers - aggregate the metrics of all workers on each scrape
+            from prometheus_client import CollectorRegistry, multiprocess
+
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            metrics_app = make_asgi_app(registry=registry)
+        else:
+            metrics_app = make_asgi_app()
 
         # Mount the metrics app to the app
         app.mount("/metrics", metrics_app)
@@ -21,6 +21,10 @@ from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.caching.caching import Cache, DualCache, RedisCache, InMemoryCache
 from litellm.caching.llm_caching_handler import LLMClientCache
 from litellm.types.llms.bedrock import COHERE_EMBEDDING_INPUT_TYPES
+from litellm.types.llms.custom_http import HTTPPoolSettings
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneSettings,
+)
 from litellm.types.utils import (
     ImageObject,
     BudgetConfig,
@@ -187,6 +191,9 @@ add_user_information_to_llm_headers: Optional[bool] = (
     None  # adds user_id, team_id, token hash (params from StandardLoggingMetadata) to request headers
 )
 store_audit_logs = False  # Enterprise feature, allow users to see audit logs
+callback_dispatch_settings: Optional[Dict[str, CallbackDispatchLaneSettings]] = (
+    None  # per-lane settings for sync callbacks, e.g. {"success_handler": {"max_workers": 20, "queue_full_policy": "drop_oldest"}}
+)
 ### end of callbacks #############
 
 email: Optional[str] = (
@@ -245,6 +252,7 @@ ssl_security_level: Optional[str] = None
 ssl_certificate: Optional[str] = None
 disable_streaming_logging: bool = False
 disable_token_counter: bool = False
+disable_token_counter_cache: bool = False
 disable_add_transform_inline_image_block: bool = False
 disable_add_user_agent_to_request_tags: bool = False
 extra_spend_tag_headers: Optional[List[str]] = None
@@ -372,6 +380,9 @@ disable_aiohttp_trust_env: bool = (
 force_ipv4: bool = (
     False  # when True, litellm will force ipv4 for all LLM requests. Some users have seen httpx ConnectionError when using ipv6.
 )
+http_pool_settings: Optional[Dict[str, HTTPPoolSettings]] = (
+    None  # per-provider connection pool limits, e.g. {"openai": {"max_connections": 200}, "default": {...}}
+)
 module_level_aclient = AsyncHTTPHandler(
     timeout=request_timeout, client_alias="module level aclient"
 )
@@ -398,9 +409,18 @@ _key_management_settings: KeyManagementSettings = KeyManagementSettings()
 #### PII MASKING ####
 output_parse_pii: bool = False
 #############################################
-from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_map
+from litellm.litellm_core_utils.compiled_model_cost_map import (
+    get_model_cost_provider_items,
+)
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_compiled_model_cost_map,
+    get_model_cost_map,
+)
 
-model_cost = get_model_cost_map(url=model_cost_map_url)
+if os.getenv("LITELLM_MODEL_COST_MAP_MMAP", "False").lower() == "true":
+    model_cost = get_compiled_model_cost_map(url=model_cost_map_url)
+else:
+    model_cost = get_model_cost_map(url=model_cost_map_url)
 custom_prompt_dict: Dict[str, dict] = {}
 check_provider_endpoint = False
 
@@ -565,7 +585,7 @@ def is_openai_finetune_model(key: str) -> bool:
 
 
 def add_known_models():
-    for key, value in model_cost.items():
+    for key, value in get_model_cost_provider_items(model_cost):
         if value.get("litellm_provider") == "openai" and not is_openai_finetune_model(
             key
         ):
@@ -1,6 +1,6 @@
 import asyncio
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Set, Union
 
 import litellm
 from litellm._logging import verbose_logger
@@ -29,6 +29,9 @@ class ServiceLogging(CustomLogger):
     Separate class used for monitoring health of litellm-adjacent services (redis/postgres).
     """
 
+    # only reads the call type + duration of llm api calls
+    standard_logging_payload_fields: Set[str] = set()
+
     def __init__(self, mock_testing: bool = False) -> None:
         self.mock_testing = mock_testing
         self.mock_testing_sync_success_hook = 0
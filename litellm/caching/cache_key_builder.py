@@ -0,0 +1,169 @@
+"""
+Builds the hashed cache key for a request. Used by `Cache.get_cache_key`.
+
+- params are hashed in sorted order, so the key doesn't depend on kwarg order
+- each value is serialized canonically (orjson, sorted dict keys) and streamed into a BLAKE2b hash - no key string is built
+- messages are hashed one at a time, and the per-message digests are memoized, so a multi-turn conversation only serializes its new messages.
+  The memo is keyed on the message content, so it keeps up to `MAX_CACHE_KEY_MESSAGE_HASHES` messages of up to `MAX_CACHE_KEY_MEMOIZED_MESSAGE_SIZE` characters alive
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Hashable, Optional
+
+from pydantic import BaseModel
+
+from litellm.constants import (
+    MAX_CACHE_KEY_MEMOIZED_MESSAGE_SIZE,
+    MAX_CACHE_KEY_MESSAGE_HASHES,
+)
+from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
+from litellm.types.utils import all_litellm_params
+
+from .dual_cache import LimitedSizeOrderedDict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional for the sdk
+    orjson = None  # type: ignore
+
+
+def _serialize_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+class CacheKeyBuilder:
+    def __init__(
+        self,
+        max_message_hashes: int = MAX_CACHE_KEY_MESSAGE_HASHES,
+        max_memoized_message_size: int = MAX_CACHE_KEY_MEMOIZED_MESSAGE_SIZE,
+    ):
+        self._message_digests: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=max_message_hashes
+        )
+        self.max_memoized_message_size = max_memoized_message_size
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_cache_key_params() -> FrozenSet[str]:
+        """
+        llm api params that are part of the cache key - computed once
+        """
+        return frozenset(ModelParamHelper._get_all_llm_api_params())
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_litellm_params() -> FrozenSet[str]:
+        """
+        litellm internal params, never part of the cache key
+        """
+        return frozenset(all_litellm_params)
+
+    @staticmethod
+    def serialize(value: Any) -> bytes:
+        """
+        Canonical serialization of a param value - dict keys are sorted
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    value,
+                    default=_serialize_default,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                )
+            except TypeError:  # e.g. ints > 64 bits
+                pass
+        try:
+            return json.dumps(
+                value,
+                default=_serialize_default,
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+        except (TypeError, ValueError):  # e.g. dict keys of mixed types
+            return str(value).encode("utf-8")
+
+    def get_hashed_cache_key(
+        self,
+        kwargs: dict,
+        get_param_value: Callable[[str, dict], Any],
+        include_provider_specific_params: bool,
+    ) -> str:
+        """
+        Returns the hex digest of the cache key params in `kwargs`.
+
+        Args:
+            kwargs: kwargs to litellm.completion() / embedding() / ...
+            get_param_value: returns the value to use for a cache key param - e.g. the model group for `model`
+            include_provider_specific_params: include params that are not litellm / openai params - e.g. top_k
+        """
+        cache_key_params = self.get_cache_key_params()
+        litellm_params = self.get_litellm_params()
+        hasher = hashlib.blake2b(digest_size=32)
+        for param in sorted(kwargs):
+            if param in cache_key_params:
+                param_value = get_param_value(param, kwargs)
+            elif include_provider_specific_params and param not in litellm_params:
+                param_value = kwargs[param]
+            else:
+                continue
+            if param_value is None:
+                continue
+
+            hasher.update(param.encode("utf-8"))
+            if param == "messages" and isinstance(param_value, list):
+                hasher.update(b"\x01" + len(param_value).to_bytes(8, "big"))
+                for message in param_value:
+                    hasher.update(self._get_message_digest(message))
+            else:
+                serialized_value = self.serialize(param_value)
+                hasher.update(b"\x00" + len(serialized_value).to_bytes(8, "big"))
+                hasher.update(serialized_value)
+        return hasher.hexdigest()
+
+    def _get_message_digest(self, message: Any) -> bytes:
+        memo_key = self._get_message_memo_key(message)
+        if memo_key is not None:
+            digest = self._message_digests.get(memo_key)
+            if digest is not None:
+                return digest
+
+        digest = hashlib.blake2b(self.serialize(message), digest_size=16).digest()
+        if memo_key is not None:
+            self._message_digests[memo_key] = digest
+        return digest
+
+    def _get_message_memo_key(self, message: Any) -> Optional[Hashable]:
+        """
+        Only messages with flat, scalar values are memoized - e.g. {"role": "user", "content": "..."}
+
+        The key is the message content itself, so different messages never share a digest - and the memo keeps the content alive.
+        Messages whose str / bytes values are longer than `max_memoized_message_size` in total aren't memoized, to bound that memory.
+        The value types are part of the key, so `True` and `1` don't share a digest.
+        """
+        if not isinstance(message, dict):
+            return None
+        memo_key = []
+        message_size = 0
+        for k, v in message.items():
+            value_type = type(v)
+            if isinstance(v, (str, bytes)):
+                message_size += len(v)
+                if message_size > self.max_memoized_message_size:
+                    return None
+            elif isinstance(v, float):
+                v = v.hex()  # -0.0 == 0.0, but they serialize differently
+            elif not (v is None or isinstance(v, (bool, int))):
+                return None
+            memo_key.append((k, value_type, v))
+        try:
+            return tuple(sorted(memo_key))  # type: ignore
+        except TypeError:  # e.g. non-str keys of mixed types
+            return None
+
+
+cache_key_builder = CacheKeyBuilder()
@@ -8,7 +8,6 @@
 #  Thank you users! We ❤️ you! - Krrish & Ishaan
 
 import ast
-import hashlib
 import json
 import time
 import traceback
@@ -20,15 +19,16 @@ from pydantic import BaseModel
 import litellm
 from litellm._logging import verbose_logger
 from litellm.constants import CACHED_STREAMING_CHUNK_DELAY
-from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.types.caching import *
-from litellm.types.utils import EmbeddingResponse, all_litellm_params
+from litellm.types.utils import EmbeddingResponse
 
 from .azure_blob_cache import AzureBlobCache
 from .base_cache import BaseCache
+from .cache_key_builder import cache_key_builder
 from .disk_cache import DiskCache
 from .dual_cache import DualCache  # noqa
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_cluster_cache import RedisClusterCache
@@ -106,6 +106,9 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        local_semantic_cache_size: Optional[int] = None,
+        local_semantic_cache_ttl: Optional[float] = None,
+        local_semantic_cache_snapshot_path: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -129,6 +132,11 @@ class Cache:
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
             similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
 
+            # Local Semantic Cache Args - in-process tier in front of "redis-semantic" / "qdrant-semantic"
+            local_semantic_cache_size (int, optional): Max number of prompts kept in the in-process index. Defaults to None (no local tier).
+            local_semantic_cache_ttl (float, optional): The ttl for local index entries, if the request has no ttl. Defaults to None (LOCAL_SEMANTIC_CACHE_TTL_SECONDS).
+            local_semantic_cache_snapshot_path (str, optional): File the local index is snapshotted to, and loaded from on startup. Defaults to None.
+
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
 
@@ -226,6 +234,17 @@ class Cache:
             )
         elif type == LiteLLMCacheType.DISK:
             self.cache = DiskCache(disk_cache_dir=disk_cache_dir)
+        if (
+            type in (LiteLLMCacheType.REDIS_SEMANTIC, LiteLLMCacheType.QDRANT_SEMANTIC)
+            and local_semantic_cache_size
+        ):
+            self.cache = LocalSemanticCache(
+                remote_cache=self.cache,  # type: ignore
+                max_size=local_semantic_cache_size,
+                similarity_threshold=similarity_threshold,  # type: ignore
+                ttl=local_semantic_cache_ttl,
+                snapshot_path=local_semantic_cache_snapshot_path,
+            )
         if "cache" not in litellm.input_callback:
             litellm.input_callback.append("cache")
         if "cache" not in litellm.success_callback:
@@ -261,34 +280,20 @@ class Cache:
         Returns:
             str: The cache key generated from the arguments, or None if no cache key could be generated.
         """
-        cache_key = ""
-        # verbose_logger.debug("\nGetting Cache key. Kwargs: %s", kwargs)
-
         preset_cache_key = self._get_preset_cache_key_from_kwargs(**kwargs)
         if preset_cache_key is not None:
             verbose_logger.debug("\nReturning preset cache key: %s", preset_cache_key)
             return preset_cache_key
 
-        combined_kwargs = ModelParamHelper._get_all_llm_api_params()
-        litellm_param_kwargs = all_litellm_params
-        for param in kwargs:
-            if param in combined_kwargs:
-                param_value: Optional[str] = self._get_param_value(param, kwargs)
-                if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
-            elif (
-                param not in litellm_param_kwargs
-            ):  # check if user passed in optional param - e.g. top_k
-                if (
-                    litellm.enable_caching_on_provider_specific_optional_params is True
-                ):  # feature flagged for now
-                    if kwargs[param] is None:
-                        continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
-
-        verbose_logger.debug("\nCreated cache key: %s", cache_key)
-        hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
+        include_provider_specific_params = (
+            litellm.enable_caching_on_provider_specific_optional_params is True
+        )  # feature flagged for now
+        hashed_cache_key = cache_key_builder.get_hashed_cache_key(
+            kwargs=kwargs,
+            get_param_value=self._get_param_value,
+            include_provider_specific_params=include_provider_specific_params,
+        )
+        verbose_logger.debug("\nCreated cache key: %s", hashed_cache_key)
         hashed_cache_key = self._add_namespace_to_cache_key(hashed_cache_key, **kwargs)
         self._set_preset_cache_key_in_kwargs(
             preset_cache_key=hashed_cache_key, **kwargs
@@ -376,25 +381,6 @@ class Cache:
             if "litellm_params" in kwargs:
                 kwargs["litellm_params"]["preset_cache_key"] = preset_cache_key
 
-    @staticmethod
-    def _get_hashed_cache_key(cache_key: str) -> str:
-        """
-        Get the hashed cache key for the given cache key.
-
-        Use hashlib to create a sha256 hash of the cache key
-
-        Args:
-            cache_key (str): The cache key to hash.
-
-        Returns:
-            str: The hashed cache key.
-        """
-        hash_object = hashlib.sha256(cache_key.encode())
-        # Hexadecimal representation of the hash
-        hash_hex = hash_object.hexdigest()
-        verbose_logger.debug("Hashed cache key (SHA-256): %s", hash_hex)
-        return hash_hex
-
     def _add_namespace_to_cache_key(self, hash_hex: str, **kwargs) -> str:
         """
         If a redis namespace is provided, add it to the cache key
@@ -35,7 +35,6 @@ from pydantic import BaseModel
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.caching.caching import S3Cache
 from litellm.types.caching import CachedEmbedding
 from litellm.litellm_core_utils.logging_utils import (
     _assemble_complete_response_from_streaming_chunks,
@@ -191,9 +190,6 @@ class LLMCachingHandler:
                     and cached_result is not None
                     and isinstance(cached_result, list)
                     and litellm.cache is not None
-                    and not isinstance(
-                        litellm.cache.cache, S3Cache
-                    )  # s3 doesn't support bulk writing. Exclude.
                 ):
                     (
                         final_embedding_cached_response,
@@ -756,22 +752,10 @@ class LLMCachingHandler:
                 or isinstance(result, TranscriptionResponse)
                 or isinstance(result, RerankResponse)
             ):
-                if (
-                    isinstance(result, EmbeddingResponse)
-                    and litellm.cache is not None
-                    and not isinstance(
-                        litellm.cache.cache, S3Cache
-                    )  # s3 doesn't support bulk writing. Exclude.
-                ):
+                if isinstance(result, EmbeddingResponse) and litellm.cache is not None:
                     asyncio.create_task(
                         litellm.cache.async_add_cache_pipeline(result, **new_kwargs)
                     )
-                elif isinstance(litellm.cache.cache, S3Cache):
-                    threading.Thread(
-                        target=litellm.cache.add_cache,
-                        args=(result,),
-                        kwargs=new_kwargs,
-                    ).start()
                 else:
                     asyncio.create_task(
                         litellm.cache.async_add_cache(
@@ -1,5 +1,10 @@
 import json
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Union
+
+import anyio
+
+from litellm.constants import DEFAULT_DISK_CACHE_MAX_CONCURRENCY
+from litellm.litellm_core_utils.asyncify import asyncify
 
 from .base_cache import BaseCache
 
@@ -12,7 +17,17 @@ else:
 
 
 class DiskCache(BaseCache):
-    def __init__(self, disk_cache_dir: Optional[str] = None):
+    """
+    diskcache is blocking (sqlite + file io), so the async methods run it in worker threads - at most `max_concurrency` at a time.
+
+    Pipelined / batched calls hop to a worker thread once for all keys.
+    """
+
+    def __init__(
+        self,
+        disk_cache_dir: Optional[str] = None,
+        max_concurrency: int = DEFAULT_DISK_CACHE_MAX_CONCURRENCY,
+    ):
         try:
             import diskcache as dc
         except ModuleNotFoundError as e:
@@ -26,6 +41,16 @@ class DiskCache(BaseCache):
         else:
             self.disk_cache = dc.Cache(disk_cache_dir)
 
+        self.max_concurrency = max_concurrency
+        self._limiter: Optional[
+            anyio.CapacityLimiter
+        ] = None  # created on first async call
+
+    def _run_in_thread(self, function: Callable, *args, **kwargs) -> Awaitable:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_concurrency)
+        return asyncify(function, limiter=self._limiter)(*args, **kwargs)
+
     def set_cache(self, key, value, **kwargs):
         if "ttl" in kwargs:
             self.disk_cache.set(key, value, expire=kwargs["ttl"])
@@ -33,14 +58,19 @@ class DiskCache(BaseCache):
             self.disk_cache.set(key, value)
 
     async def async_set_cache(self, key, value, **kwargs):
-        self.set_cache(key=key, value=value, **kwargs)
+        await self._run_in_thread(self.set_cache, key=key, value=value, **kwargs)
+
+    def set_cache_pipeline(self, cache_list: List, **kwargs):
+        # single transaction - one sqlite commit for all keys
+        with self.disk_cache.transact():
+            for cache_key, cache_value in cache_list:
+                if "ttl" in kwargs:
+                    self.set_cache(key=cache_key, value=cache_value, ttl=kwargs["ttl"])
+                else:
+                    self.set_cache(key=cache_key, value=cache_value)
 
     async def async_set_cache_pipeline(self, cache_list, **kwargs):
-        for cache_key, cache_value in cache_list:
-            if "ttl" in kwargs:
-                self.set_cache(key=cache_key, value=cache_value, ttl=kwargs["ttl"])
-            else:
-                self.set_cache(key=cache_key, value=cache_value)
+        await self._run_in_thread(self.set_cache_pipeline, cache_list, **kwargs)
 
     def get_cache(self, key, **kwargs):
         original_cached_response = self.disk_cache.get(key)
@@ -60,28 +90,21 @@ class DiskCache(BaseCache):
         return return_val
 
     def increment_cache(self, key, value: int, **kwargs) -> int:
-        # get the value
-        init_value = self.get_cache(key=key) or 0
-        value = init_value + value  # type: ignore
-        self.set_cache(key, value, **kwargs)
+        with self.disk_cache.transact():
+            # get the value
+            init_value = self.get_cache(key=key) or 0
+            value = init_value + value  # type: ignore
+            self.set_cache(key, value, **kwargs)
         return value
 
     async def async_get_cache(self, key, **kwargs):
-        return self.get_cache(key=key, **kwargs)
+        return await self._run_in_thread(self.get_cache, key=key, **kwargs)
 
     async def async_batch_get_cache(self, keys: list, **kwargs):
-        return_val = []
-        for k in keys:
-            val = self.get_cache(key=k, **kwargs)
-            return_val.append(val)
-        return return_val
+        return await self._run_in_thread(self.batch_get_cache, keys, **kwargs)
 
     async def async_increment(self, key, value: int, **kwargs) -> int:
-        # get the value
-        init_value = await self.async_get_cache(key=key) or 0
-        value = init_value + value  # type: ignore
-        await self.async_set_cache(key, value, **kwargs)
-        return value
+        return await self._run_in_thread(self.increment_cache, key, value, **kwargs)
 
     def flush_cache(self):
         self.disk_cache.clear()
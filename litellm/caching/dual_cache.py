@@ -12,7 +12,7 @@ import asyncio
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
@@ -294,9 +294,12 @@ class DualCache(BaseCache):
                             # Update the last access time for each key fetched from Redis
                             self.last_redis_batch_access_time[key] = current_time
 
-                    for key, value in redis_result.items():
-                        index = keys.index(key)
-                        result[index] = value
+                        key_indices: Dict[Any, List[int]] = {}
+                        for index, key in enumerate(keys):
+                            key_indices.setdefault(key, []).append(index)
+                        for key, value in redis_result.items():
+                            for index in key_indices.get(key, []):
+                                result[index] = value
 
             return result
         except Exception:
@@ -8,10 +8,12 @@ Has 4 methods:
     - async_get_cache
 """
 
+import heapq
 import json
 import sys
 import time
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
@@ -19,6 +21,7 @@ if TYPE_CHECKING:
 from pydantic import BaseModel
 
 from litellm.constants import MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
+from litellm.types.caching import InMemoryCacheStats
 
 from .base_cache import BaseCache
 
@@ -31,9 +34,15 @@ class InMemoryCache(BaseCache):
             int
         ] = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
         max_size_per_item: Optional[int] = 1024,  # 1MB = 1024KB
+        max_size_in_memory_bytes: Optional[int] = None,
+        eviction_policy: Literal["ttl", "lru"] = "ttl",
     ):
         """
         max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+        max_size_in_memory_bytes [Optional[int]]: Upper bound on the estimated total size of cached values. Not enforced if None. When exceeded, least recently used items are evicted.
+        eviction_policy [str]: What to do when the cache is full and no items have expired.
+            - "ttl" (default): only expired items are evicted, live items are never dropped (e.g. rate limit counters)
+            - "lru": the least recently used items are evicted until the cache is back under max_size_in_memory
         """
         self.max_size_in_memory = (
             max_size_in_memory or 200
@@ -43,9 +52,23 @@ class InMemoryCache(BaseCache):
             max_size_per_item or MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
         )  # 1MB = 1024KB
 
+        self.max_size_in_memory_bytes = max_size_in_memory_bytes
+        self.eviction_policy = eviction_policy
+
         # in-memory cache
-        self.cache_dict: dict = {}
+        # cache_dict is kept in least-recently-used -> most-recently-used order
+        self.cache_dict: OrderedDict = OrderedDict()
         self.ttl_dict: dict = {}
+        # min-heap of (expiry time, key). Entries are invalidated lazily - an entry is
+        # only acted on if it still matches the key's current expiry in ttl_dict
+        self.expiration_heap: List[Tuple[float, str]] = []
+        self.size_dict: Dict[str, int] = {}
+        self.current_size_in_bytes: int = 0
+
+        # counters, exposed via get_cache_stats()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
 
     def check_value_size(self, value: Any):
         """
@@ -99,27 +122,78 @@ class InMemoryCache(BaseCache):
         """
         self.cache_dict.pop(key, None)
         self.ttl_dict.pop(key, None)
+        self.current_size_in_bytes -= self.size_dict.pop(key, 0)
+
+    def _get_value_size_in_bytes(self, value: Any) -> int:
+        """
+        Cheap (shallow) estimate of the size of a cached value, used for byte-size accounting
+        """
+        try:
+            return sys.getsizeof(value)
+        except Exception:
+            return 0
+
+    def _is_over_item_limit(self) -> bool:
+        return len(self.cache_dict) >= self.max_size_in_memory
+
+    def _is_over_byte_limit(self, incoming_size: int = 0) -> bool:
+        return (
+            self.max_size_in_memory_bytes is not None
+            and self.current_size_in_bytes + incoming_size
+            > self.max_size_in_memory_bytes
+        )
+
+    def _should_evict_lru(self, incoming_size: int = 0) -> bool:
+        if self._is_over_byte_limit(incoming_size=incoming_size):
+            return True
+        return self.eviction_policy == "lru" and self._is_over_item_limit()
+
+    def _rebuild_expiration_heap(self) -> None:
+        self.expiration_heap = [(expiry, key) for key, expiry in self.ttl_dict.items()]
+        heapq.heapify(self.expiration_heap)
+
+    def _maybe_compact_expiration_heap(self) -> None:
+        """
+        Drop stale heap entries (re-set / removed keys) once they are the majority - amortized O(1) per push.
+        """
+        if len(self.expiration_heap) > 2 * len(self.ttl_dict) + 64:
+            self._rebuild_expiration_heap()
 
-    def evict_cache(self):
+    def _evict_expired_keys(self) -> None:
+        """
+        Pop expired entries off the expiration heap. Cost is O(k log n) for k expired keys.
+        """
+        # ttl_dict written to directly
+        if len(self.expiration_heap) < len(self.ttl_dict):
+            self._rebuild_expiration_heap()
+        else:
+            self._maybe_compact_expiration_heap()
+
+        now = time.time()
+        while self.expiration_heap and self.expiration_heap[0][0] <= now:
+            expiry, key = heapq.heappop(self.expiration_heap)
+            if self.ttl_dict.get(key) == expiry:  # skip stale heap entries
+                self._remove_key(key)
+                self.evictions += 1
+
+    def evict_cache(self, incoming_size: int = 0):
         """
         Eviction policy:
-        - check if any items in ttl_dict are expired -> remove them from ttl_dict and cache_dict
+        - remove expired items, using the expiration heap (no full scan of ttl_dict)
+        - if the cache is still over its byte bound (or item bound, with eviction_policy="lru") -> evict least recently used items
 
 
         This guarantees the following:
-        - 1. When item ttl not set: At minimumm each item will remain in memory for 5 minutes
-        - 2. When ttl is set: the item will remain in memory for at least that amount of time
+        - 1. When item ttl not set: At minimumm each item will remain in memory for 5 minutes, unless LRU eviction applies
+        - 2. When ttl is set: the item will remain in memory for at least that amount of time, unless LRU eviction applies
         - 3. the size of in-memory cache is bounded
 
         """
-        for key in list(self.ttl_dict.keys()):
-            if self._is_key_expired(key):
-                self._remove_key(key)
-
-                # de-reference the removed item
-                # https://www.geeksforgeeks.org/diagnosing-and-fixing-memory-leaks-in-python/
-                # One of the most common causes of memory leaks in Python is the retention of objects that are no longer being used.
-                # This can occur when an object is referenced by another object, but the reference is never removed.
+        self._evict_expired_keys()
+        while self.cache_dict and self._should_evict_lru(incoming_size=incoming_size):
+            lru_key = next(iter(self.cache_dict))
+            self._remove_key(lru_key)
+            self.evictions += 1
 
     def allow_ttl_override(self, key: str) -> bool:
         """
@@ -134,18 +208,30 @@ class InMemoryCache(BaseCache):
             return False
 
     def set_cache(self, key, value, **kwargs):
-        if len(self.cache_dict) >= self.max_size_in_memory:
-            # only evict when cache is full
-            self.evict_cache()
         if not self.check_value_size(value):
             return
 
+        value_size = self._get_value_size_in_bytes(value)
+        if key in self.cache_dict:
+            self.current_size_in_bytes -= self.size_dict.pop(key, 0)
+        elif self._is_over_item_limit() or self._is_over_byte_limit(
+            incoming_size=value_size
+        ):
+            # only evict when cache is full
+            self.evict_cache(incoming_size=value_size)
+
         self.cache_dict[key] = value
+        self.cache_dict.move_to_end(key)
+        self.size_dict[key] = value_size
+        self.current_size_in_bytes += value_size
         if self.allow_ttl_override(key):  # if ttl is not set, set it to default ttl
             if "ttl" in kwargs and kwargs["ttl"] is not None:
-                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
+                expiry = time.time() + float(kwargs["ttl"])
             else:
-                self.ttl_dict[key] = time.time() + self.default_ttl
+                expiry = time.time() + self.default_ttl
+            self.ttl_dict[key] = expiry
+            heapq.heappush(self.expiration_heap, (expiry, key))
+            self._maybe_compact_expiration_heap()
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -182,13 +268,17 @@ class InMemoryCache(BaseCache):
     def get_cache(self, key, **kwargs):
         if key in self.cache_dict:
             if self.evict_element_if_expired(key):
+                self.misses += 1
                 return None
+            self.hits += 1
+            self.cache_dict.move_to_end(key)
             original_cached_response = self.cache_dict[key]
             try:
                 cached_response = json.loads(original_cached_response)
             except Exception:
                 cached_response = original_cached_response
             return cached_response
+        self.misses += 1
         return None
 
     def batch_get_cache(self, keys: list, **kwargs):
@@ -236,6 +326,23 @@ class InMemoryCache(BaseCache):
     def flush_cache(self):
         self.cache_dict.clear()
         self.ttl_dict.clear()
+        self.expiration_heap.clear()
+        self.size_dict.clear()
+        self.current_size_in_bytes = 0
+
+    def get_cache_stats(self) -> "InMemoryCacheStats":
+        """
+        Hit / miss / eviction counters and current occupancy - useful for sizing the cache
+        """
+        return InMemoryCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            current_size=len(self.cache_dict),
+            current_size_in_bytes=self.current_size_in_bytes,
+            max_size_in_memory=self.max_size_in_memory,
+            max_size_in_memory_bytes=self.max_size_in_memory_bytes,
+        )
 
     async def disconnect(self):
         pass
@@ -253,6 +360,5 @@ class InMemoryCache(BaseCache):
         """
         Get the oldest n keys in the cache
         """
-        # sorted ttl dict by ttl
-        sorted_ttl_dict = sorted(self.ttl_dict.items(), key=lambda x: x[1])
-        return [key for key, _ in sorted_ttl_dict[:n]]
+        oldest_ttl_items = heapq.nsmallest(n, self.ttl_dict.items(), key=lambda x: x[1])
+        return [key for key, _ in oldest_ttl_items]
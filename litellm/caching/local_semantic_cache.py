@@ -0,0 +1,435 @@
+"""
+In-process semantic cache tier, in front of a remote semantic cache (Redis / Qdrant).
+
+- LocalSemanticIndex: cosine-similarity search over recent prompt embeddings, with ttl eviction and snapshots to local disk. Uses numpy if installed.
+- SemanticCacheEmbeddingMemo: memoizes prompt embeddings, so a repeated prompt skips the embedding call.
+- LocalSemanticCache: checks the local index before the remote cache, and adds remote hits + new writes to the local index.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import time
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from litellm._logging import print_verbose, verbose_logger
+from litellm.constants import (
+    LOCAL_SEMANTIC_CACHE_SNAPSHOT_INTERVAL_SECONDS,
+    LOCAL_SEMANTIC_CACHE_TTL_SECONDS,
+    SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE,
+)
+from litellm.litellm_core_utils.asyncify import asyncify
+
+from .base_cache import BaseCache
+from .dual_cache import LimitedSizeOrderedDict
+
+if TYPE_CHECKING:
+    from .qdrant_semantic_cache import QdrantSemanticCache
+    from .redis_semantic_cache import RedisSemanticCache
+
+try:
+    import numpy as np
+except ImportError:  # fall back to pure python similarity search
+    np = None  # type: ignore
+
+
+class SemanticCacheEmbeddingMemo:
+    """
+    Bounded memo of prompt -> embedding. Keyed by a BLAKE2b digest of the prompt, so long prompts aren't kept in memory.
+    """
+
+    def __init__(self, max_size: int = SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE):
+        self._embeddings: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=max_size
+        )
+
+    @staticmethod
+    def _get_memo_key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=32).digest()
+
+    def get(self, prompt: str) -> Optional[List[float]]:
+        embedding = self._embeddings.get(self._get_memo_key(prompt))
+        if embedding is None:
+            return None
+        return embedding.tolist()
+
+    def set(self, prompt: str, embedding: Sequence[float]) -> None:
+        self._embeddings[self._get_memo_key(prompt)] = array("d", embedding)
+
+
+class LocalSemanticCacheEntry(NamedTuple):
+    prompt: str
+    response: Any
+    expires_at: float  # unix time, math.inf if no ttl
+    vector: array  # unit vector
+
+
+class LocalSemanticIndex:
+    """
+    Exact cosine-similarity search over at most `max_size` entries.
+
+    When full, expired entries are replaced first, then the oldest.
+    """
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, max_size: int, similarity_threshold: float):
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self._entries: List[LocalSemanticCacheEntry] = []
+        self._insertion_order: List[int] = []  # per slot - lowest is the oldest entry
+        self._num_inserted = 0
+        # numpy only - rows are the entry vectors, allocated on first add
+        self._matrix: Optional[Any] = None
+        self._expires_at: Optional[Any] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Optional[array]:
+        norm = math.sqrt(math.fsum(x * x for x in vector))
+        if norm == 0:
+            return None
+        return array("f", (x / norm for x in vector))
+
+    def add(
+        self,
+        vector: Sequence[float],
+        prompt: str,
+        response: Any,
+        ttl: Optional[float] = None,
+    ) -> None:
+        expires_at = time.time() + ttl if ttl is not None else math.inf
+        normalized_vector = self._normalize(vector)
+        if normalized_vector is None:
+            return
+        self._add_entry(
+            LocalSemanticCacheEntry(
+                prompt=prompt,
+                response=response,
+                expires_at=expires_at,
+                vector=normalized_vector,
+            )
+        )
+
+    def _add_entry(self, entry: LocalSemanticCacheEntry) -> None:
+        if self._entries and len(entry.vector) != len(self._entries[0].vector):
+            verbose_logger.debug(
+                "local semantic cache: embedding size changed from %s to %s, resetting index",
+                len(self._entries[0].vector),
+                len(entry.vector),
+            )
+            self.clear()
+
+        slot = self._get_slot()
+        self._num_inserted += 1
+        if slot == len(self._entries):
+            self._entries.append(entry)
+            self._insertion_order.append(self._num_inserted)
+        else:
+            self._entries[slot] = entry
+            self._insertion_order[slot] = self._num_inserted
+
+        if np is not None:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.max_size, len(entry.vector)), np.float32)
+                self._expires_at = np.full(self.max_size, -math.inf)
+            self._matrix[slot] = entry.vector
+            self._expires_at[slot] = entry.expires_at  # type: ignore
+
+    def _get_slot(self) -> int:
+        if len(self._entries) < self.max_size:
+            return len(self._entries)
+
+        now = time.time()
+        if self._expires_at is not None:
+            expired_slots = np.flatnonzero(self._expires_at <= now)
+            if expired_slots.size > 0:
+                return int(expired_slots[0])
+        else:
+            for slot, entry in enumerate(self._entries):
+                if entry.expires_at <= now:
+                    return slot
+
+        return min(
+            range(len(self._insertion_order)), key=self._insertion_order.__getitem__
+        )
+
+    def search(
+        self, vector: Sequence[float]
+    ) -> Optional[Tuple[LocalSemanticCacheEntry, float]]:
+        """
+        Returns the most similar, unexpired entry and its similarity - if the similarity is >= `similarity_threshold`
+        """
+        if not self._entries:
+            return None
+        query = self._normalize(vector)
+        if query is None or len(query) != len(self._entries[0].vector):
+            return None
+
+        now = time.time()
+        best_slot = -1
+        best_similarity = -math.inf
+        if self._matrix is not None and self._expires_at is not None:
+            num_entries = len(self._entries)
+            similarities = self._matrix[:num_entries] @ np.asarray(query)
+            similarities[self._expires_at[:num_entries] <= now] = -np.inf
+            best_slot = int(np.argmax(similarities))
+            best_similarity = float(similarities[best_slot])
+        else:
+            for slot, entry in enumerate(self._entries):
+                if entry.expires_at <= now:
+                    continue
+                similarity = sum(map(float.__mul__, entry.vector, query))
+                if similarity > best_similarity:
+                    best_slot, best_similarity = slot, similarity
+
+        if best_slot < 0 or best_similarity < self.similarity_threshold:
+            return None
+        return self._entries[best_slot], best_similarity
+
+    def clear(self) -> None:
+        self._entries = []
+        self._insertion_order = []
+        self._num_inserted = 0
+        self._matrix = None
+        self._expires_at = None
+
+    def get_snapshot(self) -> List[LocalSemanticCacheEntry]:
+        """
+        Unexpired entries, oldest first - entries are immutable, so the snapshot can be written from another thread
+        """
+        now = time.time()
+        slots = sorted(range(len(self._entries)), key=self._insertion_order.__getitem__)
+        return [
+            self._entries[slot]
+            for slot in slots
+            if self._entries[slot].expires_at > now
+        ]
+
+    @classmethod
+    def write_snapshot(
+        cls, entries: List[LocalSemanticCacheEntry], snapshot_path: str
+    ) -> None:
+        snapshot = {
+            "version": cls.SNAPSHOT_VERSION,
+            "entries": [
+                {
+                    "prompt": entry.prompt,
+                    "response": entry.response,
+                    "expires_at": (
+                        entry.expires_at if entry.expires_at != math.inf else None
+                    ),
+                    "vector": entry.vector.tolist(),
+                }
+                for entry in entries
+            ],
+        }
+        # write + rename, so a crash mid-write never leaves a partial snapshot
+        tmp_snapshot_path = snapshot_path + ".tmp"
+        with open(tmp_snapshot_path, "w") as f:
+            json.dump(snapshot, f, default=str)
+        os.replace(tmp_snapshot_path, snapshot_path)
+
+    def load_snapshot(self, snapshot_path: str) -> None:
+        if not os.path.exists(snapshot_path):
+            return
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != self.SNAPSHOT_VERSION:
+            return
+
+        now = time.time()
+        for entry in snapshot["entries"][-self.max_size :]:
+            expires_at = entry["expires_at"]
+            if expires_at is None:
+                expires_at = math.inf
+            if expires_at <= now:
+                continue
+            self._add_entry(
+                LocalSemanticCacheEntry(
+                    prompt=entry["prompt"],
+                    response=entry["response"],
+                    expires_at=expires_at,
+                    vector=array("f", entry["vector"]),
+                )
+            )
+
+
+class LocalSemanticCache(BaseCache):
+    """
+    Semantic cache tier that keeps recent prompt embeddings in-process.
+
+    Lookups search the local index first - a local hit costs no network call (the prompt embedding is memoized on the remote cache).
+    Local misses fall through to `remote_cache`, and remote hits are added to the local index.
+    Local entries always expire (default `LOCAL_SEMANTIC_CACHE_TTL_SECONDS`), so an entry expired / evicted on the remote cache isn't served forever.
+    """
+
+    def __init__(
+        self,
+        remote_cache: Union["RedisSemanticCache", "QdrantSemanticCache"],
+        max_size: int,
+        similarity_threshold: float,
+        ttl: Optional[float] = None,
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: float = LOCAL_SEMANTIC_CACHE_SNAPSHOT_INTERVAL_SECONDS,
+    ):
+        super().__init__()
+        self.remote_cache = remote_cache
+        self.ttl: float = ttl if ttl is not None else LOCAL_SEMANTIC_CACHE_TTL_SECONDS
+        self.index = LocalSemanticIndex(
+            max_size=max_size, similarity_threshold=similarity_threshold
+        )
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self._last_snapshot_time = time.time()
+        self._snapshot_task: Optional[asyncio.Task] = None
+        if snapshot_path is not None:
+            try:
+                self.index.load_snapshot(snapshot_path)
+            except Exception as e:
+                verbose_logger.warning(
+                    "local semantic cache: failed to load snapshot %s - %s",
+                    snapshot_path,
+                    str(e),
+                )
+
+    def _get_ttl(self, **kwargs) -> float:
+        ttl = kwargs.get("ttl")
+        if ttl is not None:
+            return float(ttl)
+        return self.ttl
+
+    def _get_local_cache_hit(self, embedding: List[float], **kwargs) -> Any:
+        result = self.index.search(embedding)
+        if result is None:
+            return None
+        entry, similarity = result
+        kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
+        print_verbose(
+            f"local semantic cache hit: similarity threshold: {self.index.similarity_threshold}, similarity: {similarity}, cached_prompt: {entry.prompt}"
+        )
+        return entry.response
+
+    def set_cache(self, key, value, **kwargs):
+        messages = kwargs.get("messages")
+        if messages:
+            try:
+                prompt = self.remote_cache._get_prompt(messages)
+                embedding = self.remote_cache._get_embedding(prompt)
+                self.index.add(embedding, prompt, value, ttl=self._get_ttl(**kwargs))
+            except Exception as e:
+                print_verbose(f"local semantic cache: set_cache() - {str(e)}")
+        self.remote_cache.set_cache(key, value, **kwargs)
+
+    async def async_set_cache(self, key, value, **kwargs):
+        messages = kwargs.get("messages")
+        if messages:
+            try:
+                prompt = self.remote_cache._get_prompt(messages)
+                embedding = await self.remote_cache._get_async_embedding(
+                    prompt, **kwargs
+                )
+                self.index.add(embedding, prompt, value, ttl=self._get_ttl(**kwargs))
+                self._maybe_snapshot()
+            except Exception as e:
+                print_verbose(f"local semantic cache: async_set_cache() - {str(e)}")
+        await self.remote_cache.async_set_cache(key, value, **kwargs)
+
+    def get_cache(self, key, **kwargs):
+        messages = kwargs.get("messages")
+        prompt: Optional[str] = None
+        embedding: Optional[List[float]] = None
+        if messages:
+            try:
+                prompt = self.remote_cache._get_prompt(messages)
+                embedding = self.remote_cache._get_embedding(prompt)
+                cached_response = self._get_local_cache_hit(embedding, **kwargs)
+                if cached_response is not None:
+                    return cached_response
+            except Exception as e:
+                print_verbose(f"local semantic cache: get_cache() - {str(e)}")
+
+        cached_response = self.remote_cache.get_cache(key, **kwargs)
+        if cached_response is not None and prompt is not None and embedding is not None:
+            self.index.add(embedding, prompt, cached_response, ttl=self.ttl)
+        return cached_response
+
+    async def async_get_cache(self, key, **kwargs):
+        messages = kwargs.get("messages")
+        prompt: Optional[str] = None
+        embedding: Optional[List[float]] = None
+        if messages:
+            try:
+                prompt = self.remote_cache._get_prompt(messages)
+                embedding = await self.remote_cache._get_async_embedding(
+                    prompt, **kwargs
+                )
+                cached_response = self._get_local_cache_hit(embedding, **kwargs)
+                if cached_response is not None:
+                    return cached_response
+            except Exception as e:
+                print_verbose(f"local semantic cache: async_get_cache() - {str(e)}")
+
+        cached_response = await self.remote_cache.async_get_cache(key, **kwargs)
+        if cached_response is not None and prompt is not None and embedding is not None:
+            self.index.add(embedding, prompt, cached_response, ttl=self.ttl)
+            self._maybe_snapshot()
+        return cached_response
+
+    async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        tasks = []
+        for val in cache_list:
+            tasks.append(self.async_set_cache(val[0], val[1], **kwargs))
+        await asyncio.gather(*tasks)
+
+    def _maybe_snapshot(self) -> None:
+        """
+        Write a snapshot in a worker thread, at most once every `snapshot_interval` seconds
+        """
+        if self.snapshot_path is None:
+            return
+        if time.time() - self._last_snapshot_time < self.snapshot_interval:
+            return
+        if self._snapshot_task is not None and not self._snapshot_task.done():
+            return
+        self._last_snapshot_time = time.time()
+        self._snapshot_task = asyncio.create_task(self.async_save_snapshot())
+
+    async def async_save_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        try:
+            await asyncify(LocalSemanticIndex.write_snapshot)(
+                self.index.get_snapshot(), self.snapshot_path
+            )
+        except Exception as e:
+            verbose_logger.warning(
+                "local semantic cache: failed to write snapshot %s - %s",
+                self.snapshot_path,
+                str(e),
+            )
+
+    def flush_cache(self):
+        self.index.clear()
+
+    async def disconnect(self):
+        await self.async_save_snapshot()
+        if hasattr(self.remote_cache, "disconnect"):
+            try:
+                await self.remote_cache.disconnect()
+            except NotImplementedError:
+                pass
@@ -11,7 +11,7 @@ Has 4 methods:
 import ast
 import asyncio
 import json
-from typing import Any, cast
+from typing import Any, List, cast
 
 import litellm
 from litellm._logging import print_verbose
@@ -19,6 +19,7 @@ from litellm.constants import QDRANT_SCALAR_QUANTILE, QDRANT_VECTOR_SIZE
 from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .local_semantic_cache import SemanticCacheEmbeddingMemo
 
 
 class QdrantSemanticCache(BaseCache):
@@ -53,6 +54,7 @@ class QdrantSemanticCache(BaseCache):
             raise Exception("similarity_threshold must be provided, passed None")
         self.similarity_threshold = similarity_threshold
         self.embedding_model = embedding_model
+        self.embedding_memo = SemanticCacheEmbeddingMemo()
         headers = {}
 
         # check if defined as os.environ/ variable
@@ -166,17 +168,20 @@ class QdrantSemanticCache(BaseCache):
             cached_response = ast.literal_eval(cached_response)
         return cached_response
 
-    def set_cache(self, key, value, **kwargs):
-        print_verbose(f"qdrant semantic-cache set_cache, kwargs: {kwargs}")
-        import uuid
-
-        # get the prompt
-        messages = kwargs["messages"]
+    def _get_prompt(self, messages: List[Any]) -> str:
+        """
+        Text used to embed + match the request messages.
+        """
         prompt = ""
         for message in messages:
             prompt += message["content"]
+        return prompt
+
+    def _get_embedding(self, prompt: str) -> List[float]:
+        embedding = self.embedding_memo.get(prompt)
+        if embedding is not None:
+            return embedding
 
-        # create an embedding for prompt
         embedding_response = cast(
             EmbeddingResponse,
             litellm.embedding(
@@ -185,9 +190,55 @@ class QdrantSemanticCache(BaseCache):
                 cache={"no-store": True, "no-cache": True},
             ),
         )
+        embedding = embedding_response["data"][0]["embedding"]
+        self.embedding_memo.set(prompt, embedding)
+        return embedding
+
+    async def _get_async_embedding(self, prompt: str, **kwargs) -> List[float]:
+        from litellm.proxy.proxy_server import llm_model_list, llm_router
+
+        embedding = self.embedding_memo.get(prompt)
+        if embedding is not None:
+            return embedding
+
+        router_model_names = (
+            [m["model_name"] for m in llm_model_list]
+            if llm_model_list is not None
+            else []
+        )
+        if llm_router is not None and self.embedding_model in router_model_names:
+            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
+            embedding_response = await llm_router.aembedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+                metadata={
+                    "user_api_key": user_api_key,
+                    "semantic-cache-embedding": True,
+                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
+                },
+            )
+        else:
+            embedding_response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+            )
 
-        # get the embedding
         embedding = embedding_response["data"][0]["embedding"]
+        self.embedding_memo.set(prompt, embedding)
+        return embedding
+
+    def set_cache(self, key, value, **kwargs):
+        print_verbose(f"qdrant semantic-cache set_cache, kwargs: {kwargs}")
+        import uuid
+
+        # get the prompt
+        messages = kwargs["messages"]
+        prompt = self._get_prompt(messages)
+
+        # create an embedding for prompt
+        embedding = self._get_embedding(prompt)
 
         value = str(value)
         assert isinstance(value, str)
@@ -216,22 +267,10 @@ class QdrantSemanticCache(BaseCache):
 
         # get the messages
         messages = kwargs["messages"]
-        prompt = ""
-        for message in messages:
-            prompt += message["content"]
+        prompt = self._get_prompt(messages)
 
         # convert to embedding
-        embedding_response = cast(
-            EmbeddingResponse,
-            litellm.embedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            ),
-        )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        embedding = self._get_embedding(prompt)
 
         data = {
             "vector": embedding,
@@ -281,43 +320,13 @@ class QdrantSemanticCache(BaseCache):
     async def async_set_cache(self, key, value, **kwargs):
         import uuid
 
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
-
         print_verbose(f"async qdrant semantic-cache set_cache, kwargs: {kwargs}")
 
         # get the prompt
         messages = kwargs["messages"]
-        prompt = ""
-        for message in messages:
-            prompt += message["content"]
+        prompt = self._get_prompt(messages)
         # create an embedding for prompt
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        embedding = await self._get_async_embedding(prompt, **kwargs)
 
         value = str(value)
         assert isinstance(value, str)
@@ -344,41 +353,13 @@ class QdrantSemanticCache(BaseCache):
 
     async def async_get_cache(self, key, **kwargs):
         print_verbose(f"async qdrant semantic-cache get_cache, kwargs: {kwargs}")
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
 
         # get the messages
         messages = kwargs["messages"]
-        prompt = ""
-        for message in messages:
-            prompt += message["content"]
+        prompt = self._get_prompt(messages)
 
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        # convert to embedding
+        embedding = await self._get_async_embedding(prompt, **kwargs)
 
         data = {
             "vector": embedding,
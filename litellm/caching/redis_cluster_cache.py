@@ -3,9 +3,11 @@ Redis Cluster Cache implementation
 
 Key differences:
 - RedisClient NEEDs to be re-used across requests, adds 3000ms latency if it's re-created
+- Multi-key operations must not cross hash slots. Batch reads are grouped by hash slot, and sent as one pipeline per node.
+  Keys that must be read / written together (e.g. a rate limit descriptor's window + counter) should share a hash tag - `{tag}:suffix`
 """
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from litellm.caching.redis_cache import RedisCache
 
@@ -54,6 +56,35 @@ class RedisClusterCache(RedisCache):
     async def _async_run_redis_mget_operation(self, keys: List[str]) -> List[Any]:
         """
         Overrides `_async_run_redis_mget_operation` in redis_cache.py
+
+        One MGET per hash slot, all sent in a single cluster pipeline - redis-py sends each node's commands as one pipeline, to all nodes concurrently.
         """
         async_redis_cluster_client = self.init_async_client()
-        return await async_redis_cluster_client.mget_nonatomic(keys=keys)  # type: ignore
+        keys_by_hash_slot = self.group_keys_by_hash_slot(keys=keys)
+        async with async_redis_cluster_client.pipeline(transaction=False) as pipe:
+            for slot_keys in keys_by_hash_slot.values():
+                pipe.mget(slot_keys)
+            slot_results = await pipe.execute()
+
+        values_by_key: Dict[str, Any] = {}
+        for slot_keys, slot_values in zip(keys_by_hash_slot.values(), slot_results):
+            values_by_key.update(zip(slot_keys, slot_values))
+        return [values_by_key.get(key) for key in keys]
+
+    @staticmethod
+    def get_hash_slot(key: str) -> int:
+        """
+        Redis cluster hash slot of `key` - respects hash tags, e.g. `{api_key:sk-1}:requests` and `{api_key:sk-1}:window` share a slot.
+        """
+        from redis.crc import key_slot
+
+        return key_slot(key.encode("utf-8"))
+
+    def group_keys_by_hash_slot(self, keys: List[str]) -> Dict[int, List[str]]:
+        """
+        Group keys by hash slot, keeping their relative order.
+        """
+        keys_by_hash_slot: Dict[int, List[str]] = {}
+        for key in keys:
+            keys_by_hash_slot.setdefault(self.get_hash_slot(key), []).append(key)
+        return keys_by_hash_slot
@@ -23,6 +23,7 @@ from litellm.litellm_core_utils.prompt_templates.common_utils import (
 from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .local_semantic_cache import SemanticCacheEmbeddingMemo
 
 
 class RedisSemanticCache(BaseCache):
@@ -86,6 +87,7 @@ class RedisSemanticCache(BaseCache):
         # While similarity: 1 = most similar, 0 = least similar
         self.distance_threshold = 1 - similarity_threshold
         self.embedding_model = embedding_model
+        self.embedding_memo = SemanticCacheEmbeddingMemo()
 
         # Set up Redis connection
         if redis_url is None:
@@ -142,6 +144,10 @@ class RedisSemanticCache(BaseCache):
         Returns:
             List[float]: The embedding vector
         """
+        embedding = self.embedding_memo.get(prompt)
+        if embedding is not None:
+            return embedding
+
         # Create an embedding from prompt
         embedding_response = cast(
             EmbeddingResponse,
@@ -152,8 +158,15 @@ class RedisSemanticCache(BaseCache):
             ),
         )
         embedding = embedding_response["data"][0]["embedding"]
+        self.embedding_memo.set(prompt, embedding)
         return embedding
 
+    def _get_prompt(self, messages: List[Any]) -> str:
+        """
+        Text used to embed + match the request messages.
+        """
+        return get_str_from_messages(messages)
+
     def _get_cache_logic(self, cached_response: Any) -> Any:
         """
         Process the cached response to prepare it for use.
@@ -281,6 +294,10 @@ class RedisSemanticCache(BaseCache):
         """
         from litellm.proxy.proxy_server import llm_model_list, llm_router
 
+        embedding = self.embedding_memo.get(prompt)
+        if embedding is not None:
+            return embedding
+
         # Route the embedding request through the proxy if appropriate
         router_model_names = (
             [m["model_name"] for m in llm_model_list]
@@ -311,7 +328,9 @@ class RedisSemanticCache(BaseCache):
                 )
 
             # Extract and return the embedding vector
-            return embedding_response["data"][0]["embedding"]
+            embedding = embedding_response["data"][0]["embedding"]
+            self.embedding_memo.set(prompt, embedding)
+            return embedding
         except Exception as e:
             print_verbose(f"Error generating async embedding: {str(e)}")
             raise ValueError(f"Failed to generate embedding: {str(e)}") from e
@@ -1,6 +1,8 @@
 """
 S3 Cache implementation
-WARNING: DO NOT USE THIS IN PRODUCTION - This is not ASYNC
+
+Talks to S3 over the shared (pooled) httpx clients, signing each request with SigV4.
+Async methods never block the event loop, and at most `max_concurrency` requests are in-flight per cache.
 
 Has 4 methods:
     - set_cache
@@ -11,10 +13,23 @@ Has 4 methods:
 
 import ast
 import asyncio
+import hashlib
 import json
-from typing import Optional
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import httpx
 
 from litellm._logging import print_verbose, verbose_logger
+from litellm.constants import DEFAULT_S3_CACHE_MAX_CONCURRENCY
+from litellm.litellm_core_utils.asyncify import asyncify
+from litellm.llms.custom_httpx.http_handler import (
+    _get_httpx_client,
+    get_async_httpx_client,
+    httpxSpecialProvider,
+)
 
 from .base_cache import BaseCache
 
@@ -33,118 +48,237 @@ class S3Cache(BaseCache):
         s3_aws_session_token=None,
         s3_config=None,
         s3_path=None,
+        max_concurrency: int = DEFAULT_S3_CACHE_MAX_CONCURRENCY,
         **kwargs,
     ):
-        import boto3
+        from litellm.llms.bedrock.base_aws_llm import BaseAWSLLM
+
+        super().__init__()
+        # credential resolution (env vars, profiles, role assumption) + caching
+        self.base_aws_llm = BaseAWSLLM()
 
         self.bucket_name = s3_bucket_name
         self.key_prefix = s3_path.rstrip("/") + "/" if s3_path else ""
-        # Create an S3 client with custom endpoint URL
-
-        self.s3_client = boto3.client(
-            "s3",
-            region_name=s3_region_name,
-            endpoint_url=s3_endpoint_url,
-            api_version=s3_api_version,
-            use_ssl=s3_use_ssl,
-            verify=s3_verify,
-            aws_access_key_id=s3_aws_access_key_id,
-            aws_secret_access_key=s3_aws_secret_access_key,
-            aws_session_token=s3_aws_session_token,
-            config=s3_config,
-            **kwargs,
+        self.s3_region_name = (
+            self.base_aws_llm.get_aws_region_name_for_non_llm_api_calls(
+                aws_region_name=s3_region_name
+            )
+        )
+        self.s3_use_ssl = s3_use_ssl
+        self.s3_verify = s3_verify
+        self.s3_endpoint_url = s3_endpoint_url.rstrip("/") if s3_endpoint_url else None
+        self.s3_aws_access_key_id = s3_aws_access_key_id
+        self.s3_aws_secret_access_key = s3_aws_secret_access_key
+        self.s3_aws_session_token = s3_aws_session_token
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[
+            asyncio.Semaphore
+        ] = None  # created on first async call
+
+    @property
+    def _httpx_client_params(self) -> Optional[dict]:
+        if self.s3_verify is None:
+            return None
+        return {"ssl_verify": self.s3_verify}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_object_url(self, key: str) -> str:
+        object_key = quote(self.key_prefix + key, safe="/~")
+        if self.s3_endpoint_url is not None:
+            # custom endpoints (minio, localstack, ...) - path style
+            return f"{self.s3_endpoint_url}/{self.bucket_name}/{object_key}"
+        scheme = "https" if self.s3_use_ssl is not False else "http"
+        return f"{scheme}://{self.bucket_name}.s3.{self.s3_region_name}.amazonaws.com/{object_key}"
+
+    def _get_s3_credentials(self):
+        return self.base_aws_llm.get_credentials(
+            aws_access_key_id=self.s3_aws_access_key_id,
+            aws_secret_access_key=self.s3_aws_secret_access_key,
+            aws_session_token=self.s3_aws_session_token,
+            aws_region_name=self.s3_region_name,
+        )
+
+    def _sign_s3_request(
+        self,
+        credentials,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+    ) -> Dict[str, str]:
+        try:
+            from botocore.auth import S3SigV4Auth
+            from botocore.awsrequest import AWSRequest
+        except ImportError:
+            raise ImportError(
+                "Missing boto3 to use s3 caching. Run 'pip install boto3'."
+            )
+
+        headers = {
+            **headers,
+            "x-amz-content-sha256": hashlib.sha256(data or b"").hexdigest(),
+        }
+        aws_request = AWSRequest(method=method, url=url, data=data, headers=headers)
+        S3SigV4Auth(credentials, "s3", self.s3_region_name).add_auth(aws_request)
+        return dict(aws_request.headers.items())
+
+    def _get_put_request(
+        self, key: str, value: Any, ttl: Optional[Union[int, float]]
+    ) -> Tuple[str, Dict[str, str], bytes]:
+        url = self._get_object_url(key)
+        # Convert value to JSON before storing in S3
+        serialized_value = json.dumps(value).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Language": "en",
+            "Content-Disposition": f'inline; filename="{self.key_prefix + key}.json"',
+        }
+        if ttl is not None:
+            headers["Cache-Control"] = f"immutable, max-age={ttl}, s-maxage={ttl}"
+            # Calculate expiration time - checked when the object is read
+            headers["Expires"] = formatdate(time.time() + float(ttl), usegmt=True)
+        else:
+            headers["Cache-Control"] = "immutable, max-age=31536000, s-maxage=31536000"
+        return url, headers, serialized_value
+
+    def _process_get_response(
+        self, key: str, response: httpx.Response
+    ) -> Optional[dict]:
+        if response.status_code == 404:
+            verbose_logger.debug(
+                "S3 Cache: The specified key '%s' does not exist in the S3 bucket.",
+                key,
+            )
+            return None
+        response.raise_for_status()
+
+        expires = response.headers.get("Expires")
+        if expires is not None:
+            try:
+                if parsedate_to_datetime(expires).timestamp() <= time.time():
+                    return None
+            except (TypeError, ValueError):
+                pass
+
+        # cached_response is in `b{} convert it to ModelResponse
+        cached_response: Any = response.content.decode("utf-8")
+        try:
+            cached_response = json.loads(
+                cached_response
+            )  # Convert string to dictionary
+        except Exception:
+            cached_response = ast.literal_eval(cached_response)
+        if not isinstance(cached_response, dict):
+            cached_response = dict(cached_response)
+        verbose_logger.debug(
+            "Got S3 Cache: key: %s, cached_response %s. Type Response %s",
+            key,
+            cached_response,
+            type(cached_response),
         )
+        return cached_response
 
     def set_cache(self, key, value, **kwargs):
         try:
             print_verbose(f"LiteLLM SET Cache - S3. Key={key}. Value={value}")
-            ttl = kwargs.get("ttl", None)
-            # Convert value to JSON before storing in S3
-            serialized_value = json.dumps(value)
-            key = self.key_prefix + key
-
-            if ttl is not None:
-                cache_control = f"immutable, max-age={ttl}, s-maxage={ttl}"
-                import datetime
-
-                # Calculate expiration time
-                expiration_time = datetime.datetime.now() + ttl
-
-                # Upload the data to S3 with the calculated expiration time
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Body=serialized_value,
-                    Expires=expiration_time,
-                    CacheControl=cache_control,
-                    ContentType="application/json",
-                    ContentLanguage="en",
-                    ContentDisposition=f'inline; filename="{key}.json"',
-                )
-            else:
-                cache_control = "immutable, max-age=31536000, s-maxage=31536000"
-                # Upload the data to S3 without specifying Expires
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Body=serialized_value,
-                    CacheControl=cache_control,
-                    ContentType="application/json",
-                    ContentLanguage="en",
-                    ContentDisposition=f'inline; filename="{key}.json"',
-                )
+            url, headers, data = self._get_put_request(
+                key=key, value=value, ttl=kwargs.get("ttl", None)
+            )
+            signed_headers = self._sign_s3_request(
+                credentials=self._get_s3_credentials(),
+                method="PUT",
+                url=url,
+                headers=headers,
+                data=data,
+            )
+            response = _get_httpx_client(params=self._httpx_client_params).put(
+                url=url, data=data, headers=signed_headers  # type: ignore
+            )
+            # unlike the async client, HTTPHandler.put doesn't raise on error responses
+            response.raise_for_status()
         except Exception as e:
             # NON blocking - notify users S3 is throwing an exception
             print_verbose(f"S3 Caching: set_cache() - Got exception from S3: {e}")
 
     async def async_set_cache(self, key, value, **kwargs):
-        self.set_cache(key=key, value=value, **kwargs)
+        try:
+            print_verbose(f"LiteLLM SET Cache - S3. Key={key}. Value={value}")
+            url, headers, data = self._get_put_request(
+                key=key, value=value, ttl=kwargs.get("ttl", None)
+            )
+            credentials = await asyncify(self._get_s3_credentials)()
+            signed_headers = self._sign_s3_request(
+                credentials=credentials,
+                method="PUT",
+                url=url,
+                headers=headers,
+                data=data,
+            )
+            async with self._get_semaphore():
+                await get_async_httpx_client(
+                    llm_provider=httpxSpecialProvider.Caching,
+                    params=self._httpx_client_params,
+                ).put(
+                    url=url, data=data, headers=signed_headers  # type: ignore
+                )
+        except Exception as e:
+            # NON blocking - notify users S3 is throwing an exception
+            print_verbose(f"S3 Caching: async_set_cache() - Got exception from S3: {e}")
 
     def get_cache(self, key, **kwargs):
-        import botocore
-
         try:
-            key = self.key_prefix + key
-
             print_verbose(f"Get S3 Cache: key: {key}")
-            # Download the data from S3
-            cached_response = self.s3_client.get_object(
-                Bucket=self.bucket_name, Key=key
+            url = self._get_object_url(key)
+            signed_headers = self._sign_s3_request(
+                credentials=self._get_s3_credentials(),
+                method="GET",
+                url=url,
+                headers={},
             )
-
-            if cached_response is not None:
-                # cached_response is in `b{} convert it to ModelResponse
-                cached_response = (
-                    cached_response["Body"].read().decode("utf-8")
-                )  # Convert bytes to string
-                try:
-                    cached_response = json.loads(
-                        cached_response
-                    )  # Convert string to dictionary
-                except Exception:
-                    cached_response = ast.literal_eval(cached_response)
-            if not isinstance(cached_response, dict):
-                cached_response = dict(cached_response)
-            verbose_logger.debug(
-                f"Got S3 Cache: key: {key}, cached_response {cached_response}. Type Response {type(cached_response)}"
+            # Download the data from S3
+            response = _get_httpx_client(params=self._httpx_client_params).get(
+                url=url, headers=signed_headers
             )
-
-            return cached_response
-        except botocore.exceptions.ClientError as e:  # type: ignore
-            if e.response["Error"]["Code"] == "NoSuchKey":
-                verbose_logger.debug(
-                    f"S3 Cache: The specified key '{key}' does not exist in the S3 bucket."
-                )
-                return None
-
+            return self._process_get_response(key=key, response=response)
         except Exception as e:
             # NON blocking - notify users S3 is throwing an exception
             verbose_logger.error(
                 f"S3 Caching: get_cache() - Got exception from S3: {e}"
             )
+            return None
 
     async def async_get_cache(self, key, **kwargs):
-        return self.get_cache(key=key, **kwargs)
+        try:
+            print_verbose(f"Get S3 Cache: key: {key}")
+            url = self._get_object_url(key)
+            credentials = await asyncify(self._get_s3_credentials)()
+            signed_headers = self._sign_s3_request(
+                credentials=credentials, method="GET", url=url, headers={}
+            )
+            async with self._get_semaphore():
+                response = await get_async_httpx_client(
+                    llm_provider=httpxSpecialProvider.Caching,
+                    params=self._httpx_client_params,
+                ).get(url=url, headers=signed_headers)
+            return self._process_get_response(key=key, response=response)
+        except Exception as e:
+            # NON blocking - notify users S3 is throwing an exception
+            verbose_logger.error(
+                f"S3 Caching: async_get_cache() - Got exception from S3: {e}"
+            )
+            return None
+
+    async def async_batch_get_cache(self, keys: List[str], **kwargs) -> List:
+        """
+        S3 has no multi-get, so issue the GETs concurrently - bounded by `max_concurrency`.
+        """
+        return await asyncio.gather(
+            *[self.async_get_cache(key=key, **kwargs) for key in keys]
+        )
 
     def flush_cache(self):
         pass
@@ -4,10 +4,26 @@ from typing import List, Literal
 ROUTER_MAX_FALLBACKS = int(os.getenv("ROUTER_MAX_FALLBACKS", 5))
 DEFAULT_BATCH_SIZE = int(os.getenv("DEFAULT_BATCH_SIZE", 512))
 DEFAULT_FLUSH_INTERVAL_SECONDS = int(os.getenv("DEFAULT_FLUSH_INTERVAL_SECONDS", 5))
+DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE = int(
+    os.getenv("DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE", 100000)
+)  # max queued events per batch logger, newer events are dropped above this
+DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES = int(
+    os.getenv("DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES", 4)
+)
+BATCH_LOGGER_MAX_FLUSH_RETRIES = int(os.getenv("BATCH_LOGGER_MAX_FLUSH_RETRIES", 2))
+BATCH_LOGGER_SPILL_DIR = os.getenv(
+    "BATCH_LOGGER_SPILL_DIR", None
+)  # if set, batches that fail to flush are written here, and re-sent on the next successful flush
 DEFAULT_S3_FLUSH_INTERVAL_SECONDS = int(
     os.getenv("DEFAULT_S3_FLUSH_INTERVAL_SECONDS", 10)
 )
 DEFAULT_S3_BATCH_SIZE = int(os.getenv("DEFAULT_S3_BATCH_SIZE", 512))
+DEFAULT_S3_CACHE_MAX_CONCURRENCY = int(
+    os.getenv("DEFAULT_S3_CACHE_MAX_CONCURRENCY", 64)
+)  # max in-flight s3 requests per S3Cache
+DEFAULT_DISK_CACHE_MAX_CONCURRENCY = int(
+    os.getenv("DEFAULT_DISK_CACHE_MAX_CONCURRENCY", 8)
+)  # max worker threads used by DiskCache async methods
 DEFAULT_SQS_FLUSH_INTERVAL_SECONDS = int(
     os.getenv("DEFAULT_SQS_FLUSH_INTERVAL_SECONDS", 10)
 )
@@ -38,6 +54,12 @@ DEFAULT_IMAGE_HEIGHT = int(os.getenv("DEFAULT_IMAGE_HEIGHT", 300))
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 1024)
 )  # 1MB = 1024KB
+MAX_CACHE_KEY_MESSAGE_HASHES = int(
+    os.getenv("MAX_CACHE_KEY_MESSAGE_HASHES", 1000)
+)  # per-message digests memoized when building cache keys - each entry keeps its message alive
+MAX_CACHE_KEY_MEMOIZED_MESSAGE_SIZE = int(
+    os.getenv("MAX_CACHE_KEY_MEMOIZED_MESSAGE_SIZE", 8192)
+)  # messages with more characters than this aren't memoized when building cache keys
 SINGLE_DEPLOYMENT_TRAFFIC_FAILURE_THRESHOLD = int(
     os.getenv("SINGLE_DEPLOYMENT_TRAFFIC_FAILURE_THRESHOLD", 1000)
 )  # Minimum number of requests to consider "reasonable traffic". Used for single-deployment cooldown logic.
@@ -59,8 +81,25 @@ MAX_TOKEN_TRIMMING_ATTEMPTS = int(
 )  # Maximum number of attempts to trim the message
 
 
+########## Callback dispatch constants ##############################################################
+DEFAULT_CALLBACK_DISPATCH_MAX_WORKERS = int(
+    os.getenv("DEFAULT_CALLBACK_DISPATCH_MAX_WORKERS", 100)
+)  # worker threads per callback dispatch lane
+DEFAULT_CALLBACK_DISPATCH_MAX_QUEUE_SIZE = int(
+    os.getenv("DEFAULT_CALLBACK_DISPATCH_MAX_QUEUE_SIZE", 10000)
+)  # queued callbacks per callback dispatch lane
+
 ########## Networking constants ##############################################################
 _DEFAULT_TTL_FOR_HTTPX_CLIENTS = 3600  # 1 hour, re-use the same httpx client for 1 hour
+MAX_HTTP_CONNECTION_POOLS = int(
+    os.getenv("MAX_HTTP_CONNECTION_POOLS", 200)
+)  # max number of httpx clients (connection pools) kept open by litellm
+HTTP_POOL_WARMUP_TIMEOUT = float(
+    os.getenv("HTTP_POOL_WARMUP_TIMEOUT", 10)
+)  # seconds, timeout for each connection opened while warming pools at proxy startup
+EVICTED_HTTP_POOL_CLOSE_CHECK_INTERVAL = float(
+    os.getenv("EVICTED_HTTP_POOL_CLOSE_CHECK_INTERVAL", 1)
+)  # seconds between checks for active connections on an evicted async http pool, before it is closed
 
 ########### v2 Architecture constants for managing writing updates to the database ###########
 REDIS_UPDATE_BUFFER_KEY = "litellm_spend_update_buffer"
@@ -72,6 +111,16 @@ MAX_SIZE_IN_MEMORY_QUEUE = int(os.getenv("MAX_SIZE_IN_MEMORY_QUEUE", 10000))
 MAX_IN_MEMORY_QUEUE_FLUSH_COUNT = int(
     os.getenv("MAX_IN_MEMORY_QUEUE_FLUSH_COUNT", 1000)
 )
+# general_settings.use_batched_spend_log_ingestion
+SPEND_LOGS_INGESTION_BATCH_SIZE = int(
+    os.getenv("SPEND_LOGS_INGESTION_BATCH_SIZE", 1000)
+)  # rows per multi-row insert / batched upsert
+SPEND_LOGS_INGESTION_MAX_CONCURRENT_BATCHES = int(
+    os.getenv("SPEND_LOGS_INGESTION_MAX_CONCURRENT_BATCHES", 4)
+)
+MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE = int(
+    os.getenv("MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE", 50000)
+)  # above this, requests wait for the queued spend logs to be written to the db
 ###############################################################################################
 MINIMUM_PROMPT_CACHE_TOKEN_COUNT = int(
     os.getenv("MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 1024)
@@ -138,6 +187,12 @@ REPEATED_STREAMING_CHUNK_LIMIT = int(
     os.getenv("REPEATED_STREAMING_CHUNK_LIMIT", 100)
 )  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
 DEFAULT_MAX_LRU_CACHE_SIZE = int(os.getenv("DEFAULT_MAX_LRU_CACHE_SIZE", 16))
+MAX_MODEL_NAME_RESOLUTION_CACHE_SIZE = int(
+    os.getenv("MAX_MODEL_NAME_RESOLUTION_CACHE_SIZE", 1024)
+)  # max number of (model, custom_llm_provider) -> potential model cost map keys resolutions memoised
+TOKEN_COUNTER_CACHE_SIZE = int(
+    os.getenv("TOKEN_COUNTER_CACHE_SIZE", 1000)
+)  # max number of per-message / per-tool-schema token counts cached by token_counter
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", 0.5))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", 8.0))
 JITTER = float(os.getenv("JITTER", 0.75))
@@ -171,6 +226,15 @@ TOGETHER_AI_EMBEDDING_150_M = int(os.getenv("TOGETHER_AI_EMBEDDING_150_M", 150))
 TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
+SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE", 1000)
+)  # prompt embeddings memoized per semantic cache
+LOCAL_SEMANTIC_CACHE_SNAPSHOT_INTERVAL_SECONDS = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_SNAPSHOT_INTERVAL_SECONDS", 60)
+)
+LOCAL_SEMANTIC_CACHE_TTL_SECONDS = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_TTL_SECONDS", 600)
+)  # default ttl of local semantic cache entries - bounds how long an entry expired on the remote cache is still served
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 512)
@@ -759,6 +823,7 @@ AZURE_STORAGE_MSFT_VERSION = "2019-07-07"
 PROMETHEUS_BUDGET_METRICS_REFRESH_INTERVAL_MINUTES = int(
     os.getenv("PROMETHEUS_BUDGET_METRICS_REFRESH_INTERVAL_MINUTES", 5)
 )
+MAX_PROMETHEUS_BOUND_METRICS = int(os.getenv("MAX_PROMETHEUS_BOUND_METRICS", 10000))
 MCP_TOOL_NAME_PREFIX = "mcp_tool"
 MAXIMUM_TRACEBACK_LINES_TO_LOG = int(os.getenv("MAXIMUM_TRACEBACK_LINES_TO_LOG", 100))
 
@@ -855,6 +920,22 @@ SPECIAL_LITELLM_AUTH_TOKEN = ["ui-token"]
 DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL = int(
     os.getenv("DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL", 60)
 )
+AUTH_OBJECT_REFRESH_AHEAD_RATIO = float(
+    os.getenv("AUTH_OBJECT_REFRESH_AHEAD_RATIO", 0.8)
+)
+MAX_AUTH_OBJECT_BACKGROUND_REFRESH_KEYS = int(
+    os.getenv("MAX_AUTH_OBJECT_BACKGROUND_REFRESH_KEYS", 1000)
+)
+MAX_JWT_VERIFIED_TOKEN_CACHE_SIZE = int(
+    os.getenv("MAX_JWT_VERIFIED_TOKEN_CACHE_SIZE", 10000)
+)
+JWT_PUBLIC_KEY_MIN_REFETCH_INTERVAL_SECONDS = int(
+    os.getenv("JWT_PUBLIC_KEY_MIN_REFETCH_INTERVAL_SECONDS", 10)
+)
+MAX_MODEL_ACCESS_MATCHERS = int(os.getenv("MAX_MODEL_ACCESS_MATCHERS", 1000))
+MAX_MODEL_ACCESS_MATCHER_DECISIONS = int(
+    os.getenv("MAX_MODEL_ACCESS_MATCHER_DECISIONS", 1000)
+)
 
 # Sentry Scrubbing Configuration
 SENTRY_DENYLIST = [
@@ -1,16 +1,87 @@
 """
-Custom Logger that handles batching logic 
+Custom Logger that handles batching logic
 
 Use this if you want your logs to be stored in memory and flushed periodically.
+
+- `log_queue` is bounded (`max_queue_size`) - events are dropped, not buffered without limit, when the sink can't keep up
+- `flush_queue` swaps `log_queue` for an empty queue before sending, so events logged during a slow `async_send_batch` go to the next batch instead of waiting on the flush
+- up to `max_concurrent_flushes` batches are sent at once, with retries + jitter when `async_send_batch` raises or returns False
+- if `BATCH_LOGGER_SPILL_DIR` is set, batches that still fail are written to disk, and re-sent after the next successful flush.
+  Override `_get_spillable_event` / `_restore_spilled_event` if queued events aren't plain json, or hold secrets.
 """
 
 import asyncio
+import contextvars
+import json
+import os
+import random
 import time
-from typing import List, Optional
+import uuid
+from typing import Any, Iterable, List, Optional, SupportsIndex, Tuple
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.constants import (
+    BATCH_LOGGER_MAX_FLUSH_RETRIES,
+    BATCH_LOGGER_SPILL_DIR,
+    DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES,
+    DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE,
+)
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.types.integrations.custom_batch_logger import CustomBatchLoggerMetrics
+
+# (logger, batch) being sent by `flush_queue` in the current task - `log_queue` returns the batch inside `async_send_batch`
+_flushing_log_queue: contextvars.ContextVar[
+    Optional[Tuple["CustomBatchLogger", "BoundedLogQueue"]]
+] = contextvars.ContextVar("flushing_log_queue", default=None)
+
+
+class BoundedLogQueue(list):
+    """
+    list of queued log events, that drops new events once it holds `max_size` events.
+
+    Stays a list, so integrations can send it as-is (e.g. `json=self.log_queue`).
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable = (),
+        max_size: int = DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE,
+    ):
+        super().__init__(iterable)
+        self.max_size = max_size
+        self.dropped_events = 0
+        self.first_event_time: Optional[float] = time.time() if len(self) > 0 else None
+
+    def _make_room(self, items: List) -> List:
+        """
+        Returns the leading `items` that fit in the queue, counting the rest as dropped
+        """
+        room = max(self.max_size - len(self), 0)
+        self.dropped_events += max(len(items) - room, 0)
+        items = items[:room]
+        if items and self.first_event_time is None:
+            self.first_event_time = time.time()
+        return items
+
+    def append(self, item: Any) -> None:
+        for _item in self._make_room([item]):
+            super().append(_item)
+
+    def insert(self, index: SupportsIndex, item: Any) -> None:
+        for _item in self._make_room([item]):
+            super().insert(index, _item)
+
+    def extend(self, iterable: Iterable) -> None:
+        super().extend(self._make_room(list(iterable)))
+
+    def __iadd__(self, iterable: Iterable) -> "BoundedLogQueue":  # type: ignore[override]
+        self.extend(iterable)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.first_event_time = None
 
 
 class CustomBatchLogger(CustomLogger):
@@ -19,20 +90,63 @@ class CustomBatchLogger(CustomLogger):
         flush_lock: Optional[asyncio.Lock] = None,
         batch_size: Optional[int] = None,
         flush_interval: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        max_concurrent_flushes: Optional[int] = None,
         **kwargs,
     ) -> None:
         """
         Args:
             flush_lock (Optional[asyncio.Lock], optional): Lock to use when flushing the queue. Defaults to None. Only used for custom loggers that do batching
+            max_queue_size (Optional[int], optional): Max events held in `log_queue`. Defaults to DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE
+            max_concurrent_flushes (Optional[int], optional): Max batches sent at once. Defaults to DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES
         """
-        self.log_queue: List = []
+        self.max_queue_size: int = max_queue_size or DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE
+        self.dropped_events = 0
+        self.failed_flushes = 0
+        self.spilled_events = 0
+        self.in_flight_flushes = 0
+        self.log_queue = []
         self.flush_interval = flush_interval or litellm.DEFAULT_FLUSH_INTERVAL_SECONDS
         self.batch_size: int = batch_size or litellm.DEFAULT_BATCH_SIZE
         self.last_flush_time = time.time()
         self.flush_lock = flush_lock
+        self.flush_semaphore = asyncio.Semaphore(
+            max_concurrent_flushes or DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES
+        )
 
         super().__init__(**kwargs)
 
+    @property
+    def log_queue(self) -> BoundedLogQueue:
+        """
+        Inside `async_send_batch` (called by `flush_queue`) - the batch being sent.
+        Everywhere else - the queue new events are appended to.
+        """
+        flushing_log_queue = _flushing_log_queue.get()
+        if flushing_log_queue is not None and flushing_log_queue[0] is self:
+            return flushing_log_queue[1]
+        return self._log_queue
+
+    @log_queue.setter
+    def log_queue(self, value: List) -> None:
+        flushing_log_queue = _flushing_log_queue.get()
+        if flushing_log_queue is not None and flushing_log_queue[0] is self:
+            flushing_log_queue[1][:] = value
+            return
+        current_log_queue = getattr(self, "_log_queue", None)
+        if current_log_queue is not None:
+            self.dropped_events = (
+                getattr(self, "dropped_events", 0) + current_log_queue.dropped_events
+            )
+        if not isinstance(value, BoundedLogQueue):
+            value = BoundedLogQueue(
+                value,
+                max_size=getattr(
+                    self, "max_queue_size", DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE
+                ),
+            )
+        self._log_queue = value
+
     async def periodic_flush(self):
         while True:
             await asyncio.sleep(self.flush_interval)
@@ -46,13 +160,182 @@ class CustomBatchLogger(CustomLogger):
             return
 
         async with self.flush_lock:
-            if self.log_queue:
-                verbose_logger.debug(
-                    "CustomLogger: Flushing batch of %s events", len(self.log_queue)
-                )
-                await self.async_send_batch()
-                self.log_queue.clear()
-                self.last_flush_time = time.time()
-
-    async def async_send_batch(self, *args, **kwargs):
+            # only held for the swap - producers append to the new queue while this batch is sent
+            if not self.log_queue:
+                return
+            batch = self.log_queue
+            self.log_queue = []
+
+        verbose_logger.debug("CustomLogger: Flushing batch of %s events", len(batch))
+        if await self._send_batch_with_retries(batch) is True:
+            self.last_flush_time = time.time()
+            await self._resend_spilled_batch()
+
+    async def async_send_batch(self, *args, **kwargs) -> Optional[bool]:
+        """
+        Send `self.log_queue`. Raise, or return False, if the batch should be retried.
+        """
         pass
+
+    def get_batch_metrics(self) -> CustomBatchLoggerMetrics:
+        log_queue = self._log_queue
+        return CustomBatchLoggerMetrics(
+            logger=type(self).__name__,
+            queue_size=len(log_queue),
+            max_queue_size=self.max_queue_size,
+            dropped_events=self.dropped_events + log_queue.dropped_events,
+            in_flight_flushes=self.in_flight_flushes,
+            failed_flushes=self.failed_flushes,
+            spilled_events=self.spilled_events,
+            lag_seconds=(
+                time.time() - log_queue.first_event_time
+                if log_queue.first_event_time is not None
+                else None
+            ),
+        )
+
+    async def _send_batch_with_retries(self, batch: BoundedLogQueue) -> bool:
+        """
+        Send `batch` via `async_send_batch`, retrying with jittered backoff if it raises or returns False.
+
+        If a failed `async_send_batch` leaves events in the batch, only those are retried - e.g. the ones that failed to upload.
+        If it empties the batch, the whole batch is retried.
+
+        Returns False if the batch could not be sent - it is spilled to disk, if `BATCH_LOGGER_SPILL_DIR` is set.
+        """
+        # keep the events, in case `async_send_batch` clears the batch before failing
+        events = list(batch)
+        async with self.flush_semaphore:
+            self.in_flight_flushes += 1
+            try:
+                for attempt in range(BATCH_LOGGER_MAX_FLUSH_RETRIES + 1):
+                    if attempt > 0:
+                        await asyncio.sleep(self._get_retry_delay(attempt))
+                    token = _flushing_log_queue.set((self, batch))
+                    try:
+                        if await self.async_send_batch() is False:
+                            raise Exception("async_send_batch returned False")
+                        return True
+                    except Exception as e:
+                        verbose_logger.warning(
+                            "%s: failed to send batch of %s events, attempt %s/%s - %s",
+                            type(self).__name__,
+                            len(events),
+                            attempt + 1,
+                            BATCH_LOGGER_MAX_FLUSH_RETRIES + 1,
+                            str(e),
+                        )
+                    finally:
+                        _flushing_log_queue.reset(token)
+                    if len(batch) > 0:
+                        events = list(batch)
+                    else:
+                        batch[:] = events
+            finally:
+                self.in_flight_flushes -= 1
+
+        self.failed_flushes += 1
+        self._spill_batch(events)
+        return False
+
+    @staticmethod
+    def _get_retry_delay(attempt: int) -> float:
+        """
+        Exponential backoff with full jitter, so loggers don't retry in lockstep
+        """
+        return random.uniform(
+            0, min(2**attempt, litellm.DEFAULT_FLUSH_INTERVAL_SECONDS)
+        )
+
+    def _get_spill_dir(self) -> Optional[str]:
+        if BATCH_LOGGER_SPILL_DIR is None:
+            return None
+        return os.path.join(BATCH_LOGGER_SPILL_DIR, type(self).__name__)
+
+    def _get_spillable_event(self, event: Any) -> Optional[Any]:
+        """
+        json-serializable copy of a queued event, written to disk when its batch is spilled.
+
+        Return None to drop the event instead.
+        """
+        return event
+
+    def _restore_spilled_event(self, spilled_event: Any) -> Optional[Any]:
+        """
+        Inverse of `_get_spillable_event` - the queued event to re-send. Return None to drop the event.
+        """
+        return spilled_event
+
+    def _spill_batch(self, events: List) -> None:
+        spill_dir = self._get_spill_dir()
+        if spill_dir is None:
+            verbose_logger.error(
+                "%s: dropped batch of %s events after %s failed attempts",
+                type(self).__name__,
+                len(events),
+                BATCH_LOGGER_MAX_FLUSH_RETRIES + 1,
+            )
+            return
+        from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+
+        try:
+            spillable_events = [
+                spillable_event
+                for spillable_event in map(self._get_spillable_event, events)
+                if spillable_event is not None
+            ]
+            if len(spillable_events) == 0:
+                return
+            os.makedirs(spill_dir, exist_ok=True)
+            spill_file = os.path.join(
+                spill_dir, f"{time.time_ns()}-{uuid.uuid4()}.jsonl"
+            )
+            with open(spill_file, "w") as f:
+                for spillable_event in spillable_events:
+                    f.write(safe_dumps(spillable_event) + "\n")
+            self.spilled_events += len(spillable_events)
+        except Exception as e:
+            verbose_logger.exception(
+                "%s: failed to spill batch of %s events to %s - %s",
+                type(self).__name__,
+                len(events),
+                spill_dir,
+                str(e),
+            )
+
+    async def _resend_spilled_batch(self) -> None:
+        """
+        After a successful flush, re-send the oldest spilled batch. It is spilled again if it fails.
+        """
+        spill_dir = self._get_spill_dir()
+        if spill_dir is None or not os.path.isdir(spill_dir):
+            return
+        spill_files = sorted(os.listdir(spill_dir))
+        if len(spill_files) == 0:
+            return
+
+        spill_file = os.path.join(spill_dir, spill_files[0])
+        try:
+            with open(spill_file) as f:
+                spilled_events = [json.loads(line) for line in f if line.strip()]
+            os.remove(spill_file)
+        except Exception as e:
+            verbose_logger.exception(
+                "%s: failed to read spilled batch %s - %s",
+                type(self).__name__,
+                spill_file,
+                str(e),
+            )
+            return
+
+        self.spilled_events = max(self.spilled_events - len(spilled_events), 0)
+        events = [
+            event
+            for event in map(self._restore_spilled_event, spilled_events)
+            if event is not None
+        ]
+        if len(events) == 0:
+            return
+        await self._send_batch_with_retries(
+            BoundedLogQueue(events, max_size=len(events))
+        )
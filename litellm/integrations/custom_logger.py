@@ -9,6 +9,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -55,8 +56,28 @@ else:
     PreRoutingHookResponse = Any
 
 
+# methods passed the logging kwargs, incl. the `StandardLoggingPayload` (kwargs["standard_logging_object"])
+_STANDARD_LOGGING_PAYLOAD_METHODS = (
+    "log_success_event",
+    "log_failure_event",
+    "log_stream_event",
+    "async_log_success_event",
+    "async_log_failure_event",
+    "async_log_stream_event",
+    "logging_hook",
+    "async_logging_hook",
+    "log_event",
+    "async_log_event",
+)
+
+
 class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callback#callback-class
     # Class variables or attributes
+
+    # `StandardLoggingPayload` fields read by this callback, e.g. {"model_group", "response_cost"}. None = all fields.
+    # If every callback of a request declares its fields, only their union is built (see `get_standard_logging_object_payload`)
+    standard_logging_payload_fields: Optional[Set[str]] = None
+
     def __init__(
         self, 
         turn_off_message_logging: bool = False,
@@ -74,6 +95,20 @@ class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callbac
         self.turn_off_message_logging = turn_off_message_logging
         pass
 
+    def get_standard_logging_payload_fields(self) -> Optional[Set[str]]:
+        """
+        `StandardLoggingPayload` fields read by this callback. Override if they depend on runtime settings.
+
+        Callbacks that only implement hooks (e.g. guardrails), and none of the logging events, read no fields.
+        """
+        if self.standard_logging_payload_fields is None and not any(
+            getattr(getattr(self, method), "__func__", None)
+            is not getattr(CustomLogger, method)
+            for method in _STANDARD_LOGGING_PAYLOAD_METHODS
+        ):
+            return set()
+        return self.standard_logging_payload_fields
+
     def log_pre_api_call(self, model, messages, kwargs):
         pass
 
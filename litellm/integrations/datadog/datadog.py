@@ -146,8 +146,8 @@ class DataDogLogger(
 
         DD Ref: https://docs.datadoghq.com/api/latest/logs/
 
-        Raises:
-            Raises a NON Blocking verbose_logger.exception if an error occurs
+        Returns:
+            False if the batch should be retried - errors are logged, not raised
         """
         try:
             if not self.log_queue:
@@ -180,6 +180,7 @@ class DataDogLogger(
             verbose_logger.exception(
                 f"Datadog Error sending batch API - {str(e)}\n{traceback.format_exc()}"
             )
+            return False
 
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
         """
@@ -109,10 +109,12 @@ class GCSBucketLogger(GCSBucketBase, AdditionalLoggingUtils):
             - collect the logs to flush every `GCS_FLUSH_INTERVAL` seconds
             - during async_send_batch, we make 1 POST request per log to GCS Bucket
 
+        Returns False if any log failed to upload - only the failed logs are kept in the queue, to be retried
         """
         if not self.log_queue:
             return
 
+        failed_log_items: List[GCSLogQueueItem] = []
         for log_item in self.log_queue:
             logging_payload = log_item["payload"]
             kwargs = log_item["kwargs"]
@@ -141,10 +143,41 @@ class GCSBucketLogger(GCSBucketBase, AdditionalLoggingUtils):
                 verbose_logger.exception(
                     f"GCS Bucket error logging payload to GCS bucket: {str(e)}"
                 )
-                pass
+                failed_log_items.append(log_item)
 
         # Clear the queue after processing
         self.log_queue.clear()
+        if failed_log_items:
+            self.log_queue = failed_log_items
+            return False
+
+    def _get_spillable_event(self, event: GCSLogQueueItem) -> Optional[Any]:
+        """
+        Spill only what `async_send_batch` reads - not the full request kwargs, which hold api keys
+        """
+        kwargs = event["kwargs"]
+        spillable_kwargs: Dict[str, Any] = {}
+        standard_callback_dynamic_params = kwargs.get(
+            "standard_callback_dynamic_params", None
+        )
+        if standard_callback_dynamic_params is not None:
+            spillable_kwargs["standard_callback_dynamic_params"] = {
+                key: standard_callback_dynamic_params[key]
+                for key in ("gcs_bucket_name", "gcs_path_service_account")
+                if standard_callback_dynamic_params.get(key) is not None
+            }
+        _litellm_params = kwargs.get("litellm_params", None) or {}
+        _metadata = _litellm_params.get("metadata", None) or {}
+        if "gcs_log_id" in _metadata:
+            spillable_kwargs["litellm_params"] = {
+                "metadata": {"gcs_log_id": _metadata["gcs_log_id"]}
+            }
+        response_obj = event.get("response_obj", None) or {}
+        return {
+            "payload": event["payload"],
+            "kwargs": spillable_kwargs,
+            "response_obj": {"id": response_obj.get("id", "")},
+        }
 
     def _get_object_name(
         self, kwargs: Dict, logging_payload: StandardLoggingPayload, response_obj: Any
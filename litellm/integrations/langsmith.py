@@ -1,6 +1,7 @@
 #### What this does ####
 #    On success, logs events to Langsmith
 import asyncio
+import hashlib
 import os
 import random
 import traceback
@@ -67,6 +68,8 @@ class LangsmithLogger(CustomBatchLogger):
         if _batch_size:
             self.batch_size = int(_batch_size)
         self.log_queue: List[LangsmithQueueObject] = []
+        # api key hash -> api key, for batches spilled to disk without their api key
+        self._spilled_api_keys: Dict[str, str] = {}
         asyncio.create_task(self.periodic_flush())
 
     def get_credentials_from_env(
@@ -339,16 +342,21 @@ class LangsmithLogger(CustomBatchLogger):
 
 
         This was added to support key/team based logging on langsmith
+
+        Returns False if any batch failed to log, so the queue is retried
         """
         if not self.log_queue:
             return
 
         batch_groups = self._group_batches_by_credentials()
+        all_logged = True
         for batch_group in batch_groups.values():
-            await self._log_batch_on_langsmith(
+            logged = await self._log_batch_on_langsmith(
                 credentials=batch_group.credentials,
                 queue_objects=batch_group.queue_objects,
             )
+            all_logged = all_logged and logged
+        return all_logged
 
     def _add_endpoint_to_url(
         self, url: str, endpoint: str, api_version: str = "/api/v1"
@@ -364,7 +372,7 @@ class LangsmithLogger(CustomBatchLogger):
         self,
         credentials: LangsmithCredentialsObject,
         queue_objects: List[LangsmithQueueObject],
-    ):
+    ) -> bool:
         """
         Logs a batch of runs to Langsmith
         sends runs to /batch endpoint for the given credentials
@@ -373,7 +381,7 @@ class LangsmithLogger(CustomBatchLogger):
             credentials: LangsmithCredentialsObject
             queue_objects: List[LangsmithQueueObject]
 
-        Returns: None
+        Returns: True if the batch was logged
 
         Raises: Does not raise an exception, will only verbose_logger.exception()
         """
@@ -398,10 +406,11 @@ class LangsmithLogger(CustomBatchLogger):
                 verbose_logger.error(
                     f"Langsmith Error: {response.status_code} - {response.text}"
                 )
-            else:
-                verbose_logger.debug(
-                    f"Batch of {len(self.log_queue)} runs successfully created"
-                )
+                return False
+            verbose_logger.debug(
+                f"Batch of {len(self.log_queue)} runs successfully created"
+            )
+            return True
         except httpx.HTTPStatusError as e:
             verbose_logger.exception(
                 f"Langsmith HTTP Error: {e.response.status_code} - {e.response.text}"
@@ -410,6 +419,7 @@ class LangsmithLogger(CustomBatchLogger):
             verbose_logger.exception(
                 f"Langsmith Layer Error - {traceback.format_exc()}"
             )
+        return False
 
     def _group_batches_by_credentials(self) -> Dict[CredentialsKey, BatchGroup]:
         """Groups queue objects by credentials using a proper key structure"""
@@ -461,6 +471,50 @@ class LangsmithLogger(CustomBatchLogger):
             credentials = self.default_credentials
         return credentials
 
+    @staticmethod
+    def _hash_api_key(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def _get_spillable_event(self, event: LangsmithQueueObject) -> Optional[Any]:
+        """
+        Spilled batches are written to disk without the api key - only its hash, to find it again on re-send
+        """
+        credentials = event["credentials"]
+        api_key_hash = self._hash_api_key(credentials["LANGSMITH_API_KEY"])
+        self._spilled_api_keys[api_key_hash] = credentials["LANGSMITH_API_KEY"]
+        return {
+            "data": event["data"],
+            "credentials": {
+                "LANGSMITH_API_KEY_HASH": api_key_hash,
+                "LANGSMITH_PROJECT": credentials["LANGSMITH_PROJECT"],
+                "LANGSMITH_BASE_URL": credentials["LANGSMITH_BASE_URL"],
+            },
+        }
+
+    def _restore_spilled_event(
+        self, spilled_event: Dict[str, Any]
+    ) -> Optional[LangsmithQueueObject]:
+        spilled_credentials = spilled_event["credentials"]
+        api_key_hash = spilled_credentials["LANGSMITH_API_KEY_HASH"]
+        api_key = self._spilled_api_keys.get(api_key_hash)
+        if api_key is None and api_key_hash == self._hash_api_key(
+            self.default_credentials["LANGSMITH_API_KEY"]
+        ):
+            api_key = self.default_credentials["LANGSMITH_API_KEY"]
+        if api_key is None:
+            verbose_logger.warning(
+                "Langsmith: dropping spilled event - its api key is no longer known"
+            )
+            return None
+        return LangsmithQueueObject(
+            data=spilled_event["data"],
+            credentials=LangsmithCredentialsObject(
+                LANGSMITH_API_KEY=api_key,
+                LANGSMITH_PROJECT=spilled_credentials["LANGSMITH_PROJECT"],
+                LANGSMITH_BASE_URL=spilled_credentials["LANGSMITH_BASE_URL"],
+            ),
+        )
+
     def _send_batch(self):
         """Calls async_send_batch in an event loop"""
         if not self.log_queue:
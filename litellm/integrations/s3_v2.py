@@ -8,7 +8,7 @@ NOTE 1: S3 does not provide a BATCH PUT API endpoint, so we create tasks to uplo
 
 import asyncio
 from datetime import datetime
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
@@ -245,7 +245,10 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
 
     async def async_upload_data_to_s3(
         self, batch_logging_element: s3BatchLoggingElement
-    ):
+    ) -> bool:
+        """
+        Returns True if the element was uploaded
+        """
         try:
             import hashlib
 
@@ -314,15 +317,17 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
                 url, data=json_string, headers=signed_headers
             )
             response.raise_for_status()
+            return True
         except Exception as e:
             verbose_logger.exception(f"Error uploading to s3: {str(e)}")
+            return False
 
     async def async_send_batch(self):
         """
 
         Sends runs from self.log_queue
 
-        Returns: None
+        Returns: False if any element failed to upload - only the failed elements are kept in the queue, to be retried
 
         Raises: Does not raise an exception, will only verbose_logger.exception()
         """
@@ -335,8 +340,31 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
         #  the log queue can be bounded by DEFAULT_S3_BATCH_SIZE
         #  see custom_batch_logger.py which triggers the flush
         #########################################################
-        for payload in self.log_queue:
-            asyncio.create_task(self.async_upload_data_to_s3(payload))
+        batch_logging_elements = list(self.log_queue)
+        uploaded = await asyncio.gather(
+            *[
+                self.async_upload_data_to_s3(batch_logging_element)
+                for batch_logging_element in batch_logging_elements
+            ]
+        )
+        failed_batch_logging_elements = [
+            batch_logging_element
+            for batch_logging_element, _uploaded in zip(
+                batch_logging_elements, uploaded
+            )
+            if _uploaded is not True
+        ]
+        if failed_batch_logging_elements:
+            self.log_queue = failed_batch_logging_elements
+            return False
+
+    def _get_spillable_event(self, event: s3BatchLoggingElement) -> Optional[Any]:
+        return event.model_dump()
+
+    def _restore_spilled_event(
+        self, spilled_event: Dict[str, Any]
+    ) -> Optional[s3BatchLoggingElement]:
+        return s3BatchLoggingElement(**spilled_event)
 
     def create_s3_batch_logging_element(
         self,
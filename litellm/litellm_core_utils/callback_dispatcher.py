@@ -0,0 +1,305 @@
+"""
+Runs sync logging callbacks off the response path.
+
+Callbacks are submitted to a named lane (see `CallbackDispatchLaneName`). Each lane has:
+- a bounded queue, with a `queue_full_policy` of `drop_oldest` (default), `drop_newest` or `block`
+  The `streaming_logging` lane defaults to `block` - per-chunk logging applies backpressure to the stream instead of being dropped.
+- its own worker threads (`max_workers`), so a slow sink on one lane can't starve the others
+- an optional `timeout` - tasks that waited longer than this in the queue are dropped, and `block` waits at most this long
+- `block` never blocks a thread running an event loop - there, a full queue falls back to `drop_oldest`
+
+Lanes are configured via `litellm.callback_dispatch_settings`, e.g. `{"success_handler": {"max_workers": 20}}`.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_CALLBACK_DISPATCH_MAX_QUEUE_SIZE,
+    DEFAULT_CALLBACK_DISPATCH_MAX_WORKERS,
+)
+from litellm.litellm_core_utils.core_helpers import get_avg_ms
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneMetrics,
+    CallbackDispatchLaneName,
+    CallbackDispatchLaneSettings,
+    CallbackDispatchQueueFullPolicy,
+)
+
+# fn, args, kwargs, enqueued_at
+_CallbackTask = Tuple[Callable, tuple, dict, float]
+
+# lane defaults, overridden by `litellm.callback_dispatch_settings`
+_DEFAULT_LANE_SETTINGS: Dict[str, CallbackDispatchLaneSettings] = {
+    CallbackDispatchLaneName.STREAMING_LOGGING.value: CallbackDispatchLaneSettings(
+        queue_full_policy="block"
+    ),
+}
+
+
+class CallbackDispatchLane:
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_CALLBACK_DISPATCH_MAX_WORKERS,
+        max_queue_size: int = DEFAULT_CALLBACK_DISPATCH_MAX_QUEUE_SIZE,
+        queue_full_policy: CallbackDispatchQueueFullPolicy = "drop_oldest",
+        timeout: Optional[float] = None,
+    ):
+        if queue_full_policy not in ("drop_oldest", "drop_newest", "block"):
+            raise ValueError(
+                f"Invalid queue_full_policy={queue_full_policy} for callback dispatch lane={name}. Expected one of 'drop_oldest', 'drop_newest', 'block'"
+            )
+        if max_queue_size < 1 or max_workers < 1:
+            raise ValueError(
+                f"Invalid max_queue_size={max_queue_size}, max_workers={max_workers} for callback dispatch lane={name}. Both must be >= 1"
+            )
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.queue_full_policy = queue_full_policy
+        self.timeout = timeout
+
+        self._queue: Deque[_CallbackTask] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._running_tasks = 0
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.slow_tasks = 0
+        self._queue_wait_total_seconds = 0.0
+        self._queue_wait_max_seconds = 0.0
+        self._run_time_total_seconds = 0.0
+        self._run_time_max_seconds = 0.0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> bool:
+        """
+        Queue `fn(*args, **kwargs)` to run on the lane's workers.
+
+        Returns False if the task was dropped because the queue is full.
+        """
+        with self._lock:
+            self.submitted += 1
+            if len(self._queue) >= self.max_queue_size and not self._make_room():
+                self._record_drop()
+                return False
+
+            self._queue.append((fn, args, kwargs, time.perf_counter()))
+            if self._idle_workers == 0 and len(self._workers) < self.max_workers:
+                self._start_worker()
+            self._not_empty.notify()
+        return True
+
+    def wait_until_empty(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued and running tasks to finish. Returns False on timeout.
+        """
+        deadline = time.perf_counter() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                if len(self._queue) == 0 and self._running_tasks == 0:
+                    return True
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def get_metrics(self) -> CallbackDispatchLaneMetrics:
+        with self._lock:
+            return CallbackDispatchLaneMetrics(
+                lane=self.name,
+                max_workers=self.max_workers,
+                workers=len(self._workers),
+                max_queue_size=self.max_queue_size,
+                queue_depth=len(self._queue),
+                submitted=self.submitted,
+                completed=self.completed,
+                failed=self.failed,
+                dropped=self.dropped,
+                slow_tasks=self.slow_tasks,
+                avg_queue_wait_ms=get_avg_ms(
+                    self._queue_wait_total_seconds, self.completed + self.failed
+                ),
+                max_queue_wait_ms=self._queue_wait_max_seconds * 1000,
+                avg_run_time_ms=get_avg_ms(
+                    self._run_time_total_seconds, self.completed + self.failed
+                ),
+                max_run_time_ms=self._run_time_max_seconds * 1000,
+            )
+
+    def _make_room(self) -> bool:
+        """
+        Called with the lock held, when the queue is full. Returns False if the new task should be dropped.
+        """
+        if self.queue_full_policy == "drop_oldest":
+            self._queue.popleft()
+            self._record_drop()
+            return True
+        if self.queue_full_policy == "block":
+            if _is_event_loop_thread():
+                # blocking here would freeze the event loop - e.g. `handle_sync_success_callbacks_for_async_calls`
+                self._queue.popleft()
+                self._record_drop(reason="queue is full, can't block the event loop")
+                return True
+            return self._not_full.wait_for(
+                lambda: len(self._queue) < self.max_queue_size, timeout=self.timeout
+            )
+        return False
+
+    def _record_drop(self, reason: str = "queue is full"):
+        self.dropped += 1
+        verbose_logger.warning(
+            "callback dispatch lane=%s dropped a callback - %s (max_queue_size=%s, queue_full_policy=%s, timeout=%s). Total dropped=%s",
+            self.name,
+            reason,
+            self.max_queue_size,
+            self.queue_full_policy,
+            self.timeout,
+            self.dropped,
+        )
+
+    def _start_worker(self):
+        worker = threading.Thread(
+            target=self._run_worker,
+            name=f"litellm-callback-dispatch-{self.name}-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _run_worker(self):
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+                while len(self._queue) == 0:
+                    self._not_empty.wait()
+                self._idle_workers -= 1
+                fn, args, kwargs, enqueued_at = self._queue.popleft()
+                self._running_tasks += 1
+                self._not_full.notify()
+
+            started_at = time.perf_counter()
+            queue_wait_seconds = started_at - enqueued_at
+            failed = False
+            if self.timeout is not None and queue_wait_seconds > self.timeout:
+                # stale - the lane is lagging, shed it instead of falling further behind
+                with self._lock:
+                    self._running_tasks -= 1
+                    self._record_drop(reason="waited longer than timeout in queue")
+                continue
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                failed = True
+                verbose_logger.exception(
+                    "callback dispatch lane=%s - error running callback: %s",
+                    self.name,
+                    str(e),
+                )
+            run_time_seconds = time.perf_counter() - started_at
+
+            with self._lock:
+                self._running_tasks -= 1
+                if failed:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                self._queue_wait_total_seconds += queue_wait_seconds
+                self._queue_wait_max_seconds = max(
+                    self._queue_wait_max_seconds, queue_wait_seconds
+                )
+                self._run_time_total_seconds += run_time_seconds
+                self._run_time_max_seconds = max(
+                    self._run_time_max_seconds, run_time_seconds
+                )
+                if self.timeout is not None and run_time_seconds > self.timeout:
+                    self.slow_tasks += 1
+
+
+class CallbackDispatcher:
+    def __init__(self):
+        self.lanes: Dict[str, CallbackDispatchLane] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        lane_name: Union[CallbackDispatchLaneName, str],
+        fn: Callable,
+        *args,
+        **kwargs,
+    ) -> bool:
+        """
+        Run `fn(*args, **kwargs)` on the lane's worker threads, without blocking the caller (unless the lane uses `block`)
+        """
+        return self.get_lane(lane_name).submit(fn, *args, **kwargs)
+
+    def get_lane(
+        self, lane_name: Union[CallbackDispatchLaneName, str]
+    ) -> CallbackDispatchLane:
+        lane_name = (
+            lane_name.value
+            if isinstance(lane_name, CallbackDispatchLaneName)
+            else lane_name
+        )
+        lane = self.lanes.get(lane_name)
+        if lane is not None:
+            return lane
+        with self._lock:
+            if lane_name not in self.lanes:
+                self.lanes[lane_name] = CallbackDispatchLane(
+                    name=lane_name, **self._get_lane_settings(lane_name)
+                )
+            return self.lanes[lane_name]
+
+    def get_metrics(self) -> List[CallbackDispatchLaneMetrics]:
+        return [lane.get_metrics() for lane in list(self.lanes.values())]
+
+    def wait_until_empty(self, timeout: Optional[float] = None) -> bool:
+        return all(
+            lane.wait_until_empty(timeout=timeout) for lane in list(self.lanes.values())
+        )
+
+    def _reset_after_fork(self):
+        # worker threads don't survive a fork - the child process starts new lanes
+        self.lanes = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_lane_settings(lane_name: str) -> CallbackDispatchLaneSettings:
+        callback_dispatch_settings: Dict[str, Any] = (
+            litellm.callback_dispatch_settings or {}
+        )
+        return CallbackDispatchLaneSettings(
+            **{
+                **_DEFAULT_LANE_SETTINGS.get(lane_name, {}),
+                **callback_dispatch_settings.get(lane_name, {}),
+            }
+        )
+
+
+def _is_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+callback_dispatcher = CallbackDispatcher()
+
+# workers are daemon threads - run the queued callbacks before the interpreter exits
+atexit.register(callback_dispatcher.wait_until_empty)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=callback_dispatcher._reset_after_fork)
@@ -0,0 +1,282 @@
+"""
+Compact, memory-mapped representation of the model cost map.
+
+The model cost map json is compiled once into a binary file:
+- header: magic, format version, number of models, section offsets
+- model names + the vocabulary of `litellm_provider` / `mode` values (json)
+- `litellm_provider` / `mode` columns (uint16 indices into the vocabulary)
+- per-model (offset, length) index into the value section
+- value section: each model's json entry
+
+The file is memory-mapped read-only, so proxy workers on the same host share its pages.
+Model entries are only parsed on first access, and memoised.
+
+Enable with `LITELLM_MODEL_COST_MAP_MMAP=True`.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+COMPILED_MODEL_COST_MAP_MAGIC = b"LLMCMAP\x00"
+COMPILED_MODEL_COST_MAP_VERSION = 1
+_MISSING_STRING_INDEX = 0xFFFF
+# magic, version, byteorder, num_models, names offset, names length, columns offset, value index offset, values offset
+_HEADER_FORMAT = "<8sIcIQQQQQ"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+_BYTEORDER = b"l" if sys.byteorder == "little" else b"b"
+
+
+def compile_model_cost_map(model_cost: Dict[str, Any], path: str) -> None:
+    """
+    Compile a model cost map dict into the binary format, at `path`.
+
+    Written to a temp file + renamed, so concurrent workers never read a partial file.
+    """
+    model_names: List[str] = list(model_cost.keys())
+    vocabulary: List[str] = []
+    vocabulary_index: Dict[str, int] = {}
+
+    def _get_string_index(value: Any) -> int:
+        if not isinstance(value, str):
+            return _MISSING_STRING_INDEX
+        if value not in vocabulary_index:
+            vocabulary_index[value] = len(vocabulary)
+            vocabulary.append(value)
+        return vocabulary_index[value]
+
+    provider_column: List[int] = []
+    mode_column: List[int] = []
+    value_index: List[int] = []
+    values = bytearray()
+    for model_name in model_names:
+        entry = model_cost[model_name]
+        entry_dict = entry if isinstance(entry, dict) else {}
+        provider_column.append(_get_string_index(entry_dict.get("litellm_provider")))
+        mode_column.append(_get_string_index(entry_dict.get("mode")))
+        encoded_entry = json.dumps(entry).encode("utf-8")
+        value_index.extend([len(values), len(encoded_entry)])
+        values.extend(encoded_entry)
+
+    names_section = json.dumps(
+        {"model_names": model_names, "vocabulary": vocabulary}
+    ).encode("utf-8")
+    native = "<" if _BYTEORDER == b"l" else ">"
+    columns_section = struct.pack(
+        f"{native}{len(model_names) * 2}H", *provider_column, *mode_column
+    )
+    value_index_section = struct.pack(f"{native}{len(value_index)}Q", *value_index)
+
+    names_offset = _HEADER_SIZE
+    columns_offset = names_offset + len(names_section)
+    # 8-byte align the value index, so it can be cast to a uint64 memoryview
+    value_index_offset = columns_offset + len(columns_section)
+    padding = (-value_index_offset) % 8
+    value_index_offset += padding
+    values_offset = value_index_offset + len(value_index_section)
+
+    header = struct.pack(
+        _HEADER_FORMAT,
+        COMPILED_MODEL_COST_MAP_MAGIC,
+        COMPILED_MODEL_COST_MAP_VERSION,
+        _BYTEORDER,
+        len(model_names),
+        names_offset,
+        len(names_section),
+        columns_offset,
+        value_index_offset,
+        values_offset,
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(names_section)
+            f.write(columns_section)
+            f.write(b"\x00" * padding)
+            f.write(value_index_section)
+            f.write(values)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class CompiledModelCostMap(MutableMapping[str, Dict[str, Any]]):
+    """
+    Dict-like view over a compiled model cost map file.
+
+    Entries are parsed from the memory-mapped file on first access. Writes (e.g. `litellm.register_model`) are kept in memory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            byteorder,
+            num_models,
+            names_offset,
+            names_length,
+            columns_offset,
+            value_index_offset,
+            values_offset,
+        ) = struct.unpack_from(_HEADER_FORMAT, self._mmap, 0)
+        if (
+            magic != COMPILED_MODEL_COST_MAP_MAGIC
+            or version != COMPILED_MODEL_COST_MAP_VERSION
+            or byteorder != _BYTEORDER
+        ):
+            raise ValueError(f"Invalid compiled model cost map file: {path}")
+
+        names = json.loads(self._mmap[names_offset : names_offset + names_length])
+        self._model_names: List[str] = names["model_names"]
+        self._vocabulary: List[str] = names["vocabulary"]
+        self._row_by_model_name: Dict[str, int] = {
+            model_name: row for row, model_name in enumerate(self._model_names)
+        }
+
+        view = memoryview(self._mmap)
+        self._provider_column = view[
+            columns_offset : columns_offset + num_models * 2
+        ].cast("H")
+        self._mode_column = view[
+            columns_offset + num_models * 2 : columns_offset + num_models * 4
+        ].cast("H")
+        self._value_index = view[
+            value_index_offset : value_index_offset + num_models * 16
+        ].cast("Q")
+        self._values_offset = values_offset
+
+        # parsed / written entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # keys added at runtime, that are not in the compiled file
+        self._added_model_names: Dict[str, None] = {}
+        self._deleted_model_names: Set[str] = set()
+
+    def _parse_row(self, row: int) -> Dict[str, Any]:
+        offset = self._values_offset + self._value_index[row * 2]
+        length = self._value_index[row * 2 + 1]
+        return json.loads(self._mmap[offset : offset + length])
+
+    def _get_string(self, index: int) -> Optional[str]:
+        if index == _MISSING_STRING_INDEX:
+            return None
+        return self._vocabulary[index]
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        row = self._row_by_model_name.get(key)
+        if row is None or key in self._deleted_model_names:
+            raise KeyError(key)
+        entry = self._parse_row(row)
+        self._entries[key] = entry
+        return entry
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = value
+        self._deleted_model_names.discard(key)
+        if key not in self._row_by_model_name:
+            self._added_model_names[key] = None
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._entries.pop(key, None)
+        self._added_model_names.pop(key, None)
+        if key in self._row_by_model_name:
+            self._deleted_model_names.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._entries:
+            return True
+        return key in self._row_by_model_name and key not in self._deleted_model_names
+
+    def __iter__(self) -> Iterator[str]:
+        for model_name in self._model_names:
+            if model_name not in self._deleted_model_names:
+                yield model_name
+        yield from list(self._added_model_names)
+
+    def __len__(self) -> int:
+        return (
+            len(self._model_names)
+            - len(self._deleted_model_names)
+            + len(self._added_model_names)
+        )
+
+    def __repr__(self) -> str:
+        return f"CompiledModelCostMap(path={self.path!r}, models={len(self)})"
+
+    def provider_and_mode_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        (model name, {"litellm_provider", "mode"}) for every model - read from the columns, without parsing the entries.
+        """
+        for row, model_name in enumerate(self._model_names):
+            if model_name in self._deleted_model_names:
+                continue
+            entry = self._entries.get(model_name)
+            if entry is not None:
+                yield model_name, entry
+                continue
+            yield model_name, {
+                "litellm_provider": self._get_string(self._provider_column[row]),
+                "mode": self._get_string(self._mode_column[row]),
+            }
+        for model_name in list(self._added_model_names):
+            yield model_name, self._entries[model_name]
+
+
+def get_model_cost_provider_items(
+    model_cost: MutableMapping[str, Any]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Iterate (model name, entry) pairs, only needing `litellm_provider` / `mode` of each entry.
+
+    Avoids parsing every entry of a `CompiledModelCostMap`.
+    """
+    if isinstance(model_cost, CompiledModelCostMap):
+        return model_cost.provider_and_mode_items()
+    return iter(model_cost.items())
+
+
+def load_compiled_model_cost_map(
+    source: bytes, cache_dir: Optional[str] = None
+) -> CompiledModelCostMap:
+    """
+    Load the compiled model cost map for the model cost map json `source` - compiling it first, if no worker has yet.
+
+    The compiled file name includes a hash of the source, so a changed model cost map is recompiled.
+    """
+    source_hash = hashlib.sha256(
+        source + str(COMPILED_MODEL_COST_MAP_VERSION).encode("utf-8") + _BYTEORDER
+    ).hexdigest()
+    cache_dir = cache_dir or os.path.join(
+        tempfile.gettempdir(), "litellm_model_cost_map"
+    )
+    path = os.path.join(cache_dir, f"model_cost_map_{source_hash[:32]}.bin")
+    if not os.path.exists(path):
+        compile_model_cost_map(model_cost=json.loads(source), path=path)
+    return CompiledModelCostMap(path=path)
@@ -1,6 +1,6 @@
 # What is this?
 ## Helper utilities
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Union, cast
 
 import httpx
 
@@ -37,6 +37,14 @@ def safe_divide_seconds(
     return float(seconds / denominator)
 
 
+def get_avg_ms(total_seconds: float, count: int) -> float:
+    """
+    Average of `count` durations totalling `total_seconds`, in milliseconds. 0.0 if count is 0.
+    """
+    avg_seconds = safe_divide_seconds(total_seconds, count, default=0.0)
+    return cast(float, avg_seconds) * 1000
+
+
 def map_finish_reason(
     finish_reason: str,
 ):  # openai supports 5 stop sequences - 'stop', 'length', 'function_call', 'content_filter', 'null'
@@ -6,12 +6,20 @@ This can be disabled by setting the LITELLM_LOCAL_MODEL_COST_MAP environment var
 ```
 export LITELLM_LOCAL_MODEL_COST_MAP=True
 ```
+
+Set LITELLM_MODEL_COST_MAP_MMAP=True to load it as a memory-mapped, lazily parsed map (see `compiled_model_cost_map.py`).
 """
 
 import os
+from typing import TYPE_CHECKING
 
 import httpx
 
+if TYPE_CHECKING:
+    from litellm.litellm_core_utils.compiled_model_cost_map import (
+        CompiledModelCostMap,
+    )
+
 
 def get_model_cost_map(url: str) -> dict:
     if (
@@ -43,3 +51,48 @@ def get_model_cost_map(url: str) -> dict:
         ) as f:
             content = json.load(f)
             return content
+
+
+def _get_model_cost_map_source(url: str) -> bytes:
+    """
+    Raw model cost map json - from `url`, or the local backup (same rules as `get_model_cost_map`)
+
+    The remote body is only used if it is a valid json object - a bad or partial response falls back to the local backup.
+    """
+    import importlib.resources
+    import json
+
+    if not (
+        os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False)
+        or os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == "True"
+    ):
+        try:
+            response = httpx.get(
+                url, timeout=5
+            )  # set a 5 second timeout for the get request
+            response.raise_for_status()  # Raise an exception if the request is unsuccessful
+            if isinstance(json.loads(response.content), dict):
+                return response.content
+        except Exception:
+            pass
+
+    with importlib.resources.open_binary(
+        "litellm", "model_prices_and_context_window_backup.json"
+    ) as f:
+        return f.read()
+
+
+def get_compiled_model_cost_map(url: str) -> "CompiledModelCostMap":
+    """
+    Model cost map as a memory-mapped, lazily parsed `CompiledModelCostMap`.
+
+    Used when `LITELLM_MODEL_COST_MAP_MMAP=True`. The compiled file is written to `LITELLM_MODEL_COST_MAP_CACHE_DIR` (default: a temp dir) and shared by all workers on the host.
+    """
+    from litellm.litellm_core_utils.compiled_model_cost_map import (
+        load_compiled_model_cost_map,
+    )
+
+    return load_compiled_model_cost_map(
+        source=_get_model_cost_map_source(url),
+        cache_dir=os.getenv("LITELLM_MODEL_COST_MAP_CACHE_DIR"),
+    )
@@ -3,6 +3,7 @@
 # Logging function -> log the exact model details + what's being sent | Non-Blocking
 import copy
 import datetime
+import inspect
 import json
 import os
 import re
@@ -21,6 +22,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -59,6 +61,7 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.deepeval.deepeval import DeepEvalLogger
 from litellm.integrations.mlflow import MlflowLogger
 from litellm.integrations.sqs import SQSLogger
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
@@ -69,6 +72,7 @@ from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_logging,
 )
 from litellm.responses.utils import ResponseAPILoggingUtils
+from litellm.types.litellm_core_utils.callback_dispatcher import CallbackDispatchLaneName
 from litellm.types.llms.openai import (
     AllMessageValues,
     Batch,
@@ -111,7 +115,7 @@ from litellm.types.utils import (
     TranscriptionResponse,
     Usage,
 )
-from litellm.utils import _get_base_model_from_metadata, executor, print_verbose
+from litellm.utils import _get_base_model_from_metadata, print_verbose
 
 from ..integrations.argilla import ArgillaLogger
 from ..integrations.arize.arize_phoenix import ArizePhoenixLogger
@@ -1462,6 +1466,9 @@ class Logging(LiteLLMLoggingBaseClass):
                             logging_obj=self,
                             status="success",
                             standard_built_in_tools_params=self.standard_built_in_tools_params,
+                            payload_fields=self._get_standard_logging_payload_fields(
+                                status="success"
+                            ),
                         )
                     )
                 elif isinstance(result, dict) or isinstance(result, list):
@@ -1475,6 +1482,9 @@ class Logging(LiteLLMLoggingBaseClass):
                             logging_obj=self,
                             status="success",
                             standard_built_in_tools_params=self.standard_built_in_tools_params,
+                            payload_fields=self._get_standard_logging_payload_fields(
+                                status="success"
+                            ),
                         )
                     )
             elif standard_logging_object is not None:
@@ -1648,6 +1658,9 @@ class Logging(LiteLLMLoggingBaseClass):
                         logging_obj=self,
                         status="success",
                         standard_built_in_tools_params=self.standard_built_in_tools_params,
+                        payload_fields=self._get_standard_logging_payload_fields(
+                            status="success"
+                        ),
                     )
                 )
             callbacks = self.get_combined_callback_list(
@@ -2188,6 +2201,9 @@ class Logging(LiteLLMLoggingBaseClass):
                     logging_obj=self,
                     status="success",
                     standard_built_in_tools_params=self.standard_built_in_tools_params,
+                    payload_fields=self._get_standard_logging_payload_fields(
+                        status="success"
+                    ),
                 )
             )
         callbacks = self.get_combined_callback_list(
@@ -2412,6 +2428,9 @@ class Logging(LiteLLMLoggingBaseClass):
                 error_str=str(exception),
                 original_exception=exception,
                 standard_built_in_tools_params=self.standard_built_in_tools_params,
+                payload_fields=self._get_standard_logging_payload_fields(
+                    status="failure"
+                ),
             )
         )
         return start_time, end_time
@@ -2780,12 +2799,13 @@ class Logging(LiteLLMLoggingBaseClass):
         """
         Handles calling success callbacks for Async calls.
 
-        Why: Some callbacks - `langfuse`, `s3` are sync callbacks. We need to call them in the executor.
+        Why: Some callbacks - `langfuse`, `s3` are sync callbacks. We need to call them on the callback dispatcher's worker threads.
         """
         if self._should_run_sync_callbacks_for_async_calls() is False:
             return
 
-        executor.submit(
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.SUCCESS_HANDLER,
             self.success_handler,
             result,
             start_time,
@@ -2809,6 +2829,30 @@ class Logging(LiteLLMLoggingBaseClass):
         )
         return len(_filtered_success_callbacks) > 0
 
+    def _get_standard_logging_payload_fields(
+        self, status: StandardLoggingPayloadStatus
+    ) -> Optional[Set[str]]:
+        """
+        The `StandardLoggingPayload` fields read by the callbacks this event is logged to - None means all fields.
+        """
+        if status == "success":
+            callbacks = (
+                litellm.callbacks
+                + litellm.success_callback
+                + litellm._async_success_callback
+                + (self.dynamic_success_callbacks or [])
+                + (self.dynamic_async_success_callbacks or [])
+            )
+        else:
+            callbacks = (
+                litellm.callbacks
+                + litellm.failure_callback
+                + litellm._async_failure_callback
+                + (self.dynamic_failure_callbacks or [])
+                + (self.dynamic_async_failure_callbacks or [])
+            )
+        return get_standard_logging_payload_fields(callbacks=callbacks)
+
     def get_combined_callback_list(
         self, dynamic_success_callbacks: Optional[List], global_callbacks: List
     ) -> List:
@@ -3988,6 +4032,21 @@ class StandardLoggingPayloadSetup:
                 )
         return model_cost_information
 
+    @staticmethod
+    def get_response_id_and_usage(init_response_obj: BaseModel) -> dict:
+        """
+        The `id` and `usage` of a response - without dumping the full response, when the payload doesn't include it.
+        """
+        response_obj: dict = {}
+        if hasattr(init_response_obj, "id"):
+            response_obj["id"] = getattr(init_response_obj, "id")
+        usage = getattr(init_response_obj, "usage", None)
+        if isinstance(usage, BaseModel) and not isinstance(usage, Usage):
+            # e.g. responses api usage - transformed from its dict form
+            usage = usage.model_dump()
+        response_obj["usage"] = usage
+        return response_obj
+
     @staticmethod
     def get_final_response_obj(
         response_obj: dict, init_response_obj: Union[Any, BaseModel, dict], kwargs: dict
@@ -4226,7 +4285,14 @@ def get_standard_logging_object_payload(
     error_str: Optional[str] = None,
     original_exception: Optional[Exception] = None,
     standard_built_in_tools_params: Optional[StandardBuiltInToolsParams] = None,
+    payload_fields: Optional[Set[str]] = None,
 ) -> Optional[StandardLoggingPayload]:
+    """
+    Build the `StandardLoggingPayload` for a request.
+
+    If `payload_fields` is set, the expensive fields not in it (the response, messages, model cost information, etc.) are left empty instead of being built.
+    `messages` and `response` are references to the request / response data - callbacks must copy them before mutating them.
+    """
     try:
         kwargs = kwargs or {}
 
@@ -4234,7 +4300,12 @@ def get_standard_logging_object_payload(
         if init_response_obj is None:
             response_obj = {}
         elif isinstance(init_response_obj, BaseModel):
-            response_obj = init_response_obj.model_dump()
+            if _should_build_payload_field("response", payload_fields):
+                response_obj = init_response_obj.model_dump()
+            else:
+                response_obj = StandardLoggingPayloadSetup.get_response_id_and_usage(
+                    init_response_obj
+                )
             hidden_params = getattr(init_response_obj, "_hidden_params", None)
         elif isinstance(init_response_obj, dict):
             response_obj = init_response_obj
@@ -4329,38 +4400,8 @@ def get_standard_logging_object_payload(
             "user", None
         )  # maintain backwards compatibility with old request body check
 
-        saved_cache_cost: float = 0.0
         if cache_hit is True:
             id = f"{id}_cache_hit{time.time()}"  # do not duplicate the request id
-            saved_cache_cost = (
-                logging_obj._response_cost_calculator(
-                    result=init_response_obj, cache_hit=False  # type: ignore
-                )
-                or 0.0
-            )
-
-        ## Get model cost information ##
-        base_model = _get_base_model_from_metadata(model_call_details=kwargs)
-        custom_pricing = use_custom_pricing_for_model(litellm_params=litellm_params)
-
-        model_cost_information = StandardLoggingPayloadSetup.get_model_cost_information(
-            base_model=base_model,
-            custom_pricing=custom_pricing,
-            custom_llm_provider=kwargs.get("custom_llm_provider"),
-            init_response_obj=init_response_obj,
-        )
-        response_cost: float = kwargs.get("response_cost", 0) or 0.0
-
-        error_information = StandardLoggingPayloadSetup.get_error_information(
-            original_exception=original_exception,
-        )
-
-        ## get final response object ##
-        final_response_obj = StandardLoggingPayloadSetup.get_final_response_obj(
-            response_obj=response_obj,
-            init_response_obj=init_response_obj,
-            kwargs=kwargs,
-        )
 
         stream: Optional[bool] = None
         if (
@@ -4380,7 +4421,7 @@ def get_standard_logging_object_payload(
             stream=stream,
             status=status,
             custom_llm_provider=cast(Optional[str], kwargs.get("custom_llm_provider")),
-            saved_cache_cost=saved_cache_cost,
+            saved_cache_cost=0.0,
             startTime=start_time_float,
             endTime=end_time_float,
             completionStartTime=completion_start_time_float,
@@ -4388,7 +4429,7 @@ def get_standard_logging_object_payload(
             model=kwargs.get("model", "") or "",
             metadata=clean_metadata,
             cache_key=clean_hidden_params["cache_key"],
-            response_cost=response_cost,
+            response_cost=kwargs.get("response_cost", 0) or 0.0,
             total_tokens=usage.total_tokens,
             prompt_tokens=usage.prompt_tokens,
             completion_tokens=usage.completion_tokens,
@@ -4401,15 +4442,15 @@ def get_standard_logging_object_payload(
             model_group=_model_group,
             model_id=_model_id,
             requester_ip_address=clean_metadata.get("requester_ip_address", None),
-            messages=kwargs.get("messages"),
-            response=final_response_obj,
-            model_parameters=ModelParamHelper.get_standard_logging_model_parameters(
-                kwargs.get("optional_params", None) or {}
-            ),
+            messages=None,
+            response=None,
+            model_parameters={},
             hidden_params=clean_hidden_params,
-            model_map_information=model_cost_information,
+            model_map_information=StandardLoggingModelInformation(
+                model_map_key="", model_map_value=None
+            ),
             error_str=error_str,
-            error_information=error_information,
+            error_information=None,
             response_cost_failure_debug_info=kwargs.get(
                 "response_cost_failure_debug_information"
             ),
@@ -4418,6 +4459,15 @@ def get_standard_logging_object_payload(
             ),
             standard_built_in_tools_params=standard_built_in_tools_params,
         )
+        _set_projected_payload_fields(
+            payload=payload,
+            kwargs=kwargs,
+            init_response_obj=init_response_obj,
+            response_obj=response_obj,
+            logging_obj=logging_obj,
+            original_exception=original_exception,
+            payload_fields=payload_fields,
+        )
 
         emit_standard_logging_payload(payload)
         return payload
@@ -4428,6 +4478,101 @@ def get_standard_logging_object_payload(
         return None
 
 
+def _should_build_payload_field(field: str, payload_fields: Optional[Set[str]]) -> bool:
+    return payload_fields is None or field in payload_fields
+
+
+def _set_projected_payload_fields(
+    payload: StandardLoggingPayload,
+    kwargs: dict,
+    init_response_obj: Union[Any, BaseModel, dict],
+    response_obj: dict,
+    logging_obj: Logging,
+    original_exception: Optional[Exception],
+    payload_fields: Optional[Set[str]],
+) -> None:
+    """
+    Build the expensive `StandardLoggingPayload` fields - only the ones in `payload_fields` (all, if None).
+
+    Fields that aren't built keep their empty defaults.
+    """
+    if payload["cache_hit"] is True and _should_build_payload_field(
+        "saved_cache_cost", payload_fields
+    ):
+        payload["saved_cache_cost"] = (
+            logging_obj._response_cost_calculator(
+                result=init_response_obj, cache_hit=False  # type: ignore
+            )
+            or 0.0
+        )
+
+    if _should_build_payload_field("model_map_information", payload_fields):
+        payload[
+            "model_map_information"
+        ] = StandardLoggingPayloadSetup.get_model_cost_information(
+            base_model=_get_base_model_from_metadata(model_call_details=kwargs),
+            custom_pricing=use_custom_pricing_for_model(
+                litellm_params=kwargs.get("litellm_params", {})
+            ),
+            custom_llm_provider=kwargs.get("custom_llm_provider"),
+            init_response_obj=init_response_obj,
+        )
+
+    if _should_build_payload_field("error_information", payload_fields):
+        payload[
+            "error_information"
+        ] = StandardLoggingPayloadSetup.get_error_information(
+            original_exception=original_exception,
+        )
+
+    if _should_build_payload_field("response", payload_fields):
+        payload["response"] = StandardLoggingPayloadSetup.get_final_response_obj(
+            response_obj=response_obj,
+            init_response_obj=init_response_obj,
+            kwargs=kwargs,
+        )
+
+    if _should_build_payload_field("messages", payload_fields):
+        payload["messages"] = kwargs.get("messages")
+
+    if _should_build_payload_field("model_parameters", payload_fields):
+        payload[
+            "model_parameters"
+        ] = ModelParamHelper.get_standard_logging_model_parameters(
+            kwargs.get("optional_params", None) or {}
+        )
+
+
+def get_standard_logging_payload_fields(callbacks: List) -> Optional[Set[str]]:
+    """
+    Union of the `StandardLoggingPayload` fields read by `callbacks`.
+
+    Returns None (= build all fields) if any callback doesn't declare its fields, e.g. string / function callbacks.
+    Bound method callbacks (e.g. `Router.deployment_callback_on_success`) use the fields declared by their instance.
+    """
+    payload_fields: Set[str] = set()
+    for callback in callbacks:
+        if (
+            isinstance(callback, str)
+            and callback in litellm._known_custom_logger_compatible_callbacks
+        ):
+            # e.g. "prometheus" - use the fields of its initialized logger
+            callback = get_custom_logger_compatible_class(
+                cast(_custom_logger_compatible_callbacks_literal, callback)
+            )
+        callback_payload_fields: Optional[Set[str]] = None
+        if isinstance(callback, CustomLogger):
+            callback_payload_fields = callback.get_standard_logging_payload_fields()
+        elif inspect.ismethod(callback):
+            callback_payload_fields = getattr(
+                callback.__self__, "standard_logging_payload_fields", None
+            )
+        if callback_payload_fields is None:
+            return None
+        payload_fields.update(callback_payload_fields)
+    return payload_fields
+
+
 def emit_standard_logging_payload(payload: StandardLoggingPayload):
     if os.getenv("LITELLM_PRINT_STANDARD_LOGGING_PAYLOAD"):
         verbose_logger.info(json.dumps(payload, indent=4))
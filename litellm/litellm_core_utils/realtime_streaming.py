@@ -1,11 +1,14 @@
 import asyncio
-import concurrent.futures
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.llms.base_llm.realtime.transformation import BaseRealtimeConfig
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneName,
+)
 from litellm.types.llms.openai import (
     OpenAIRealtimeEvents,
     OpenAIRealtimeOutputItemDone,
@@ -24,9 +27,6 @@ if TYPE_CHECKING:
 else:
     CLIENT_CONNECTION_CLASS = Any
 
-# Create a thread pool with a maximum of 10 threads
-executor = concurrent.futures.ThreadPoolExecutor(max_workers=10)
-
 DefaultLoggedRealTimeEventTypes = [
     "session.created",
     "response.create",
@@ -111,7 +111,11 @@ class RealTimeStreaming:
             # Create an event loop for the new thread
             asyncio.create_task(self.logging_obj.async_success_handler(self.messages))
             ## SYNC LOGGING
-            executor.submit(self.logging_obj.success_handler(self.messages))
+            callback_dispatcher.submit(
+                CallbackDispatchLaneName.SUCCESS_HANDLER,
+                self.logging_obj.success_handler,
+                self.messages,
+            )
 
     async def backend_to_client_send_messages(self):
         import websockets
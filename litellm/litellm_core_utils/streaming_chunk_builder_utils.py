@@ -17,6 +17,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     PromptTokensDetailsWrapper,
+    TextChoices,
     Usage,
 )
 from litellm.utils import print_verbose, token_counter
@@ -381,86 +382,94 @@ class ChunkProcessor:
         self,
         chunks: List[Union[Dict[str, Any], ModelResponse]],
     ) -> "UsagePerChunk":
+        usage_per_chunk = ChunkProcessor._get_empty_usage_per_chunk()
+        for chunk in chunks:
+            self._update_usage_per_chunk(usage_per_chunk=usage_per_chunk, chunk=chunk)
+        return usage_per_chunk
+
+    @staticmethod
+    def _get_empty_usage_per_chunk() -> "UsagePerChunk":
         from litellm.types.litellm_core_utils.streaming_chunk_builder_utils import (
             UsagePerChunk,
         )
 
-        # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-
-        web_search_requests: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetailsWrapper] = None
-        for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif (
-                isinstance(chunk, ModelResponse)
-                or isinstance(chunk, ModelResponseStream)
-            ) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
-
-            if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_creation_input_tokens"] > 0
-                    or cache_creation_input_tokens is None
-                ):
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_read_input_tokens"] > 0
-                    or cache_read_input_tokens is None
-                ):
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                if (
-                    usage_chunk_dict["prompt_tokens_details"] is not None
-                    and getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                        None,
-                    )
-                    is not None
-                ):
-                    web_search_requests = getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                    )
-
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
-
         return UsagePerChunk(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_creation_input_tokens=cache_creation_input_tokens,
-            cache_read_input_tokens=cache_read_input_tokens,
-            web_search_requests=web_search_requests,
-            completion_tokens_details=completion_tokens_details,
-            prompt_tokens_details=prompt_tokens_details,
+            prompt_tokens=0,
+            completion_tokens=0,
+            ## anthropic prompt caching information ##
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+            web_search_requests=None,
+            completion_tokens_details=None,
+            prompt_tokens_details=None,
         )
 
+    def _update_usage_per_chunk(
+        self,
+        usage_per_chunk: "UsagePerChunk",
+        chunk: Union[Dict[str, Any], ModelResponse],
+    ) -> None:
+        """
+        Fold the usage of a single chunk into `usage_per_chunk` (in place)
+        """
+        usage_chunk: Optional[Usage] = None
+        if "usage" in chunk:
+            usage_chunk = chunk["usage"]
+        elif (
+            isinstance(chunk, ModelResponse) or isinstance(chunk, ModelResponseStream)
+        ) and hasattr(chunk, "_hidden_params"):
+            usage_chunk = chunk._hidden_params.get("usage", None)
+
+        if usage_chunk is None:
+            return
+
+        usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            usage_per_chunk["prompt_tokens"] = usage_chunk_dict["prompt_tokens"]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            usage_per_chunk["completion_tokens"] = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
+            usage_chunk_dict["cache_creation_input_tokens"] > 0
+            or usage_per_chunk["cache_creation_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_creation_input_tokens"] = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None and (
+            usage_chunk_dict["cache_read_input_tokens"] > 0
+            or usage_per_chunk["cache_read_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_read_input_tokens"] = usage_chunk_dict[
+                "cache_read_input_tokens"
+            ]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            usage_per_chunk["completion_tokens_details"] = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        if (
+            usage_chunk_dict["prompt_tokens_details"] is not None
+            and getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+                None,
+            )
+            is not None
+        ):
+            usage_per_chunk["web_search_requests"] = getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+            )
+
+        usage_per_chunk["prompt_tokens_details"] = usage_chunk_dict[
+            "prompt_tokens_details"
+        ]
+
     def calculate_usage(
         self,
         chunks: List[Union[Dict[str, Any], ModelResponse]],
@@ -468,14 +477,18 @@ class ChunkProcessor:
         completion_output: str,
         messages: Optional[List] = None,
         reasoning_tokens: Optional[int] = None,
+        calculated_usage_per_chunk: Optional["UsagePerChunk"] = None,
     ) -> Usage:
         """
         Calculate usage for the given chunks.
+
+        If `calculated_usage_per_chunk` is passed (e.g. folded incrementally while streaming), the chunks are not re-walked.
         """
         returned_usage = Usage()
         # # Update usage information if needed
 
-        calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
+        if calculated_usage_per_chunk is None:
+            calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
         prompt_tokens = calculated_usage_per_chunk["prompt_tokens"]
         completion_tokens = calculated_usage_per_chunk["completion_tokens"]
         ## anthropic prompt caching information ##
@@ -566,6 +579,316 @@ class ChunkProcessor:
         return returned_usage
 
 
+class StreamingChunkAccumulator(ChunkProcessor):
+    """
+    Incremental version of `ChunkProcessor`, used by `CustomStreamWrapper`.
+
+    Each chunk is folded into running builders (content, reasoning, tool calls, thinking, audio, usage) as it arrives,
+    so building the complete response at the end of the stream doesn't need to sort / re-walk the list of chunks.
+
+    Assumes chunks are added in the order they were created.
+    """
+
+    def __init__(self):
+        self.first_chunk: Optional[ModelResponseStream] = None
+        self.last_chunk: Optional[ModelResponseStream] = None
+        self.is_text_completion: bool = False
+
+        self.chunk_id: str = ""
+        self.finish_reason: Optional[str] = "stop"
+        self.content_list: List[str] = []
+        self.has_content: bool = False
+        self.reasoning_content_list: List[str] = []
+        self.has_reasoning_content: bool = False
+        self.tool_call_map: Dict[int, Dict[str, Any]] = {}
+        self.has_tool_calls: bool = False
+        self.function_call_name: Optional[str] = None
+        self.function_call_arguments: List[str] = []
+        self.has_function_call: bool = False
+
+        self.thinking_text_list: List[str] = []
+        self.thinking_data: Optional[str] = None
+        self.thinking_signature: Optional[str] = None
+        self.thinking_type: Literal["thinking", "redacted_thinking"] = "thinking"
+        self.has_thinking_blocks: bool = False
+
+        self.audio_bytes = bytearray()
+        self.audio_transcript_list: List[str] = []
+        self.audio_expires_at: Optional[int] = None
+        self.audio_id: Optional[str] = None
+        self.has_audio: bool = False
+
+        self.usage_per_chunk = ChunkProcessor._get_empty_usage_per_chunk()
+
+    def add_chunk(self, chunk: ModelResponseStream) -> None:
+        """
+        Fold a single chunk into the running state. O(1) per chunk (excluding the size of the chunk itself).
+        """
+        if self.first_chunk is None:
+            self.first_chunk = chunk
+            choices = chunk.get("choices") or []
+            if len(choices) > 0 and isinstance(choices[0], TextChoices):
+                self.is_text_completion = True
+        self.last_chunk = chunk
+
+        if not self.chunk_id and chunk.get("id"):
+            self.chunk_id = chunk["id"]
+
+        self._update_usage_per_chunk(usage_per_chunk=self.usage_per_chunk, chunk=chunk)
+
+        if self.is_text_completion:
+            return
+
+        if "choices" not in chunk or len(chunk["choices"]) == 0:
+            return
+
+        first_choice = chunk["choices"][0]
+        if hasattr(first_choice, "finish_reason"):
+            self.finish_reason = first_choice.finish_reason
+        elif "finish_reason" in first_choice:
+            self.finish_reason = first_choice["finish_reason"]
+
+        delta = first_choice["delta"]
+        if "tool_calls" in delta and delta["tool_calls"] is not None:
+            self.has_tool_calls = True
+            self._add_tool_calls(chunk)
+        if "function_call" in delta and delta["function_call"] is not None:
+            self._add_function_call(chunk)
+        if "content" in delta and delta["content"] is not None:
+            self.has_content = True
+            self._add_content(chunk, self.content_list, delta_key="content")
+        if "thinking_blocks" in delta and delta["thinking_blocks"] is not None:
+            self.has_thinking_blocks = True
+            self._add_thinking_blocks(chunk)
+        if "reasoning_content" in delta and delta["reasoning_content"] is not None:
+            self.has_reasoning_content = True
+            self._add_content(
+                chunk, self.reasoning_content_list, delta_key="reasoning_content"
+            )
+        if "audio" in delta and delta["audio"] is not None:
+            self.has_audio = True
+            self._add_audio(chunk)
+
+    def _add_tool_calls(self, chunk: Dict[str, Any]) -> None:
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            tool_calls = delta.get("tool_calls", []) or []
+            for tool_call in tool_calls:
+                if not tool_call or not hasattr(tool_call, "function"):
+                    continue
+
+                index = getattr(tool_call, "index", 0)
+                if index not in self.tool_call_map:
+                    self.tool_call_map[index] = {
+                        "id": None,
+                        "name": None,
+                        "type": None,
+                        "arguments": [],
+                    }
+                tool_call_data = self.tool_call_map[index]
+                if hasattr(tool_call, "id") and tool_call.id:
+                    tool_call_data["id"] = tool_call.id
+                if hasattr(tool_call, "type") and tool_call.type:
+                    tool_call_data["type"] = tool_call.type
+                if hasattr(tool_call.function, "name") and tool_call.function.name:
+                    tool_call_data["name"] = tool_call.function.name
+                if (
+                    hasattr(tool_call.function, "arguments")
+                    and tool_call.function.arguments
+                ):
+                    tool_call_data["arguments"].append(tool_call.function.arguments)
+
+    def _add_function_call(self, chunk: Dict[str, Any]) -> None:
+        if self.has_function_call is False:
+            self.has_function_call = True
+            self.function_call_name = chunk["choices"][0]["delta"]["function_call"].name
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            function_call = delta.get("function_call", "")
+            if function_call:
+                self.function_call_arguments.append(function_call.arguments)
+
+    @staticmethod
+    def _add_content(
+        chunk: Dict[str, Any], content_list: List[str], delta_key: str
+    ) -> None:
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            content = delta.get(delta_key, "")
+            if content is None:
+                continue  # openai v1.0.0 sets content = None for chunks
+            content_list.append(content)
+
+    def _add_thinking_blocks(self, chunk: Dict[str, Any]) -> None:
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            thinking = delta.get("thinking_blocks", None)
+            if not thinking or not isinstance(thinking, list):
+                continue
+            for thinking_block in thinking:
+                thinking_type = thinking_block.get("type", None)
+                if thinking_type and thinking_type == "redacted_thinking":
+                    self.thinking_type = "redacted_thinking"
+                    self.thinking_data = thinking_block.get("data", None)
+                else:
+                    self.thinking_type = "thinking"
+                    thinking_text = thinking_block.get("thinking", None)
+                    if thinking_text:
+                        self.thinking_text_list.append(thinking_text)
+                    self.thinking_signature = thinking_block.get("signature", None)
+
+    def _add_audio(self, chunk: Dict[str, Any]) -> None:
+        for choice in chunk["choices"]:
+            delta = choice.get("delta") or {}
+            audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
+            if audio is None:
+                continue
+            for k, v in audio.items():
+                if k == "data" and v is not None and isinstance(v, str):
+                    self.audio_bytes.extend(base64.b64decode(v))
+                elif k == "transcript" and v is not None and isinstance(v, str):
+                    self.audio_transcript_list.append(v)
+                elif k == "expires_at" and v is not None and isinstance(v, int):
+                    self.audio_expires_at = v
+                elif k == "id" and v is not None and isinstance(v, str):
+                    self.audio_id = v
+
+    def _get_combined_tool_calls(self) -> List[ChatCompletionMessageToolCall]:
+        tool_calls_list: List[ChatCompletionMessageToolCall] = []
+        for index in sorted(self.tool_call_map.keys()):
+            tool_call_data = self.tool_call_map[index]
+            if tool_call_data["id"] and tool_call_data["name"]:
+                tool_calls_list.append(
+                    ChatCompletionMessageToolCall(
+                        id=tool_call_data["id"],
+                        function=Function(
+                            arguments="".join(tool_call_data["arguments"]) or "{}",
+                            name=tool_call_data["name"],
+                        ),
+                        type=tool_call_data["type"] or "function",
+                    )
+                )
+        return tool_calls_list
+
+    def _get_combined_thinking_blocks(
+        self,
+    ) -> Optional[
+        List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ]
+    ]:
+        from litellm.types.llms.openai import (
+            ChatCompletionRedactedThinkingBlock,
+            ChatCompletionThinkingBlock,
+        )
+
+        combined_thinking_text = "".join(self.thinking_text_list)
+        if (
+            combined_thinking_text
+            and self.thinking_type == "thinking"
+            and self.thinking_signature
+        ):
+            return [
+                ChatCompletionThinkingBlock(
+                    type="thinking",
+                    thinking=combined_thinking_text,
+                    signature=self.thinking_signature,
+                )
+            ]
+        elif self.thinking_data and self.thinking_type == "redacted_thinking":
+            return [
+                ChatCompletionRedactedThinkingBlock(
+                    type="redacted_thinking",
+                    data=self.thinking_data,
+                )
+            ]
+        return None
+
+    def build_base_response(self, chunks: List[Dict[str, Any]]) -> ModelResponse:
+        first_chunk = cast(ModelResponseStream, self.first_chunk)
+        response = ModelResponse(
+            **{
+                "id": self.chunk_id,
+                "object": first_chunk["object"],
+                "created": first_chunk["created"],
+                "model": first_chunk["model"],
+                "system_fingerprint": first_chunk.get("system_fingerprint", None),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": first_chunk["choices"][0]["delta"]["role"],
+                            "content": "",
+                        },
+                        "finish_reason": self.finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        )
+        return self.update_model_response_with_hidden_params(
+            model_response=response, chunk=self.last_chunk
+        )
+
+    def build_model_response(
+        self, messages: Optional[list] = None
+    ) -> Optional[ModelResponse]:
+        """
+        Build the complete `ModelResponse` from the accumulated state, without replaying the chunks.
+        """
+        from litellm.litellm_core_utils.prompt_templates.common_utils import (
+            get_content_from_model_response,
+        )
+
+        if self.first_chunk is None:
+            return None
+
+        response = self.build_base_response(chunks=[])
+        _choice = cast(Choices, response.choices[0])
+
+        if self.has_tool_calls:
+            _choice.message.content = None
+            _choice.message.tool_calls = self._get_combined_tool_calls()
+        if self.has_function_call:
+            _choice.message.content = None
+            _choice.message.function_call = FunctionCall(
+                name=self.function_call_name,
+                arguments="".join(self.function_call_arguments),
+            )
+        if self.has_content:
+            response["choices"][0]["message"]["content"] = "".join(self.content_list)
+        if self.has_thinking_blocks:
+            response["choices"][0]["message"][
+                "thinking_blocks"
+            ] = self._get_combined_thinking_blocks()
+        if self.has_reasoning_content:
+            response["choices"][0]["message"]["reasoning_content"] = "".join(
+                self.reasoning_content_list
+            )
+        if self.has_audio:
+            _choice.message.audio = ChatCompletionAudioResponse(
+                data=base64.b64encode(bytes(self.audio_bytes)).decode("utf-8"),
+                expires_at=self.audio_expires_at or int(time.time() + 3600),
+                transcript="".join(self.audio_transcript_list),
+                id=self.audio_id,
+            )
+
+        usage = self.calculate_usage(
+            chunks=[],
+            model=response["model"],
+            completion_output=get_content_from_model_response(response),
+            messages=messages,
+            reasoning_tokens=self.count_reasoning_tokens(response),
+            calculated_usage_per_chunk=self.usage_per_chunk,
+        )
+        setattr(response, "usage", usage)
+        return response
+
+
 def concatenate_base64_list(base64_strings: List[str]) -> str:
     """
     Concatenates a list of base64-encoded strings.
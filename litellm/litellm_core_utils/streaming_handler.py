@@ -14,7 +14,8 @@ from pydantic import BaseModel
 import litellm
 from litellm import verbose_logger
 from litellm.litellm_core_utils.redact_messages import LiteLLMLoggingObject
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
+from litellm.types.litellm_core_utils.callback_dispatcher import CallbackDispatchLaneName
 from litellm.types.llms.openai import ChatCompletionChunk
 from litellm.types.router import GenericLiteLLMParams
 from litellm.types.utils import Delta
@@ -23,6 +24,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     StreamingChoices,
+    TextCompletionResponse,
     Usage,
 )
 
@@ -46,9 +48,14 @@ def is_async_iterable(obj: Any) -> bool:
     return isinstance(obj, collections.abc.AsyncIterable)
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
+    """
+    `args` are %-formatted into `print_statement` only when verbose logging is on - keeps per-chunk debug logs cheap
+    """
     try:
         if litellm.set_verbose:
+            if args:
+                print_statement = print_statement % args
             print(print_statement)  # noqa
     except Exception:
         pass
@@ -65,6 +72,10 @@ class CustomStreamWrapper:
         make_call: Optional[Callable] = None,
         _response_headers: Optional[dict] = None,
     ):
+        from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+            StreamingChunkAccumulator,
+        )
+
         self.model = model
         self.make_call = make_call
         self.custom_llm_provider = custom_llm_provider
@@ -99,7 +110,8 @@ class CustomStreamWrapper:
         ]
         self.holding_chunk = ""
         self.complete_response = ""
-        self.response_uptil_now = ""
+        self._response_uptil_now_parts: List[str] = []
+        self._post_call_rules_checked_length: Optional[int] = None
         _model_info: Dict = litellm_params.model_info or {}
 
         _api_base = get_api_base(
@@ -131,12 +143,127 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
-            []
-        )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        # latest prompt / completion tokens reported on the returned chunks - used for calculating the total usage
+        self._usage_prompt_tokens = 0
+        self._usage_completion_tokens = 0
+        # content of the last returned chunk, and how many chunks in a row repeated it - used by safety_checker()
+        self._last_chunk_content: Optional[Any] = None
+        self._repeated_chunk_count = 0
+        self.chunk_accumulator = (
+            StreamingChunkAccumulator()
+        )  # folds each returned chunk in as it arrives - used for building the complete response at the end of the stream
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
 
+    def _append_chunk(self, chunk: Any) -> None:
+        try:
+            self.chunk_accumulator.add_chunk(chunk)
+        except Exception as e:
+            # only degrades the complete response used for logging / caching - never break the user's stream
+            verbose_logger.exception(
+                "LiteLLM.CustomStreamWrapper: error accumulating chunk, skipping it for the complete response - {}".format(
+                    str(e)
+                )
+            )
+
+        if "usage" in chunk:
+            if "prompt_tokens" in chunk["usage"]:
+                self._usage_prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
+            if "completion_tokens" in chunk["usage"]:
+                self._usage_completion_tokens = (
+                    chunk["usage"].get("completion_tokens", 0) or 0
+                )
+
+        choices = chunk.get("choices") or []
+        delta = getattr(choices[0], "delta", None) if len(choices) > 0 else None
+        content = getattr(delta, "content", None)
+        if self._repeated_chunk_count > 0 and content == self._last_chunk_content:
+            self._repeated_chunk_count += 1
+        else:
+            self._last_chunk_content = content
+            self._repeated_chunk_count = 1
+
+    def _calculate_total_usage(self) -> Usage:
+        """Assume most recent usage chunk has total usage uptil then."""
+        return Usage(
+            prompt_tokens=self._usage_prompt_tokens,
+            completion_tokens=self._usage_completion_tokens,
+            total_tokens=self._usage_prompt_tokens + self._usage_completion_tokens,
+        )
+
+    def _build_complete_streaming_response(
+        self,
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        Build the complete response from `self.chunk_accumulator`, for logging / caching.
+
+        Errors are logged and return None - they only degrade the logged response, the stream itself already finished.
+        """
+        try:
+            return litellm.stream_chunk_builder(
+                chunks=[],
+                messages=self.messages,
+                chunk_accumulator=self.chunk_accumulator,
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "LiteLLM.CustomStreamWrapper: error building the complete streaming response - {}".format(
+                    str(e)
+                )
+            )
+            return None
+
+    @property
+    def response_uptil_now(self) -> str:
+        """
+        Text content streamed so far.
+
+        Content is collected as a list of deltas and only joined when read - appending to a string on every chunk is O(n^2) over a stream.
+        """
+        if len(self._response_uptil_now_parts) > 1:
+            self._response_uptil_now_parts = ["".join(self._response_uptil_now_parts)]
+        if len(self._response_uptil_now_parts) == 0:
+            return ""
+        return self._response_uptil_now_parts[0]
+
+    @response_uptil_now.setter
+    def response_uptil_now(self, value: str) -> None:
+        self._response_uptil_now_parts = [value] if value else []
+
+    def _add_response_content(self, chunk: ModelResponseStream) -> None:
+        """
+        Track the chunk's text content, and run `litellm.post_call_rules` on the response so far.
+
+        Rules are only re-run when the response text changed, and the text is only joined if rules are set.
+        """
+        choice = chunk.choices[0]
+        if isinstance(choice, StreamingChoices):
+            content = choice.delta.get("content", "") or ""
+            if content:
+                self._response_uptil_now_parts.append(content)
+
+        if not litellm.post_call_rules:
+            return
+        response_uptil_now = self.response_uptil_now
+        if len(response_uptil_now) == self._post_call_rules_checked_length:
+            return
+        self.rules.post_call_rules(input=response_uptil_now, model=self.model)
+        self._post_call_rules_checked_length = len(response_uptil_now)
+
+    @staticmethod
+    def _remove_usage_from_chunk(chunk: ModelResponseStream) -> ModelResponseStream:
+        """
+        Returns the chunk without `usage` - usage is only sent on the final chunk.
+
+        Returns a shallow copy, the original chunk keeps its usage - it's folded into `self.chunk_accumulator` for calculating the total usage.
+        """
+        if not hasattr(chunk, "usage"):
+            return chunk
+        chunk_without_usage = chunk.model_copy()
+        delattr(chunk_without_usage, "usage")
+        chunk_without_usage._hidden_params = {**chunk._hidden_params}
+        return chunk_without_usage
+
     def __iter__(self):
         return self
 
@@ -187,28 +314,21 @@ class CustomStreamWrapper:
 
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
-        if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
-
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
-
-            # Check if all extracted contents are identical
-            if all(content == last_contents[0] for content in last_contents):
-                if (
-                    last_contents[0] is not None
-                    and isinstance(last_contents[0], str)
-                    and len(last_contents[0]) > 2
-                ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
-                    # All last n chunks are identical
-                    raise litellm.InternalServerError(
-                        message="The model is repeating the same chunk = {}.".format(
-                            last_contents[0]
-                        ),
-                        model="",
-                        llm_provider="",
-                    )
+        if self._repeated_chunk_count >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
+            # the last n chunks are identical
+            last_content = self._last_chunk_content
+            if (
+                last_content is not None
+                and isinstance(last_content, str)
+                and len(last_content) > 2
+            ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
+                raise litellm.InternalServerError(
+                    message="The model is repeating the same chunk = {}.".format(
+                        last_content
+                    ),
+                    model="",
+                    llm_provider="",
+                )
 
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
@@ -254,10 +374,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -360,7 +480,7 @@ class CustomStreamWrapper:
         is_finished = False
         finish_reason = ""
         text = ""
-        print_verbose(f"chunk: {chunk}")
+        print_verbose("chunk: %s", chunk)
         if "data: [DONE]" in chunk:
             text = ""
             is_finished = True
@@ -380,7 +500,10 @@ class CustomStreamWrapper:
                         is_finished = True
                         finish_reason = data_json["choices"][0]["finish_reason"]
                 print_verbose(
-                    f"text: {text}; is_finished: {is_finished}; finish_reason: {finish_reason}"
+                    "text: %s; is_finished: %s; finish_reason: %s",
+                    text,
+                    is_finished,
+                    finish_reason,
                 )
                 return {
                     "text": text,
@@ -423,7 +546,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -474,7 +597,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -495,7 +618,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -578,7 +701,7 @@ class CustomStreamWrapper:
                         "completion_tokens": 0,
                     }
             else:
-                print_verbose(f"chunk: {chunk} (Type: {type(chunk)})")
+                print_verbose("chunk: %s (Type: %s)", chunk, type(chunk))
                 raise ValueError(
                     f"Unable to parse response. Original response: {chunk}"
                 )
@@ -774,7 +897,10 @@ class CustomStreamWrapper:
         )
 
         print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         is_chunk_non_empty = self.is_chunk_non_empty(
             completion_obj, model_response, response_obj
@@ -803,11 +929,11 @@ class CustomStreamWrapper:
                                     choice_json.pop(
                                         "finish_reason", None
                                     )  # for mistral etc. which return a value in their last chunk (not-openai compatible).
-                                    print_verbose(f"choice_json: {choice_json}")
+                                    print_verbose("choice_json: %s", choice_json)
                                     choices.append(StreamingChoices(**choice_json))
                             except Exception:
                                 choices.append(StreamingChoices())
-                        print_verbose(f"choices in streaming: {choices}")
+                        print_verbose("choices in streaming: %s", choices)
                         setattr(model_response, "choices", choices)
                     else:
 
@@ -827,7 +953,8 @@ class CustomStreamWrapper:
 
                     model_response = self.strip_role_from_delta(model_response)
                     verbose_logger.debug(
-                        f"model_response.choices[0].delta inside is_chunk_non_empty: {model_response.choices[0].delta}"
+                        "model_response.choices[0].delta inside is_chunk_non_empty: %s",
+                        model_response.choices[0].delta,
                     )
                 else:
                     ## else
@@ -859,7 +986,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self._append_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -901,7 +1028,7 @@ class CustomStreamWrapper:
             return model_response
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self._append_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -1145,13 +1272,13 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "triton":
                 response_obj = self.handle_triton_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "text-completion-openai":
                 response_obj = self.handle_openai_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if response_obj["usage"] is not None:
@@ -1172,7 +1299,7 @@ class CustomStreamWrapper:
                     litellm.CodestralTextCompletionConfig()._chunk_parser(chunk),
                 )
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if "usage" in response_obj is not None:
@@ -1188,7 +1315,7 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "azure_text":
                 response_obj = self.handle_azure_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cached_response":
@@ -1208,7 +1335,7 @@ class CustomStreamWrapper:
                 completion_obj["content"] = response_obj["text"]
                 if response_obj["tool_calls"] is not None:
                     completion_obj["tool_calls"] = response_obj["tool_calls"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if hasattr(chunk, "id"):
                     model_response.id = chunk.id
                     self.response_id = chunk.id
@@ -1286,7 +1413,9 @@ class CustomStreamWrapper:
 
             model_response.model = self.model
             print_verbose(
-                f"model_response finish reason 3: {self.received_finish_reason}; response_obj={response_obj}"
+                "model_response finish reason 3: %s; response_obj=%s",
+                self.received_finish_reason,
+                response_obj,
             )
             ## FUNCTION CALL PARSING
             if (
@@ -1346,7 +1475,7 @@ class CustomStreamWrapper:
                                             ):
                                                 t.function.arguments = ""
                             _json_delta = delta.model_dump()
-                            print_verbose(f"_json_delta: {_json_delta}")
+                            print_verbose("_json_delta: %s", _json_delta)
                             if "role" not in _json_delta or _json_delta["role"] is None:
                                 _json_delta["role"] = (
                                     "assistant"  # mistral's api returns role as None
@@ -1382,10 +1511,10 @@ class CustomStreamWrapper:
                                 if original_chunk.choices[0].delta is None
                                 else dict(original_chunk.choices[0].delta)
                             )
-                            print_verbose(f"original delta: {delta}")
+                            print_verbose("original delta: %s", delta)
                             model_response.choices[0].delta = Delta(**delta)
                             print_verbose(
-                                f"new delta: {model_response.choices[0].delta}"
+                                "new delta: %s", model_response.choices[0].delta
                             )
                         except Exception:
                             model_response.choices[0].delta = Delta()
@@ -1397,9 +1526,11 @@ class CustomStreamWrapper:
                         return model_response
                     return
             print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+                "model_response.choices[0].delta: %s; completion_obj: %s",
+                model_response.choices[0].delta,
+                completion_obj,
             )
-            print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+            print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
 
             ## CHECK FOR TOOL USE
 
@@ -1531,12 +1662,14 @@ class CustomStreamWrapper:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
                     print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    print_verbose("PROCESSED CHUNK POST CHUNK CREATOR: %s", response)
 
                     if response is None:
                         continue
@@ -1545,47 +1678,27 @@ class CustomStreamWrapper:
                             completion_start_time=datetime.datetime.now()
                         )
                     ## LOGGING
-                    executor.submit(
+                    callback_dispatcher.submit(
+                        CallbackDispatchLaneName.STREAMING_LOGGING,
                         self.run_success_logging_and_cache_storage,
                         response,
                         cache_hit,
                     )  # log response
-                    choice = response.choices[0]
-                    if isinstance(choice, StreamingChoices):
-                        self.response_uptil_now += choice.delta.get("content", "") or ""
-                    else:
-                        self.response_uptil_now += ""
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
+                    self._add_response_content(response)
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
-                    if hasattr(
-                        response, "usage"
-                    ):  # remove usage from chunk, only send on final chunk
-                        # Convert the object to a dictionary
-                        obj_dict = response.dict()
-
-                        # Remove an attribute (e.g., 'attr2')
-                        if "usage" in obj_dict:
-                            del obj_dict["usage"]
-
-                        # Create a new object without the removed attribute
-                        response = self.model_response_creator(
-                            chunk=obj_dict, hidden_params=response._hidden_params
-                        )
+                    self._append_chunk(response)
+                    # remove usage from chunk, only send on final chunk
+                    response = self._remove_usage_from_chunk(response)
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self._calculate_total_usage()
                         response._hidden_params["usage"] = usage
                     # RETURN RESULT
                     return response
 
         except StopIteration:
             if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks, messages=self.messages
-                )
+                complete_streaming_response = self._build_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1600,7 +1713,8 @@ class CustomStreamWrapper:
                         ),
                         cache_hit=cache_hit,
                     )
-                    executor.submit(
+                    callback_dispatcher.submit(
+                        CallbackDispatchLaneName.SUCCESS_HANDLER,
                         self.logging_obj.success_handler,
                         complete_streaming_response.model_copy(deep=True),
                         None,
@@ -1608,7 +1722,8 @@ class CustomStreamWrapper:
                         cache_hit,
                     )
                 else:
-                    executor.submit(
+                    callback_dispatcher.submit(
+                        CallbackDispatchLaneName.SUCCESS_HANDLER,
                         self.logging_obj.success_handler,
                         response,
                         None,
@@ -1623,10 +1738,11 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self._calculate_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
-                executor.submit(
+                callback_dispatcher.submit(
+                    CallbackDispatchLaneName.STREAMING_LOGGING,
                     self.run_success_logging_and_cache_storage,
                     processed_chunk,
                     cache_hit,
@@ -1690,14 +1806,14 @@ class CustomStreamWrapper:
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}"
+                        "PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk
                     )
 
                     processed_chunk: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
@@ -1707,28 +1823,11 @@ class CustomStreamWrapper:
                             completion_start_time=datetime.datetime.now()
                         )
 
-                    choice = processed_chunk.choices[0]
-                    if isinstance(choice, StreamingChoices):
-                        self.response_uptil_now += choice.delta.get("content", "") or ""
-                    else:
-                        self.response_uptil_now += ""
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
-                    self.chunks.append(processed_chunk)
-                    if hasattr(
-                        processed_chunk, "usage"
-                    ):  # remove usage from chunk, only send on final chunk
-                        # Convert the object to a dictionary
-                        obj_dict = processed_chunk.dict()
-
-                        # Remove an attribute (e.g., 'attr2')
-                        if "usage" in obj_dict:
-                            del obj_dict["usage"]
-
-                        # Create a new object without the removed attribute
-                        processed_chunk = self.model_response_creator(chunk=obj_dict)
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    self._add_response_content(processed_chunk)
+                    self._append_chunk(processed_chunk)
+                    # remove usage from chunk, only send on final chunk
+                    processed_chunk = self._remove_usage_from_chunk(processed_chunk)
+                    print_verbose("final returned processed chunk: %s", processed_chunk)
                     return processed_chunk
                 raise StopAsyncIteration
             else:  # temporary patch for non-aiohttp async calls
@@ -1741,35 +1840,24 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        print_verbose("PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk)
                         processed_chunk: Optional[ModelResponseStream] = (
                             self.chunk_creator(chunk=chunk)
                         )
                         print_verbose(
-                            f"PROCESSED CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                            "PROCESSED CHUNK POST CHUNK CREATOR: %s", processed_chunk
                         )
                         if processed_chunk is None:
                             continue
 
-                        choice = processed_chunk.choices[0]
-                        if isinstance(choice, StreamingChoices):
-                            self.response_uptil_now += (
-                                choice.delta.get("content", "") or ""
-                            )
-                        else:
-                            self.response_uptil_now += ""
-                        self.rules.post_call_rules(
-                            input=self.response_uptil_now, model=self.model
-                        )
+                        self._add_response_content(processed_chunk)
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self._append_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks, messages=self.messages
-                )
+                complete_streaming_response = self._build_complete_streaming_response()
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
                     setattr(
@@ -1798,7 +1886,8 @@ class CustomStreamWrapper:
                     )
                 )
 
-                executor.submit(
+                callback_dispatcher.submit(
+                    CallbackDispatchLaneName.SUCCESS_HANDLER,
                     self.logging_obj.success_handler,
                     complete_streaming_response,
                     cache_hit=cache_hit,
@@ -1898,26 +1987,6 @@ class CustomStreamWrapper:
         return chunk
 
 
-def calculate_total_usage(chunks: List[ModelResponse]) -> Usage:
-    """Assume most recent usage chunk has total usage uptil then."""
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    for chunk in chunks:
-        if "usage" in chunk:
-            if "prompt_tokens" in chunk["usage"]:
-                prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
-            if "completion_tokens" in chunk["usage"]:
-                completion_tokens = chunk["usage"].get("completion_tokens", 0) or 0
-
-    returned_usage_chunk = Usage(
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=prompt_tokens + completion_tokens,
-    )
-
-    return returned_usage_chunk
-
-
 def generic_chunk_has_all_required_fields(chunk: dict) -> bool:
     """
     Checks if the provided chunk dictionary contains all required fields for GenericStreamingChunk.
@@ -1,9 +1,11 @@
 # What is this?
 ## Helper utilities for token counting
 import base64
+import hashlib
 import io
+import json
 import struct
-from typing import Callable, List, Literal, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, cast
 
 import tiktoken
 
@@ -17,7 +19,9 @@ from litellm.constants import (
     MAX_SHORT_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_TILE_HEIGHT,
     MAX_TILE_WIDTH,
+    TOKEN_COUNTER_CACHE_SIZE,
 )
+from litellm.caching.in_memory_cache import InMemoryCache
 from litellm.litellm_core_utils.default_encoding import encoding as default_encoding
 from litellm.llms.custom_httpx.http_handler import _get_httpx_client
 from litellm.types.llms.openai import (
@@ -298,6 +302,18 @@ TokenCounterFunction = Callable[[str], int]
 Type for a function that counts tokens in a string.
 """
 
+BatchTokenCounterFunction = Callable[[List[str]], List[int]]
+"""
+Type for a function that counts tokens in a list of strings, with a single tokenizer call.
+"""
+
+token_counter_cache = InMemoryCache(
+    max_size_in_memory=TOKEN_COUNTER_CACHE_SIZE, eviction_policy="lru"
+)
+"""
+Token counts per message / tool schema, keyed by a content hash - so a multi-turn conversation only counts the new turns.
+"""
+
 
 class _MessageCountParams:
     """
@@ -330,6 +346,10 @@ class _MessageCountParams:
             self.tokens_per_message = 3
             self.tokens_per_name = 1
         self.count_function = _get_count_function(model, custom_tokenizer)
+        self.batch_count_function = _get_batch_count_function(model, custom_tokenizer)
+        self.cache_key_prefix = _get_token_count_cache_key_prefix(
+            model, custom_tokenizer
+        )
 
 
 def token_counter(
@@ -402,7 +422,11 @@ def token_counter(
                 [message.get("role", None) == "system" for message in new_messages]
             )
             num_tokens += _count_extra(
-                params.count_function, tools, tool_choice, includes_system_message
+                params.count_function,
+                tools,
+                tool_choice,
+                includes_system_message,
+                cache_key_prefix=params.cache_key_prefix,
             )
 
     else:
@@ -420,6 +444,8 @@ def _count_messages(
     """
     Count the number of tokens in a list of messages.
 
+    Per-message counts are cached by content hash. Strings of the messages that are not cached are encoded in one batched tokenizer call.
+
     Args:
         params (_MessageCountParams): The parameters for counting tokens.
         messages (List[AllMessageValues]): The list of messages to count tokens in.
@@ -429,49 +455,177 @@ def _count_messages(
     num_tokens = 0
     if len(messages) == 0:
         return num_tokens
+
+    uncached_messages: List[Tuple[AllMessageValues, Optional[str]]] = []
     for message in messages:
-        num_tokens += params.tokens_per_message
-        for key, value in message.items():
-            if value is None:
-                pass
-            elif key == "tool_calls":
-                if isinstance(value, List):
-                    for tool_call in value:
-                        if "function" in tool_call:
-                            function_arguments = tool_call["function"].get(
-                                "arguments", []
-                            )
-                            num_tokens += params.count_function(str(function_arguments))
-                        else:
-                            raise ValueError(
-                                f"Unsupported tool call {tool_call} must contain a function key"
-                            )
-                else:
-                    raise ValueError(
-                        f"Unsupported type {type(value)} for key tool_calls in message {message}"
-                    )
-            elif isinstance(value, str):
-                num_tokens += params.count_function(value)
-                if key == "name":
-                    num_tokens += params.tokens_per_name
-            elif key == "content" and isinstance(value, List):
-                num_tokens += _count_content_list(
-                    params.count_function,
-                    value,
-                    use_default_image_token_count,
-                    default_token_count,
-                )
+        cache_key = _get_token_count_cache_key(
+            params.cache_key_prefix,
+            message,
+            use_default_image_token_count,
+            default_token_count,
+        )
+        cached_num_tokens = (
+            token_counter_cache.get_cache(key=cache_key)
+            if cache_key is not None
+            else None
+        )
+        if cached_num_tokens is not None:
+            num_tokens += cached_num_tokens
+        else:
+            uncached_messages.append((message, cache_key))
+
+    if len(uncached_messages) == 0:
+        return num_tokens
+
+    count_function = _get_batched_count_function(
+        params,
+        texts=[
+            text
+            for message, _ in uncached_messages
+            for text in _get_message_texts(message)
+        ],
+    )
+    for message, cache_key in uncached_messages:
+        message_num_tokens = _count_message(
+            params,
+            count_function,
+            message,
+            use_default_image_token_count,
+            default_token_count,
+        )
+        if cache_key is not None:
+            token_counter_cache.set_cache(key=cache_key, value=message_num_tokens)
+        num_tokens += message_num_tokens
+    return num_tokens
+
+
+def _count_message(
+    params: _MessageCountParams,
+    count_function: TokenCounterFunction,
+    message: AllMessageValues,
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    """
+    Count the number of tokens in a single message.
+    """
+    num_tokens = params.tokens_per_message
+    for key, value in message.items():
+        if value is None:
+            pass
+        elif key == "tool_calls":
+            if isinstance(value, List):
+                for tool_call in value:
+                    if "function" in tool_call:
+                        function_arguments = tool_call["function"].get("arguments", [])
+                        num_tokens += count_function(str(function_arguments))
+                    else:
+                        raise ValueError(
+                            f"Unsupported tool call {tool_call} must contain a function key"
+                        )
             else:
-                # Skip unsupported keys instead of raising an error
-                continue
+                raise ValueError(
+                    f"Unsupported type {type(value)} for key tool_calls in message {message}"
+                )
+        elif isinstance(value, str):
+            num_tokens += count_function(value)
+            if key == "name":
+                num_tokens += params.tokens_per_name
+        elif key == "content" and isinstance(value, List):
+            num_tokens += _count_content_list(
+                count_function,
+                value,
+                use_default_image_token_count,
+                default_token_count,
+            )
+        else:
+            # Skip unsupported keys instead of raising an error
+            continue
     return num_tokens
 
 
+def _get_message_texts(message: AllMessageValues) -> List[str]:
+    """
+    Get the strings of a message that `_count_message` will tokenize - used to batch encode them up front.
+    """
+    texts: List[str] = []
+    for key, value in message.items():
+        if isinstance(value, str):
+            texts.append(value)
+        elif key == "tool_calls" and isinstance(value, List):
+            for tool_call in value:
+                if isinstance(tool_call, dict) and "function" in tool_call:
+                    texts.append(str(tool_call["function"].get("arguments", [])))
+        elif key == "content" and isinstance(value, List):
+            for c in value:
+                if isinstance(c, str):
+                    texts.append(c)
+                elif isinstance(c, dict) and isinstance(c.get("text"), str):
+                    texts.append(cast(str, c["text"]))
+    return texts
+
+
+def _get_batched_count_function(
+    params: _MessageCountParams, texts: List[str]
+) -> TokenCounterFunction:
+    """
+    Encode `texts` in a single tokenizer call, and return a count function that looks up their counts.
+
+    Falls back to `params.count_function` for strings that were not batch encoded.
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    if len(unique_texts) <= 1:
+        return params.count_function
+    try:
+        text_counts: Dict[str, int] = dict(
+            zip(unique_texts, params.batch_count_function(unique_texts))
+        )
+    except Exception as e:
+        verbose_logger.debug(f"Error batch counting tokens: {e}")
+        return params.count_function
+
+    def count_tokens(text: str) -> int:
+        num_tokens = text_counts.get(text)
+        if num_tokens is None:
+            return params.count_function(text)
+        return num_tokens
+
+    return count_tokens
+
+
+def _get_token_count_cache_key_prefix(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]],
+) -> Optional[str]:
+    """
+    Prefix identifying the tokenizer used for counting. None (no caching) for custom tokenizers.
+    """
+    if custom_tokenizer is not None:
+        return None
+    return f"token_counter:{model}"
+
+
+def _get_token_count_cache_key(
+    cache_key_prefix: Optional[str], obj: Any, *args: Any
+) -> Optional[str]:
+    """
+    Content hash of a message / tool schema (+ counting args), used as the token count cache key.
+    """
+    if cache_key_prefix is None or litellm.disable_token_counter_cache is True:
+        return None
+    try:
+        serialized = json.dumps([obj, *args], sort_keys=True, default=str)
+    except Exception:
+        return None
+    return f"{cache_key_prefix}:{hashlib.sha256(serialized.encode()).hexdigest()}"
+
+
 def _count_extra(
     count_function: TokenCounterFunction,
     tools: Optional[List[ChatCompletionToolParam]],
     tool_choice: Optional[ChatCompletionNamedToolChoiceParam],
     includes_system_message: bool,
+    cache_key_prefix: Optional[str] = None,
 ) -> int:
     """Count extra tokens for function definitions and tool choices.
     Args:
@@ -479,12 +633,15 @@ def _count_extra(
         tools (Optional[List[ChatCompletionToolParam]]): The available tools.
         tool_choice (Optional[ChatCompletionNamedToolChoiceParam]): The tool choice.
         includes_system_message (bool): Whether the messages include a system message.
+        cache_key_prefix (Optional[str]): Tokenizer identifier, to cache the tool definitions token count. Not cached if None.
     """
 
     num_tokens = 3  # every reply is primed with <|start|>assistant<|message|>
 
     if tools:
-        num_tokens += count_function(_format_function_definitions(tools))
+        num_tokens += _count_function_definitions(
+            count_function, tools, cache_key_prefix
+        )
         num_tokens += 9  # Additional tokens for function definition of tools
     # If there's a system message and tools are present, subtract four tokens
     if tools and includes_system_message:
@@ -501,13 +658,48 @@ def _count_extra(
     return num_tokens
 
 
+def _count_function_definitions(
+    count_function: TokenCounterFunction,
+    tools: List[ChatCompletionToolParam],
+    cache_key_prefix: Optional[str],
+) -> int:
+    """
+    Count the tokens of the formatted tool definitions - cached by a content hash of the tool schemas.
+    """
+    cache_key = _get_token_count_cache_key(cache_key_prefix, tools)
+    if cache_key is not None:
+        cached_num_tokens = token_counter_cache.get_cache(key=cache_key)
+        if cached_num_tokens is not None:
+            return cached_num_tokens
+    num_tokens = count_function(_format_function_definitions(tools))
+    if cache_key is not None:
+        token_counter_cache.set_cache(key=cache_key, value=num_tokens)
+    return num_tokens
+
+
+def _get_openai_encoding(model: Optional[str]) -> tiktoken.Encoding:
+    """
+    Get the tiktoken encoding for the model
+    """
+    from litellm.utils import print_verbose
+
+    model_to_use = _fix_model_name(model)  # type: ignore
+    try:
+        if "gpt-4o" in model_to_use:
+            return tiktoken.get_encoding("o200k_base")
+        return tiktoken.encoding_for_model(model_to_use)
+    except KeyError:
+        print_verbose("Warning: model not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def _get_count_function(
     model: Optional[str],
     custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
 ) -> TokenCounterFunction:
     """
     Get the function to count tokens based on the model and custom tokenizer."""
-    from litellm.utils import _select_tokenizer, print_verbose
+    from litellm.utils import _select_tokenizer
 
     if model is not None or custom_tokenizer is not None:
         tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
@@ -518,15 +710,7 @@ def _get_count_function(
                 return len(enc.ids)
 
         elif tokenizer_json["type"] == "openai_tokenizer":
-            model_to_use = _fix_model_name(model)  # type: ignore
-            try:
-                if "gpt-4o" in model_to_use:
-                    encoding = tiktoken.get_encoding("o200k_base")
-                else:
-                    encoding = tiktoken.encoding_for_model(model_to_use)
-            except KeyError:
-                print_verbose("Warning: model not found. Using cl100k_base encoding.")
-                encoding = tiktoken.get_encoding("cl100k_base")
+            encoding = _get_openai_encoding(model)
 
             def count_tokens(text: str) -> int:
                 return len(encoding.encode(text))
@@ -541,6 +725,63 @@ def _get_count_function(
     return count_tokens
 
 
+def _get_batch_count_function(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+) -> BatchTokenCounterFunction:
+    """
+    Get the function to count tokens in a list of strings, with a single tokenizer call.
+
+    Mirrors `_get_count_function`.
+    """
+    from litellm.utils import _select_tokenizer
+
+    if model is not None or custom_tokenizer is not None:
+        tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
+        if tokenizer_json["type"] == "huggingface_tokenizer":
+
+            def batch_count_tokens(texts: List[str]) -> List[int]:
+                encodings = tokenizer_json["tokenizer"].encode_batch(texts)
+                return [len(enc.ids) for enc in encodings]
+
+        elif tokenizer_json["type"] == "openai_tokenizer":
+            encoding = _get_openai_encoding(model)
+
+            def batch_count_tokens(texts: List[str]) -> List[int]:
+                return [len(enc) for enc in encoding.encode_batch(texts)]
+
+        else:
+            raise ValueError("Unsupported tokenizer type")
+    else:
+
+        def batch_count_tokens(texts: List[str]) -> List[int]:
+            return [
+                len(enc)
+                for enc in default_encoding.encode_batch(texts, disallowed_special=())
+            ]
+
+    return batch_count_tokens
+
+
+def prewarm_tokenizers() -> None:
+    """
+    Load the tokenizers bundled in `litellm_core_utils/tokenizers`, so the first request doesn't pay the load cost.
+
+    Blocking - call from a background thread.
+    """
+    from litellm.utils import _get_claude_tokenizer
+
+    for encoding_name in ["cl100k_base", "o200k_base", "p50k_base"]:
+        try:
+            tiktoken.get_encoding(encoding_name)
+        except Exception as e:
+            verbose_logger.debug(f"Error pre-warming {encoding_name} tokenizer: {e}")
+    try:
+        _get_claude_tokenizer()
+    except Exception as e:
+        verbose_logger.debug(f"Error pre-warming anthropic tokenizer: {e}")
+
+
 def _fix_model_name(model: str) -> str:
     """We normalize some model names to others"""
     if model in litellm.azure_llms:
@@ -38,6 +38,8 @@ else:
 
 
 class AmazonInvokeAgentConfig(BaseConfig, BaseAWSLLM):
+    _response_stream_shape_cache = None
+
     def __init__(self, **kwargs):
         BaseConfig.__init__(self, **kwargs)
         BaseAWSLLM.__init__(self, **kwargs)
@@ -285,16 +287,8 @@ class AmazonInvokeAgentConfig(BaseConfig, BaseAWSLLM):
             )
 
     def _get_response_stream_shape(self):
-        """Get the response stream shape for parsing, reusing existing logic."""
-        try:
-            # Try to reuse the cached shape from the existing decoder
-            from litellm.llms.bedrock.chat.invoke_handler import (
-                get_response_stream_shape,
-            )
-
-            return get_response_stream_shape()
-        except ImportError:
-            # Fallback: create our own shape
+        """Get the response stream shape for parsing - loaded once, then cached on the class."""
+        if AmazonInvokeAgentConfig._response_stream_shape_cache is None:
             try:
                 from botocore.loaders import Loader
                 from botocore.model import ServiceModel
@@ -304,10 +298,13 @@ class AmazonInvokeAgentConfig(BaseConfig, BaseAWSLLM):
                     "bedrock-runtime", "service-2"
                 )
                 bedrock_service_model = ServiceModel(bedrock_service_dict)
-                return bedrock_service_model.shape_for("ResponseStream")
+                AmazonInvokeAgentConfig._response_stream_shape_cache = (
+                    bedrock_service_model.shape_for("ResponseStream")
+                )
             except Exception as e:
                 verbose_logger.warning(f"Could not load response stream shape: {e}")
                 return None
+        return AmazonInvokeAgentConfig._response_stream_shape_cache
 
     def _extract_response_content(self, events: InvokeAgentEventList) -> str:
         """Extract the final response content from parsed events."""
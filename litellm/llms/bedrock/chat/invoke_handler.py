@@ -2,6 +2,7 @@
 TODO: DELETE FILE. Bedrock LLM is no longer used. Goto `litellm/llms/bedrock/chat/invoke_transformations/base_invoke_transformation.py`
 """
 
+import base64
 import copy
 import json
 import time
@@ -13,6 +14,7 @@ from typing import (
     Any,
     AsyncIterator,
     Callable,
+    Dict,
     Iterator,
     List,
     Optional,
@@ -67,9 +69,13 @@ from litellm.types.utils import (
 from litellm.utils import CustomStreamWrapper, get_secret
 
 from ..base_aws_llm import BaseAWSLLM
-from ..common_utils import BedrockError, ModelResponseIterator, get_bedrock_tool_name
+from ..common_utils import (
+    AWSEventStreamFrameDecoder,
+    BedrockError,
+    ModelResponseIterator,
+    get_bedrock_tool_name,
+)
 
-_response_stream_shape_cache = None
 bedrock_tool_name_mappings: InMemoryCache = InMemoryCache(
     max_size_in_memory=50, default_ttl=600
 )
@@ -1204,50 +1210,38 @@ class BedrockLLM(BaseAWSLLM):
         return self.encode_model_id(model_id=model_id)
 
 
-def get_response_stream_shape():
-    global _response_stream_shape_cache
-    if _response_stream_shape_cache is None:
-        from botocore.loaders import Loader
-        from botocore.model import ServiceModel
-
-        loader = Loader()
-        bedrock_service_dict = loader.load_service_model("bedrock-runtime", "service-2")
-        bedrock_service_model = ServiceModel(bedrock_service_dict)
-        _response_stream_shape_cache = bedrock_service_model.shape_for("ResponseStream")
-
-    return _response_stream_shape_cache
-
-
 class AWSEventStreamDecoder:
     def __init__(self, model: str) -> None:
-        from botocore.parsers import EventStreamJSONParser
-
         self.model = model
-        self.parser = EventStreamJSONParser()
-        self.content_blocks: List[ContentBlockDeltaEvent] = []
         self.tool_calls_index: Optional[int] = None
+        # current content block - whether it's a tool use block (None if no deltas yet), and the length of its tool call args so far
+        self.content_block_is_tool_use: Optional[bool] = None
+        self.tool_call_args_length: int = 0
 
     def check_empty_tool_call_args(self) -> bool:
         """
         Check if the tool call block so far has been an empty string
         """
-        args = ""
         # if text content block -> skip
-        if len(self.content_blocks) == 0:
+        # be explicit - only do this if tool use block, as this is to prevent json decoding errors
+        if self.content_block_is_tool_use is not True:
             return False
 
-        if (
-            "toolUse" not in self.content_blocks[0]
-        ):  # be explicit - only do this if tool use block, as this is to prevent json decoding errors
-            return False
-
-        for block in self.content_blocks:
-            if "toolUse" in block:
-                args += block["toolUse"]["input"]
+        return self.tool_call_args_length == 0
 
-        if len(args) == 0:
-            return True
-        return False
+    def _track_content_block(self, chunk_data: dict) -> None:
+        """
+        Track the current content block for `check_empty_tool_call_args` - reset on a 'start' chunk, add the tool call args of a 'delta' chunk
+        """
+        if "start" in chunk_data:
+            self.content_block_is_tool_use = None
+            self.tool_call_args_length = 0
+        elif "delta" in chunk_data:
+            delta_obj = chunk_data["delta"]
+            if self.content_block_is_tool_use is None:
+                self.content_block_is_tool_use = "toolUse" in delta_obj
+            if "toolUse" in delta_obj:
+                self.tool_call_args_length += len(delta_obj["toolUse"]["input"])
 
     def extract_reasoning_content_str(
         self, reasoning_content_block: BedrockConverseReasoningContentBlockDelta
@@ -1289,7 +1283,7 @@ class AWSEventStreamDecoder:
 
     def converse_chunk_parser(self, chunk_data: dict) -> ModelResponseStream:
         try:
-            verbose_logger.debug("\n\nRaw Chunk: {}\n\n".format(chunk_data))
+            verbose_logger.debug("\n\nRaw Chunk: %s\n\n", chunk_data)
             text = ""
             tool_use: Optional[ChatCompletionToolCallChunk] = None
             finish_reason = ""
@@ -1305,9 +1299,9 @@ class AWSEventStreamDecoder:
             ] = None
 
             index = int(chunk_data.get("contentBlockIndex", 0))
+            self._track_content_block(chunk_data)
             if "start" in chunk_data:
                 start_obj = ContentBlockStartEvent(**chunk_data["start"])
-                self.content_blocks = []  # reset
                 if start_obj is not None:
                     if "toolUse" in start_obj and start_obj["toolUse"] is not None:
                         ## check tool name was formatted by litellm
@@ -1341,7 +1335,6 @@ class AWSEventStreamDecoder:
                         }
             elif "delta" in chunk_data:
                 delta_obj = ContentBlockDeltaEvent(**chunk_data["delta"])
-                self.content_blocks.append(delta_obj)
                 if "text" in delta_obj:
                     text = delta_obj["text"]
                 elif "toolUse" in delta_obj:
@@ -1488,13 +1481,12 @@ class AWSEventStreamDecoder:
         self, iterator: Iterator[bytes]
     ) -> Iterator[Union[GChunk, ModelResponseStream, dict]]:
         """Given an iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        frame_decoder = AWSEventStreamFrameDecoder()
         for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                message = self._parse_message_from_event(event)
+            for headers, payload in frame_decoder.decode(chunk):
+                message = self._parse_message_from_frame(
+                    headers=headers, payload=payload
+                )
                 if message:
                     # sse_event = ServerSentEvent(data=message, event="completion")
                     _data = json.loads(message)
@@ -1504,50 +1496,45 @@ class AWSEventStreamDecoder:
         self, iterator: AsyncIterator[bytes]
     ) -> AsyncIterator[Union[GChunk, ModelResponseStream, dict]]:
         """Given an async iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        frame_decoder = AWSEventStreamFrameDecoder()
         async for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                message = self._parse_message_from_event(event)
+            for headers, payload in frame_decoder.decode(chunk):
+                message = self._parse_message_from_frame(
+                    headers=headers, payload=payload
+                )
                 if message:
                     _data = json.loads(message)
                     yield self._chunk_parser(chunk_data=_data)
 
     def _parse_message_from_event(self, event) -> Optional[str]:
-        response_dict = event.to_response_dict()
-        parsed_response = self.parser.parse(response_dict, get_response_stream_shape())
-
-        if response_dict["status_code"] != 200:
-            decoded_body = response_dict["body"].decode()
-            if isinstance(decoded_body, dict):
-                error_message = decoded_body.get("message")
-            elif isinstance(decoded_body, str):
-                error_message = decoded_body
-            else:
-                error_message = ""
-            exception_status = response_dict["headers"].get(":exception-type")
-            error_message = exception_status + " " + error_message
+        """Parse a botocore `EventStreamMessage`"""
+        return self._parse_message_from_frame(
+            headers=event.headers, payload=event.payload
+        )
+
+    def _parse_message_from_frame(
+        self, headers: Dict[str, Any], payload: bytes
+    ) -> Optional[str]:
+        message_type = headers.get(":message-type")
+        if message_type == "error" or message_type == "exception":
+            error_message = payload.decode()
+            exception_status = (
+                headers.get(":exception-type") or headers.get(":error-code") or ""
+            )
             raise BedrockError(
-                status_code=response_dict["status_code"],
-                message=(
-                    json.dumps(error_message)
-                    if isinstance(error_message, dict)
-                    else error_message
-                ),
+                status_code=400,
+                message=exception_status + " " + error_message,
             )
-        if "chunk" in parsed_response:
-            chunk = parsed_response.get("chunk")
-            if not chunk:
+        if not payload:
+            return None
+        if headers.get(":event-type") == "chunk":
+            # /invoke-with-response-stream - {"bytes": "<base64 encoded model chunk>"}
+            chunk_bytes = json.loads(payload).get("bytes")
+            if not chunk_bytes:
                 return None
-            return chunk.get("bytes").decode()  # type: ignore[no-any-return]
-        else:
-            chunk = response_dict.get("body")
-            if not chunk:
-                return None
-
-            return chunk.decode()  # type: ignore[no-any-return]
+            return base64.b64decode(chunk_bytes).decode()
+        # /converse-stream - the payload is the event
+        return payload.decode()
 
 
 class AmazonAnthropicClaudeStreamDecoder(AWSEventStreamDecoder):
@@ -4,7 +4,9 @@ Common utilities used across bedrock chat/embedding/image generation
 
 import json
 import os
-from typing import TYPE_CHECKING, List, Literal, Optional, Union
+import struct
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import httpx
 
@@ -461,6 +463,140 @@ class BedrockModelInfo(BaseLLMModelInfo):
         return "invoke"
 
 
+class AWSEventStreamFrameDecoder:
+    """
+    Decodes `application/vnd.amazon.eventstream` frames from a stream of bytes.
+
+    Each frame is:
+    - prelude: total length (uint32), headers length (uint32), prelude crc (uint32)
+    - headers
+    - payload
+    - message crc (uint32)
+
+    Frames are read straight out of a bytearray via memoryview slices, and the consumed bytes are dropped once per `decode()` call.
+    """
+
+    _PRELUDE = struct.Struct("!III")
+    _UINT32 = struct.Struct("!I")
+    _UINT16 = struct.Struct("!H")
+    _PRELUDE_LENGTH = 12
+    _MESSAGE_CRC_LENGTH = 4
+    # same limits as botocore.eventstream
+    _MAX_HEADERS_LENGTH = 128 * 1024
+    _MAX_PAYLOAD_LENGTH = 16 * 1024**2
+
+    # header value type -> fixed size struct
+    _FIXED_SIZE_HEADER_VALUES = {
+        2: struct.Struct("!b"),  # byte
+        3: struct.Struct("!h"),  # short
+        4: struct.Struct("!i"),  # integer
+        5: struct.Struct("!q"),  # long
+        8: struct.Struct("!q"),  # timestamp
+    }
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def decode(self, data: bytes) -> List[Tuple[Dict[str, Any], bytes]]:
+        """
+        Add `data` to the buffer, and return the (headers, payload) of every complete frame in it.
+        """
+        self._buffer += data
+        frames: List[Tuple[Dict[str, Any], bytes]] = []
+        buffer_length = len(self._buffer)
+        offset = 0
+        with memoryview(self._buffer) as view:
+            while buffer_length - offset >= self._PRELUDE_LENGTH:
+                total_length, headers_length, prelude_crc = self._PRELUDE.unpack_from(
+                    view, offset
+                )
+                if zlib.crc32(view[offset : offset + 8]) != prelude_crc:
+                    raise BedrockError(
+                        status_code=500,
+                        message="Invalid event stream frame - prelude checksum mismatch",
+                    )
+                payload_length = (
+                    total_length
+                    - headers_length
+                    - self._PRELUDE_LENGTH
+                    - self._MESSAGE_CRC_LENGTH
+                )
+                if (
+                    headers_length > self._MAX_HEADERS_LENGTH
+                    or payload_length > self._MAX_PAYLOAD_LENGTH
+                    or payload_length < 0
+                ):
+                    raise BedrockError(
+                        status_code=500,
+                        message="Invalid event stream frame - total length={}, headers length={}".format(
+                            total_length, headers_length
+                        ),
+                    )
+                if buffer_length - offset < total_length:
+                    break  # wait for the rest of the frame
+
+                crc_offset = offset + total_length - self._MESSAGE_CRC_LENGTH
+                (message_crc,) = self._UINT32.unpack_from(view, crc_offset)
+                if zlib.crc32(view[offset:crc_offset]) != message_crc:
+                    raise BedrockError(
+                        status_code=500,
+                        message="Invalid event stream frame - message checksum mismatch",
+                    )
+                headers_offset = offset + self._PRELUDE_LENGTH
+                payload_offset = headers_offset + headers_length
+                frames.append(
+                    (
+                        self._decode_headers(view[headers_offset:payload_offset]),
+                        bytes(view[payload_offset:crc_offset]),
+                    )
+                )
+                offset += total_length
+
+        if offset > 0:
+            del self._buffer[:offset]
+        return frames
+
+    def _decode_headers(self, view: memoryview) -> Dict[str, Any]:
+        headers: Dict[str, Any] = {}
+        offset = 0
+        while offset < len(view):
+            name_length = view[offset]
+            offset += 1
+            name = bytes(view[offset : offset + name_length]).decode("utf-8")
+            offset += name_length
+            value_type = view[offset]
+            offset += 1
+
+            value: Any
+            if value_type == 0:
+                value = True
+            elif value_type == 1:
+                value = False
+            elif value_type in self._FIXED_SIZE_HEADER_VALUES:
+                value_struct = self._FIXED_SIZE_HEADER_VALUES[value_type]
+                (value,) = value_struct.unpack_from(view, offset)
+                offset += value_struct.size
+            elif value_type in (6, 7):  # bytes / string
+                (value_length,) = self._UINT16.unpack_from(view, offset)
+                offset += self._UINT16.size
+                value = bytes(view[offset : offset + value_length])
+                if value_type == 7:
+                    value = value.decode("utf-8")
+                offset += value_length
+            elif value_type == 9:  # uuid
+                value = bytes(view[offset : offset + 16])
+                offset += 16
+            else:
+                raise BedrockError(
+                    status_code=500,
+                    message="Invalid event stream frame - unknown header value type={}".format(
+                        value_type
+                    ),
+                )
+            headers[name] = value
+        return headers
+
+
 class BedrockEventStreamDecoderBase:
     """
     Base class for event stream decoding for Bedrock
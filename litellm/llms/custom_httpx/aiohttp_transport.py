@@ -157,9 +157,10 @@ class LiteLLMAiohttpTransport(AiohttpTransport):
             session_loop = getattr(self.client, "_loop", None)
             current_loop = asyncio.get_running_loop()
 
-            # If session is from a different or closed loop, recreate it
+            # If session is closed, or from a different or closed loop, recreate it
             if (
-                session_loop is None
+                self.client.closed
+                or session_loop is None
                 or session_loop != current_loop
                 or session_loop.is_closed()
             ):
@@ -8,16 +8,24 @@ async def close_litellm_async_clients():
     """
     Close all cached async HTTP clients to prevent resource leaks.
 
-    This function iterates through all cached clients in litellm's in-memory cache
-    and closes any aiohttp client sessions that are still open.
+    This function iterates through all cached clients in litellm's in-memory cache,
+    and the pooled httpx clients, and closes any aiohttp client sessions that are still open.
     """
     # Import here to avoid circular import
     import litellm
     from litellm.llms.custom_httpx.aiohttp_handler import BaseLLMAIOHTTPHandler
+    from litellm.llms.custom_httpx.connection_pool_manager import (
+        http_connection_pool_manager,
+    )
 
     cache_dict = getattr(litellm.in_memory_llm_clients_cache, "cache_dict", {})
+    handlers = list(cache_dict.values()) + [
+        pool.client
+        for pool in http_connection_pool_manager.pools.values()
+        if pool.is_async
+    ]
 
-    for key, handler in cache_dict.items():
+    for handler in handlers:
         # Handle BaseLLMAIOHTTPHandler instances (aiohttp_openai provider)
         if isinstance(handler, BaseLLMAIOHTTPHandler) and hasattr(handler, "close"):
             try:
@@ -0,0 +1,488 @@
+"""
+Shared, bounded set of httpx connection pools, used by `get_async_httpx_client` and `_get_httpx_client`.
+
+- Pools are keyed by provider and their connection settings (TLS config, pool limits, timeout, event loop).
+  Each provider gets its own pool, so one provider's traffic can't use up another's `max_connections`.
+- Pools are not expired on a TTL. Once there are more than `MAX_HTTP_CONNECTION_POOLS`, the least recently used pool is dropped.
+  Callers may still hold its client mid-request, so an async pool's connections are only closed once none are active.
+- Per-provider pool limits are read from `litellm.http_pool_settings`.
+- Each pool reports its occupancy, the time spent waiting for a free connection, and its connect latency.
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    EVICTED_HTTP_POOL_CLOSE_CHECK_INTERVAL,
+    HTTP_POOL_WARMUP_TIMEOUT,
+    MAX_HTTP_CONNECTION_POOLS,
+)
+from litellm.litellm_core_utils.core_helpers import get_avg_ms
+from litellm.types.llms.custom_http import HTTPPoolMetrics, HTTPPoolSettings
+
+if TYPE_CHECKING:
+    from aiohttp import TraceConfig
+
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+else:
+    TraceConfig = Any
+    AsyncHTTPHandler = Any
+    HTTPHandler = Any
+
+DEFAULT_POOL_SETTINGS_KEY = "default"
+# settings that don't change how the pool is built, so they are not part of the pool key
+_WARMUP_POOL_SETTINGS = ("warmup_connections", "warmup_urls")
+
+
+class HTTPPoolStats:
+    """
+    Connection wait time and connect latency of one pool.
+
+    Recorded by the aiohttp transport (the default transport) via an aiohttp `TraceConfig`.
+    aiohttp only queues a request when all `max_connections` connections are in use.
+    """
+
+    def __init__(self):
+        self.connection_wait_count: int = 0
+        self.connection_wait_total_seconds: float = 0.0
+        self.connection_wait_max_seconds: float = 0.0
+        self.connect_count: int = 0
+        self.connect_total_seconds: float = 0.0
+        self.connect_max_seconds: float = 0.0
+
+    def record_connection_wait(self, seconds: float):
+        self.connection_wait_count += 1
+        self.connection_wait_total_seconds += seconds
+        self.connection_wait_max_seconds = max(
+            self.connection_wait_max_seconds, seconds
+        )
+
+    def record_connect(self, seconds: float):
+        self.connect_count += 1
+        self.connect_total_seconds += seconds
+        self.connect_max_seconds = max(self.connect_max_seconds, seconds)
+
+    def get_aiohttp_trace_config(self) -> TraceConfig:
+        from aiohttp import TraceConfig
+
+        async def on_connection_queued_start(session, trace_config_ctx, params):
+            trace_config_ctx.connection_queued_start = time.perf_counter()
+
+        async def on_connection_queued_end(session, trace_config_ctx, params):
+            self.record_connection_wait(
+                time.perf_counter() - trace_config_ctx.connection_queued_start
+            )
+
+        async def on_connection_create_start(session, trace_config_ctx, params):
+            trace_config_ctx.connection_create_start = time.perf_counter()
+
+        async def on_connection_create_end(session, trace_config_ctx, params):
+            self.record_connect(
+                time.perf_counter() - trace_config_ctx.connection_create_start
+            )
+
+        trace_config = TraceConfig()
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return trace_config
+
+
+class HTTPConnectionPool:
+    """
+    A pooled httpx client, and the providers using it
+    """
+
+    def __init__(
+        self,
+        client: Union[AsyncHTTPHandler, HTTPHandler],
+        is_async: bool,
+        pool_settings: Optional[HTTPPoolSettings],
+        pool_stats: HTTPPoolStats,
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        self.client = client
+        self.is_async = is_async
+        self.pool_settings = pool_settings
+        self.pool_stats = pool_stats
+        self.event_loop = event_loop
+        self.llm_providers: Set[str] = set()
+
+    def is_closed(self) -> bool:
+        if self.client.client.is_closed:
+            return True
+        return self.event_loop is not None and self.event_loop.is_closed()
+
+    def get_connection_counts(self) -> Tuple[int, int, Optional[int]]:
+        """
+        Returns (active_connections, idle_connections, max_connections) of the underlying transport
+        """
+        from aiohttp import ClientSession
+
+        from litellm.llms.custom_httpx.aiohttp_transport import AiohttpTransport
+
+        transport = getattr(self.client.client, "_transport", None)
+        if isinstance(transport, AiohttpTransport):
+            if not isinstance(transport.client, ClientSession):
+                # session is created on the first request
+                return 0, 0, None
+            connector = transport.client.connector
+            active_connections = len(getattr(connector, "_acquired", ()))
+            idle_connections = sum(
+                len(connections)
+                for connections in getattr(connector, "_conns", {}).values()
+            )
+            max_connections = getattr(connector, "limit", None) or None
+            return active_connections, idle_connections, max_connections
+
+        # httpx transport - connections are held by the httpcore pool
+        pool = getattr(transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle_connections = sum(1 for connection in connections if connection.is_idle())
+        return (
+            len(connections) - idle_connections,
+            idle_connections,
+            getattr(pool, "_max_connections", None),
+        )
+
+    def get_metrics(self) -> HTTPPoolMetrics:
+        (
+            active_connections,
+            idle_connections,
+            max_connections,
+        ) = self.get_connection_counts()
+        pool_stats = self.pool_stats
+        return HTTPPoolMetrics(
+            llm_providers=sorted(self.llm_providers),
+            is_async=self.is_async,
+            http2=bool((self.pool_settings or {}).get("http2", False)),
+            max_connections=max_connections,
+            active_connections=active_connections,
+            idle_connections=idle_connections,
+            connection_wait_count=pool_stats.connection_wait_count,
+            avg_connection_wait_ms=get_avg_ms(
+                pool_stats.connection_wait_total_seconds,
+                pool_stats.connection_wait_count,
+            ),
+            max_connection_wait_ms=pool_stats.connection_wait_max_seconds * 1000,
+            connect_count=pool_stats.connect_count,
+            avg_connect_latency_ms=get_avg_ms(
+                pool_stats.connect_total_seconds, pool_stats.connect_count
+            ),
+            max_connect_latency_ms=pool_stats.connect_max_seconds * 1000,
+        )
+
+
+class HTTPConnectionPoolManager:
+    def __init__(self, max_pools: int = MAX_HTTP_CONNECTION_POOLS):
+        self.max_pools = max_pools
+        self.pools: "OrderedDict[Tuple, HTTPConnectionPool]" = OrderedDict()
+        # keep a reference to the tasks closing evicted pools, so they aren't garbage collected mid-run
+        self._close_tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def get_pool_settings(llm_provider: Optional[str]) -> Optional[HTTPPoolSettings]:
+        """
+        Pool settings for a provider - `litellm.http_pool_settings["default"]`, overridden by the provider's own entry
+        """
+        http_pool_settings = litellm.http_pool_settings
+        if not http_pool_settings:
+            return None
+        pool_settings = HTTPPoolSettings(
+            **http_pool_settings.get(DEFAULT_POOL_SETTINGS_KEY, {})
+        )
+        if llm_provider is not None:
+            pool_settings.update(
+                http_pool_settings.get(_get_provider_name(llm_provider), {})
+            )
+        return pool_settings or None
+
+    def get_async_client(
+        self, llm_provider: Optional[str], params: Optional[dict] = None
+    ) -> AsyncHTTPHandler:
+        from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+        event_loop = _get_running_event_loop()
+        pool_settings = self.get_pool_settings(llm_provider)
+        pool_key = self._get_pool_key(
+            is_async=True,
+            llm_provider=llm_provider,
+            params=params,
+            pool_settings=pool_settings,
+            event_loop=event_loop,
+        )
+        pool = self.pools.get(pool_key)
+        if pool is None or pool.is_closed():
+            pool_stats = HTTPPoolStats()
+            if params is not None:
+                client = AsyncHTTPHandler(
+                    **params, pool_settings=pool_settings, pool_stats=pool_stats
+                )
+            else:
+                client = AsyncHTTPHandler(
+                    timeout=httpx.Timeout(timeout=600.0, connect=5.0),
+                    pool_settings=pool_settings,
+                    pool_stats=pool_stats,
+                )
+            pool = HTTPConnectionPool(
+                client=client,
+                is_async=True,
+                pool_settings=pool_settings,
+                pool_stats=pool_stats,
+                event_loop=event_loop,
+            )
+            self._add_pool(pool_key=pool_key, pool=pool)
+        else:
+            self.pools.move_to_end(pool_key)
+
+        if llm_provider is not None:
+            pool.llm_providers.add(_get_provider_name(llm_provider))
+        return pool.client
+
+    def get_sync_client(self, params: Optional[dict] = None) -> HTTPHandler:
+        from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+        pool_settings = self.get_pool_settings(llm_provider=None)
+        pool_key = self._get_pool_key(
+            is_async=False,
+            llm_provider=None,
+            params=params,
+            pool_settings=pool_settings,
+        )
+        pool = self.pools.get(pool_key)
+        if pool is None or pool.is_closed():
+            if params is not None:
+                client = HTTPHandler(**params, pool_settings=pool_settings)
+            else:
+                client = HTTPHandler(
+                    timeout=httpx.Timeout(timeout=600.0, connect=5.0),
+                    pool_settings=pool_settings,
+                )
+            pool = HTTPConnectionPool(
+                client=client,
+                is_async=False,
+                pool_settings=pool_settings,
+                pool_stats=HTTPPoolStats(),
+            )
+            self._add_pool(pool_key=pool_key, pool=pool)
+        else:
+            self.pools.move_to_end(pool_key)
+        return pool.client
+
+    def get_pool_metrics(self) -> List[HTTPPoolMetrics]:
+        return [pool.get_metrics() for pool in self.pools.values()]
+
+    def flush(self):
+        self.pools.clear()
+
+    async def async_warm_up_connection_pools(self, model_list: List[dict]) -> int:
+        """
+        Opens `warmup_connections` connections to each deployment's api_base, and to each provider's `warmup_urls`,
+        so the first requests after proxy startup don't pay for the TCP + TLS handshake.
+
+        Only providers with `warmup_connections` set in `litellm.http_pool_settings` are warmed.
+
+        Returns the number of origins warmed.
+        """
+        warmup_tasks = []
+        warmup_targets = self._get_warmup_targets(model_list=model_list)
+        for llm_provider, url, ssl_verify in warmup_targets:
+            pool_settings = self.get_pool_settings(llm_provider) or {}
+            # same params as the llm http handler, so requests reuse the warmed pool
+            client = self.get_async_client(
+                llm_provider=llm_provider, params={"ssl_verify": ssl_verify}
+            )
+            for _ in range(pool_settings.get("warmup_connections", 0)):
+                warmup_tasks.append(self._async_open_connection(client=client, url=url))
+
+        await asyncio.gather(*warmup_tasks)
+        verbose_logger.debug(
+            "warmed %s connections to %s origins",
+            len(warmup_tasks),
+            len(warmup_targets),
+        )
+        return len(warmup_targets)
+
+    def _get_warmup_targets(
+        self, model_list: List[dict]
+    ) -> List[Tuple[str, str, Optional[Union[str, bool]]]]:
+        """
+        Returns (llm_provider, origin, ssl_verify) for every origin that should be warmed
+        """
+        warmup_targets: List[Tuple[str, str, Optional[Union[str, bool]]]] = []
+        seen: Set[Tuple[str, str, str]] = set()
+
+        def _add_target(llm_provider: str, url: str, ssl_verify: Any):
+            origin = _get_origin(url)
+            if origin is None:
+                return
+            pool_settings = self.get_pool_settings(llm_provider) or {}
+            if not pool_settings.get("warmup_connections"):
+                return
+            key = (llm_provider, origin, str(ssl_verify))
+            if key in seen:
+                return
+            seen.add(key)
+            warmup_targets.append((llm_provider, origin, ssl_verify))
+
+        for deployment in model_list:
+            litellm_params = deployment.get("litellm_params") or {}
+            api_base = litellm_params.get("api_base")
+            if not api_base:
+                continue
+            try:
+                _, llm_provider, _, _ = litellm.get_llm_provider(
+                    model=litellm_params.get("model", ""),
+                    custom_llm_provider=litellm_params.get("custom_llm_provider"),
+                    api_base=api_base,
+                )
+            except Exception:
+                continue
+            _add_target(
+                llm_provider=llm_provider,
+                url=api_base,
+                ssl_verify=litellm_params.get("ssl_verify"),
+            )
+
+        for llm_provider, pool_settings in (litellm.http_pool_settings or {}).items():
+            for url in pool_settings.get("warmup_urls", []):
+                _add_target(llm_provider=llm_provider, url=url, ssl_verify=None)
+
+        return warmup_targets
+
+    @staticmethod
+    async def _async_open_connection(client: AsyncHTTPHandler, url: str):
+        try:
+            await client.client.head(url, timeout=HTTP_POOL_WARMUP_TIMEOUT)
+        except Exception as e:
+            verbose_logger.debug("failed to warm connection to %s: %s", url, str(e))
+
+    def _add_pool(self, pool_key: Tuple, pool: HTTPConnectionPool):
+        # pools bound to a closed event loop can't be used or closed anymore
+        for key in [key for key, _pool in self.pools.items() if _pool.is_closed()]:
+            del self.pools[key]
+
+        self.pools[pool_key] = pool
+        while len(self.pools) > self.max_pools:
+            _, evicted_pool = self.pools.popitem(last=False)
+            self._close_when_idle(evicted_pool)
+
+    def _close_when_idle(self, pool: HTTPConnectionPool):
+        """
+        Close an evicted async pool's connections once it has no active ones - callers may still hold its client mid-request.
+
+        Only the transport is closed, not the client. A caller that kept the client (e.g. a logging integration) still works,
+        its next request opens a new aiohttp session. Sync clients are closed by `HTTPHandler.__del__`, once the last caller drops them.
+        """
+        if not pool.is_async or pool.is_closed():
+            return
+        running_event_loop = _get_running_event_loop()
+        event_loop = pool.event_loop or running_event_loop
+        if event_loop is None:
+            return
+        close_coroutine = self._async_close_when_idle(pool)
+        if event_loop is running_event_loop:
+            close_task = event_loop.create_task(close_coroutine)
+            self._close_tasks.add(close_task)
+            close_task.add_done_callback(self._close_tasks.discard)
+        elif event_loop.is_running():
+            asyncio.run_coroutine_threadsafe(close_coroutine, event_loop)
+        else:
+            close_coroutine.close()
+
+    @staticmethod
+    async def _async_close_when_idle(pool: HTTPConnectionPool):
+        try:
+            while True:
+                # also gives callers that just got the client time to start their request
+                await asyncio.sleep(EVICTED_HTTP_POOL_CLOSE_CHECK_INTERVAL)
+                if pool.is_closed():
+                    return
+                active_connections, _, _ = pool.get_connection_counts()
+                if active_connections == 0:
+                    break
+            transport = getattr(pool.client.client, "_transport", None)
+            if transport is not None:
+                await transport.aclose()
+        except Exception as e:
+            verbose_logger.debug("failed to close evicted connection pool: %s", str(e))
+
+    @staticmethod
+    def _get_pool_key(
+        is_async: bool,
+        llm_provider: Optional[str],
+        params: Optional[dict],
+        pool_settings: Optional[HTTPPoolSettings],
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Tuple:
+        pool_settings = pool_settings or HTTPPoolSettings()
+        return (
+            is_async,
+            _get_provider_name(llm_provider) if llm_provider is not None else None,
+            id(event_loop) if event_loop is not None else None,
+            _make_hashable(params),
+            _make_hashable(
+                {
+                    key: value
+                    for key, value in pool_settings.items()
+                    if key not in _WARMUP_POOL_SETTINGS
+                }
+            ),
+            # TLS settings, read by `get_ssl_configuration` when the client is created
+            _make_hashable(os.getenv("SSL_VERIFY", litellm.ssl_verify)),
+            os.getenv("SSL_SECURITY_LEVEL", litellm.ssl_security_level),
+            os.getenv("SSL_CERT_FILE"),
+            _make_hashable(os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate)),
+            litellm.force_ipv4,
+        )
+
+
+def _get_provider_name(llm_provider: Union[str, Enum]) -> str:
+    if isinstance(llm_provider, Enum):
+        return str(llm_provider.value)
+    return llm_provider
+
+
+def _get_origin(url: str) -> Optional[str]:
+    parsed_url = urlparse(url)
+    if parsed_url.scheme not in ("http", "https") or not parsed_url.netloc:
+        return None
+    return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+
+def _get_running_event_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _make_hashable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((str(key), _make_hashable(_value)) for key, _value in value.items()),
+                key=lambda item: item[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(_value) for _value in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        # e.g. httpx.Timeout
+        return repr(value)
+
+
+http_connection_pool_manager = HTTPConnectionPoolManager()
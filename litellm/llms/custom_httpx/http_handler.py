@@ -12,8 +12,11 @@ from httpx._types import RequestFiles
 
 import litellm
 from litellm._logging import verbose_logger
-from litellm.constants import _DEFAULT_TTL_FOR_HTTPX_CLIENTS
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    HTTPPoolStats,
+    http_connection_pool_manager,
+)
 from litellm.types.llms.custom_http import *
 
 if TYPE_CHECKING:
@@ -168,6 +171,8 @@ class AsyncHTTPHandler:
         concurrent_limit=1000,
         client_alias: Optional[str] = None,  # name for client in logs
         ssl_verify: Optional[VerifyTypes] = None,
+        pool_settings: Optional[HTTPPoolSettings] = None,
+        pool_stats: Optional[HTTPPoolStats] = None,
     ):
         self.timeout = timeout
         self.event_hooks = event_hooks
@@ -176,6 +181,8 @@ class AsyncHTTPHandler:
             concurrent_limit=concurrent_limit,
             event_hooks=event_hooks,
             ssl_verify=ssl_verify,
+            pool_settings=pool_settings,
+            pool_stats=pool_stats,
         )
         self.client_alias = client_alias
 
@@ -185,6 +192,8 @@ class AsyncHTTPHandler:
         concurrent_limit: int,
         event_hooks: Optional[Mapping[str, List[Callable[..., Any]]]],
         ssl_verify: Optional[VerifyTypes] = None,
+        pool_settings: Optional[HTTPPoolSettings] = None,
+        pool_stats: Optional[HTTPPoolStats] = None,
     ) -> httpx.AsyncClient:
         # Get unified SSL configuration
         ssl_config = get_ssl_configuration(ssl_verify)
@@ -197,19 +206,23 @@ class AsyncHTTPHandler:
             timeout = _DEFAULT_TIMEOUT
         # Create a client with a connection pool
 
+        limits = _get_httpx_limits(
+            concurrent_limit=concurrent_limit, pool_settings=pool_settings
+        )
+        http2 = _should_use_http2(pool_settings)
         transport = AsyncHTTPHandler._create_async_transport(
             ssl_context=ssl_config if isinstance(ssl_config, ssl.SSLContext) else None,
             ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
+            pool_settings=pool_settings,
+            pool_stats=pool_stats,
         )
 
         return httpx.AsyncClient(
             transport=transport,
             event_hooks=event_hooks,
             timeout=timeout,
-            limits=httpx.Limits(
-                max_connections=concurrent_limit,
-                max_keepalive_connections=concurrent_limit,
-            ),
+            limits=limits,
+            http2=http2,
             verify=ssl_config,
             cert=cert,
             headers=headers,
@@ -522,13 +535,17 @@ class AsyncHTTPHandler:
 
     @staticmethod
     def _create_async_transport(
-        ssl_context: Optional[ssl.SSLContext] = None, ssl_verify: Optional[bool] = None
+        ssl_context: Optional[ssl.SSLContext] = None,
+        ssl_verify: Optional[bool] = None,
+        pool_settings: Optional[HTTPPoolSettings] = None,
+        pool_stats: Optional[HTTPPoolStats] = None,
     ) -> Optional[Union[LiteLLMAiohttpTransport, AsyncHTTPTransport]]:
         """
         - Creates a transport for httpx.AsyncClient
             - if litellm.force_ipv4 is True, it will return AsyncHTTPTransport with local_address="0.0.0.0"
             - [Default] It will return AiohttpTransport
             - Users can opt out of using AiohttpTransport by setting litellm.use_aiohttp_transport to False
+            - if http2 is enabled in the pool settings, httpx is used - aiohttp only speaks HTTP/1.1
 
 
         Notes on this handler:
@@ -541,15 +558,21 @@ class AsyncHTTPHandler:
         #########################################################
         # AIOHTTP TRANSPORT is off by default
         #########################################################
-        if AsyncHTTPHandler._should_use_aiohttp_transport():
+        if (
+            AsyncHTTPHandler._should_use_aiohttp_transport()
+            and not _should_use_http2(pool_settings)
+        ):
             return AsyncHTTPHandler._create_aiohttp_transport(
-                ssl_context=ssl_context, ssl_verify=ssl_verify
+                ssl_context=ssl_context,
+                ssl_verify=ssl_verify,
+                pool_settings=pool_settings,
+                pool_stats=pool_stats,
             )
 
         #########################################################
         # HTTPX TRANSPORT is used when aiohttp is not installed
         #########################################################
-        return AsyncHTTPHandler._create_httpx_transport()
+        return AsyncHTTPHandler._create_httpx_transport(pool_settings=pool_settings)
 
     @staticmethod
     def _should_use_aiohttp_transport() -> bool:
@@ -611,10 +634,15 @@ class AsyncHTTPHandler:
     def _create_aiohttp_transport(
         ssl_verify: Optional[bool] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
+        pool_settings: Optional[HTTPPoolSettings] = None,
+        pool_stats: Optional[HTTPPoolStats] = None,
     ) -> LiteLLMAiohttpTransport:
         """
         Creates an AiohttpTransport with RequestNotRead error handling
 
+        - pool_settings: max_connections / keepalive_expiry are applied to the TCPConnector
+        - pool_stats: records connection wait time and connect latency for the pool
+
         Note: aiohttp TCPConnector ssl parameter accepts:
         - SSLContext: custom SSL context
         - False: disable SSL verification
@@ -625,6 +653,14 @@ class AsyncHTTPHandler:
         connector_kwargs = AsyncHTTPHandler._get_ssl_connector_kwargs(
             ssl_verify=ssl_verify, ssl_context=ssl_context
         )
+        if pool_settings is not None:
+            if pool_settings.get("max_connections") is not None:
+                connector_kwargs["limit"] = pool_settings["max_connections"]
+            if pool_settings.get("keepalive_expiry") is not None:
+                connector_kwargs["keepalive_timeout"] = pool_settings["keepalive_expiry"]
+        trace_configs = (
+            [pool_stats.get_aiohttp_trace_config()] if pool_stats is not None else None
+        )
         #########################################################
         # Check if user enabled aiohttp trust env
         # use for HTTP_PROXY, HTTPS_PROXY, etc.
@@ -638,11 +674,14 @@ class AsyncHTTPHandler:
             client=lambda: ClientSession(
                 connector=TCPConnector(**connector_kwargs),
                 trust_env=trust_env,
+                trace_configs=trace_configs,
             ),
         )
 
     @staticmethod
-    def _create_httpx_transport() -> Optional[AsyncHTTPTransport]:
+    def _create_httpx_transport(
+        pool_settings: Optional[HTTPPoolSettings] = None,
+    ) -> Optional[AsyncHTTPTransport]:
         """
         Creates an AsyncHTTPTransport
 
@@ -650,6 +689,12 @@ class AsyncHTTPHandler:
         - [Default] If force_ipv4 is False, it will return None
         """
         if litellm.force_ipv4:
+            if pool_settings is not None:
+                return AsyncHTTPTransport(
+                    local_address="0.0.0.0",
+                    limits=_get_httpx_limits(pool_settings=pool_settings),
+                    http2=_should_use_http2(pool_settings),
+                )
             return AsyncHTTPTransport(local_address="0.0.0.0")
         else:
             return None
@@ -662,6 +707,7 @@ class HTTPHandler:
         concurrent_limit=1000,
         client: Optional[httpx.Client] = None,
         ssl_verify: Optional[Union[bool, str]] = None,
+        pool_settings: Optional[HTTPPoolSettings] = None,
     ):
         if timeout is None:
             timeout = _DEFAULT_TIMEOUT
@@ -674,16 +720,16 @@ class HTTPHandler:
         cert = os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate)
 
         if client is None:
-            transport = self._create_sync_transport()
+            transport = self._create_sync_transport(pool_settings=pool_settings)
 
             # Create a client with a connection pool
             self.client = httpx.Client(
                 transport=transport,
                 timeout=timeout,
-                limits=httpx.Limits(
-                    max_connections=concurrent_limit,
-                    max_keepalive_connections=concurrent_limit,
+                limits=_get_httpx_limits(
+                    concurrent_limit=concurrent_limit, pool_settings=pool_settings
                 ),
+                http2=_should_use_http2(pool_settings),
                 verify=ssl_config,
                 cert=cert,
                 headers=headers,
@@ -903,7 +949,9 @@ class HTTPHandler:
         except Exception:
             pass
 
-    def _create_sync_transport(self) -> Optional[HTTPTransport]:
+    def _create_sync_transport(
+        self, pool_settings: Optional[HTTPPoolSettings] = None
+    ) -> Optional[HTTPTransport]:
         """
         Create an HTTP transport with IPv4 only if litellm.force_ipv4 is True.
         Otherwise, return None.
@@ -911,78 +959,68 @@ class HTTPHandler:
         Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
         """
         if litellm.force_ipv4:
+            if pool_settings is not None:
+                return HTTPTransport(
+                    local_address="0.0.0.0",
+                    limits=_get_httpx_limits(pool_settings=pool_settings),
+                    http2=_should_use_http2(pool_settings),
+                )
             return HTTPTransport(local_address="0.0.0.0")
         else:
             return None
 
 
+def _get_httpx_limits(
+    concurrent_limit: int = 1000, pool_settings: Optional[HTTPPoolSettings] = None
+) -> httpx.Limits:
+    """
+    httpx pool limits - `concurrent_limit`, unless overridden by the provider's pool settings
+    """
+    pool_settings = pool_settings or HTTPPoolSettings()
+    max_connections = pool_settings.get("max_connections", concurrent_limit)
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=pool_settings.get(
+            "max_keepalive_connections", max_connections
+        ),
+        keepalive_expiry=pool_settings.get("keepalive_expiry", 5.0),
+    )
+
+
+def _should_use_http2(pool_settings: Optional[HTTPPoolSettings]) -> bool:
+    """
+    HTTP/2 needs the optional `h2` package - fall back to HTTP/1.1 if it is not installed
+    """
+    if pool_settings is None or pool_settings.get("http2", False) is not True:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        verbose_logger.warning(
+            "http2=True in http_pool_settings, but the `h2` package is not installed. Falling back to HTTP/1.1. Run `pip install httpx[http2]` to use HTTP/2."
+        )
+        return False
+    return True
+
+
 def get_async_httpx_client(
     llm_provider: Union[LlmProviders, httpxSpecialProvider],
     params: Optional[dict] = None,
 ) -> AsyncHTTPHandler:
     """
-    Retrieves the async HTTP client from the cache
+    Retrieves the async HTTP client from the shared connection pool manager
     If not present, creates a new client
 
-    Caches the new client and returns it.
+    Each provider gets its own client, reused by calls with the same params and pool settings.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
-    _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
-
-    if params is not None:
-        _new_client = AsyncHTTPHandler(**params)
-    else:
-        _new_client = AsyncHTTPHandler(
-            timeout=httpx.Timeout(timeout=600.0, connect=5.0)
-        )
-
-    litellm.in_memory_llm_clients_cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    return http_connection_pool_manager.get_async_client(
+        llm_provider=llm_provider, params=params
     )
-    return _new_client
 
 
 def _get_httpx_client(params: Optional[dict] = None) -> HTTPHandler:
     """
-    Retrieves the HTTP client from the cache
+    Retrieves the HTTP client from the shared connection pool manager
     If not present, creates a new client
-
-    Caches the new client and returns it.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "httpx_client" + _params_key_name
-
-    _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
-
-    if params is not None:
-        _new_client = HTTPHandler(**params)
-    else:
-        _new_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
-
-    litellm.in_memory_llm_clients_cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
-    )
-    return _new_client
+    return http_connection_pool_manager.get_sync_client(params=params)
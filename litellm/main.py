@@ -128,7 +128,10 @@ from .litellm_core_utils.prompt_templates.factory import (
     prompt_factory,
     stringify_json_tool_call_content,
 )
-from .litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+from .litellm_core_utils.streaming_chunk_builder_utils import (
+    ChunkProcessor,
+    StreamingChunkAccumulator,
+)
 from .llms import baseten
 from .llms.anthropic.chat import AnthropicChatCompletion
 from .llms.azure.audio_transcriptions import AzureAudioTranscription
@@ -5702,9 +5705,25 @@ def stream_chunk_builder_text_completion(
 
 
 def stream_chunk_builder(  # noqa: PLR0915
-    chunks: list, messages: Optional[list] = None, start_time=None, end_time=None
+    chunks: list,
+    messages: Optional[list] = None,
+    start_time=None,
+    end_time=None,
+    chunk_accumulator: Optional[StreamingChunkAccumulator] = None,
 ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+    """
+    Build the complete response from a list of streaming chunks.
+
+    If `chunk_accumulator` is passed (chunks already folded in as they streamed), the response is built from its state,
+    without sorting / re-walking `chunks`.
+    """
     try:
+        if (
+            chunk_accumulator is not None
+            and chunk_accumulator.first_chunk is not None
+            and chunk_accumulator.is_text_completion is False
+        ):
+            return chunk_accumulator.build_model_response(messages=messages)
         if chunks is None:
             raise litellm.APIError(
                 status_code=500,
@@ -325,7 +325,10 @@ def _sync_streaming(
     litellm_logging_obj: "LiteLLMLoggingObj",
     provider_config: "BasePassthroughConfig",
 ):
-    from litellm.utils import executor
+    from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
+    from litellm.types.litellm_core_utils.callback_dispatcher import (
+        CallbackDispatchLaneName,
+    )
 
     try:
         raw_bytes: List[bytes] = []
@@ -333,7 +336,8 @@ def _sync_streaming(
             raw_bytes.append(chunk)
             yield chunk
 
-        executor.submit(
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.PASS_THROUGH_LOGGING,
             litellm_logging_obj.flush_passthrough_collected_chunks,
             raw_bytes=raw_bytes,
             provider_config=provider_config,
@@ -2,7 +2,17 @@ import enum
 import json
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Union,
+)
 
 import httpx
 from pydantic import (
@@ -2969,6 +2979,28 @@ RBAC_ROLES = Literal[
 ]
 
 
+class JWTVerifiedTokenClaims(TypedDict):
+    """
+    Role / team / scope mapping of a verified JWT - computed once per token, see `JWTAuthManager.get_verified_token_claims`
+    """
+
+    rbac_role: Optional[RBAC_ROLES]
+    scopes: List[str]
+    object_id: Optional[str]
+    user_id: Optional[str]
+    user_email: Optional[str]
+    valid_user_email: Optional[bool]
+    org_id: Optional[str]
+    end_user_id: Optional[str]
+    team_ids: Set[str]
+
+
+class JWTVerifiedToken(TypedDict):
+    payload: dict
+    expires_at: float  # min(`exp` claim, verified at + `public_key_ttl`)
+    claims: Optional[JWTVerifiedTokenClaims]
+
+
 class OIDCPermissions(LiteLLMPydanticObjectBase):
     models: Optional[List[str]] = None
     routes: Optional[List[str]] = None
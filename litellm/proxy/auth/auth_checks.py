@@ -11,7 +11,20 @@ Run checks for:
 import asyncio
 import re
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, cast
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Union,
+    cast,
+)
 
 from fastapi import Request, status
 from pydantic import BaseModel
@@ -21,11 +34,12 @@ from litellm._logging import verbose_proxy_logger
 from litellm.caching.caching import DualCache
 from litellm.caching.dual_cache import LimitedSizeOrderedDict
 from litellm.constants import (
+    AUTH_OBJECT_REFRESH_AHEAD_RATIO,
     DEFAULT_IN_MEMORY_TTL,
     DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL,
     DEFAULT_MAX_RECURSE_DEPTH,
+    MAX_AUTH_OBJECT_BACKGROUND_REFRESH_KEYS,
 )
-from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
 from litellm.proxy._types import (
     RBAC_ROLES,
     CallInfo,
@@ -46,7 +60,12 @@ from litellm.proxy._types import (
     SpecialModelNames,
     UserAPIKeyAuth,
 )
+from litellm.proxy.auth.model_access_matcher import (
+    compile_model_access_matcher,
+    get_model_access_matcher,
+)
 from litellm.proxy.auth.route_checks import RouteChecks
+from litellm.proxy.auth.single_flight import SingleFlight
 from litellm.proxy.route_llm_request import route_request
 from litellm.proxy.utils import PrismaClient, ProxyLogging, log_db_metrics
 from litellm.router import Router
@@ -66,6 +85,12 @@ else:
 last_db_access_time = LimitedSizeOrderedDict(max_size=100)
 db_cache_expiry = DEFAULT_IN_MEMORY_TTL  # refresh every 5s
 
+# only 1 coroutine per key / team / user / org loads it from the db - concurrent cache misses await its result
+auth_object_single_flight = SingleFlight()
+last_background_refresh_time = LimitedSizeOrderedDict(
+    max_size=MAX_AUTH_OBJECT_BACKGROUND_REFRESH_KEYS
+)
+
 all_routes = LiteLLMRoutes.openai_routes.value + LiteLLMRoutes.management_routes.value
 
 
@@ -557,6 +582,36 @@ def _update_last_db_access_time(
     last_db_access_time[key] = (value, time.time())
 
 
+def _refresh_auth_object_in_background(
+    key: Hashable,
+    last_refreshed_at: Optional[float],
+    fn: Callable[[], Awaitable],
+) -> None:
+    """
+    Stale-while-revalidate for cached auth objects.
+
+    If a cached object is used after `AUTH_OBJECT_REFRESH_AHEAD_RATIO` of its TTL, reload it from the db in the background - so hot objects are refreshed before they expire, instead of every request missing the cache at once.
+    """
+    if last_refreshed_at is None:
+        return
+    current_time = time.time()
+    if (
+        current_time - last_refreshed_at
+        < DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL
+        * AUTH_OBJECT_REFRESH_AHEAD_RATIO
+    ):
+        return
+    # don't retry a failed refresh on every request
+    last_refresh_time = last_background_refresh_time.get(key)
+    if (
+        last_refresh_time is not None
+        and current_time - last_refresh_time < db_cache_expiry
+    ):
+        return
+    if auth_object_single_flight.do_in_background(key=key, fn=fn):
+        last_background_refresh_time[key] = current_time
+
+
 def _get_role_based_permissions(
     rbac_role: RBAC_ROLES,
     general_settings: dict,
@@ -672,17 +727,59 @@ async def get_user_object(
     if user_id is None:
         return None
 
+    db_access_time_key = "user_id:{}".format(user_id)
+    # same key for cache-miss loads + background refreshes, so they coalesce
+    single_flight_key = ("user", user_id, user_id_upsert, sso_user_id, user_email)
     # check if in cache
     if not check_db_only:
         cached_user_obj = await user_api_key_cache.async_get_cache(key=user_id)
         if cached_user_obj is not None:
             if isinstance(cached_user_obj, dict):
-                return LiteLLM_UserTable(**cached_user_obj)
-            elif isinstance(cached_user_obj, LiteLLM_UserTable):
+                cached_user_obj = LiteLLM_UserTable(**cached_user_obj)
+            if isinstance(cached_user_obj, LiteLLM_UserTable):
+                if prisma_client is not None:
+                    last_db_access = last_db_access_time.get(db_access_time_key)
+                    _refresh_auth_object_in_background(
+                        key=single_flight_key,
+                        last_refreshed_at=(
+                            last_db_access[1] if last_db_access is not None else None
+                        ),
+                        fn=partial(
+                            _get_user_object_from_db,
+                            user_id=user_id,
+                            prisma_client=prisma_client,
+                            user_api_key_cache=user_api_key_cache,
+                            user_id_upsert=user_id_upsert,
+                            sso_user_id=sso_user_id,
+                            user_email=user_email,
+                        ),
+                    )
                 return cached_user_obj
     # else, check db
     if prisma_client is None:
         raise Exception("No db connected")
+    return await auth_object_single_flight.do(
+        key=single_flight_key,
+        fn=partial(
+            _get_user_object_from_db,
+            user_id=user_id,
+            prisma_client=prisma_client,
+            user_api_key_cache=user_api_key_cache,
+            user_id_upsert=user_id_upsert,
+            sso_user_id=sso_user_id,
+            user_email=user_email,
+        ),
+    )
+
+
+async def _get_user_object_from_db(
+    user_id: str,
+    prisma_client: PrismaClient,
+    user_api_key_cache: DualCache,
+    user_id_upsert: bool,
+    sso_user_id: Optional[str] = None,
+    user_email: Optional[str] = None,
+) -> LiteLLM_UserTable:
     try:
         db_access_time_key = "user_id:{}".format(user_id)
         should_check_db = _should_check_db(
@@ -778,6 +875,7 @@ async def _cache_team_object(
 
     ## CACHE REFRESH TIME!
     team_table.last_refreshed_at = time.time()
+    compile_model_access_matcher(team_table.models)
 
     await _cache_management_object(
         key=key,
@@ -797,6 +895,7 @@ async def _cache_key_object(
 
     ## CACHE REFRESH TIME
     user_api_key_obj.last_refreshed_at = time.time()
+    compile_model_access_matcher(user_api_key_obj.models)
 
     await _cache_management_object(
         key=key,
@@ -945,6 +1044,19 @@ async def get_team_object(
 
     # check if in cache
     key = "team_id:{}".format(team_id)
+    # same key for cache-miss loads + background refreshes, so they coalesce
+    single_flight_key = ("team", team_id, team_id_upsert)
+    load_team_object = partial(
+        _get_team_object_from_user_api_key_cache,
+        team_id=team_id,
+        prisma_client=prisma_client,
+        user_api_key_cache=user_api_key_cache,
+        proxy_logging_obj=proxy_logging_obj,
+        last_db_access_time=last_db_access_time,
+        db_cache_expiry=db_cache_expiry,
+        key=key,
+        team_id_upsert=team_id_upsert,
+    )
 
     if not check_db_only:
         cached_team_obj = await _get_team_object_from_cache(
@@ -955,6 +1067,11 @@ async def get_team_object(
         )
 
         if cached_team_obj is not None:
+            _refresh_auth_object_in_background(
+                key=single_flight_key,
+                last_refreshed_at=cached_team_obj.last_refreshed_at,
+                fn=load_team_object,
+            )
             return cached_team_obj
 
         if check_cache_only:
@@ -964,15 +1081,8 @@ async def get_team_object(
 
     # else, check db
     try:
-        return await _get_team_object_from_user_api_key_cache(
-            team_id=team_id,
-            prisma_client=prisma_client,
-            user_api_key_cache=user_api_key_cache,
-            proxy_logging_obj=proxy_logging_obj,
-            last_db_access_time=last_db_access_time,
-            db_cache_expiry=db_cache_expiry,
-            key=key,
-            team_id_upsert=team_id_upsert,
+        return await auth_object_single_flight.do(
+            key=single_flight_key, fn=load_team_object
         )
     except Exception:
         raise Exception(
@@ -1066,8 +1176,19 @@ async def get_key_object(
 
     if cached_key_obj is not None:
         if isinstance(cached_key_obj, dict):
-            return UserAPIKeyAuth(**cached_key_obj)
-        elif isinstance(cached_key_obj, UserAPIKeyAuth):
+            cached_key_obj = UserAPIKeyAuth(**cached_key_obj)
+        if isinstance(cached_key_obj, UserAPIKeyAuth):
+            _refresh_auth_object_in_background(
+                key=("key", hashed_token),
+                last_refreshed_at=cached_key_obj.last_refreshed_at,
+                fn=partial(
+                    _get_key_object_from_db,
+                    hashed_token=hashed_token,
+                    prisma_client=prisma_client,
+                    user_api_key_cache=user_api_key_cache,
+                    proxy_logging_obj=proxy_logging_obj,
+                ),
+            )
             return cached_key_obj
 
     if check_cache_only:
@@ -1076,6 +1197,26 @@ async def get_key_object(
         )
 
     # else, check db
+    return await auth_object_single_flight.do(
+        key=("key", hashed_token),
+        fn=partial(
+            _get_key_object_from_db,
+            hashed_token=hashed_token,
+            prisma_client=prisma_client,
+            user_api_key_cache=user_api_key_cache,
+            parent_otel_span=parent_otel_span,
+            proxy_logging_obj=proxy_logging_obj,
+        ),
+    )
+
+
+async def _get_key_object_from_db(
+    hashed_token: str,
+    prisma_client: PrismaClient,
+    user_api_key_cache: DualCache,
+    parent_otel_span: Optional[Span] = None,
+    proxy_logging_obj: Optional[ProxyLogging] = None,
+) -> UserAPIKeyAuth:
     _valid_token: Optional[BaseModel] = await prisma_client.get_data(
         token=hashed_token,
         table_name="combined_view",
@@ -1125,7 +1266,9 @@ async def get_org_object(
         )
 
     # check if in cache
-    cached_org_obj = user_api_key_cache.async_get_cache(key="org_id:{}".format(org_id))
+    cached_org_obj = await user_api_key_cache.async_get_cache(
+        key="org_id:{}".format(org_id)
+    )
     if cached_org_obj is not None:
         if isinstance(cached_org_obj, dict):
             return LiteLLM_OrganizationTable(**cached_org_obj)
@@ -1133,8 +1276,12 @@ async def get_org_object(
             return cached_org_obj
     # else, check db
     try:
-        response = await prisma_client.db.litellm_organizationtable.find_unique(
-            where={"organization_id": org_id}
+        response = await auth_object_single_flight.do(
+            key=("org", org_id),
+            fn=partial(
+                prisma_client.db.litellm_organizationtable.find_unique,
+                where={"organization_id": org_id},
+            ),
         )
 
         if response is None:
@@ -1218,25 +1365,32 @@ def _can_object_call_model(
                 return True
 
     # Filter out models that are access_groups
-    filtered_models = [m for m in models if m not in access_groups]
+    filtered_models = (
+        [m for m in models if m not in access_groups] if access_groups else models
+    )
+    model_access_matcher = get_model_access_matcher(filtered_models)
 
     if _model_in_team_aliases(model=model, team_model_aliases=team_model_aliases):
         return True
 
-    if _model_matches_any_wildcard_pattern_in_list(
-        model=model, allowed_model_list=filtered_models
-    ):
+    if model_access_matcher.matches_any_wildcard_pattern(model=model):
         return True
 
     all_model_access: bool = False
 
-    if (len(filtered_models) == 0 and len(models) == 0) or "*" in filtered_models:
+    if (
+        len(filtered_models) == 0 and len(models) == 0
+    ) or "*" in model_access_matcher.models:
         all_model_access = True
 
-    if SpecialModelNames.all_proxy_models.value in filtered_models:
+    if SpecialModelNames.all_proxy_models.value in model_access_matcher.models:
         all_model_access = True
 
-    if model is not None and model not in filtered_models and all_model_access is False:
+    if (
+        model is not None
+        and model not in model_access_matcher.models
+        and all_model_access is False
+    ):
         raise ProxyException(
             message=f"{object_type} not allowed to access model. This {object_type} can only access models={models}. Tried to access {model}",
             type=ProxyErrorTypes.get_model_access_error_type_for_object(
@@ -1541,61 +1695,14 @@ def _model_matches_any_wildcard_pattern_in_list(
     - model=`bedrock/us.amazon.nova-micro-v1:0`, allowed_models=`bedrock/*` returns True
     - model=`bedrock/us.amazon.nova-micro-v1:0`, allowed_models=`bedrock/us.*` returns True
     - model=`bedrockzzzz/us.amazon.nova-micro-v1:0`, allowed_models=`bedrock/*` returns False
-    """
 
-    if any(
-        _is_wildcard_pattern(allowed_model_pattern)
-        and is_model_allowed_by_pattern(
-            model=model, allowed_model_pattern=allowed_model_pattern
-        )
-        for allowed_model_pattern in allowed_model_list
-    ):
-        return True
-
-    if any(
-        _is_wildcard_pattern(allowed_model_pattern)
-        and _model_custom_llm_provider_matches_wildcard_pattern(
-            model=model, allowed_model_pattern=allowed_model_pattern
-        )
-        for allowed_model_pattern in allowed_model_list
-    ):
-        return True
-
-    return False
-
-
-def _model_custom_llm_provider_matches_wildcard_pattern(
-    model: str, allowed_model_pattern: str
-) -> bool:
+    The list is compiled once - see `ModelAccessMatcher`.
     """
-    Returns True for this scenario:
-    - `model=gpt-4o`
-    - `allowed_model_pattern=openai/*`
-
-    or
-    - `model=claude-3-5-sonnet-20240620`
-    - `allowed_model_pattern=anthropic/*`
-    """
-    try:
-        model, custom_llm_provider, _, _ = get_llm_provider(model=model)
-    except Exception:
-        return False
-
-    return is_model_allowed_by_pattern(
-        model=f"{custom_llm_provider}/{model}",
-        allowed_model_pattern=allowed_model_pattern,
+    return get_model_access_matcher(allowed_model_list).matches_any_wildcard_pattern(
+        model=model
     )
 
 
-def _is_wildcard_pattern(allowed_model_pattern: str) -> bool:
-    """
-    Returns True if the pattern is a wildcard pattern.
-
-    Checks if `*` is in the pattern.
-    """
-    return "*" in allowed_model_pattern
-
-
 async def vector_store_access_check(
     request_body: dict,
     team_object: Optional[LiteLLM_TeamTable],
@@ -8,6 +8,7 @@ from fastapi import HTTPException, Request, status
 from litellm import Router, provider_list
 from litellm._logging import verbose_proxy_logger
 from litellm.proxy._types import *
+from litellm.proxy.common_utils.http_parsing_utils import _read_request_body_bytes
 from litellm.types.router import CONFIGURABLE_CLIENTSIDE_AUTH_PARAMS
 
 
@@ -347,8 +348,11 @@ async def check_if_request_size_is_safe(request: Request) -> bool:
                     param="content-length",
                 )
         else:
-            # If Content-Length is not available, read the body
-            body = await request.body()
+            # If Content-Length is not available, read the body - stopping as soon as it is over the limit
+            body = await _read_request_body_bytes(
+                request=request,
+                max_body_size_bytes=int(max_request_size_mb * 1024 * 1024),
+            )
             body_size = len(body)
             request_size_mb = bytes_to_mb(bytes_value=body_size)
 
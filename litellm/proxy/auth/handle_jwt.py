@@ -7,9 +7,12 @@ JWT token must have 'litellm_proxy_admin' in scope.
 """
 
 import fnmatch
+import hashlib
 import json
 import os
-from typing import Any, List, Literal, Optional, Set, Tuple, cast
+import time
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, cast
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -18,6 +21,12 @@ from fastapi import HTTPException
 
 from litellm._logging import verbose_proxy_logger
 from litellm.caching.caching import DualCache
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import (
+    AUTH_OBJECT_REFRESH_AHEAD_RATIO,
+    JWT_PUBLIC_KEY_MIN_REFETCH_INTERVAL_SECONDS,
+    MAX_JWT_VERIFIED_TOKEN_CACHE_SIZE,
+)
 from litellm.litellm_core_utils.dot_notation_indexing import get_nested_value
 from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
 from litellm.proxy._types import (
@@ -25,6 +34,8 @@ from litellm.proxy._types import (
     JWKKeyValue,
     JWTAuthBuilderResult,
     JWTKeyItem,
+    JWTVerifiedToken,
+    JWTVerifiedTokenClaims,
     LiteLLM_EndUserTable,
     LiteLLM_JWTAuth,
     LiteLLM_OrganizationTable,
@@ -40,6 +51,7 @@ from litellm.proxy._types import (
     UserAPIKeyAuth,
 )
 from litellm.proxy.auth.auth_checks import can_team_access_model
+from litellm.proxy.auth.single_flight import SingleFlight
 from litellm.proxy.utils import PrismaClient, ProxyLogging
 
 from .auth_checks import (
@@ -71,6 +83,16 @@ class JWTHandler:
     ) -> None:
         self.http_handler = HTTPHandler()
         self.leeway = 0
+        self.litellm_jwtauth = LiteLLM_JWTAuth()
+        # sha256(token) -> verified payload, so repeat tokens skip signature verification
+        self.verified_token_cache: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=MAX_JWT_VERIFIED_TOKEN_CACHE_SIZE
+        )
+        self.public_keys_single_flight = SingleFlight()
+        self.public_keys_fetched_at: Dict[str, float] = {}
+        self.public_keys_last_fetch_attempt: Dict[str, float] = {}
+        # key_url -> (keys, kid -> key)
+        self.public_keys_kid_index: Dict[str, Tuple[Any, Dict[str, JWTKeyItem]]] = {}
 
     def update_environment(
         self,
@@ -83,6 +105,8 @@ class JWTHandler:
         self.user_api_key_cache = user_api_key_cache
         self.litellm_jwtauth = litellm_jwtauth
         self.leeway = leeway
+        # cached claims were mapped with the previous settings
+        self.verified_token_cache.clear()
     
     @staticmethod
     def is_jwt(token: str):
@@ -405,28 +429,19 @@ class JWTHandler:
         keys_url_list = [url.strip() for url in keys_url.split(",")]
 
         for key_url in keys_url_list:
-            cache_key = f"litellm_jwt_auth_keys_{key_url}"
-
-            cached_keys = await self.user_api_key_cache.async_get_cache(cache_key)
-
-            if cached_keys is None:
-                response = await self.http_handler.get(key_url)
-
-                response_json = response.json()
-                if "keys" in response_json:
-                    keys: JWKKeyValue = response.json()["keys"]
-                else:
-                    keys = response_json
-
-                await self.user_api_key_cache.async_set_cache(
-                    key=cache_key,
-                    value=keys,
-                    ttl=self.litellm_jwtauth.public_key_ttl,  # cache for 10 mins
-                )
-            else:
-                keys = cached_keys
+            keys = await self._get_public_keys(key_url=key_url)
+            public_key = self._find_public_key(key_url=key_url, keys=keys, kid=kid)
+            if public_key is not None:
+                return cast(dict, public_key)
 
-            public_key = self.parse_keys(keys=keys, kid=kid)
+        # unknown kid - the provider may have rotated its keys, refetch them (at most once per `JWT_PUBLIC_KEY_MIN_REFETCH_INTERVAL_SECONDS`)
+        for key_url in keys_url_list:
+            if not self._can_fetch_public_keys(key_url=key_url):
+                continue
+            keys = await self.public_keys_single_flight.do(
+                key=key_url, fn=partial(self._fetch_public_keys, key_url)
+            )
+            public_key = self._find_public_key(key_url=key_url, keys=keys, kid=kid)
             if public_key is not None:
                 return cast(dict, public_key)
 
@@ -434,6 +449,88 @@ class JWTHandler:
             f"No matching public key found. keys={keys_url_list}, kid={kid}"
         )
 
+    async def _get_public_keys(self, key_url: str) -> JWKKeyValue:
+        """
+        Returns the cached keys for `key_url` - fetching them on a cache miss.
+
+        Keys are refetched in the background after `AUTH_OBJECT_REFRESH_AHEAD_RATIO` of `public_key_ttl`, so requests don't wait on the fetch when they expire.
+        """
+        cache_key = f"litellm_jwt_auth_keys_{key_url}"
+        cached_keys = await self.user_api_key_cache.async_get_cache(cache_key)
+
+        if cached_keys is None:
+            return await self.public_keys_single_flight.do(
+                key=key_url, fn=partial(self._fetch_public_keys, key_url)
+            )
+
+        fetched_at = self.public_keys_fetched_at.get(key_url)
+        if (
+            fetched_at is not None
+            and time.time() - fetched_at
+            >= self.litellm_jwtauth.public_key_ttl * AUTH_OBJECT_REFRESH_AHEAD_RATIO
+            and self._can_fetch_public_keys(key_url=key_url)
+        ):
+            self.public_keys_single_flight.do_in_background(
+                key=key_url, fn=partial(self._fetch_public_keys, key_url)
+            )
+        return cached_keys
+
+    async def _fetch_public_keys(self, key_url: str) -> JWKKeyValue:
+        self.public_keys_last_fetch_attempt[key_url] = time.time()
+        response = await self.http_handler.get(key_url)
+
+        response_json = response.json()
+        if "keys" in response_json:
+            keys: JWKKeyValue = response_json["keys"]
+        else:
+            keys = response_json
+
+        await self.user_api_key_cache.async_set_cache(
+            key=f"litellm_jwt_auth_keys_{key_url}",
+            value=keys,
+            ttl=self.litellm_jwtauth.public_key_ttl,  # cache for 10 mins
+        )
+        self.public_keys_fetched_at[key_url] = time.time()
+        return keys
+
+    def _can_fetch_public_keys(self, key_url: str) -> bool:
+        """
+        Rate limits refetches - so tokens with unknown kids, or a down key server, don't cause a fetch per request
+        """
+        if self.public_keys_single_flight.is_in_flight(key_url):
+            return True
+        last_fetch_attempt = self.public_keys_last_fetch_attempt.get(key_url)
+        return (
+            last_fetch_attempt is None
+            or time.time() - last_fetch_attempt
+            >= JWT_PUBLIC_KEY_MIN_REFETCH_INTERVAL_SECONDS
+        )
+
+    def _find_public_key(
+        self, key_url: str, keys: JWKKeyValue, kid: Optional[str]
+    ) -> Optional[JWTKeyItem]:
+        """
+        kid -> key lookup, via an index built once per fetched key set
+        """
+        if not isinstance(keys, list) or len(keys) <= 1:
+            return self.parse_keys(keys=keys, kid=kid)
+
+        kid_index = self.public_keys_kid_index.get(key_url)
+        if kid_index is None or kid_index[0] is not keys:
+            kid_index = (
+                keys,
+                {
+                    key["kid"]: key
+                    for key in keys
+                    if isinstance(key, dict) and key.get("kid", None) is not None
+                },
+            )
+            self.public_keys_kid_index[key_url] = kid_index
+
+        if kid is None:
+            return None
+        return kid_index[1].get(kid)
+
     def parse_keys(self, keys: JWKKeyValue, kid: Optional[str]) -> Optional[JWTKeyItem]:
         public_key: Optional[JWTKeyItem] = None
         if len(keys) == 1:
@@ -470,6 +567,46 @@ class JWTHandler:
             return False
 
     async def auth_jwt(self, token: str) -> dict:
+        """
+        Verify `token`, and return its payload.
+
+        Verified tokens are cached until they expire (at most `public_key_ttl`), so repeat tokens skip signature verification.
+        """
+        verified_token = self.get_verified_token(token=token)
+        if verified_token is not None:
+            return verified_token["payload"]
+
+        payload = await self._verify_jwt(token=token)
+
+        verified_at = time.time()
+        expires_at = verified_at + self.litellm_jwtauth.public_key_ttl
+        if isinstance(payload.get("exp"), (int, float)):
+            expires_at = min(expires_at, payload["exp"] + self.leeway)
+        self.verified_token_cache[self._get_token_cache_key(token)] = JWTVerifiedToken(
+            payload=payload, expires_at=expires_at, claims=None
+        )
+        return payload
+
+    def get_verified_token(self, token: str) -> Optional[JWTVerifiedToken]:
+        """
+        Returns the cached verified token, if it hasn't expired
+        """
+        token_cache_key = self._get_token_cache_key(token)
+        verified_token: Optional[JWTVerifiedToken] = self.verified_token_cache.get(
+            token_cache_key
+        )
+        if verified_token is None:
+            return None
+        if time.time() >= verified_token["expires_at"]:
+            self.verified_token_cache.pop(token_cache_key, None)
+            return None
+        return verified_token
+
+    @staticmethod
+    def _get_token_cache_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def _verify_jwt(self, token: str) -> dict:
         # Supported algos: https://pyjwt.readthedocs.io/en/stable/algorithms.html
         # "Warning: Make sure not to mix symmetric and asymmetric algorithms that interpret
         #   the key in different ways (e.g. HS* and RS*)."
@@ -811,6 +948,47 @@ class JWTAuthManager:
 
         return None, None
 
+    @staticmethod
+    async def get_verified_token_claims(
+        jwt_handler: JWTHandler,
+        token: str,
+        jwt_valid_token: dict,
+    ) -> JWTVerifiedTokenClaims:
+        """
+        Role / team / scope mapping of the token - computed once per verified token, and cached with it.
+        """
+        verified_token = jwt_handler.get_verified_token(token=token)
+        if (
+            verified_token is not None
+            and verified_token["claims"] is not None
+            and verified_token["payload"] is jwt_valid_token
+        ):
+            return verified_token["claims"]
+
+        user_id, user_email, valid_user_email = await JWTAuthManager.get_user_info(
+            jwt_handler, jwt_valid_token
+        )
+        claims = JWTVerifiedTokenClaims(
+            rbac_role=jwt_handler.get_rbac_role(token=jwt_valid_token),
+            scopes=jwt_handler.get_scopes(token=jwt_valid_token),
+            object_id=jwt_handler.get_object_id(
+                token=jwt_valid_token, default_value=None
+            ),
+            user_id=user_id,
+            user_email=user_email,
+            valid_user_email=valid_user_email,
+            org_id=jwt_handler.get_org_id(token=jwt_valid_token, default_value=None),
+            end_user_id=jwt_handler.get_end_user_id(
+                token=jwt_valid_token, default_value=None
+            ),
+            team_ids=JWTAuthManager.get_all_team_ids(jwt_handler, jwt_valid_token),
+        )
+
+        # only cache claims computed from the cached payload
+        if verified_token is not None and verified_token["payload"] is jwt_valid_token:
+            verified_token["claims"] = claims
+        return claims
+
     @staticmethod
     async def get_user_info(
         jwt_handler: JWTHandler,
@@ -1037,8 +1215,12 @@ class JWTAuthManager:
                     detail="Invalid JWT token",
                 )
 
+        claims = await JWTAuthManager.get_verified_token_claims(
+            jwt_handler=jwt_handler, token=api_key, jwt_valid_token=jwt_valid_token
+        )
+
         # Check RBAC
-        rbac_role = jwt_handler.get_rbac_role(token=jwt_valid_token)
+        rbac_role = claims["rbac_role"]
         await JWTAuthManager.check_rbac_role(
             jwt_handler,
             jwt_valid_token,
@@ -1049,7 +1231,7 @@ class JWTAuthManager:
         )
 
         # Check Scope Based Access
-        scopes = jwt_handler.get_scopes(token=jwt_valid_token)
+        scopes = claims["scopes"]
         if (
             jwt_handler.litellm_jwtauth.enforce_scope_based_access
             and jwt_handler.litellm_jwtauth.scope_mappings
@@ -1061,22 +1243,17 @@ class JWTAuthManager:
                 general_settings=general_settings,
             )
 
-        object_id = jwt_handler.get_object_id(token=jwt_valid_token, default_value=None)
-
         # Get basic user info
-        scopes = jwt_handler.get_scopes(token=jwt_valid_token)
-        user_id, user_email, valid_user_email = await JWTAuthManager.get_user_info(
-            jwt_handler, jwt_valid_token
-        )
+        user_id = claims["user_id"]
+        user_email = claims["user_email"]
+        valid_user_email = claims["valid_user_email"]
 
         # Get IDs
-        org_id = jwt_handler.get_org_id(token=jwt_valid_token, default_value=None)
-        end_user_id = jwt_handler.get_end_user_id(
-            token=jwt_valid_token, default_value=None
-        )
+        org_id = claims["org_id"]
+        end_user_id = claims["end_user_id"]
         team_id: Optional[str] = None
         team_object: Optional[LiteLLM_TeamTable] = None
-        object_id = jwt_handler.get_object_id(token=jwt_valid_token, default_value=None)
+        object_id = claims["object_id"]
 
         if rbac_role and object_id:
             if rbac_role == LitellmUserRoles.TEAM:
@@ -1109,7 +1286,7 @@ class JWTAuthManager:
 
         if not team_object and not team_id:
             ## CHECK USER GROUP ACCESS
-            all_team_ids = JWTAuthManager.get_all_team_ids(jwt_handler, jwt_valid_token)
+            all_team_ids = claims["team_ids"]
             team_id, team_object = await JWTAuthManager.find_team_with_model_access(
                 team_ids=all_team_ids,
                 requested_model=request_data.get("model"),
@@ -0,0 +1,111 @@
+"""
+Compiled allowed-model lists, for key / team / org / user model access checks.
+
+An allowed model list (e.g. `["gpt-4o", "bedrock/*", "anthropic/*"]`) is compiled once into a `ModelAccessMatcher`:
+- exact model names -> set lookup
+- wildcard patterns -> one combined regex, instead of a regex per pattern per request
+- wildcard decisions are memoised per model, so `get_llm_provider` runs once per model, not once per pattern
+
+Matchers are (re)compiled when a key / team is loaded into `user_api_key_cache` (`_cache_key_object`, `_cache_team_object`), and lazily for everything else.
+"""
+
+import re
+from typing import List, Optional, Pattern, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import (
+    MAX_MODEL_ACCESS_MATCHER_DECISIONS,
+    MAX_MODEL_ACCESS_MATCHERS,
+)
+from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+
+
+class ModelAccessMatcher:
+    def __init__(self, models: List[str]):
+        self.models = frozenset(models)
+        self.wildcard_patterns: List[str] = [m for m in models if "*" in m]
+        self.wildcard_regex: Optional[Pattern] = self._compile_wildcard_patterns(
+            self.wildcard_patterns
+        )
+        self._wildcard_decisions: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=MAX_MODEL_ACCESS_MATCHER_DECISIONS
+        )
+
+    def matches_any_wildcard_pattern(self, model: str) -> bool:
+        """
+        Returns True if `model`, or `{custom_llm_provider}/{model}`, matches any wildcard pattern in the list.
+        """
+        if self.wildcard_regex is None:
+            return False
+        decision = self._wildcard_decisions.get(model)
+        if decision is None:
+            decision = self._match_wildcard_patterns(model)
+            self._wildcard_decisions[model] = decision
+        return decision
+
+    def _match_wildcard_patterns(self, model: str) -> bool:
+        if self.wildcard_regex is None:
+            return False
+        if self.wildcard_regex.match(model):
+            return True
+
+        try:
+            _model, custom_llm_provider, _, _ = get_llm_provider(model=model)
+        except Exception:
+            return False
+        return bool(self.wildcard_regex.match(f"{custom_llm_provider}/{_model}"))
+
+    @staticmethod
+    def _compile_wildcard_patterns(wildcard_patterns: List[str]) -> Optional[Pattern]:
+        """
+        Combine the patterns into one regex - `*` matches anything, same as `is_model_allowed_by_pattern`.
+
+        Patterns that aren't valid regexes are skipped, so they never match.
+        """
+        valid_patterns: List[str] = []
+        for wildcard_pattern in wildcard_patterns:
+            pattern = wildcard_pattern.replace("*", ".*")
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                verbose_proxy_logger.warning(
+                    "Skipping invalid model access pattern=%s - %s",
+                    wildcard_pattern,
+                    str(e),
+                )
+                continue
+            valid_patterns.append(f"(?:{pattern})")
+        if len(valid_patterns) == 0:
+            return None
+        return re.compile(f"^(?:{'|'.join(valid_patterns)})$")
+
+
+_model_access_matchers: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+    max_size=MAX_MODEL_ACCESS_MATCHERS
+)
+
+
+def _get_matcher_key(models: List[str]) -> Tuple[str, ...]:
+    return tuple(models)
+
+
+def get_model_access_matcher(models: List[str]) -> ModelAccessMatcher:
+    """
+    Returns the compiled matcher for an allowed model list - compiling it, if it isn't cached yet.
+    """
+    matcher = _model_access_matchers.get(_get_matcher_key(models))
+    if matcher is None:
+        matcher = compile_model_access_matcher(models)
+    return matcher
+
+
+def compile_model_access_matcher(models: List[str]) -> ModelAccessMatcher:
+    """
+    (Re)compile the matcher for an allowed model list, replacing the cached one and its memoised decisions.
+
+    Called when a key / team is (re)loaded into `user_api_key_cache`, so memoised decisions don't outlive the cached object.
+    """
+    matcher = ModelAccessMatcher(models)
+    _model_access_matchers[_get_matcher_key(models)] = matcher
+    return matcher
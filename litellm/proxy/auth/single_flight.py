@@ -0,0 +1,78 @@
+"""
+Single-flight request coalescing for auth object lookups.
+
+When a hot key / team / user drops out of `user_api_key_cache`, every concurrent request misses the cache at once.
+`SingleFlight` makes sure only one coroutine per object loads it from the DB - the others await the same result.
+"""
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from litellm._logging import verbose_proxy_logger
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn()`, unless a call for `key` is already in flight - then await its result (or exception) instead.
+        """
+        task = self._get_in_flight_task(key)
+        if task is None:
+            task = self._start(key, fn)
+        # shield - a cancelled caller (e.g. client disconnected) doesn't cancel the load for the other callers
+        return await asyncio.shield(task)
+
+    def do_in_background(self, key: Hashable, fn: Callable[[], Awaitable]) -> bool:
+        """
+        Start `fn()` without waiting for it, unless a call for `key` is already in flight.
+
+        Used to refresh cached objects before they expire. Callers that miss the cache meanwhile join the refresh.
+
+        Returns True if the call was started.
+        """
+        if self._get_in_flight_task(key) is not None:
+            return False
+        self._start(key, functools.partial(self._run_in_background, key, fn))
+        return True
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        return self._get_in_flight_task(key) is not None
+
+    def _get_in_flight_task(self, key: Hashable) -> Optional[asyncio.Future]:
+        task = self._in_flight.get(key)
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            return None
+        return task
+
+    def _start(self, key: Hashable, fn: Callable[[], Awaitable]) -> asyncio.Future:
+        task = asyncio.ensure_future(fn())
+        self._in_flight[key] = task
+        task.add_done_callback(functools.partial(self._on_done, key))
+        return task
+
+    def _on_done(self, key: Hashable, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # mark the exception as retrieved - background refreshes, and loads whose callers were all cancelled, have no one to raise to
+            task.exception()
+
+    @staticmethod
+    async def _run_in_background(key: Hashable, fn: Callable[[], Awaitable]):
+        try:
+            return await fn()
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                "Background refresh failed for key=%s - %s", key, str(e)
+            )
+            raise
@@ -49,6 +49,47 @@ async def get_active_tasks_stats():
     }
 
 
+@router.get("/debug/http-connection-pools")
+async def get_http_connection_pool_stats():
+    """
+    Returns occupancy, connection wait time and connect latency of litellm's pooled httpx clients
+    """
+    from litellm.llms.custom_httpx.connection_pool_manager import (
+        http_connection_pool_manager,
+    )
+
+    return {"pools": http_connection_pool_manager.get_pool_metrics()}
+
+
+@router.get("/debug/callback-dispatch")
+async def get_callback_dispatch_stats():
+    """
+    Returns queue depth, drops and latency of each sync callback dispatch lane
+    """
+    from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
+
+    return {"lanes": callback_dispatcher.get_metrics()}
+
+
+@router.get("/debug/batch-loggers")
+async def get_batch_logger_stats():
+    """
+    Returns queue size, drops, failed flushes and lag of each batching logger (e.g. Datadog, GCS, Langsmith)
+    """
+    import litellm
+    from litellm.integrations.custom_batch_logger import CustomBatchLogger
+
+    return {
+        "batch_loggers": [
+            custom_logger.get_batch_metrics()
+            for custom_logger in litellm.logging_callback_manager.get_custom_loggers_for_type(
+                CustomBatchLogger
+            )
+            if isinstance(custom_logger, CustomBatchLogger)
+        ]
+    }
+
+
 if os.environ.get("LITELLM_PROFILE", "false").lower() == "true":
     try:
         import objgraph  # type: ignore
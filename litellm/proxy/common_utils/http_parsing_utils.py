@@ -5,7 +5,7 @@ import orjson
 from fastapi import Request, UploadFile, status
 
 from litellm._logging import verbose_proxy_logger
-from litellm.proxy._types import ProxyException
+from litellm.proxy._types import ProxyErrorTypes, ProxyException
 from litellm.types.router import Deployment
 
 
@@ -32,12 +32,28 @@ async def _read_request_body(request: Optional[Request]) -> Dict:
 
         _request_headers: dict = _safe_get_request_headers(request=request)
         content_type = _request_headers.get("content-type", "")
+        max_body_size_bytes = _get_max_request_body_size_bytes()
+        if max_body_size_bytes is not None:
+            _check_content_length_is_safe(
+                request_headers=_request_headers,
+                max_body_size_bytes=max_body_size_bytes,
+            )
 
         if "form" in content_type:
+            if max_body_size_bytes is not None:
+                # buffer the body under the size limit - `request.form()` parses the buffered body
+                await _read_request_body_bytes(
+                    request=request, max_body_size_bytes=max_body_size_bytes
+                )
             parsed_body = dict(await request.form())
         else:
             # Read the request body
-            body = await request.body()
+            if max_body_size_bytes is not None:
+                body = await _read_request_body_bytes(
+                    request=request, max_body_size_bytes=max_body_size_bytes
+                )
+            else:
+                body = await request.body()
 
             # Return empty dict if body is empty or None
             if not body:
@@ -90,6 +106,66 @@ async def _read_request_body(request: Optional[Request]) -> Dict:
         return {}
 
 
+def _get_max_request_body_size_bytes() -> Optional[int]:
+    """
+    `general_settings.max_request_size_mb` in bytes - None if it is not set, or not enforced (non-premium user).
+    """
+    from litellm.proxy.proxy_server import general_settings, premium_user
+
+    max_request_size_mb = general_settings.get("max_request_size_mb", None)
+    if max_request_size_mb is None or premium_user is not True:
+        return None
+    return int(max_request_size_mb * 1024 * 1024)
+
+
+def _get_request_body_too_large_exception(max_body_size_bytes: int) -> ProxyException:
+    max_request_size_mb = max_body_size_bytes / (1024 * 1024)
+    return ProxyException(
+        message=f"Request size is too large. Max size is {max_request_size_mb} MB",
+        type=ProxyErrorTypes.bad_request_error.value,
+        code=400,
+        param="content-length",
+    )
+
+
+def _check_content_length_is_safe(request_headers: dict, max_body_size_bytes: int):
+    """
+    Reject a request whose `content-length` is over the limit, before reading the body.
+    """
+    content_length = request_headers.get("content-length")
+    if (
+        content_length is not None
+        and content_length.isdigit()
+        and int(content_length) > max_body_size_bytes
+    ):
+        raise _get_request_body_too_large_exception(max_body_size_bytes)
+
+
+async def _read_request_body_bytes(request: Request, max_body_size_bytes: int) -> bytes:
+    """
+    Stream the request body, raising as soon as it goes over `max_body_size_bytes`.
+
+    Unlike `request.body()`, a chunked / mislabelled upload is never buffered in full.
+    """
+    cached_body = getattr(request, "_body", None)
+    if isinstance(cached_body, bytes):
+        if len(cached_body) > max_body_size_bytes:
+            raise _get_request_body_too_large_exception(max_body_size_bytes)
+        return cached_body
+
+    chunks: List[bytes] = []
+    body_size = 0
+    async for chunk in request.stream():
+        body_size += len(chunk)
+        if body_size > max_body_size_bytes:
+            raise _get_request_body_too_large_exception(max_body_size_bytes)
+        chunks.append(chunk)
+    body = b"".join(chunks)
+    # same as `request.body()` - so later `request.body()` calls return the buffered body
+    request._body = body
+    return body
+
+
 def _safe_get_request_parsed_body(request: Optional[Request]) -> Optional[dict]:
     if request is None:
         return None
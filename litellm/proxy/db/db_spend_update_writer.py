@@ -11,12 +11,27 @@ import os
 import time
 import traceback
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
 
 import litellm
 from litellm._logging import verbose_proxy_logger
 from litellm.caching import DualCache, RedisCache
-from litellm.constants import DB_SPEND_UPDATE_JOB_NAME
+from litellm.constants import (
+    DB_SPEND_UPDATE_JOB_NAME,
+    MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE,
+    SPEND_LOGS_INGESTION_BATCH_SIZE,
+    SPEND_LOGS_INGESTION_MAX_CONCURRENT_BATCHES,
+)
 from litellm.proxy._types import (
     DB_CONNECTION_ERROR_TYPES,
     BaseDailySpendTransaction,
@@ -36,6 +51,7 @@ from litellm.proxy.db.db_transaction_queue.daily_spend_update_queue import (
 from litellm.proxy.db.db_transaction_queue.pod_lock_manager import PodLockManager
 from litellm.proxy.db.db_transaction_queue.redis_update_buffer import RedisUpdateBuffer
 from litellm.proxy.db.db_transaction_queue.spend_update_queue import SpendUpdateQueue
+from litellm.secret_managers.main import str_to_bool
 
 if TYPE_CHECKING:
     from litellm.proxy.utils import PrismaClient, ProxyLogging
@@ -63,6 +79,8 @@ class DBSpendUpdateWriter:
         self.daily_spend_update_queue = DailySpendUpdateQueue()
         self.daily_team_spend_update_queue = DailySpendUpdateQueue()
         self.daily_tag_spend_update_queue = DailySpendUpdateQueue()
+        # only one spend log write at a time - the scheduled job, or a write triggered by backpressure
+        self.spend_logs_write_lock = asyncio.Lock()
 
     async def update_database(
         # LiteLLM management object fields
@@ -340,6 +358,12 @@ class DBSpendUpdateWriter:
             prisma_client.spend_log_transactions.append(payload)
         elif prisma_client is not None:
             prisma_client.spend_log_transactions.append(payload)
+            if (
+                len(prisma_client.spend_log_transactions)
+                >= MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE
+                and DBSpendUpdateWriter._should_use_batched_spend_log_ingestion()
+            ):
+                await self._apply_spend_logs_backpressure(prisma_client=prisma_client)
         else:
             verbose_proxy_logger.debug(
                 "prisma_client is None. Skipping writing spend logs to db."
@@ -347,6 +371,138 @@ class DBSpendUpdateWriter:
 
         return prisma_client
 
+    @staticmethod
+    def _should_use_batched_spend_log_ingestion() -> bool:
+        """
+        Checks `general_settings.use_batched_spend_log_ingestion`
+
+        High-throughput mode - spend logs are written with concurrent multi-row inserts, daily spend with larger batched upserts,
+        and requests wait on the db write when the spend log queue is full.
+        """
+        from litellm.proxy.proxy_server import general_settings
+
+        _use_batched_spend_log_ingestion: Optional[Union[bool, str]] = (
+            general_settings.get("use_batched_spend_log_ingestion", False)
+        )
+        if isinstance(_use_batched_spend_log_ingestion, str):
+            _use_batched_spend_log_ingestion = str_to_bool(
+                _use_batched_spend_log_ingestion
+            )
+        return _use_batched_spend_log_ingestion is True
+
+    async def _apply_spend_logs_backpressure(self, prisma_client: PrismaClient):
+        """
+        Called when the spend log queue reaches MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE.
+
+        Writes the queued spend logs now, instead of on the next scheduled run. Callers wait on the write,
+        so producers are slowed down to the rate the DB can absorb.
+        If the write fails, the oldest spend logs over the limit are dropped, to bound memory.
+        """
+        from litellm.proxy.proxy_server import proxy_logging_obj
+
+        async with self.spend_logs_write_lock:
+            # another request may have written the queue while we waited
+            if (
+                len(prisma_client.spend_log_transactions)
+                < MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE
+            ):
+                return
+            verbose_proxy_logger.warning(
+                "Spend log queue is full (%s logs). Writing spend logs to db before accepting more.",
+                len(prisma_client.spend_log_transactions),
+            )
+            try:
+                await self._write_spend_logs_to_db(
+                    prisma_client=prisma_client,
+                    n_retry_times=0,
+                    proxy_logging_obj=proxy_logging_obj,
+                )
+            except Exception as e:
+                verbose_proxy_logger.error(
+                    f"Error writing spend logs to db under backpressure: {str(e)}"
+                )
+
+            overflow = (
+                len(prisma_client.spend_log_transactions)
+                - MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE
+            )
+            if overflow > 0:
+                prisma_client.spend_log_transactions = (
+                    prisma_client.spend_log_transactions[overflow:]
+                )
+                verbose_proxy_logger.error(
+                    f"Spend log queue is full. Dropped the {overflow} oldest spend logs."
+                )
+
+    async def batch_write_spend_logs_to_db(
+        self,
+        prisma_client: PrismaClient,
+        n_retry_times: int,
+        proxy_logging_obj: ProxyLogging,
+    ):
+        """
+        Write all queued spend logs to the db, used when `general_settings.use_batched_spend_log_ingestion` is set.
+        """
+        async with self.spend_logs_write_lock:
+            await self._write_spend_logs_to_db(
+                prisma_client=prisma_client,
+                n_retry_times=n_retry_times,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+
+    async def _write_spend_logs_to_db(
+        self,
+        prisma_client: PrismaClient,
+        n_retry_times: int,
+        proxy_logging_obj: ProxyLogging,
+    ):
+        """
+        Drains the whole spend log queue, as multi-row inserts of SPEND_LOGS_INGESTION_BATCH_SIZE rows,
+        with up to SPEND_LOGS_INGESTION_MAX_CONCURRENT_BATCHES inserts in flight.
+
+        Failed batches are dropped (same as the regular flow) and the first error is raised.
+        """
+        from litellm.proxy.utils import _raise_failed_update_spend_exception
+
+        logs_to_process: List = prisma_client.spend_log_transactions
+        if len(logs_to_process) == 0:
+            return
+        prisma_client.spend_log_transactions = []
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(SPEND_LOGS_INGESTION_MAX_CONCURRENT_BATCHES)
+
+        async def _write_batch(batch: List) -> None:
+            async with semaphore:
+                batch_with_dates = [
+                    prisma_client.jsonify_object({**entry}) for entry in batch
+                ]
+                for i in range(n_retry_times + 1):
+                    try:
+                        await prisma_client.db.litellm_spendlogs.create_many(
+                            data=batch_with_dates, skip_duplicates=True
+                        )
+                        return
+                    except DB_CONNECTION_ERROR_TYPES:
+                        if i >= n_retry_times:
+                            raise
+                        await asyncio.sleep(2**i)
+
+        results = await asyncio.gather(
+            *(
+                _write_batch(logs_to_process[j : j + SPEND_LOGS_INGESTION_BATCH_SIZE])
+                for j in range(0, len(logs_to_process), SPEND_LOGS_INGESTION_BATCH_SIZE)
+            ),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        verbose_proxy_logger.debug(
+            f"Wrote {len(logs_to_process)} spend logs to the DB in {len(results)} batches, {len(errors)} failed batches, in {time.time() - start_time:.2f}s"
+        )
+        if len(errors) > 0:
+            _raise_failed_update_spend_exception(
+                e=errors[0], start_time=start_time, proxy_logging_obj=proxy_logging_obj
+            )
+
     async def db_update_spend_transaction_handler(
         self,
         prisma_client: PrismaClient,
@@ -843,140 +999,150 @@ class DBSpendUpdateWriter:
         verbose_proxy_logger.debug(
             f"Daily {entity_type.capitalize()} Spend transactions: {len(daily_spend_transactions)}"
         )
-        BATCH_SIZE = 100
+        BATCH_SIZE = (
+            SPEND_LOGS_INGESTION_BATCH_SIZE
+            if DBSpendUpdateWriter._should_use_batched_spend_log_ingestion()
+            else 100
+        )
         start_time = time.time()
 
-        try:
-            for i in range(n_retry_times + 1):
-                try:
-                    transactions_to_process = dict(
-                        list(daily_spend_transactions.items())[:BATCH_SIZE]
-                    )
+        if len(daily_spend_transactions) == 0:
+            verbose_proxy_logger.debug(
+                f"No new transactions to process for daily {entity_type} spend update"
+            )
+            return
 
-                    if len(transactions_to_process) == 0:
-                        verbose_proxy_logger.debug(
-                            f"No new transactions to process for daily {entity_type} spend update"
+        try:
+            # write all transactions, in batches of BATCH_SIZE
+            while len(daily_spend_transactions) > 0:
+                for i in range(n_retry_times + 1):
+                    try:
+                        transactions_to_process = dict(
+                            list(daily_spend_transactions.items())[:BATCH_SIZE]
                         )
-                        break
 
-                    async with prisma_client.db.batch_() as batcher:
-                        for _, transaction in transactions_to_process.items():
-                            entity_id = transaction.get(entity_id_field)
+                        async with prisma_client.db.batch_() as batcher:
+                            for _, transaction in transactions_to_process.items():
+                                entity_id = transaction.get(entity_id_field)
+
+                                # Construct the where clause dynamically
+                                where_clause = {
+                                    unique_constraint_name: {
+                                        entity_id_field: entity_id,
+                                        "date": transaction["date"],
+                                        "api_key": transaction["api_key"],
+                                        "model": transaction["model"],
+                                        "custom_llm_provider": transaction.get(
+                                            "custom_llm_provider"
+                                        )
+                                        or "",
+                                        "mcp_namespaced_tool_name": transaction.get(
+                                            "mcp_namespaced_tool_name"
+                                        )
+                                        or "",
+                                    }
+                                }
 
-                            # Construct the where clause dynamically
-                            where_clause = {
-                                unique_constraint_name: {
+                                # Get the table dynamically
+                                table = getattr(batcher, table_name)
+
+                                # Common data structure for both create and update
+                                common_data = {
                                     entity_id_field: entity_id,
                                     "date": transaction["date"],
                                     "api_key": transaction["api_key"],
-                                    "model": transaction["model"],
-                                    "custom_llm_provider": transaction.get(
-                                        "custom_llm_provider"
-                                    )
-                                    or "",
+                                    "model": transaction.get("model"),
+                                    "model_group": transaction.get("model_group"),
                                     "mcp_namespaced_tool_name": transaction.get(
                                         "mcp_namespaced_tool_name"
-                                    )
-                                    or "",
+                                    ) or "",
+                                    "custom_llm_provider": transaction.get(
+                                        "custom_llm_provider"
+                                    ),
+                                    "prompt_tokens": transaction["prompt_tokens"],
+                                    "completion_tokens": transaction[
+                                        "completion_tokens"
+                                    ],
+                                    "spend": transaction["spend"],
+                                    "api_requests": transaction["api_requests"],
+                                    "successful_requests": transaction[
+                                        "successful_requests"
+                                    ],
+                                    "failed_requests": transaction["failed_requests"],
                                 }
-                            }
-
-                            # Get the table dynamically
-                            table = getattr(batcher, table_name)
-
-                            # Common data structure for both create and update
-                            common_data = {
-                                entity_id_field: entity_id,
-                                "date": transaction["date"],
-                                "api_key": transaction["api_key"],
-                                "model": transaction.get("model"),
-                                "model_group": transaction.get("model_group"),
-                                "mcp_namespaced_tool_name": transaction.get(
-                                    "mcp_namespaced_tool_name"
-                                ) or "",
-                                "custom_llm_provider": transaction.get(
-                                    "custom_llm_provider"
-                                ),
-                                "prompt_tokens": transaction["prompt_tokens"],
-                                "completion_tokens": transaction["completion_tokens"],
-                                "spend": transaction["spend"],
-                                "api_requests": transaction["api_requests"],
-                                "successful_requests": transaction[
-                                    "successful_requests"
-                                ],
-                                "failed_requests": transaction["failed_requests"],
-                            }
-
-                            # Add cache-related fields if they exist
-                            if "cache_read_input_tokens" in transaction:
-                                common_data["cache_read_input_tokens"] = (
-                                    transaction.get("cache_read_input_tokens", 0)
-                                )
-                            if "cache_creation_input_tokens" in transaction:
-                                common_data["cache_creation_input_tokens"] = (
-                                    transaction.get("cache_creation_input_tokens", 0)
-                                )
 
-                            # Create update data structure
-                            update_data = {
-                                "prompt_tokens": {
-                                    "increment": transaction["prompt_tokens"]
-                                },
-                                "completion_tokens": {
-                                    "increment": transaction["completion_tokens"]
-                                },
-                                "spend": {"increment": transaction["spend"]},
-                                "api_requests": {
-                                    "increment": transaction["api_requests"]
-                                },
-                                "successful_requests": {
-                                    "increment": transaction["successful_requests"]
-                                },
-                                "failed_requests": {
-                                    "increment": transaction["failed_requests"]
-                                },
-                            }
-
-                            # Add cache-related fields to update if they exist
-                            if "cache_read_input_tokens" in transaction:
-                                update_data["cache_read_input_tokens"] = {
-                                    "increment": transaction.get(
-                                        "cache_read_input_tokens", 0
+                                # Add cache-related fields if they exist
+                                if "cache_read_input_tokens" in transaction:
+                                    common_data["cache_read_input_tokens"] = (
+                                        transaction.get("cache_read_input_tokens", 0)
                                     )
-                                }
-                            if "cache_creation_input_tokens" in transaction:
-                                update_data["cache_creation_input_tokens"] = {
-                                    "increment": transaction.get(
-                                        "cache_creation_input_tokens", 0
+                                if "cache_creation_input_tokens" in transaction:
+                                    common_data["cache_creation_input_tokens"] = (
+                                        transaction.get(
+                                            "cache_creation_input_tokens", 0
+                                        )
                                     )
+
+                                # Create update data structure
+                                update_data = {
+                                    "prompt_tokens": {
+                                        "increment": transaction["prompt_tokens"]
+                                    },
+                                    "completion_tokens": {
+                                        "increment": transaction["completion_tokens"]
+                                    },
+                                    "spend": {"increment": transaction["spend"]},
+                                    "api_requests": {
+                                        "increment": transaction["api_requests"]
+                                    },
+                                    "successful_requests": {
+                                        "increment": transaction["successful_requests"]
+                                    },
+                                    "failed_requests": {
+                                        "increment": transaction["failed_requests"]
+                                    },
                                 }
 
-                            table.upsert(
-                                where=where_clause,
-                                data={
-                                    "create": common_data,
-                                    "update": update_data,
-                                },
-                            )
+                                # Add cache-related fields to update if they exist
+                                if "cache_read_input_tokens" in transaction:
+                                    update_data["cache_read_input_tokens"] = {
+                                        "increment": transaction.get(
+                                            "cache_read_input_tokens", 0
+                                        )
+                                    }
+                                if "cache_creation_input_tokens" in transaction:
+                                    update_data["cache_creation_input_tokens"] = {
+                                        "increment": transaction.get(
+                                            "cache_creation_input_tokens", 0
+                                        )
+                                    }
+
+                                table.upsert(
+                                    where=where_clause,
+                                    data={
+                                        "create": common_data,
+                                        "update": update_data,
+                                    },
+                                )
 
-                    verbose_proxy_logger.info(
-                        f"Processed {len(transactions_to_process)} daily {entity_type} transactions in {time.time() - start_time:.2f}s"
-                    )
+                        verbose_proxy_logger.info(
+                            f"Processed {len(transactions_to_process)} daily {entity_type} transactions in {time.time() - start_time:.2f}s"
+                        )
 
-                    # Remove processed transactions
-                    for key in transactions_to_process.keys():
-                        daily_spend_transactions.pop(key, None)
+                        # Remove processed transactions
+                        for key in transactions_to_process.keys():
+                            daily_spend_transactions.pop(key, None)
 
-                    break
+                        break
 
-                except DB_CONNECTION_ERROR_TYPES as e:
-                    if i >= n_retry_times:
-                        _raise_failed_update_spend_exception(
-                            e=e,
-                            start_time=start_time,
-                            proxy_logging_obj=proxy_logging_obj,
-                        )
-                    await asyncio.sleep(2**i)
+                    except DB_CONNECTION_ERROR_TYPES as e:
+                        if i >= n_retry_times:
+                            _raise_failed_update_spend_exception(
+                                e=e,
+                                start_time=start_time,
+                                proxy_logging_obj=proxy_logging_obj,
+                            )
+                        await asyncio.sleep(2**i)
 
         except Exception as e:
             if "transactions_to_process" in locals():
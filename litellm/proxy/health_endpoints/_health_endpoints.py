@@ -747,15 +747,22 @@ async def health_readiness():
         # check Cache
         cache_type = None
         if litellm.cache is not None:
-            from litellm.caching.caching import RedisSemanticCache
+            from litellm.caching.caching import (
+                LocalSemanticCache,
+                RedisSemanticCache,
+            )
 
             cache_type = litellm.cache.type
 
-            if isinstance(litellm.cache.cache, RedisSemanticCache):
+            remote_cache = litellm.cache.cache
+            if isinstance(remote_cache, LocalSemanticCache):
+                remote_cache = remote_cache.remote_cache
+
+            if isinstance(remote_cache, RedisSemanticCache):
                 # ping the cache
                 # TODO: @ishaan-jaff - we should probably not ping the cache on every /health/readiness check
                 try:
-                    index_info = await litellm.cache.cache._index_info()
+                    index_info = await remote_cache._index_info()
                 except Exception as e:
                     index_info = "index does not exist - error: " + str(e)
                 cache_type = {"type": cache_type, "index_info": index_info}
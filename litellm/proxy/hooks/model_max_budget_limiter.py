@@ -24,6 +24,8 @@ class _PROXY_VirtualKeyModelMaxBudgetLimiter(RouterBudgetLimiting):
     Example: key=sk-1234567890, model=gpt-4o, max_budget=100, time_period=1d
     """
 
+    standard_logging_payload_fields = {"metadata", "model", "response_cost"}
+
     def __init__(self, dual_cache: DualCache):
         self.dual_cache = dual_cache
         self.redis_increment_operation_queue = []
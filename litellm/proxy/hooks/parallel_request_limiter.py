@@ -1,7 +1,17 @@
 import asyncio
 import sys
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, List, Literal, Optional, Tuple, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from fastapi import HTTPException
 from pydantic import BaseModel
@@ -40,6 +50,9 @@ class CacheObject(TypedDict):
 
 class _PROXY_MaxParallelRequestsHandler(CustomLogger):
     # Class variables or attributes
+    # reads the request metadata + usage from the response, not the logging payload
+    standard_logging_payload_fields: Set[str] = set()
+
     def __init__(self, internal_usage_cache: InternalUsageCache):
         self.internal_usage_cache = internal_usage_cache
 
@@ -3,6 +3,7 @@ This is a rate limiter implementation based on a similar one by Envoy proxy.
 
 This is currently in development and not yet ready for production.
 """
+import asyncio
 import os
 from datetime import datetime
 from typing import (
@@ -12,6 +13,8 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
+    Tuple,
     TypedDict,
     Union,
     cast,
@@ -21,6 +24,7 @@ from fastapi import HTTPException
 
 from litellm import DualCache
 from litellm._logging import verbose_proxy_logger
+from litellm.caching.redis_cluster_cache import RedisClusterCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.proxy._types import UserAPIKeyAuth
 
@@ -68,6 +72,101 @@ return results
 """
 
 
+# Atomic check-and-increment across all of a request's descriptors, in one round trip.
+# Counters are only incremented if every descriptor is under its limit - so a rejected request leaves no trace.
+#
+# KEYS: window_key_1, counter_key_1, window_key_2, counter_key_2, ...
+# ARGV: now, window_size, then per window/counter pair: limit, counter_type
+#   counter_type:
+#     - "increment": sliding window counter, incremented by 1 on admission (requests / max parallel requests)
+#     - "check": sliding window counter, only checked (tokens - incremented on success)
+#     - "token_bucket": counter_key is a hash {tokens, ts} refilled at limit / window_size tokens per second
+# Returns: window_start_1, counter_1, window_start_2, counter_2, ..., over_limit (0 / 1)
+ATOMIC_BATCH_RATE_LIMITER_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window_size = tonumber(ARGV[2])
+local num_pairs = #KEYS / 2
+local window_starts = {}
+local counters = {}
+local expired = {}
+local over_limit = 0
+
+for i = 1, num_pairs do
+    local window_key = KEYS[2 * i - 1]
+    local counter_key = KEYS[2 * i]
+    local limit = tonumber(ARGV[2 * i + 1])
+    local counter_type = ARGV[2 * i + 2]
+
+    if counter_type == 'token_bucket' then
+        local bucket = redis.call('HMGET', counter_key, 'tokens', 'ts')
+        local tokens = tonumber(bucket[1])
+        local last_refill = tonumber(bucket[2])
+        if not tokens or not last_refill then
+            tokens = limit
+            last_refill = now
+        end
+        tokens = math.min(limit, tokens + (now - last_refill) * limit / window_size)
+        window_starts[i] = tostring(now)
+        counters[i] = tokens
+        if tokens <= 0 then
+            over_limit = 1
+        end
+    else
+        local window_start = redis.call('GET', window_key)
+        local counter = 0
+        if window_start and (now - tonumber(window_start)) < window_size then
+            counter = tonumber(redis.call('GET', counter_key) or '0')
+        else
+            window_start = tostring(now)
+            expired[i] = true
+        end
+        window_starts[i] = window_start
+        counters[i] = counter
+        if counter + 1 > limit then
+            over_limit = 1
+        end
+    end
+end
+
+local results = {}
+for i = 1, num_pairs do
+    local window_key = KEYS[2 * i - 1]
+    local counter_key = KEYS[2 * i]
+    local counter_type = ARGV[2 * i + 2]
+
+    if over_limit == 0 then
+        if counter_type == 'token_bucket' then
+            redis.call('HSET', counter_key, 'tokens', tostring(counters[i]), 'ts', tostring(now))
+            redis.call('EXPIRE', counter_key, window_size)
+        else
+            if expired[i] then
+                redis.call('SET', window_key, window_starts[i], 'EX', window_size)
+                redis.call('SET', counter_key, 0, 'EX', window_size)
+            end
+            if counter_type == 'increment' then
+                counters[i] = redis.call('INCR', counter_key)
+            end
+        end
+    end
+    table.insert(results, window_starts[i])
+    table.insert(results, tostring(counters[i]))
+end
+table.insert(results, over_limit)
+
+return results
+"""
+
+# Consume tokens from existing token buckets (on success). KEYS: bucket keys, ARGV: tokens to consume
+TOKEN_BUCKET_CONSUME_SCRIPT = """
+for i, bucket_key in ipairs(KEYS) do
+    if redis.call('EXISTS', bucket_key) == 1 then
+        redis.call('HINCRBYFLOAT', bucket_key, 'tokens', -tonumber(ARGV[1]))
+    end
+end
+return 1
+"""
+
+
 class RateLimitDescriptorRateLimitObject(TypedDict, total=False):
     requests_per_unit: Optional[int]
     tokens_per_unit: Optional[int]
@@ -100,6 +199,9 @@ class RateLimitResponseWithDescriptors(TypedDict):
 
 
 class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
+    # reads the request metadata + usage from the response, not the logging payload
+    standard_logging_payload_fields: Set[str] = set()
+
     def __init__(self, internal_usage_cache: InternalUsageCache):
         self.internal_usage_cache = internal_usage_cache
         if self.internal_usage_cache.dual_cache.redis_cache is not None:
@@ -113,6 +215,30 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
         self.window_size = int(os.getenv("LITELLM_RATE_LIMIT_WINDOW_SIZE", 60))
 
+        # atomic mode - check + increment all descriptors in a single redis call
+        self.use_atomic_rate_limiter: bool = (
+            os.getenv("LITELLM_RATE_LIMIT_ATOMIC_MODE", "false").lower() == "true"
+        )
+        self.tpm_rate_limit_algorithm: Literal["sliding_window", "token_bucket"] = (
+            "token_bucket"
+            if os.getenv("LITELLM_TPM_RATE_LIMIT_ALGORITHM", "sliding_window")
+            == "token_bucket"
+            else "sliding_window"
+        )
+        self.atomic_rate_limiter_script: Optional[Any] = None
+        self.token_bucket_consume_script: Optional[Any] = None
+        if (
+            self.use_atomic_rate_limiter
+            and self.internal_usage_cache.dual_cache.redis_cache is not None
+        ):
+            redis_cache = self.internal_usage_cache.dual_cache.redis_cache
+            self.atomic_rate_limiter_script = redis_cache.async_register_script(
+                ATOMIC_BATCH_RATE_LIMITER_SCRIPT
+            )
+            self.token_bucket_consume_script = redis_cache.async_register_script(
+                TOKEN_BUCKET_CONSUME_SCRIPT
+            )
+
     async def in_memory_cache_sliding_window(
         self,
         keys: List[str],
@@ -192,6 +318,43 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
         return counter_key
 
+    @property
+    def uses_token_bucket(self) -> bool:
+        """
+        True if TPM limits are enforced by the redis token bucket - the ':tokens' window counters are then unused.
+        """
+        return (
+            self.token_bucket_consume_script is not None
+            and self.tpm_rate_limit_algorithm == "token_bucket"
+        )
+
+    @staticmethod
+    def get_token_bucket_key(tokens_counter_key: str) -> str:
+        """
+        Key of the TPM token bucket (a redis hash) backing a ':tokens' counter key.
+        """
+        return tokens_counter_key[: -len(":tokens")] + ":token_bucket"
+
+    @staticmethod
+    def _get_limit_for_counter_key(
+        counter_key: str, window_key_metadata: Dict[str, Any]
+    ) -> Tuple[
+        Optional[int], Optional[Literal["requests", "tokens", "max_parallel_requests"]]
+    ]:
+        """
+        Returns the limit + rate limit type tracked by a counter key.
+        """
+        if counter_key.endswith(":requests"):
+            return window_key_metadata["requests_limit"], "requests"
+        elif counter_key.endswith(":max_parallel_requests"):
+            return (
+                window_key_metadata["max_parallel_requests_limit"],
+                "max_parallel_requests",
+            )
+        elif counter_key.endswith(":tokens"):
+            return window_key_metadata["tokens_limit"], "tokens"
+        return None, None
+
     def is_cache_list_over_limit(
         self,
         keys_to_fetch: List[str],
@@ -209,29 +372,17 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
             window_key = keys_to_fetch[i]
             counter_key = keys_to_fetch[i + 1]
             counter_value = cache_values[i + 1]
-            requests_limit = key_metadata[window_key]["requests_limit"]
-            max_parallel_requests_limit = key_metadata[window_key][
-                "max_parallel_requests_limit"
-            ]
-            tokens_limit = key_metadata[window_key]["tokens_limit"]
 
             # Determine which limit to use for current_limit and limit_remaining
-            current_limit: Optional[int] = None
-            rate_limit_type: Optional[
-                Literal["requests", "tokens", "max_parallel_requests"]
-            ] = None
-            if counter_key.endswith(":requests"):
-                current_limit = requests_limit
-                rate_limit_type = "requests"
-            elif counter_key.endswith(":max_parallel_requests"):
-                current_limit = max_parallel_requests_limit
-                rate_limit_type = "max_parallel_requests"
-            elif counter_key.endswith(":tokens"):
-                current_limit = tokens_limit
-                rate_limit_type = "tokens"
+            current_limit, rate_limit_type = self._get_limit_for_counter_key(
+                counter_key=counter_key, window_key_metadata=key_metadata[window_key]
+            )
 
             if current_limit is None or rate_limit_type is None:
                 continue
+            if rate_limit_type == "tokens" and self.uses_token_bucket:
+                # checked against the token bucket, in atomic_should_rate_limit
+                continue
 
             if counter_value is not None and int(counter_value) + 1 > current_limit:
                 overall_code = "OVER_LIMIT"
@@ -335,11 +486,29 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                 return rate_limit_response
 
         ## IF under limit, check Redis
-        if self.batch_rate_limiter_script is not None:
-            cache_values = await self.batch_rate_limiter_script(
-                keys=keys_to_fetch,
-                args=[now_int, self.window_size],  # Use integer timestamp
+        if self.atomic_rate_limiter_script is not None:
+            return await self.atomic_should_rate_limit(
+                keys_to_fetch=keys_to_fetch,
+                key_metadata=key_metadata,
+                now_int=now_int,
+                parent_otel_span=parent_otel_span,
+            )
+        elif self.batch_rate_limiter_script is not None:
+            cache_values = [None] * len(keys_to_fetch)
+            pair_groups = self.get_hash_slot_pair_groups(keys=keys_to_fetch)
+            group_results = await asyncio.gather(
+                *(
+                    self.batch_rate_limiter_script(
+                        keys=self._get_pair_keys(keys_to_fetch, pair_indices),
+                        args=[now_int, self.window_size],  # Use integer timestamp
+                    )
+                    for pair_indices in pair_groups
+                )
             )
+            for pair_indices, group_values in zip(pair_groups, group_results):
+                for group_idx, pair_idx in enumerate(pair_indices):
+                    cache_values[2 * pair_idx] = group_values[2 * group_idx]
+                    cache_values[2 * pair_idx + 1] = group_values[2 * group_idx + 1]
 
             # update in-memory cache with new values
             for i in range(0, len(cache_values), 2):
@@ -373,6 +542,157 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
         )
         return rate_limit_response
 
+    def get_hash_slot_pair_groups(self, keys: List[str]) -> List[List[int]]:
+        """
+        Indices of the (window key, counter key) pairs in `keys`, grouped by redis cluster hash slot.
+
+        Lua scripts can only touch keys in one hash slot of a redis cluster. A descriptor's keys share a hash tag (`{key:value}:...`),
+        so the scripts are run once per slot group. Without a redis cluster, all pairs are sent in one group.
+        """
+        num_pairs = len(keys) // 2
+        redis_cache = self.internal_usage_cache.dual_cache.redis_cache
+        if not isinstance(redis_cache, RedisClusterCache):
+            return [list(range(num_pairs))]
+
+        pair_groups: Dict[int, List[int]] = {}
+        for pair_idx in range(num_pairs):
+            slot = redis_cache.get_hash_slot(keys[2 * pair_idx])
+            pair_groups.setdefault(slot, []).append(pair_idx)
+        return list(pair_groups.values())
+
+    @staticmethod
+    def _get_pair_keys(keys: List[str], pair_indices: List[int]) -> List[str]:
+        return [
+            key
+            for pair_idx in pair_indices
+            for key in keys[2 * pair_idx : 2 * pair_idx + 2]
+        ]
+
+    async def atomic_should_rate_limit(
+        self,
+        keys_to_fetch: List[str],
+        key_metadata: Dict[str, Any],
+        now_int: int,
+        parent_otel_span: Optional[Span] = None,
+    ) -> RateLimitResponse:
+        """
+        Check + increment all descriptors in one redis call (ATOMIC_BATCH_RATE_LIMITER_SCRIPT).
+
+        Counters are only incremented if the request is admitted, so there is nothing to roll back when it is rate limited.
+        On a redis cluster, descriptors in different hash slots are checked in separate calls - a request rejected by one descriptor may still be counted against the others.
+        With tpm_rate_limit_algorithm="token_bucket", TPM limits are checked against a token bucket instead of a fixed window counter.
+        """
+        script_keys: List[str] = []
+        script_args: List[Any] = [now_int, self.window_size]
+        pair_metadata: List[Tuple[str, int, str, str]] = []
+        for i in range(0, len(keys_to_fetch), 2):
+            window_key = keys_to_fetch[i]
+            counter_key = keys_to_fetch[i + 1]
+            current_limit, rate_limit_type = self._get_limit_for_counter_key(
+                counter_key=counter_key, window_key_metadata=key_metadata[window_key]
+            )
+            if current_limit is None or rate_limit_type is None:
+                continue
+
+            if rate_limit_type != "tokens":
+                counter_type = "increment"
+            elif self.tpm_rate_limit_algorithm == "token_bucket":
+                counter_type = "token_bucket"
+                counter_key = self.get_token_bucket_key(counter_key)
+            else:
+                counter_type = "check"
+
+            script_keys.extend([window_key, counter_key])
+            script_args.extend([current_limit, counter_type])
+            pair_metadata.append(
+                (counter_key, current_limit, rate_limit_type, counter_type)
+            )
+
+        if not pair_metadata:
+            return RateLimitResponse(overall_code="OK", statuses=[])
+
+        # on redis cluster, the script runs once per hash slot - so it is atomic per descriptor
+        pair_groups = self.get_hash_slot_pair_groups(keys=script_keys)
+        group_results = await asyncio.gather(
+            *(
+                cast(Any, self.atomic_rate_limiter_script)(
+                    keys=self._get_pair_keys(script_keys, pair_indices),
+                    args=script_args[:2]
+                    + [
+                        arg
+                        for pair_idx in pair_indices
+                        for arg in script_args[2 + 2 * pair_idx : 4 + 2 * pair_idx]
+                    ],
+                )
+                for pair_indices in pair_groups
+            )
+        )
+        results: List[Any] = [None] * len(script_keys)
+        pair_is_over_limit: List[bool] = [False] * len(pair_metadata)
+        for pair_indices, group_values in zip(pair_groups, group_results):
+            group_is_over_limit = int(group_values[-1]) == 1
+            for group_idx, pair_idx in enumerate(pair_indices):
+                results[2 * pair_idx] = group_values[2 * group_idx]
+                results[2 * pair_idx + 1] = group_values[2 * group_idx + 1]
+                pair_is_over_limit[pair_idx] = group_is_over_limit
+        is_over_limit = any(pair_is_over_limit)
+
+        statuses: List[RateLimitStatus] = []
+        for idx, (
+            counter_key,
+            current_limit,
+            rate_limit_type,
+            counter_type,
+        ) in enumerate(pair_metadata):
+            window_key = script_keys[2 * idx]
+            window_value = results[2 * idx]
+            counter_value = float(results[2 * idx + 1])
+            if counter_type == "token_bucket":
+                item_is_over_limit = counter_value <= 0
+                limit_remaining = max(int(counter_value), 0)
+            else:
+                # "increment" counters are returned post-increment when the request is admitted
+                _counter_before_request = (
+                    counter_value - 1
+                    if counter_type == "increment" and not pair_is_over_limit[idx]
+                    else counter_value
+                )
+                item_is_over_limit = _counter_before_request + 1 > current_limit
+                limit_remaining = current_limit - int(counter_value)
+
+                # keep the in-memory cache in sync, so over-limit requests are rejected without a redis call
+                await self.internal_usage_cache.async_set_cache(
+                    key=counter_key,
+                    value=int(counter_value),
+                    ttl=self.window_size,
+                    litellm_parent_otel_span=parent_otel_span,
+                    local_only=True,
+                )
+                await self.internal_usage_cache.async_set_cache(
+                    key=window_key,
+                    value=window_value,
+                    ttl=self.window_size,
+                    litellm_parent_otel_span=parent_otel_span,
+                    local_only=True,
+                )
+
+            statuses.append(
+                {
+                    "code": "OVER_LIMIT" if item_is_over_limit else "OK",
+                    "current_limit": current_limit,
+                    "limit_remaining": limit_remaining,
+                    "rate_limit_type": cast(
+                        Literal["requests", "tokens", "max_parallel_requests"],
+                        rate_limit_type,
+                    ),
+                    "descriptor_key": key_metadata[window_key]["descriptor_key"],
+                }
+            )
+
+        return RateLimitResponse(
+            overall_code="OVER_LIMIT" if is_over_limit else "OK", statuses=statuses
+        )
+
     async def async_pre_call_hook(
         self,
         user_api_key_dict: UserAPIKeyAuth,
@@ -668,6 +988,20 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                     )
                 )
 
+            # With the token bucket, TPM is tracked in the buckets - not the ':tokens' window counters
+            bucket_keys: List[str] = []
+            if self.uses_token_bucket:
+                bucket_keys = [
+                    self.get_token_bucket_key(op["key"])
+                    for op in pipeline_operations
+                    if op["key"].endswith(":tokens")
+                ]
+                pipeline_operations = [
+                    op
+                    for op in pipeline_operations
+                    if not op["key"].endswith(":tokens")
+                ]
+
             # Execute all increments in a single pipeline
             if pipeline_operations:
                 await self.internal_usage_cache.dual_cache.async_increment_cache_pipeline(
@@ -675,6 +1009,12 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                     litellm_parent_otel_span=litellm_parent_otel_span,
                 )
 
+            # Consume tokens from the TPM token buckets
+            if bucket_keys and total_tokens > 0:
+                await cast(Any, self.token_bucket_consume_script)(
+                    keys=bucket_keys, args=[total_tokens]
+                )
+
         except Exception as e:
             verbose_proxy_logger.exception(
                 f"Error in rate limit success event: {str(e)}"
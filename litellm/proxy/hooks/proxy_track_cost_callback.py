@@ -1,7 +1,7 @@
 import asyncio
 import traceback
 from datetime import datetime
-from typing import Any, Optional, Union, cast
+from typing import Any, Optional, Set, Union, cast
 
 import litellm
 from litellm._logging import verbose_proxy_logger
@@ -14,6 +14,9 @@ from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSet
 from litellm.proxy._types import UserAPIKeyAuth
 from litellm.proxy.auth.auth_checks import log_db_metrics
 from litellm.proxy.auth.route_checks import RouteChecks
+from litellm.proxy.spend_tracking.spend_tracking_utils import (
+    _should_store_prompts_and_responses_in_spend_logs,
+)
 from litellm.proxy.utils import ProxyUpdateSpend
 from litellm.types.utils import (
     StandardLoggingPayload,
@@ -23,6 +26,26 @@ from litellm.utils import get_end_user_id_for_cost_tracking
 
 
 class _ProxyDBLogger(CustomLogger):
+    # read for cost tracking + spend logs (see `get_logging_payload`)
+    standard_logging_payload_fields = {
+        "completion_tokens",
+        "guardrail_information",
+        "hidden_params",
+        "metadata",
+        "model_map_information",
+        "prompt_tokens",
+        "request_tags",
+        "response_cost",
+        "response_cost_failure_debug_info",
+        "total_tokens",
+        "trace_id",
+    }
+
+    def get_standard_logging_payload_fields(self) -> Optional[Set[str]]:
+        if _should_store_prompts_and_responses_in_spend_logs():
+            return self.standard_logging_payload_fields | {"response"}
+        return self.standard_logging_payload_fields
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         await self._PROXY_track_cost_callback(
             kwargs, response_obj, start_time, end_time
@@ -9,11 +9,14 @@ import httpx
 
 import litellm
 from litellm._logging import verbose_proxy_logger
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.litellm_core_utils.litellm_logging import (
     get_standard_logging_object_payload,
 )
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneName,
+)
 from litellm.types.passthrough_endpoints.assembly_ai import (
     ASSEMBLY_AI_MAX_POLLING_ATTEMPTS,
     ASSEMBLY_AI_POLLING_INTERVAL,
@@ -64,9 +67,10 @@ class AssemblyAIPassthroughLoggingHandler:
         **kwargs,
     ):
         """
-        Since cost tracking requires polling the AssemblyAI API, we need to handle this in a separate thread. Hence the executor.submit.
+        Since cost tracking requires polling the AssemblyAI API, we need to handle this in a separate thread. Hence the callback_dispatcher.submit.
         """
-        executor.submit(
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.PASS_THROUGH_LOGGING,
             self._handle_assemblyai_passthrough_logging,
             httpx_response,
             response_body,
@@ -5,9 +5,12 @@ from typing import List, Optional
 import httpx
 
 from litellm._logging import verbose_proxy_logger
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.proxy._types import PassThroughEndpointLoggingResultValues
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneName,
+)
 from litellm.types.passthrough_endpoints.pass_through_endpoints import EndpointType
 from litellm.types.utils import StandardPassThroughResponseObject
 
@@ -134,7 +137,8 @@ class PassThroughStreamingHandler:
         if litellm_logging_obj._should_run_sync_callbacks_for_async_calls() is False:
             return
 
-        executor.submit(
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.PASS_THROUGH_LOGGING,
             litellm_logging_obj.success_handler,
             result=standard_logging_response_object,
             end_time=end_time,
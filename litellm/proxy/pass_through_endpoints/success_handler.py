@@ -5,13 +5,14 @@ from urllib.parse import urlparse
 
 import httpx
 
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.proxy._types import PassThroughEndpointLoggingResultValues
+from litellm.types.litellm_core_utils.callback_dispatcher import CallbackDispatchLaneName
 from litellm.types.passthrough_endpoints.pass_through_endpoints import (
     PassthroughStandardLoggingPayload,
 )
 from litellm.types.utils import StandardPassThroughResponseObject
-from litellm.utils import executor as thread_pool_executor
 
 from .llm_provider_handlers.anthropic_passthrough_logging_handler import (
     AnthropicPassthroughLoggingHandler,
@@ -66,8 +67,9 @@ class PassThroughEndpointLogging:
         **kwargs,
     ):
         """Helper function to handle both sync and async logging operations"""
-        # Submit to thread pool for sync logging
-        thread_pool_executor.submit(
+        # Submit to the callback dispatcher for sync logging
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.PASS_THROUGH_LOGGING,
             logging_obj.success_handler,
             standard_logging_response_object,
             start_time,
@@ -146,6 +146,7 @@ from litellm.litellm_core_utils.core_helpers import (
 from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
+from litellm.litellm_core_utils.token_counter import prewarm_tokenizers
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.proxy._experimental.mcp_server.rest_endpoints import (
     router as mcp_rest_endpoints_router,
@@ -635,6 +636,23 @@ async def proxy_startup_event(app: FastAPI):
             _run_background_health_check()
         )  # start the background health check coroutine.
 
+    ## PRE-WARM TOKENIZERS ##
+    asyncio.get_running_loop().run_in_executor(
+        None, prewarm_tokenizers
+    )  # load bundled tokenizers in the background, so the first request doesn't pay the load cost
+
+    ## PRE-WARM HTTP CONNECTION POOLS ##
+    if llm_router is not None and litellm.http_pool_settings:
+        from litellm.llms.custom_httpx.connection_pool_manager import (
+            http_connection_pool_manager,
+        )
+
+        asyncio.create_task(
+            http_connection_pool_manager.async_warm_up_connection_pools(
+                model_list=llm_router.get_model_list() or []
+            )
+        )  # open connections to the deployments' api_base in the background
+
     if prompt_injection_detection_obj is not None:  # [TODO] - REFACTOR THIS
         prompt_injection_detection_obj.update_environment(router=llm_router)
 
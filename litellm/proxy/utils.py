@@ -3421,6 +3421,17 @@ async def update_spend(  # noqa: PLR0915
     )
 
     if len(prisma_client.spend_log_transactions) > 0:
+        if (
+            DBSpendUpdateWriter._should_use_batched_spend_log_ingestion()
+            and os.getenv("SPEND_LOGS_URL", None) is None
+        ):
+            await proxy_logging_obj.db_spend_update_writer.batch_write_spend_logs_to_db(
+                prisma_client=prisma_client,
+                n_retry_times=n_retry_times,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+            return
+
         await ProxyUpdateSpend.update_spend_logs(
             n_retry_times=n_retry_times,
             prisma_client=prisma_client,
@@ -7,10 +7,13 @@ import httpx
 
 from litellm.constants import STREAM_SSE_DONE_STRING
 from litellm.litellm_core_utils.asyncify import run_async_function
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.llms.base_llm.responses.transformation import BaseResponsesAPIConfig
 from litellm.responses.utils import ResponsesAPIRequestUtils
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneName,
+)
 from litellm.types.llms.openai import (
     OutputTextDeltaEvent,
     ResponseCompletedEvent,
@@ -170,7 +173,8 @@ class ResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
             )
         )
 
-        executor.submit(
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.SUCCESS_HANDLER,
             self.logging_obj.success_handler,
             result=self.completed_response,
             cache_hit=None,
@@ -239,7 +243,8 @@ class SyncResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
             cache_hit=None,
         )
 
-        executor.submit(
+        callback_dispatcher.submit(
+            CallbackDispatchLaneName.SUCCESS_HANDLER,
             self.logging_obj.success_handler,
             result=self.completed_response,
             cache_hit=None,
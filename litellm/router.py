@@ -113,7 +113,8 @@ from litellm.router_utils.router_callbacks.track_deployment_metrics import (
     increment_deployment_failures_for_current_minute,
     increment_deployment_successes_for_current_minute,
 )
-from litellm.scheduler import FlowItem, Scheduler
+from litellm.router_utils.routing_index import RouterDeploymentIndex
+from litellm.scheduler import FlowItem, SchedulerType, get_scheduler
 from litellm.types.llms.openai import (
     AllMessageValues,
     FileTypes,
@@ -190,6 +191,8 @@ class Router:
     leastbusy_logger: Optional[LeastBusyLoggingHandler] = None
     lowesttpm_logger: Optional[LowestTPMLoggingHandler] = None
     optional_callbacks: Optional[List[Union[CustomLogger, Callable, str]]] = None
+    # `StandardLoggingPayload` fields read by the deployment success / failure callbacks
+    standard_logging_payload_fields = {"model_group", "model_id", "total_tokens"}
 
     def __init__(  # noqa: PLR0915
         self,
@@ -212,6 +215,7 @@ class Router:
         ## SCHEDULER ##
         polling_interval: Optional[float] = None,
         default_priority: Optional[int] = None,
+        scheduler_type: SchedulerType = "default",
         ## RELIABILITY ##
         num_retries: Optional[int] = None,
         max_fallbacks: Optional[
@@ -285,6 +289,7 @@ class Router:
             client_ttl (int): Time-to-live for cached clients in seconds. Defaults to 3600.
             polling_interval: (Optional[float]): frequency of polling queue. Only for '.scheduler_acompletion()'. Default is 3ms.
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
+            scheduler_type (Literal["default", "redis", "asyncio"]): queue backend for prioritized requests. "redis" uses a sorted set shared across instances (requires redis), "asyncio" is in-process with event-based wakeups. Defaults to "default".
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
             default_litellm_params (dict): Default parameters for Router.chat.completion.create. Defaults to {}.
@@ -398,8 +403,10 @@ class Router:
         )  # use a dual cache (Redis+In-Memory) for tracking cooldowns, usage, etc.
 
         ### SCHEDULER ###
-        self.scheduler = Scheduler(
-            polling_interval=polling_interval, redis_cache=redis_cache
+        self.scheduler = get_scheduler(
+            scheduler_type=scheduler_type,
+            polling_interval=polling_interval,
+            redis_cache=redis_cache,
         )
         self.default_priority = default_priority
         self.default_deployment = None  # use this to track the users default deployment, when they want to use model = *
@@ -407,6 +414,7 @@ class Router:
         self.provider_default_deployment_ids: List[str] = []
         self.pattern_router = PatternMatchRouter()
         self.auto_routers: Dict[str, "AutoRouter"] = {}
+        self._routing_index: Optional[RouterDeploymentIndex] = None
 
         if model_list is not None:
             model_list = copy.deepcopy(model_list)
@@ -1117,7 +1125,10 @@ class Router:
                 from litellm.main import stream_chunk_builder
 
                 complete_response_object = stream_chunk_builder(
-                    chunks=model_response.chunks
+                    chunks=[],
+                    chunk_accumulator=getattr(
+                        model_response, "chunk_accumulator", None
+                    ),
                 )
                 complete_response_object_usage = cast(
                     Optional[Usage],
@@ -1820,7 +1831,6 @@ class Router:
         ## POLL QUEUE
         end_time = time.time() + self.timeout
         curr_time = time.time()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
         make_request = False
 
         while curr_time < end_time:
@@ -1835,7 +1845,7 @@ class Router:
             if make_request:  ## IF TRUE -> MAKE REQUEST
                 break
             else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
+                await self.scheduler.wait_for_next_poll(model_name=item.model_name)
                 curr_time = time.time()
 
         if make_request:
@@ -1852,6 +1862,7 @@ class Router:
                 setattr(e, "priority", priority)
                 raise e
         else:
+            await self.scheduler.remove_request(request=item)
             raise litellm.Timeout(
                 message="Request timed out while polling queue",
                 model=model,
@@ -1882,7 +1893,6 @@ class Router:
         ## POLL QUEUE
         end_time = time.time() + self.timeout
         curr_time = time.time()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
         make_request = False
 
         while curr_time < end_time:
@@ -1897,7 +1907,7 @@ class Router:
             if make_request:  ## IF TRUE -> MAKE REQUEST
                 break
             else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
+                await self.scheduler.wait_for_next_poll(model_name=item.model_name)
                 curr_time = time.time()
 
         if make_request:
@@ -1913,6 +1923,7 @@ class Router:
                 setattr(e, "priority", priority)
                 raise e
         else:
+            await self.scheduler.remove_request(request=item)
             raise litellm.Timeout(
                 message="Request timed out while polling queue",
                 model=model,
@@ -5048,10 +5059,11 @@ class Router:
                     _model_info=_model_info,
                 )
 
+        self.model_names = [m["model_name"] for m in model_list]
+        self._invalidate_routing_index()
         verbose_router_logger.debug(
             f"\nInitialized Model List {self.get_model_names()}"
         )
-        self.model_names = [m["model_name"] for m in model_list]
 
     def _add_deployment(self, deployment: Deployment) -> Deployment:
         import os
@@ -5210,7 +5222,7 @@ class Router:
         """
         # check if deployment already exists
 
-        if deployment.model_info.id in self.get_model_ids():
+        if self._get_routing_index().has_model_id(deployment.model_info.id or ""):
             return None
 
         # add to model list
@@ -5221,6 +5233,7 @@ class Router:
         # add to model names
         self.model_list.append(_deployment)
         self.model_names.append(deployment.model_name)
+        self._invalidate_routing_index()
         return deployment
 
     def upsert_deployment(self, deployment: Deployment) -> Optional[Deployment]:
@@ -5254,6 +5267,7 @@ class Router:
 
                 if removal_idx is not None:
                     self.model_list.pop(removal_idx)
+                    self._invalidate_routing_index()
 
             # if the model_id is not in router
             self.add_deployment(deployment=deployment)
@@ -5284,28 +5298,46 @@ class Router:
         try:
             if deployment_idx is not None:
                 item = self.model_list.pop(deployment_idx)
+                self._invalidate_routing_index()
                 return item
             else:
                 return None
         except Exception:
             return None
 
+    def _get_routing_index(self) -> RouterDeploymentIndex:
+        """
+        Returns the deployment lookup index - rebuilt if the model list changed since it was built
+        """
+        if self._routing_index is None or self._routing_index.is_stale(
+            model_list=self.model_list, model_names=self.model_names
+        ):
+            self._routing_index = RouterDeploymentIndex(
+                model_list=self.model_list, model_names=self.model_names
+            )
+        return self._routing_index
+
+    def _invalidate_routing_index(self) -> None:
+        """
+        Drop the deployment lookup index. Call after any change to `self.model_list`.
+        """
+        self._routing_index = None
+
     def get_deployment(self, model_id: str) -> Optional[Deployment]:
         """
         Returns -> Deployment or None
 
         Raise Exception -> if model found in invalid format
         """
-        for model in self.model_list:
-            if "model_info" in model and "id" in model["model_info"]:
-                if model_id == model["model_info"]["id"]:
-                    if isinstance(model, dict):
-                        return Deployment(**model)
-                    elif isinstance(model, Deployment):
-                        return model
-                    else:
-                        raise Exception("Model invalid format - {}".format(type(model)))
-        return None
+        model = self._get_routing_index().get_deployment_by_model_id(model_id=model_id)
+        if model is None:
+            return None
+        if isinstance(model, dict):
+            return Deployment(**model)
+        elif isinstance(model, Deployment):
+            return model
+        else:
+            raise Exception("Model invalid format - {}".format(type(model)))
 
     def get_deployment_credentials(self, model_id: str) -> Optional[dict]:
         """
@@ -5903,17 +5935,9 @@ class Router:
 
         Returns list of model id's.
         """
-        ids = []
-        for model in self.model_list:
-            if "model_info" in model and "id" in model["model_info"]:
-                id = model["model_info"]["id"]
-                if exclude_team_models and model["model_info"].get("team_id"):
-                    continue
-                if model_name is not None and model["model_name"] == model_name:
-                    ids.append(id)
-                elif model_name is None:
-                    ids.append(id)
-        return ids
+        return self._get_routing_index().get_model_ids(
+            model_name=model_name, exclude_team_models=exclude_team_models
+        )
 
     def map_team_model(self, team_model_name: str, team_id: str) -> Optional[str]:
         """
@@ -5923,17 +5947,9 @@ class Router:
         - team_model_name: str - the team-specific model name
         - None: if no team-specific model name is found
         """
-        for model in self.model_list:
-            model_team_id = model["model_info"].get("team_id")
-            model_team_public_model_name = model["model_info"].get(
-                "team_public_model_name"
-            )
-            if (
-                model_team_id == team_id
-                and model_team_public_model_name == team_model_name
-            ):
-                return model["model_name"]
-        return None
+        return self._get_routing_index().get_team_model_name(
+            team_public_model_name=team_model_name, team_id=team_id
+        )
 
     def should_include_deployment(
         self, model_name: str, model: dict, team_id: Optional[str] = None
@@ -5965,16 +5981,15 @@ class Router:
         if team_id specified, only return team-specific models
         """
         returned_models: List[DeploymentTypedDict] = []
-        for model in self.model_list:
-            if self.should_include_deployment(
-                model_name=model_name, model=model, team_id=team_id
-            ):
-                if model_alias is not None:
-                    alias_model = copy.deepcopy(model)
-                    alias_model["model_name"] = model_alias
-                    returned_models.append(alias_model)
-                else:
-                    returned_models.append(model)
+        for model in self._get_routing_index().get_deployments_by_model_name(
+            model_name=model_name, team_id=team_id
+        ):
+            if model_alias is not None:
+                alias_model = copy.deepcopy(model)
+                alias_model["model_name"] = model_alias
+                returned_models.append(alias_model)  # type: ignore
+            else:
+                returned_models.append(model)  # type: ignore
 
         return returned_models
 
@@ -6120,7 +6135,21 @@ class Router:
 
         access_groups = defaultdict(list)
 
-        model_list = self.get_model_list(model_name=model_name, team_id=team_id)
+        if model_name is None and model_access_group is not None:
+            # only deployments in the access group - looked up via the routing index
+            model_list: Optional[List[DeploymentTypedDict]] = [
+                m
+                for m in self.get_model_list_from_model_alias()
+                if model_access_group
+                in ((m.get("model_info") or {}).get("access_groups", []) or [])
+            ]
+            model_list.extend(  # type: ignore
+                self._get_routing_index().get_deployments_by_access_group(
+                    access_group=model_access_group
+                )
+            )
+        else:
+            model_list = self.get_model_list(model_name=model_name, team_id=team_id)
         if model_list:
             for m in model_list:
                 _model_info = m.get("model_info")
@@ -6511,7 +6540,9 @@ class Router:
         """
         Get the deployment by litellm model.
         """
-        return [m for m in self.model_list if m["litellm_params"]["model"] == model]
+        return self._get_routing_index().get_deployments_by_litellm_model(
+            litellm_model=model
+        )
 
     def _common_checks_available_deployment(
         self,
@@ -6533,7 +6564,7 @@ class Router:
         # check if aliases set on litellm model alias map
         if specific_deployment is True:
             return model, self._get_deployment_by_litellm_model(model=model)
-        elif model in self.get_model_ids():
+        elif self._get_routing_index().has_model_id(model):
             deployment = self.get_deployment(model_id=model)
             if deployment is not None:
                 deployment_model = deployment.litellm_params.model
@@ -6547,7 +6578,7 @@ class Router:
         if _model_from_alias is not None:
             model = _model_from_alias
 
-        if model not in self.model_names:
+        if model not in self._get_routing_index().model_names:
             # check if provider/ specific wildcard routing use pattern matching
             pattern_deployments = self.pattern_router.get_deployments_by_pattern(
                 model=model,
@@ -42,6 +42,8 @@ DEFAULT_REDIS_SYNC_INTERVAL = 1
 
 
 class RouterBudgetLimiting(CustomLogger):
+    standard_logging_payload_fields = {"model_id", "response_cost"}
+
     def __init__(
         self,
         dual_cache: DualCache,
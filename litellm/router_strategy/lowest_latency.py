@@ -1,8 +1,9 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
+import math
 import random
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 import litellm
 from litellm import ModelResponse, token_counter, verbose_logger
@@ -24,6 +25,9 @@ class RoutingArgs(LiteLLMPydanticObjectBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    # statistic routing picks on - "mean" / "p50" / "p95" of the last `max_latency_list_size` calls, or "ewma"
+    latency_metric: Literal["mean", "ewma", "p50", "p95"] = "mean"
+    ewma_alpha: float = 0.3
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
@@ -38,6 +42,73 @@ class LowestLatencyLoggingHandler(CustomLogger):
         self.model_list = model_list
         self.routing_args = RoutingArgs(**routing_args)
 
+    def _update_latency_stats(
+        self, deployment_map: dict, key: str, value: Union[float, timedelta]
+    ):
+        """
+        Record a call's latency for a deployment.
+
+        `deployment_map[key]` is a sliding window of the last `max_latency_list_size` calls, updated in place.
+        `deployment_map[f"{key}_stats"]` holds the statistics routing reads, so picking a deployment doesn't re-aggregate the window.
+        """
+        if isinstance(value, timedelta):
+            value = value.total_seconds()
+        value = float(value)
+        max_size = max(self.routing_args.max_latency_list_size, 1)
+
+        window: List[float] = deployment_map.get(key) or []
+        stats: dict = deployment_map.get(f"{key}_stats") or {}
+        # drop the oldest calls in place - the window is at most `max_latency_list_size` long
+        while len(window) >= max_size:
+            window.pop(0)
+        window.append(value)
+
+        ewma = stats.get("ewma")
+        if ewma is None:
+            ewma = value
+        else:
+            ewma = (
+                self.routing_args.ewma_alpha * value
+                + (1 - self.routing_args.ewma_alpha) * ewma
+            )
+
+        sorted_window = sorted(
+            _latency for _latency in window if isinstance(_latency, (int, float))
+        )
+        deployment_map[key] = window
+        deployment_map[f"{key}_stats"] = {
+            "mean": sum(sorted_window) / len(window),
+            "ewma": ewma,
+            "p50": self._get_percentile(sorted_window, 50),
+            "p95": self._get_percentile(sorted_window, 95),
+        }
+
+    @staticmethod
+    def _get_percentile(sorted_values: List[float], percentile: float) -> float:
+        """Nearest-rank percentile of an already sorted list"""
+        if len(sorted_values) == 0:
+            return 0.0
+        index = math.ceil(percentile / 100 * len(sorted_values)) - 1
+        return sorted_values[max(index, 0)]
+
+    def _get_deployment_latency(self, deployment_map: dict, key: str) -> float:
+        """
+        Returns the `latency_metric` statistic for a deployment.
+        """
+        stats = deployment_map.get(f"{key}_stats")
+        if stats is not None:
+            return stats.get(self.routing_args.latency_metric, 0.0)
+
+        # deployment not used yet, or cached before latency stats were recorded
+        window = deployment_map.get(key) or []
+        if len(window) == 0:
+            return 0.0
+        total: float = 0.0
+        for _call_latency in window:
+            if isinstance(_call_latency, float):
+                total += _call_latency
+        return total / len(window)
+
     def log_success_event(  # noqa: PLR0915
         self, kwargs, response_obj, start_time, end_time
     ):
@@ -67,6 +138,9 @@ class LowestLatencyLoggingHandler(CustomLogger):
                     {model_group}_map: {
                         id: {
                             "latency": [..]
+                            "latency_stats": {"mean": .., "ewma": .., "p50": .., "p95": ..}
+                            "time_to_first_token": [..]
+                            "time_to_first_token_stats": {..}
                             f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
                         }
                     }
@@ -134,33 +208,19 @@ class LowestLatencyLoggingHandler(CustomLogger):
                     request_count_dict[id] = {}
 
                 ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
+                self._update_latency_stats(
+                    deployment_map=request_count_dict[id],
+                    key="latency",
+                    value=final_value,
+                )
 
                 ## Time to first token
                 if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
+                    self._update_latency_stats(
+                        deployment_map=request_count_dict[id],
+                        key="time_to_first_token",
+                        value=time_to_first_token,
+                    )
 
                 if precise_minute not in request_count_dict[id]:
                     request_count_dict[id][precise_minute] = {}
@@ -219,6 +279,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
                         {model_group}_map: {
                             id: {
                                 "latency": [..]
+                                "latency_stats": {..}
                                 f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
                             }
                         }
@@ -233,15 +294,11 @@ class LowestLatencyLoggingHandler(CustomLogger):
                         request_count_dict[id] = {}
 
                     ## Latency - give 1000s penalty for failing
-                    if (
-                        len(request_count_dict[id].get("latency", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault("latency", []).append(1000.0)
-                    else:
-                        request_count_dict[id]["latency"] = request_count_dict[id][
-                            "latency"
-                        ][: self.routing_args.max_latency_list_size - 1] + [1000.0]
+                    self._update_latency_stats(
+                        deployment_map=request_count_dict[id],
+                        key="latency",
+                        value=1000.0,
+                    )
 
                     await self.router_cache.async_set_cache(
                         key=latency_key,
@@ -288,7 +345,9 @@ class LowestLatencyLoggingHandler(CustomLogger):
                     {model_group}_map: {
                         id: {
                             "latency": [..]
+                            "latency_stats": {"mean": .., "ewma": .., "p50": .., "p95": ..}
                             "time_to_first_token": [..]
+                            "time_to_first_token_stats": {..}
                             f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
                         }
                     }
@@ -356,33 +415,19 @@ class LowestLatencyLoggingHandler(CustomLogger):
                     request_count_dict[id] = {}
 
                 ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
+                self._update_latency_stats(
+                    deployment_map=request_count_dict[id],
+                    key="latency",
+                    value=final_value,
+                )
 
                 ## Time to first token
                 if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
+                    self._update_latency_stats(
+                        deployment_map=request_count_dict[id],
+                        key="time_to_first_token",
+                        value=time_to_first_token,
+                    )
 
                 if precise_minute not in request_count_dict[id]:
                     request_count_dict[id][precise_minute] = {}
@@ -439,37 +484,25 @@ class LowestLatencyLoggingHandler(CustomLogger):
         if request_count_dict is None:  # base case
             return
 
-        all_deployments = request_count_dict
-        for d in healthy_deployments:
-            ## if healthy deployment not yet used
-            if d["model_info"]["id"] not in all_deployments:
-                all_deployments[d["model_info"]["id"]] = {
-                    "latency": [0],
-                    precise_minute: {"tpm": 0, "rpm": 0},
-                }
-
         try:
             input_tokens = token_counter(messages=messages, text=input)
         except Exception:
             input_tokens = 0
 
-        # randomly sample from all_deployments, incase all deployments have latency=0.0
-        _items = all_deployments.items()
+        is_streaming_request = (
+            request_kwargs is not None and request_kwargs.get("stream", None) is True
+        )
 
-        _all_deployments = random.sample(list(_items), len(_items))
-        all_deployments = dict(_all_deployments)
+        # randomly order deployments, incase all deployments have latency=0.0
+        _healthy_deployments = random.sample(
+            healthy_deployments, len(healthy_deployments)
+        )
         ### GET AVAILABLE DEPLOYMENTS ### filter out any deployments > tpm/rpm limits
 
         potential_deployments = []
-        for item, item_map in all_deployments.items():
-            ## get the item from model list
-            _deployment = None
-            for m in healthy_deployments:
-                if item == m["model_info"]["id"]:
-                    _deployment = m
-
-            if _deployment is None:
-                continue  # skip to next one
+        for _deployment in _healthy_deployments:
+            ## if healthy deployment not yet used, its latency is 0
+            item_map = request_count_dict.get(_deployment["model_info"]["id"]) or {}
 
             _deployment_tpm = (
                 _deployment.get("tpm", None)
@@ -484,27 +517,18 @@ class LowestLatencyLoggingHandler(CustomLogger):
                 or _deployment.get("model_info", {}).get("rpm", None)
                 or float("inf")
             )
-            item_latency = item_map.get("latency", [])
-            item_ttft_latency = item_map.get("time_to_first_token", [])
             item_rpm = item_map.get(precise_minute, {}).get("rpm", 0)
             item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
 
-            # get average latency or average ttft (depending on streaming/non-streaming)
-            total: float = 0.0
-            if (
-                request_kwargs is not None
-                and request_kwargs.get("stream", None) is not None
-                and request_kwargs["stream"] is True
-                and len(item_ttft_latency) > 0
-            ):
-                for _call_latency in item_ttft_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
+            # get latency or ttft (depending on streaming/non-streaming)
+            if is_streaming_request and len(item_map.get("time_to_first_token", [])) > 0:
+                item_latency = self._get_deployment_latency(
+                    deployment_map=item_map, key="time_to_first_token"
+                )
             else:
-                for _call_latency in item_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
-            item_latency = total / len(item_latency)
+                item_latency = self._get_deployment_latency(
+                    deployment_map=item_map, key="latency"
+                )
 
             # -------------- #
             # Debugging Logic
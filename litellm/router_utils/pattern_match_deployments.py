@@ -4,7 +4,7 @@ Class to handle llm wildcard routing and regex pattern matching
 
 import copy
 import re
-from re import Match
+from re import Match, Pattern
 from typing import Dict, List, Optional, Tuple
 
 from litellm import get_llm_provider
@@ -60,6 +60,10 @@ class PatternMatchRouter:
 
     def __init__(self):
         self.patterns: Dict[str, List] = {}
+        # compiled on first route() after add_pattern - see `_get_compiled_patterns`
+        self._compiled_patterns: Optional[List[Tuple[str, Pattern, List[Dict]]]] = None
+        self._combined_pattern: Optional[Pattern] = None
+        self._compiled_patterns_source: Optional[Tuple[int, int]] = None
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -74,6 +78,68 @@ class PatternMatchRouter:
         if regex not in self.patterns:
             self.patterns[regex] = []
         self.patterns[regex].append(llm_deployment)
+        self._compiled_patterns = None
+        self._combined_pattern = None
+
+    def _get_compiled_patterns(
+        self,
+    ) -> Tuple[List[Tuple[str, Pattern, List[Dict]]], Optional[Pattern]]:
+        """
+        Patterns sorted by specificity + compiled, and a single regex alternating all of them.
+
+        The combined regex tries the alternatives in order, so the first alternative that matches is the most specific matching pattern.
+        Each alternative is wrapped in a named group `p<index>`, to know which pattern matched.
+        """
+        # recompile if `self.patterns` was replaced / changed outside add_pattern
+        patterns_source = (id(self.patterns), len(self.patterns))
+        if (
+            self._compiled_patterns is None
+            or self._compiled_patterns_source != patterns_source
+        ):
+            self._compiled_patterns_source = patterns_source
+            self._compiled_patterns = [
+                (pattern, re.compile(pattern), llm_deployments)
+                for pattern, llm_deployments in PatternUtils.sorted_patterns(
+                    self.patterns
+                )
+            ]
+            try:
+                self._combined_pattern = (
+                    re.compile(
+                        "|".join(
+                            f"(?P<p{idx}>{pattern})"
+                            for idx, (pattern, _, _) in enumerate(
+                                self._compiled_patterns
+                            )
+                        )
+                    )
+                    if self._compiled_patterns
+                    else None
+                )
+            except re.error:
+                self._combined_pattern = None
+        return self._compiled_patterns, self._combined_pattern
+
+    def _match_combined_pattern(
+        self,
+        request: str,
+        compiled_patterns: List[Tuple[str, Pattern, List[Dict]]],
+        combined_pattern: Pattern,
+    ) -> Optional[Tuple[Match, List[Dict]]]:
+        """
+        Find the most specific matching pattern with a single regex match, instead of trying each pattern in turn.
+        """
+        combined_match = combined_pattern.match(request)
+        if combined_match is None or combined_match.lastgroup is None:
+            return None
+        _, compiled_pattern, llm_deployments = compiled_patterns[
+            int(combined_match.lastgroup[1:])
+        ]
+        # re-match with the pattern alone, so match groups are the pattern's wildcard segments
+        pattern_match = compiled_pattern.match(request)
+        if pattern_match is None:
+            return None
+        return pattern_match, llm_deployments
 
     def _pattern_to_regex(self, pattern: str) -> str:
         """
@@ -135,19 +201,32 @@ class PatternMatchRouter:
             if request is None:
                 return None
 
-            sorted_patterns = PatternUtils.sorted_patterns(self.patterns)
+            compiled_patterns, combined_pattern = self._get_compiled_patterns()
+            if filtered_model_names is None and combined_pattern is not None:
+                matched = self._match_combined_pattern(
+                    request=request,
+                    compiled_patterns=compiled_patterns,
+                    combined_pattern=combined_pattern,
+                )
+                if matched is None:
+                    return None
+                pattern_match, llm_deployments = matched
+                return self._return_pattern_matched_deployments(
+                    matched_pattern=pattern_match, deployments=llm_deployments
+                )
+
             regex_filtered_model_names = (
                 [self._pattern_to_regex(m) for m in filtered_model_names]
                 if filtered_model_names is not None
                 else []
             )
-            for pattern, llm_deployments in sorted_patterns:
+            for pattern, compiled_pattern, llm_deployments in compiled_patterns:
                 if (
                     filtered_model_names is not None
                     and pattern not in regex_filtered_model_names
                 ):
                     continue
-                pattern_match = re.match(pattern, request)
+                pattern_match = compiled_pattern.match(request)
                 if pattern_match:
                     return self._return_pattern_matched_deployments(
                         matched_pattern=pattern_match, deployments=llm_deployments
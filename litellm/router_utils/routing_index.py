@@ -0,0 +1,140 @@
+"""
+Precompiled lookup index over `Router.model_list`
+
+Replaces linear scans of the model list on the request path with hash map lookups.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+class RouterDeploymentIndex:
+    """
+    Immutable index over a router's model list.
+
+    Built once per version of the model list - the router drops it on set_model_list / add_deployment / upsert_deployment / delete_deployment,
+    and rebuilds it on the next lookup.
+
+    All lookups return deployments in model list order, same as scanning the model list.
+    """
+
+    def __init__(self, model_list: List[Dict], model_names: List[str]):
+        self._model_list = model_list
+        self._model_names_list = model_names
+        self._model_list_length = len(model_list)
+        self._model_names_length = len(model_names)
+
+        self.model_names: FrozenSet[str] = frozenset(model_names)
+        self.model_ids: List[str] = []
+
+        by_model_name: Dict[str, List[int]] = {}
+        by_team_model_name: Dict[Tuple[str, str], List[int]] = {}
+        by_model_id: Dict[str, int] = {}
+        by_litellm_model: Dict[str, List[int]] = {}
+        by_access_group: Dict[str, List[int]] = {}
+
+        for idx, deployment in enumerate(model_list):
+            model_info = deployment.get("model_info") or {}
+            model_id = model_info.get("id")
+            if model_id is not None:
+                self.model_ids.append(model_id)
+                by_model_id.setdefault(model_id, idx)
+
+            model_name = deployment.get("model_name")
+            if model_name is not None:
+                by_model_name.setdefault(model_name, []).append(idx)
+
+            team_id = model_info.get("team_id")
+            team_public_model_name = model_info.get("team_public_model_name")
+            if team_id is not None and team_public_model_name is not None:
+                by_team_model_name.setdefault(
+                    (team_id, team_public_model_name), []
+                ).append(idx)
+
+            litellm_model = (deployment.get("litellm_params") or {}).get("model")
+            if litellm_model is not None:
+                by_litellm_model.setdefault(litellm_model, []).append(idx)
+
+            for access_group in model_info.get("access_groups", []) or []:
+                by_access_group.setdefault(access_group, []).append(idx)
+
+        self._by_model_name = by_model_name
+        self._by_team_model_name = by_team_model_name
+        self._by_model_id = by_model_id
+        self._by_litellm_model = by_litellm_model
+        self._by_access_group = by_access_group
+
+    def is_stale(self, model_list: List[Dict], model_names: List[str]) -> bool:
+        """
+        True if the model list / model names were replaced or resized since the index was built.
+
+        Guards against direct mutation of `router.model_list`, which does not go through the router's invalidation.
+        """
+        return (
+            model_list is not self._model_list
+            or len(model_list) != self._model_list_length
+            or model_names is not self._model_names_list
+            or len(model_names) != self._model_names_length
+        )
+
+    def _get_deployments(self, indices: List[int]) -> List[Dict]:
+        return [self._model_list[idx] for idx in indices]
+
+    def get_deployments_by_model_name(
+        self, model_name: str, team_id: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Deployments with `model_name`, plus - if team_id is set - the team's deployments with `team_public_model_name == model_name`.
+        """
+        indices = self._by_model_name.get(model_name, [])
+        if team_id is not None:
+            team_indices = self._by_team_model_name.get((team_id, model_name))
+            if team_indices:
+                indices = sorted(set(indices).union(team_indices))
+        return self._get_deployments(indices)
+
+    def get_deployment_by_model_id(self, model_id: str) -> Optional[Dict]:
+        idx = self._by_model_id.get(model_id)
+        if idx is None:
+            return None
+        return self._model_list[idx]
+
+    def has_model_id(self, model_id: str) -> bool:
+        return model_id in self._by_model_id
+
+    def get_model_ids(
+        self, model_name: Optional[str] = None, exclude_team_models: bool = False
+    ) -> List[str]:
+        if model_name is None and exclude_team_models is False:
+            return list(self.model_ids)
+
+        deployments = (
+            self._model_list
+            if model_name is None
+            else self._get_deployments(self._by_model_name.get(model_name, []))
+        )
+        model_ids: List[str] = []
+        for deployment in deployments:
+            model_info = deployment.get("model_info") or {}
+            if "id" not in model_info:
+                continue
+            if exclude_team_models and model_info.get("team_id"):
+                continue
+            model_ids.append(model_info["id"])
+        return model_ids
+
+    def get_deployments_by_litellm_model(self, litellm_model: str) -> List[Dict]:
+        return self._get_deployments(self._by_litellm_model.get(litellm_model, []))
+
+    def get_deployments_by_access_group(self, access_group: str) -> List[Dict]:
+        return self._get_deployments(self._by_access_group.get(access_group, []))
+
+    def get_team_model_name(
+        self, team_public_model_name: str, team_id: str
+    ) -> Optional[str]:
+        """
+        Router model name of the team's deployment with `team_public_model_name`.
+        """
+        indices = self._by_team_model_name.get((team_id, team_public_model_name))
+        if not indices:
+            return None
+        return self._model_list[indices[0]]["model_name"]
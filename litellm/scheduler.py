@@ -1,6 +1,7 @@
+import asyncio
 import enum
 import heapq
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 from pydantic import BaseModel
 
@@ -16,6 +17,19 @@ class SchedulerCacheKeys(enum.Enum):
     )
 
 
+SchedulerType = Literal["default", "redis", "asyncio"]
+
+# Atomically pop `request_id` from the sorted set, only if it is the head of the queue
+REDIS_SCHEDULER_POP_IF_HEAD_SCRIPT = """
+local head = redis.call('ZRANGE', KEYS[1], 0, 0)
+if head[1] == ARGV[1] then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+
 class FlowItem(BaseModel):
     priority: int  # Priority between 0 and 255
     request_id: str
@@ -109,6 +123,22 @@ class Scheduler:
 
         return False
 
+    async def remove_request(self, request: FlowItem) -> None:
+        """
+        Remove a request from the queue - e.g. when it timed out while waiting, so it doesn't block the queue
+        """
+        queue = await self.get_queue(model_name=request.model_name)
+        _filtered_queue = [item for item in queue if item[1] != request.request_id]
+        if len(_filtered_queue) != len(queue):
+            heapq.heapify(_filtered_queue)
+            await self.save_queue(queue=_filtered_queue, model_name=request.model_name)
+
+    async def wait_for_next_poll(self, model_name: str) -> None:
+        """
+        Wait until the queue should be polled again. Polls every `polling_interval`.
+        """
+        await asyncio.sleep(self.polling_interval)
+
     def get_queue_status(self):
         """Get the status of items in the queue"""
         return self.queue
@@ -134,3 +164,215 @@ class Scheduler:
             _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
             await self.cache.async_set_cache(key=_cache_key, value=queue)
         return None
+
+
+class AsyncioScheduler(Scheduler):
+    """
+    In-process scheduler. Keeps one heap per model group in memory (no read-modify-write of the whole queue),
+    and wakes up waiting requests as soon as the head of their queue changes, instead of only on the polling interval.
+
+    Queues are not shared across instances - use `RedisScheduler` for that.
+    """
+
+    def __init__(self, polling_interval: Optional[float] = None):
+        super().__init__(polling_interval=polling_interval)
+        self.queues: Dict[str, List[Tuple[int, str]]] = {}
+        self.removed_request_ids: Dict[str, Set[str]] = {}
+        self.queue_events: Dict[str, asyncio.Event] = {}
+
+    def _drop_removed_head_items(self, model_name: str) -> None:
+        """Lazily drop removed requests once they reach the head of the heap"""
+        queue = self.queues.get(model_name, [])
+        removed_request_ids = self.removed_request_ids.get(model_name, set())
+        while queue and queue[0][1] in removed_request_ids:
+            _, request_id = heapq.heappop(queue)
+            removed_request_ids.discard(request_id)
+
+    def _notify_waiters(self, model_name: str) -> None:
+        event = self.queue_events.pop(model_name, None)
+        if event is not None:
+            event.set()
+
+    def _remove_from_queue(self, request_id: str, model_name: str) -> None:
+        queue = self.queues.get(model_name, [])
+        if queue and queue[0][1] == request_id:
+            heapq.heappop(queue)
+            self._drop_removed_head_items(model_name=model_name)
+            self._notify_waiters(model_name=model_name)
+        else:
+            self.removed_request_ids.setdefault(model_name, set()).add(request_id)
+
+    async def add_request(self, request: FlowItem):
+        heapq.heappush(
+            self.queues.setdefault(request.model_name, []),
+            (request.priority, request.request_id),
+        )
+
+    async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
+        """
+        Return if request can be processed. Removes the request from the queue when it returns True.
+        """
+        self._drop_removed_head_items(model_name=model_name)
+        queue = self.queues.get(model_name)
+        if not queue:
+            raise Exception(
+                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+            )
+
+        if len(health_deployments) == 0 and queue[0][1] != id:
+            return False
+
+        self._remove_from_queue(request_id=id, model_name=model_name)
+        return True
+
+    async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
+        """Return if the id is at the top of the queue. Don't pop the value from heap."""
+        self._drop_removed_head_items(model_name=model_name)
+        queue = self.queues.get(model_name)
+        if not queue:
+            raise Exception(
+                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+            )
+        return queue[0][1] == id
+
+    async def remove_request(self, request: FlowItem) -> None:
+        self._remove_from_queue(
+            request_id=request.request_id, model_name=request.model_name
+        )
+
+    async def wait_for_next_poll(self, model_name: str) -> None:
+        """
+        Wait until the head of the queue changes, or `polling_interval` elapses (to re-check deployment health).
+        """
+        event = self.queue_events.setdefault(model_name, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=self.polling_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def get_queue(self, model_name: str) -> list:
+        removed_request_ids = self.removed_request_ids.get(model_name, set())
+        return sorted(
+            item
+            for item in self.queues.get(model_name, [])
+            if item[1] not in removed_request_ids
+        )
+
+    async def save_queue(self, queue: list, model_name: str) -> None:
+        heapq.heapify(queue)
+        self.queues[model_name] = queue
+        self.removed_request_ids.pop(model_name, None)
+        self._notify_waiters(model_name=model_name)
+
+
+class RedisScheduler(Scheduler):
+    """
+    Scheduler backed by one Redis sorted set per model group, shared across instances.
+
+    - add_request: ZADD - O(log n)
+    - poll: atomic pop-if-head via a Lua script - O(log n), no lost updates across pods
+    """
+
+    def __init__(
+        self,
+        redis_cache: RedisCache,
+        polling_interval: Optional[float] = None,
+    ):
+        super().__init__(polling_interval=polling_interval, redis_cache=redis_cache)
+        self.redis_cache = redis_cache
+        self.pop_if_head_script: Any = redis_cache.async_register_script(
+            REDIS_SCHEDULER_POP_IF_HEAD_SCRIPT
+        )
+
+    def _get_queue_key(self, model_name: str) -> str:
+        return self.redis_cache.check_and_fix_namespace(
+            key="{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
+        )
+
+    async def add_request(self, request: FlowItem):
+        # equal priorities are ordered by request_id, same as the tuple ordering of the in-memory heap
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.zadd(
+            self._get_queue_key(model_name=request.model_name),
+            {request.request_id: request.priority},
+        )
+
+    async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
+        """
+        Return if request can be processed. Removes the request from the queue when it returns True.
+        """
+        queue_key = self._get_queue_key(model_name=model_name)
+        if len(health_deployments) == 0:
+            popped = await self.pop_if_head_script(keys=[queue_key], args=[id])
+            return int(popped) == 1
+
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.zrem(queue_key, id)
+        return True
+
+    async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
+        """Return if the id is at the top of the queue. Don't pop the value from the queue."""
+        _redis_client: Any = self.redis_cache.init_async_client()
+        head = await _redis_client.zrange(
+            self._get_queue_key(model_name=model_name), 0, 0
+        )
+        if not head:
+            raise Exception(
+                "Incorrectly setup. Queue is invalid. Queue={}".format(head)
+            )
+        return self._decode(head[0]) == id
+
+    async def remove_request(self, request: FlowItem) -> None:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.zrem(
+            self._get_queue_key(model_name=request.model_name), request.request_id
+        )
+
+    async def get_queue(self, model_name: str) -> list:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        response = await _redis_client.zrange(
+            self._get_queue_key(model_name=model_name), 0, -1, withscores=True
+        )
+        return [(int(score), self._decode(member)) for member, score in response]
+
+    async def save_queue(self, queue: list, model_name: str) -> None:
+        queue_key = self._get_queue_key(model_name=model_name)
+        _redis_client: Any = self.redis_cache.init_async_client()
+        async with _redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(queue_key)
+            if queue:
+                pipe.zadd(
+                    queue_key, {request_id: priority for priority, request_id in queue}
+                )
+            await pipe.execute()
+
+    @staticmethod
+    def _decode(member: Any) -> str:
+        if isinstance(member, bytes):
+            return member.decode("utf-8")
+        return member
+
+
+def get_scheduler(
+    scheduler_type: SchedulerType = "default",
+    polling_interval: Optional[float] = None,
+    redis_cache: Optional[RedisCache] = None,
+) -> Scheduler:
+    """
+    Returns the scheduler for the given scheduler_type
+
+    - "default": queue stored in the DualCache (redis + in-memory)
+    - "redis": queue stored in a redis sorted set, shared across instances. Requires redis_cache.
+    - "asyncio": in-process queue, with event-based wakeups
+    """
+    if scheduler_type == "redis":
+        if redis_cache is None:
+            raise ValueError(
+                "scheduler_type='redis' requires a redis cache. Pass `redis_host`/`redis_port` or `redis_url` to the Router."
+            )
+        return RedisScheduler(
+            redis_cache=redis_cache, polling_interval=polling_interval
+        )
+    elif scheduler_type == "asyncio":
+        return AsyncioScheduler(polling_interval=polling_interval)
+    return Scheduler(polling_interval=polling_interval, redis_cache=redis_cache)
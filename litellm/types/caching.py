@@ -49,6 +49,20 @@ class RedisPipelineSetOperation(TypedDict):
     ttl: Optional[int]
 
 
+class InMemoryCacheStats(TypedDict):
+    """
+    TypeDict for InMemoryCache hit / miss / eviction counters and occupancy
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    current_size: int
+    current_size_in_bytes: int
+    max_size_in_memory: int
+    max_size_in_memory_bytes: Optional[int]
+
+
 DynamicCacheControl = TypedDict(
     "DynamicCacheControl",
     {
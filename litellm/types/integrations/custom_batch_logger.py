@@ -0,0 +1,12 @@
+from typing import Optional, TypedDict
+
+
+class CustomBatchLoggerMetrics(TypedDict):
+    logger: str
+    queue_size: int
+    max_queue_size: int
+    dropped_events: int  # events dropped because the queue was full
+    in_flight_flushes: int
+    failed_flushes: int  # flushes that failed after all retries
+    spilled_events: int  # events written to `BATCH_LOGGER_SPILL_DIR` after a failed flush
+    lag_seconds: Optional[float]  # age of the oldest queued event
@@ -0,0 +1,44 @@
+from enum import Enum
+from typing import Literal, Optional, TypedDict
+
+
+class CallbackDispatchLaneName(str, Enum):
+    """
+    Each lane has its own bounded queue and worker threads, so a slow sink on one lane can't starve the others
+    """
+
+    # sync success callbacks - `Logging.success_handler`
+    SUCCESS_HANDLER = "success_handler"
+    # per-chunk logging + cache storage for sync streams
+    STREAMING_LOGGING = "streaming_logging"
+    # pass-through endpoint logging
+    PASS_THROUGH_LOGGING = "pass_through_logging"
+
+
+CallbackDispatchQueueFullPolicy = Literal["drop_oldest", "drop_newest", "block"]
+
+
+class CallbackDispatchLaneSettings(TypedDict, total=False):
+    max_workers: int
+    max_queue_size: int
+    queue_full_policy: CallbackDispatchQueueFullPolicy
+    # seconds - max time `block` waits for queue space, and max time a task can wait in the queue before it is dropped
+    # `block` never waits on a thread running an event loop - it falls back to `drop_oldest` there
+    timeout: Optional[float]
+
+
+class CallbackDispatchLaneMetrics(TypedDict):
+    lane: str
+    max_workers: int
+    workers: int
+    max_queue_size: int
+    queue_depth: int
+    submitted: int
+    completed: int
+    failed: int
+    dropped: int
+    slow_tasks: int  # tasks that ran longer than `timeout`
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_run_time_ms: float
+    max_run_time_ms: float
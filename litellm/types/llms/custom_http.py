@@ -1,6 +1,8 @@
 import ssl
 from enum import Enum
-from typing import Union
+from typing import List, Optional, Union
+
+from typing_extensions import TypedDict
 
 
 class httpxSpecialProvider(str, Enum):
@@ -23,3 +25,34 @@ class httpxSpecialProvider(str, Enum):
 
 
 VerifyTypes = Union[str, bool, ssl.SSLContext]
+
+
+class HTTPPoolSettings(TypedDict, total=False):
+    """
+    Connection pool settings for a provider's httpx client.
+
+    Set per provider via `litellm.http_pool_settings`, e.g.
+    `{"anthropic": {"max_connections": 200, "http2": True}, "default": {...}}`
+    """
+
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float  # seconds an idle connection is kept open
+    http2: bool  # requires the `h2` package, uses the httpx transport
+    warmup_connections: int  # connections to open per origin at proxy startup
+    warmup_urls: List[str]  # extra urls to warm, besides the deployments' api_base
+
+
+class HTTPPoolMetrics(TypedDict):
+    llm_providers: List[str]
+    is_async: bool
+    http2: bool
+    max_connections: Optional[int]
+    active_connections: int
+    idle_connections: int
+    connection_wait_count: int  # requests that waited for a free connection
+    avg_connection_wait_ms: float
+    max_connection_wait_ms: float
+    connect_count: int  # new connections opened
+    avg_connect_latency_ms: float
+    max_connect_latency_ms: float
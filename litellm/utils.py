@@ -70,6 +70,7 @@ from litellm.constants import (
     FUNCTION_DEFINITION_TOKEN_COUNT,
     INITIAL_RETRY_DELAY,
     JITTER,
+    MAX_MODEL_NAME_RESOLUTION_CACHE_SIZE,
     MAX_RETRY_DELAY,
     MAX_TOKEN_TRIMMING_ATTEMPTS,
     MINIMUM_PROMPT_CACHE_TOKEN_COUNT,
@@ -139,6 +140,7 @@ from litellm.router_utils.get_retry_from_policy import (
     reset_retry_policy,
 )
 from litellm.secret_managers.main import get_secret
+from litellm.types.litellm_core_utils.callback_dispatcher import CallbackDispatchLaneName
 from litellm.types.llms.anthropic import (
     ANTHROPIC_API_ONLY_HEADERS,
     AnthropicThinkingParam,
@@ -222,6 +224,7 @@ from typing import (
 
 from openai import OpenAIError as OriginalError
 
+from litellm.litellm_core_utils.callback_dispatcher import callback_dispatcher
 from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.litellm_core_utils.token_counter import token_counter as token_counter_new
 from litellm.llms.base_llm.anthropic_messages.transformation import (
@@ -366,6 +369,8 @@ def custom_llm_setup():
     for custom_llm in litellm.custom_provider_map:
         if custom_llm["provider"] not in litellm.provider_list:
             litellm.provider_list.append(custom_llm["provider"])
+            # a new provider can change how model names resolve
+            _resolve_potential_model_names.cache_clear()
 
         if custom_llm["provider"] not in litellm._custom_providers:
             litellm._custom_providers.append(custom_llm["provider"])
@@ -1260,7 +1265,8 @@ def client(original_function):  # noqa: PLR0915
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object, remove `handle_success` once it's deprecated
             verbose_logger.info("Wrapper: Completed Call, calling success_handler")
-            executor.submit(
+            callback_dispatcher.submit(
+                CallbackDispatchLaneName.SUCCESS_HANDLER,
                 logging_obj.success_handler,
                 result,
                 start_time,
@@ -1715,6 +1721,14 @@ def _return_openai_tokenizer(model: str) -> SelectTokenizerResponse:
     return {"type": "openai_tokenizer", "tokenizer": encoding}
 
 
+@lru_cache(maxsize=1)
+def _get_claude_tokenizer() -> Tokenizer:
+    """
+    Bundled anthropic tokenizer - parsed once and shared across models
+    """
+    return Tokenizer.from_str(claude_json_str)
+
+
 def _return_huggingface_tokenizer(model: str) -> Optional[SelectTokenizerResponse]:
     if model in litellm.cohere_models and "command-r" in model:
         # cohere
@@ -1724,8 +1738,7 @@ def _return_huggingface_tokenizer(model: str) -> Optional[SelectTokenizerRespons
         return {"type": "huggingface_tokenizer", "tokenizer": cohere_tokenizer}
     # anthropic
     elif model in litellm.anthropic_models and "claude-3" not in model:
-        claude_tokenizer = Tokenizer.from_str(claude_json_str)
-        return {"type": "huggingface_tokenizer", "tokenizer": claude_tokenizer}
+        return {"type": "huggingface_tokenizer", "tokenizer": _get_claude_tokenizer()}
     # llama2
     elif "llama-2" in model.lower() or "replicate" in model.lower():
         tokenizer = Tokenizer.from_pretrained("hf-internal-testing/llama-tokenizer")
@@ -2357,6 +2370,8 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         elif value.get("litellm_provider") == "novita":
             if key not in litellm.novita_models:
                 litellm.novita_models.append(key)
+    # registered models can change how model names resolve
+    _resolve_potential_model_names.cache_clear()
     return model_cost
 
 
@@ -4486,6 +4501,27 @@ class PotentialModelNamesAndCustomLLMProvider(TypedDict):
 
 def _get_potential_model_names(
     model: str, custom_llm_provider: Optional[str]
+) -> PotentialModelNamesAndCustomLLMProvider:
+    """
+    Resolve the model cost map keys to check for a model / provider.
+
+    Memoised - cleared by `register_model` and `custom_llm_setup`, which change how model names resolve.
+    Not memoised while requests default to the litellm proxy, since that flag can be toggled at any time. Do not mutate the returned dict.
+    """
+    if custom_llm_provider is None and (
+        litellm.use_litellm_proxy is True or "USE_LITELLM_PROXY" in os.environ
+    ):
+        return _resolve_potential_model_names.__wrapped__(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+    return _resolve_potential_model_names(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+
+
+@lru_cache(maxsize=MAX_MODEL_NAME_RESOLUTION_CACHE_SIZE)
+def _resolve_potential_model_names(
+    model: str, custom_llm_provider: Optional[str]
 ) -> PotentialModelNamesAndCustomLLMProvider:
     if custom_llm_provider is None:
         # Get custom_llm_provider
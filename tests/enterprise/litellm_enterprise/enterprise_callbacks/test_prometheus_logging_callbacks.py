@@ -1940,3 +1940,66 @@ async def test_prometheus_token_metrics_with_prometheus_config():
   
 
         
+
+
+def test_get_bound_metric_caches_label_children(prometheus_logger, monkeypatch):
+    from litellm_enterprise.integrations.prometheus import prometheus_label_factory
+
+    monkeypatch.setattr(litellm, "custom_prometheus_tags", ["prod"])
+    prometheus_logger.litellm_requests_metric = MagicMock()
+    enum_values = UserAPIKeyLabelValues(
+        hashed_api_key="test_hash",
+        api_key_alias="test_alias",
+        model="gpt-4o",
+        tags=["prod"],
+    )
+
+    bound_metric = prometheus_logger._get_bound_metric(
+        metric=prometheus_logger.litellm_requests_metric,
+        metric_name="litellm_requests_metric",
+        enum_values=enum_values,
+    )
+    # same labels as building them per metric
+    prometheus_logger.litellm_requests_metric.labels.assert_called_once_with(
+        **prometheus_label_factory(
+            supported_enum_labels=prometheus_logger.get_labels_for_metric(
+                "litellm_requests_metric"
+            ),
+            enum_values=enum_values,
+        )
+    )
+
+    # a later request with the same label values reuses the bound child
+    same_enum_values = UserAPIKeyLabelValues(**enum_values.model_dump())
+    assert (
+        prometheus_logger._get_bound_metric(
+            metric=prometheus_logger.litellm_requests_metric,
+            metric_name="litellm_requests_metric",
+            enum_values=same_enum_values,
+        )
+        is bound_metric
+    )
+    assert prometheus_logger.litellm_requests_metric.labels.call_count == 1
+
+    prometheus_logger._get_bound_metric(
+        metric=prometheus_logger.litellm_requests_metric,
+        metric_name="litellm_requests_metric",
+        enum_values=UserAPIKeyLabelValues(hashed_api_key="other_hash"),
+    )
+    assert prometheus_logger.litellm_requests_metric.labels.call_count == 2
+
+
+def test_mount_metrics_endpoint_multiprocess(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    mock_app = MagicMock()
+    with patch("litellm.proxy.proxy_server.app", mock_app), patch(
+        "prometheus_client.make_asgi_app"
+    ) as mock_make_asgi_app, patch(
+        "prometheus_client.multiprocess.MultiProcessCollector"
+    ) as mock_multiprocess_collector:
+        PrometheusLogger._mount_metrics_endpoint(premium_user=True)
+
+    registry = mock_multiprocess_collector.call_args[0][0]
+    assert isinstance(registry, CollectorRegistry)
+    mock_make_asgi_app.assert_called_once_with(registry=registry)
+    mock_app.mount.assert_called_once_with("/metrics", mock_make_asgi_app.return_value)
@@ -0,0 +1,80 @@
+"""
+Benchmark deployment selection time as the number of deployments on the router grows.
+
+Run with `pytest -s tests/load_tests/test_router_deployment_lookup_load_test.py` to see the timings.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import pytest
+
+from litellm import Router
+
+
+def _build_router(num_deployments: int) -> Router:
+    model_list = []
+    for i in range(num_deployments):
+        model_list.append(
+            {
+                "model_name": f"model-group-{i % (num_deployments // 4)}",
+                "litellm_params": {
+                    "model": f"openai/gpt-4o-{i}",
+                    "api_key": "sk-1234",
+                },
+                "model_info": {
+                    "id": f"deployment-{i}",
+                    "team_id": f"team-{i % 50}" if i % 5 == 0 else None,
+                    "access_groups": [f"access-group-{i % 20}"],
+                },
+            }
+        )
+    for i in range(50):
+        model_list.append(
+            {
+                "model_name": f"provider-{i}/*",
+                "litellm_params": {"model": "openai/*", "api_key": "sk-1234"},
+            }
+        )
+    return Router(model_list=model_list)
+
+
+def _time_lookups(router: Router, num_deployments: int, iterations: int) -> float:
+    start_time = time.perf_counter()
+    for i in range(iterations):
+        router._common_checks_available_deployment(
+            model=f"model-group-{i % (num_deployments // 4)}"
+        )
+        router._common_checks_available_deployment(
+            model=f"deployment-{i % num_deployments}"
+        )
+        router._common_checks_available_deployment(model=f"provider-{i % 50}/foo")
+        router.get_model_access_groups(model_access_group=f"access-group-{i % 20}")
+    return (time.perf_counter() - start_time) / iterations
+
+
+@pytest.mark.parametrize("num_deployments", [100, 500, 2000])
+def test_router_deployment_lookup_scales(num_deployments):
+    """
+    Deployment selection should stay roughly flat as deployments grow, since lookups are hash map / single regex lookups.
+    """
+    iterations = 500
+    baseline_router = _build_router(num_deployments=100)
+    baseline_time = _time_lookups(
+        baseline_router, num_deployments=100, iterations=iterations
+    )
+
+    router = _build_router(num_deployments=num_deployments)
+    avg_time = _time_lookups(
+        router, num_deployments=num_deployments, iterations=iterations
+    )
+
+    print(
+        f"\n{num_deployments} deployments: {avg_time * 1e6:.1f}us per lookup round "
+        f"(100 deployments: {baseline_time * 1e6:.1f}us)"
+    )
+    # linear scans would make 2000 deployments ~20x slower than 100
+    assert avg_time < baseline_time * 3
@@ -0,0 +1,106 @@
+"""
+Benchmark per-request allocations of the StandardLoggingPayload, with and without field projection.
+
+Run with `pytest -s tests/load_tests/test_standard_logging_payload_load_test.py` to see the numbers.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.litellm_core_utils.litellm_logging import Logging as LitellmLogging
+from litellm.litellm_core_utils.litellm_logging import (
+    get_standard_logging_object_payload,
+)
+from litellm.types.utils import ModelResponse, Usage
+
+# fields read by metrics / spend tracking style callbacks
+METRICS_PAYLOAD_FIELDS = {
+    "model",
+    "model_group",
+    "model_id",
+    "api_base",
+    "custom_llm_provider",
+    "response_cost",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "metadata",
+    "end_user",
+    "status",
+}
+
+
+def _build_request():
+    logging_obj = LitellmLogging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=False,
+        call_type="completion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    response = ModelResponse(
+        id="chatcmpl-123",
+        model="gpt-4o",
+        choices=[
+            {
+                "message": {"role": "assistant", "content": "a" * 20_000},
+            }
+            for _ in range(4)
+        ],
+        usage=Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150),
+    )
+    kwargs = {
+        "model": "gpt-4o",
+        "custom_llm_provider": "openai",
+        "messages": [{"role": "user", "content": "Hey"}],
+        "optional_params": {"temperature": 0.2, "max_tokens": 100},
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-4o", "model_info": {"id": "1"}}
+        },
+        "response_cost": 0.001,
+    }
+    return logging_obj, response, kwargs
+
+
+def _measure(payload_fields, iterations: int):
+    logging_obj, response, kwargs = _build_request()
+    start_time = datetime.now()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        get_standard_logging_object_payload(
+            kwargs=kwargs,
+            init_response_obj=response,
+            start_time=start_time,
+            end_time=start_time,
+            logging_obj=logging_obj,
+            status="success",
+            payload_fields=payload_fields,
+        )
+    elapsed = (time.perf_counter() - start) / iterations
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def test_standard_logging_payload_projection_allocates_less():
+    iterations = 200
+    full_time, full_peak = _measure(payload_fields=None, iterations=iterations)
+    projected_time, projected_peak = _measure(
+        payload_fields=METRICS_PAYLOAD_FIELDS, iterations=iterations
+    )
+
+    print(
+        f"\nfull payload: {full_time * 1e6:.1f}us, peak {full_peak / 1024:.1f}KB"
+        f"\nprojected payload: {projected_time * 1e6:.1f}us, peak {projected_peak / 1024:.1f}KB"
+    )
+    assert projected_peak < full_peak
@@ -0,0 +1,172 @@
+"""
+Benchmark CustomStreamWrapper.__anext__ throughput (tokens per second) across provider chunk shapes.
+
+Run with `pytest -s tests/load_tests/test_streaming_handler_load_test.py` to see the numbers.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from openai.types.chat import ChatCompletionChunk
+
+import litellm
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.llms.anthropic.chat.handler import (
+    ModelResponseIterator as AnthropicModelResponseIterator,
+)
+from litellm.llms.bedrock.chat.invoke_handler import AWSEventStreamDecoder
+
+NUM_TOKENS = 2000
+# distinct tokens - repeated chunks trip CustomStreamWrapper.safety_checker
+TOKENS = [f"tok{i} " for i in range(NUM_TOKENS)]
+
+
+class _ListAsyncIterator:
+    def __init__(self, chunks: list):
+        self.chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _openai_chunks() -> list:
+    def _chunk(delta: dict, finish_reason=None, usage=None) -> ChatCompletionChunk:
+        return ChatCompletionChunk(
+            id="chatcmpl-123",
+            object="chat.completion.chunk",
+            created=1742056047,
+            model="gpt-4o",
+            choices=[{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            usage=usage,
+        )
+
+    return (
+        [_chunk({"role": "assistant", "content": ""})]
+        + [_chunk({"content": token}) for token in TOKENS]
+        + [_chunk({}, finish_reason="stop")]
+    )
+
+
+def _anthropic_chunks() -> list:
+    iterator = AnthropicModelResponseIterator(
+        streaming_response=None, sync_stream=False
+    )
+    raw_chunks = (
+        [
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            }
+        ]
+        + [
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": token},
+            }
+            for token in TOKENS
+        ]
+        + [
+            {"type": "content_block_stop", "index": 0},
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn"},
+                "usage": {"input_tokens": 10, "output_tokens": NUM_TOKENS},
+            },
+        ]
+    )
+    return [iterator.chunk_parser(chunk) for chunk in raw_chunks]
+
+
+def _bedrock_chunks() -> list:
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-3-5-sonnet-20240620-v1:0")
+    raw_chunks = (
+        [{"role": "assistant"}]
+        + [
+            {"contentBlockIndex": 0, "delta": {"text": token}}
+            for token in TOKENS
+        ]
+        + [
+            {"contentBlockIndex": 0},
+            {"stopReason": "end_turn"},
+            {
+                "usage": {
+                    "inputTokens": 10,
+                    "outputTokens": NUM_TOKENS,
+                    "totalTokens": NUM_TOKENS + 10,
+                }
+            },
+        ]
+    )
+    return [decoder.converse_chunk_parser(chunk) for chunk in raw_chunks]
+
+
+async def _measure(custom_llm_provider: str, model: str, chunks: list):
+    logging_obj = Logging(
+        model=model,
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    logging_obj.update_environment_variables(
+        model=model,
+        user=None,
+        optional_params={},
+        litellm_params={},
+        custom_llm_provider=custom_llm_provider,
+    )
+    response = CustomStreamWrapper(
+        completion_stream=_ListAsyncIterator(chunks),
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        logging_obj=logging_obj,
+    )
+
+    start = time.perf_counter()
+    content = ""
+    async for chunk in response:
+        content += chunk.choices[0].delta.content or ""
+    elapsed = time.perf_counter() - start
+    return elapsed, content
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "custom_llm_provider, model, get_chunks",
+    [
+        ("openai", "gpt-4o", _openai_chunks),
+        ("anthropic", "claude-3-5-sonnet-20240620", _anthropic_chunks),
+        ("bedrock", "anthropic.claude-3-5-sonnet-20240620-v1:0", _bedrock_chunks),
+    ],
+)
+async def test_streaming_handler_tokens_per_second(
+    custom_llm_provider, model, get_chunks
+):
+    litellm.post_call_rules = []
+    elapsed, content = await _measure(
+        custom_llm_provider=custom_llm_provider, model=model, chunks=get_chunks()
+    )
+    print(
+        f"\n{custom_llm_provider}: {NUM_TOKENS / elapsed:.0f} tokens/s ({elapsed * 1e6 / NUM_TOKENS:.1f}us per token)"
+    )
+    assert content == "".join(TOKENS)
+
+    # give the background logging tasks a chance to finish
+    await asyncio.sleep(0.1)
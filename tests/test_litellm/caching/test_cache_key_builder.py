@@ -0,0 +1,136 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+import litellm
+from litellm.caching.cache_key_builder import CacheKeyBuilder, cache_key_builder
+from litellm.caching.caching import Cache
+
+
+def test_cache_key_independent_of_kwarg_and_dict_key_order():
+    cache = Cache()
+    cache_key = cache.get_cache_key(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        temperature=0.2,
+        response_format={"type": "json_object", "strict": True},
+    )
+    assert cache_key == cache.get_cache_key(
+        response_format={"strict": True, "type": "json_object"},
+        temperature=0.2,
+        messages=[{"content": "hi", "role": "user"}],
+        model="gpt-4o",
+    )
+    assert cache_key != cache.get_cache_key(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        temperature=0.3,
+        response_format={"type": "json_object", "strict": True},
+    )
+
+
+def test_cache_key_ignores_litellm_params():
+    cache = Cache()
+    assert cache.get_cache_key(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        litellm_call_id="1234",
+        top_k=3,
+    ) == cache.get_cache_key(
+        model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+    )
+
+
+def test_cache_key_provider_specific_params(monkeypatch):
+    monkeypatch.setattr(
+        litellm, "enable_caching_on_provider_specific_optional_params", True
+    )
+    cache = Cache()
+    assert cache.get_cache_key(
+        model="gpt-4o", messages=[{"role": "user", "content": "hi"}], top_k=3
+    ) != cache.get_cache_key(
+        model="gpt-4o", messages=[{"role": "user", "content": "hi"}], top_k=4
+    )
+
+
+def test_cache_key_reuses_message_digests_across_turns():
+    builder = CacheKeyBuilder()
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant"},
+        {"role": "user", "content": "hi"},
+    ]
+
+    with patch.object(
+        CacheKeyBuilder, "serialize", wraps=CacheKeyBuilder.serialize
+    ) as mock_serialize:
+        builder.get_hashed_cache_key(
+            kwargs={"model": "gpt-4o", "messages": messages},
+            get_param_value=lambda param, kwargs: kwargs[param],
+            include_provider_specific_params=False,
+        )
+        assert mock_serialize.call_count == 3  # model + 2 messages
+
+        mock_serialize.reset_mock()
+        builder.get_hashed_cache_key(
+            kwargs={
+                "model": "gpt-4o",
+                "messages": messages
+                + [
+                    {"role": "assistant", "content": "hello!"},
+                    {"role": "user", "content": "how are you?"},
+                ],
+            },
+            get_param_value=lambda param, kwargs: kwargs[param],
+            include_provider_specific_params=False,
+        )
+        assert mock_serialize.call_count == 3  # model + 2 new messages
+
+
+@pytest.mark.parametrize(
+    "message_1, message_2",
+    [
+        ({"role": "user", "content": "1"}, {"role": "user", "content": 1}),
+        ({"role": "user", "name": True}, {"role": "user", "name": 1}),
+        (
+            {"role": "user", "content": [{"type": "text", "text": "a"}]},
+            {"role": "user", "content": [{"type": "text", "text": "b"}]},
+        ),
+    ],
+)
+def test_cache_key_distinguishes_messages(message_1, message_2):
+    def _get_key(message):
+        return cache_key_builder.get_hashed_cache_key(
+            kwargs={"messages": [message]},
+            get_param_value=lambda param, kwargs: kwargs[param],
+            include_provider_specific_params=False,
+        )
+
+    assert _get_key(message_1) != _get_key(message_2)
+
+
+def test_message_memo_key_is_exact_and_bounded():
+    builder = CacheKeyBuilder(max_memoized_message_size=100)
+
+    # keyed on the exact content - messages with the same length + hash never share a digest
+    assert builder._get_message_memo_key(
+        {"role": "user", "content": "a" * 10}
+    ) != builder._get_message_memo_key({"role": "user", "content": "b" * 10})
+    # -1 and -2 share a hash, -0.0 == 0.0
+    assert builder._get_message_memo_key(
+        {"role": "user", "index": -1}
+    ) != builder._get_message_memo_key({"role": "user", "index": -2})
+    assert builder._get_message_memo_key(
+        {"role": "user", "temperature": 0.0}
+    ) != builder._get_message_memo_key({"role": "user", "temperature": -0.0})
+    # not memoized - too long to keep alive, or not flat
+    assert builder._get_message_memo_key({"role": "user", "content": "a" * 101}) is None
+    assert (
+        builder._get_message_memo_key(
+            {"role": "user", "content": [{"type": "text", "text": "a"}]}
+        )
+        is None
+    )
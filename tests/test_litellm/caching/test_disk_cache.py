@@ -0,0 +1,48 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+pytest.importorskip("diskcache")
+
+from litellm.caching.disk_cache import DiskCache
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_async_methods_run_off_event_loop(tmp_path):
+    disk_cache = DiskCache(disk_cache_dir=str(tmp_path))
+    event_loop_thread = threading.get_ident()
+    set_cache_threads = []
+    original_set_cache = disk_cache.set_cache
+
+    def _set_cache(key, value, **kwargs):
+        set_cache_threads.append(threading.get_ident())
+        return original_set_cache(key, value, **kwargs)
+
+    disk_cache.set_cache = _set_cache  # type: ignore
+
+    await disk_cache.async_set_cache("key", "value")
+    await disk_cache.async_set_cache_pipeline(
+        [("key1", "value1"), ("key2", "value2")], ttl=60
+    )
+
+    assert len(set_cache_threads) == 3
+    assert event_loop_thread not in set_cache_threads
+    assert await disk_cache.async_get_cache("key") == "value"
+    assert await disk_cache.async_batch_get_cache(["key1", "key2", "key3"]) == [
+        "value1",
+        "value2",
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_async_increment(tmp_path):
+    disk_cache = DiskCache(disk_cache_dir=str(tmp_path))
+
+    assert await disk_cache.async_increment("counter", 2) == 2
+    assert await disk_cache.async_increment("counter", 3) == 5
+    assert disk_cache.get_cache("counter") == 5
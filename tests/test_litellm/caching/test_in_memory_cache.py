@@ -88,3 +88,113 @@ def test_in_memory_cache_ttl_allow_override():
     new_ttl_time = in_memory_cache.ttl_dict["new-fake-key"]
     assert new_ttl_time is not None
     assert new_ttl_time != initial_ttl_time
+
+
+def test_in_memory_cache_evicts_expired_keys_via_heap():
+    """
+    Expired keys are evicted from the expiration heap when the cache is full, without scanning ttl_dict
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2)
+    in_memory_cache.set_cache(key="expired-key", value="value", ttl=0.01)
+    in_memory_cache.set_cache(key="live-key", value="value", ttl=60)
+    time.sleep(0.02)
+
+    in_memory_cache.set_cache(key="new-key", value="value", ttl=60)
+
+    assert "expired-key" not in in_memory_cache.cache_dict
+    assert "expired-key" not in in_memory_cache.ttl_dict
+    assert set(in_memory_cache.cache_dict.keys()) == {"live-key", "new-key"}
+    assert in_memory_cache.get_cache_stats()["evictions"] == 1
+
+
+def test_in_memory_cache_ttl_policy_does_not_evict_live_keys():
+    """
+    With the default "ttl" eviction policy, live keys are never dropped to make room
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2)
+    for i in range(3):
+        in_memory_cache.set_cache(key=f"key-{i}", value=i, ttl=60)
+
+    assert len(in_memory_cache.cache_dict) == 3
+    assert in_memory_cache.get_cache_stats()["evictions"] == 0
+
+
+def test_in_memory_cache_lru_eviction():
+    """
+    With eviction_policy="lru", the least recently used key is evicted when the cache is full
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2, eviction_policy="lru")
+    in_memory_cache.set_cache(key="key-1", value=1)
+    in_memory_cache.set_cache(key="key-2", value=2)
+
+    # touch key-1, so key-2 becomes the least recently used key
+    assert in_memory_cache.get_cache(key="key-1") == 1
+
+    in_memory_cache.set_cache(key="key-3", value=3)
+
+    assert in_memory_cache.get_cache(key="key-2") is None
+    assert in_memory_cache.get_cache(key="key-1") == 1
+    assert in_memory_cache.get_cache(key="key-3") == 3
+    assert "key-2" not in in_memory_cache.ttl_dict
+
+
+def test_in_memory_cache_max_size_in_memory_bytes():
+    """
+    Items are evicted (least recently used first) to keep the total size under max_size_in_memory_bytes
+    """
+    value = "a" * 1000
+    value_size = sys.getsizeof(value)
+    in_memory_cache = InMemoryCache(max_size_in_memory_bytes=value_size * 2)
+
+    in_memory_cache.set_cache(key="key-1", value=value)
+    in_memory_cache.set_cache(key="key-2", value=value)
+    assert in_memory_cache.current_size_in_bytes == value_size * 2
+
+    in_memory_cache.set_cache(key="key-3", value=value)
+
+    assert "key-1" not in in_memory_cache.cache_dict
+    assert in_memory_cache.current_size_in_bytes == value_size * 2
+
+    # overwriting a key should not double count its size
+    in_memory_cache.set_cache(key="key-3", value=value)
+    assert in_memory_cache.current_size_in_bytes == value_size * 2
+
+    in_memory_cache.delete_cache(key="key-3")
+    assert in_memory_cache.current_size_in_bytes == value_size
+
+
+def test_in_memory_cache_stats():
+    in_memory_cache = InMemoryCache()
+    in_memory_cache.set_cache(key="key-1", value="value")
+
+    in_memory_cache.get_cache(key="key-1")
+    in_memory_cache.get_cache(key="key-1")
+    in_memory_cache.get_cache(key="missing-key")
+
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 0
+    assert stats["current_size"] == 1
+    assert stats["max_size_in_memory"] == 200
+
+    in_memory_cache.flush_cache()
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["current_size"] == 0
+    assert stats["current_size_in_bytes"] == 0
+    assert in_memory_cache.expiration_heap == []
+
+
+def test_in_memory_cache_expiration_heap_stays_bounded_below_capacity():
+    """
+    Re-set / deleted keys leave stale heap entries - they're compacted on the set path, not only on eviction
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=1000)
+    for i in range(2000):
+        for key in range(10):
+            in_memory_cache.set_cache(key=f"key-{key}", value=i, ttl=600)
+            if i % 2 == 0:
+                in_memory_cache.delete_cache(key=f"key-{key}")
+
+    assert len(in_memory_cache.cache_dict) == 10
+    assert len(in_memory_cache.expiration_heap) <= 2 * 10 + 64 + 1
@@ -0,0 +1,200 @@
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.local_semantic_cache import (
+    LocalSemanticCache,
+    LocalSemanticIndex,
+    SemanticCacheEmbeddingMemo,
+)
+
+
+def _get_remote_cache(embedding):
+    remote_cache = MagicMock()
+    remote_cache._get_prompt.side_effect = lambda messages: "".join(
+        m["content"] for m in messages
+    )
+    remote_cache._get_embedding.return_value = embedding
+    remote_cache._get_async_embedding = AsyncMock(return_value=embedding)
+    remote_cache.async_get_cache = AsyncMock(return_value=None)
+    remote_cache.async_set_cache = AsyncMock()
+    return remote_cache
+
+
+def test_local_semantic_index_similarity_threshold():
+    index = LocalSemanticIndex(max_size=10, similarity_threshold=0.9)
+    index.add([1.0, 0.0, 0.0], "paris", "Paris")
+    index.add([0.0, 1.0, 0.0], "berlin", "Berlin")
+
+    entry, similarity = index.search([0.95, 0.05, 0.0])
+    assert entry.response == "Paris"
+    assert similarity == pytest.approx(0.9986, abs=1e-3)
+
+    # closest entry is below the threshold
+    assert index.search([0.7, 0.7, 0.0]) is None
+    # zero vector / different embedding size
+    assert index.search([0.0, 0.0, 0.0]) is None
+    assert index.search([1.0, 0.0]) is None
+
+
+def test_local_semantic_index_ttl_and_eviction():
+    index = LocalSemanticIndex(max_size=2, similarity_threshold=0.9)
+    index.add([1.0, 0.0], "a", "A", ttl=10)
+    index.add([0.0, 1.0], "b", "B")
+
+    now = time.time()
+    with patch("litellm.caching.local_semantic_cache.time.time") as mock_time:
+        mock_time.return_value = now + 60
+        # "a" expired - not returned, and its slot is reused first
+        assert index.search([1.0, 0.0]) is None
+        index.add([1.0, 1.0], "c", "C")
+
+    assert len(index) == 2
+    assert index.search([0.0, 1.0])[0].response == "B"
+    assert index.search([1.0, 1.0])[0].response == "C"
+
+    # full, nothing expired - oldest entry ("b") is replaced
+    index.add([-1.0, 0.0], "d", "D")
+    assert index.search([-1.0, 0.0])[0].response == "D"
+    assert index.search([1.0, 1.0])[0].response == "C"
+    assert index.search([0.0, 1.0]) is None
+
+
+def test_local_semantic_index_snapshot_roundtrip(tmp_path):
+    snapshot_path = str(tmp_path / "semantic-cache.json")
+    index = LocalSemanticIndex(max_size=10, similarity_threshold=0.9)
+    index.add([1.0, 0.0], "a", {"content": "A"}, ttl=600)
+    index.add([0.0, 1.0], "b", {"content": "B"})
+    LocalSemanticIndex.write_snapshot(index.get_snapshot(), snapshot_path)
+
+    loaded_index = LocalSemanticIndex(max_size=10, similarity_threshold=0.9)
+    loaded_index.load_snapshot(snapshot_path)
+    assert len(loaded_index) == 2
+    assert loaded_index.search([1.0, 0.0])[0].response == {"content": "A"}
+    assert loaded_index.search([0.0, 1.0])[0].expires_at == float("inf")
+
+
+def test_semantic_cache_embedding_memo():
+    memo = SemanticCacheEmbeddingMemo(max_size=1)
+    memo.set("hello", [0.1, 0.2])
+    assert memo.get("hello") == [0.1, 0.2]
+    memo.set("world", [0.3, 0.4])
+    assert memo.get("hello") is None
+    assert memo.get("world") == [0.3, 0.4]
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_hit_skips_remote_cache():
+    remote_cache = _get_remote_cache(embedding=[0.1, 0.2, 0.3])
+    cache = LocalSemanticCache(
+        remote_cache=remote_cache, max_size=10, similarity_threshold=0.9
+    )
+    messages = [{"role": "user", "content": "What is the capital of France?"}]
+
+    await cache.async_set_cache("key", {"content": "Paris"}, messages=messages)
+    remote_cache.async_set_cache.assert_awaited_once()
+
+    metadata: dict = {}
+    result = await cache.async_get_cache("key", messages=messages, metadata=metadata)
+    assert result == {"content": "Paris"}
+    assert metadata["semantic-similarity"] == pytest.approx(1.0)
+    remote_cache.async_get_cache.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_remote_hit_populates_local_index():
+    remote_cache = _get_remote_cache(embedding=[0.1, 0.2, 0.3])
+    remote_cache.async_get_cache.return_value = {"content": "Paris"}
+    cache = LocalSemanticCache(
+        remote_cache=remote_cache, max_size=10, similarity_threshold=0.9
+    )
+    messages = [{"role": "user", "content": "What is the capital of France?"}]
+
+    assert await cache.async_get_cache("key", messages=messages) == {"content": "Paris"}
+    assert await cache.async_get_cache("key", messages=messages) == {"content": "Paris"}
+    remote_cache.async_get_cache.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_remote_hit_expires_locally():
+    """
+    Remote hits are added to the local index with a finite ttl - once it passes, the remote cache is checked again.
+    """
+    remote_cache = _get_remote_cache(embedding=[0.1, 0.2, 0.3])
+    remote_cache.async_get_cache.return_value = {"content": "Paris"}
+    cache = LocalSemanticCache(
+        remote_cache=remote_cache, max_size=10, similarity_threshold=0.9
+    )
+    messages = [{"role": "user", "content": "What is the capital of France?"}]
+
+    now = time.time()
+    assert await cache.async_get_cache("key", messages=messages) == {"content": "Paris"}
+    entry, _ = cache.index.search([0.1, 0.2, 0.3])
+    assert entry.expires_at <= now + cache.ttl + 1
+
+    # expired on the remote cache
+    remote_cache.async_get_cache.return_value = None
+    with patch("litellm.caching.local_semantic_cache.time.time") as mock_time:
+        mock_time.return_value = now + cache.ttl + 1
+        assert await cache.async_get_cache("key", messages=messages) is None
+    assert remote_cache.async_get_cache.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_snapshot_on_disconnect(tmp_path):
+    snapshot_path = str(tmp_path / "semantic-cache.json")
+    remote_cache = _get_remote_cache(embedding=[0.1, 0.2, 0.3])
+    remote_cache.disconnect = AsyncMock()
+    cache = LocalSemanticCache(
+        remote_cache=remote_cache,
+        max_size=10,
+        similarity_threshold=0.9,
+        snapshot_path=snapshot_path,
+    )
+    await cache.async_set_cache(
+        "key", {"content": "Paris"}, messages=[{"content": "capital of France?"}]
+    )
+    await cache.disconnect()
+    remote_cache.disconnect.assert_awaited_once()
+
+    restored_cache = LocalSemanticCache(
+        remote_cache=_get_remote_cache(embedding=[0.1, 0.2, 0.3]),
+        max_size=10,
+        similarity_threshold=0.9,
+        snapshot_path=snapshot_path,
+    )
+    assert restored_cache.get_cache(
+        "key", messages=[{"content": "capital of France?"}]
+    ) == {"content": "Paris"}
+
+
+@pytest.mark.asyncio
+async def test_redis_semantic_cache_memoizes_prompt_embedding():
+    with patch.dict(
+        "sys.modules",
+        {
+            "redisvl.extensions.llmcache": MagicMock(SemanticCache=MagicMock()),
+            "redisvl.utils.vectorize": MagicMock(CustomTextVectorizer=MagicMock()),
+        },
+    ):
+        from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+        redis_semantic_cache = RedisSemanticCache(
+            redis_url="redis://localhost:6379", similarity_threshold=0.8
+        )
+
+    with patch(
+        "litellm.aembedding",
+        new=AsyncMock(return_value={"data": [{"embedding": [0.1, 0.2, 0.3]}]}),
+    ) as mock_aembedding:
+        for _ in range(2):
+            embedding = await redis_semantic_cache._get_async_embedding("hello")
+            assert embedding == pytest.approx([0.1, 0.2, 0.3])
+        mock_aembedding.assert_awaited_once()
@@ -42,11 +42,20 @@ def test_redis_cluster_batch_get(mock_init_redis_cluster):
 @patch("litellm._redis.init_redis_cluster")
 async def test_redis_cluster_async_batch_get(mock_init_redis_cluster):
     """
-    Test that RedisClusterCache uses mget_nonatomic instead of mget for async batch operations
+    Test that RedisClusterCache sends one MGET per hash slot, in a single cluster pipeline, for async batch operations
     """
     # Create a mock Redis client
     mock_redis = MagicMock()
-    mock_redis.mget_nonatomic.return_value = [None, None]  # Simulate no cache hits
+    mock_pipe = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = mock_pipe
+
+    async def mock_execute():
+        return [
+            [f"value-{key}" for key in call.args[0]]
+            for call in mock_pipe.mget.call_args_list
+        ]
+
+    mock_pipe.execute = mock_execute
 
     # Create RedisClusterCache instance with mock client
     cache = RedisClusterCache(
@@ -58,9 +67,26 @@ async def test_redis_cluster_async_batch_get(mock_init_redis_cluster):
     cache.init_async_client = MagicMock(return_value=mock_redis)
 
     # Test async_batch_get_cache
-    keys = ["key1", "key2"]
-    await cache.async_batch_get_cache(keys)
+    keys = ["{api_key:sk-1}:requests", "key2", "{api_key:sk-1}:window"]
+    results = await cache.async_batch_get_cache(keys)
 
-    # Verify mget_nonatomic was called instead of mget
-    mock_redis.mget_nonatomic.assert_called_once()
+    # keys sharing a hash tag are fetched with one MGET
+    assert mock_pipe.mget.call_count == 2
+    assert mock_pipe.mget.call_args_list[0].args[0] == [
+        "{api_key:sk-1}:requests",
+        "{api_key:sk-1}:window",
+    ]
     assert not mock_redis.mget.called
+    assert not mock_redis.mget_nonatomic.called
+    # results are returned for the keys in the order requested
+    assert list(results.keys()) == keys
+    assert results["key2"] == "value-key2"
+
+
+def test_redis_cluster_hash_slot_respects_hash_tags():
+    assert RedisClusterCache.get_hash_slot(
+        "{api_key:sk-1}:requests"
+    ) == RedisClusterCache.get_hash_slot("{api_key:sk-1}:window")
+    assert RedisClusterCache.get_hash_slot("{api_key:sk-1}:requests") == (
+        RedisClusterCache.get_hash_slot("api_key:sk-1")
+    )
@@ -0,0 +1,152 @@
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+from litellm.caching.s3_cache import S3Cache
+
+
+@pytest.fixture
+def s3_cache():
+    return S3Cache(
+        s3_bucket_name="test-bucket",
+        s3_region_name="us-east-1",
+        s3_aws_access_key_id="test-access-key",
+        s3_aws_secret_access_key="test-secret-key",
+        s3_path="litellm",
+    )
+
+
+def _get_response(body: dict, headers: dict = {}, status_code: int = 200):
+    return httpx.Response(
+        status_code=status_code,
+        content=json.dumps(body).encode(),
+        headers=headers,
+        request=httpx.Request("GET", "https://test-bucket.s3.amazonaws.com"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_s3_cache_async_set_cache_signs_request(s3_cache):
+    mock_async_client = AsyncMock()
+    with patch(
+        "litellm.caching.s3_cache.get_async_httpx_client",
+        return_value=mock_async_client,
+    ):
+        await s3_cache.async_set_cache("my key", {"foo": "bar"}, ttl=60)
+
+    mock_async_client.put.assert_called_once()
+    call_kwargs = mock_async_client.put.call_args.kwargs
+    assert (
+        call_kwargs["url"]
+        == "https://test-bucket.s3.us-east-1.amazonaws.com/litellm/my%20key"
+    )
+    assert json.loads(call_kwargs["data"]) == {"foo": "bar"}
+    headers = httpx.Headers(call_kwargs["headers"])
+    assert headers["Authorization"].startswith(
+        "AWS4-HMAC-SHA256 Credential=test-access-key/"
+    )
+    assert (
+        headers["x-amz-content-sha256"]
+        == hashlib.sha256(call_kwargs["data"]).hexdigest()
+    )
+    assert "Expires" in headers
+
+
+@pytest.mark.asyncio
+async def test_s3_cache_async_get_cache(s3_cache):
+    mock_async_client = AsyncMock()
+    mock_async_client.get.return_value = _get_response({"foo": "bar"})
+    with patch(
+        "litellm.caching.s3_cache.get_async_httpx_client",
+        return_value=mock_async_client,
+    ):
+        assert await s3_cache.async_get_cache("key") == {"foo": "bar"}
+
+        # missing key
+        mock_async_client.get.return_value = _get_response({}, status_code=404)
+        assert await s3_cache.async_get_cache("key") is None
+
+        # expired object
+        mock_async_client.get.return_value = _get_response(
+            {"foo": "bar"},
+            headers={"Expires": formatdate(time.time() - 10, usegmt=True)},
+        )
+        assert await s3_cache.async_get_cache("key") is None
+
+
+@pytest.mark.asyncio
+async def test_s3_cache_async_batch_get_cache_bounded_concurrency():
+    s3_cache = S3Cache(
+        s3_bucket_name="test-bucket",
+        s3_region_name="us-east-1",
+        s3_aws_access_key_id="test-access-key",
+        s3_aws_secret_access_key="test-secret-key",
+        max_concurrency=2,
+    )
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _get(url, headers):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _get_response({"url": url})
+
+    mock_async_client = MagicMock()
+    mock_async_client.get = _get
+    with patch(
+        "litellm.caching.s3_cache.get_async_httpx_client",
+        return_value=mock_async_client,
+    ):
+        results = await s3_cache.async_batch_get_cache(keys=[str(i) for i in range(6)])
+
+    assert [r["url"].rsplit("/", 1)[-1] for r in results] == [str(i) for i in range(6)]
+    assert max_in_flight == 2
+
+
+def test_s3_cache_custom_endpoint_uses_path_style():
+    s3_cache = S3Cache(
+        s3_bucket_name="test-bucket",
+        s3_region_name="us-east-1",
+        s3_endpoint_url="http://localhost:9000/",
+        s3_aws_access_key_id="test-access-key",
+        s3_aws_secret_access_key="test-secret-key",
+    )
+    mock_sync_client = MagicMock()
+    mock_sync_client.get.return_value = _get_response({"foo": "bar"})
+    with patch(
+        "litellm.caching.s3_cache._get_httpx_client", return_value=mock_sync_client
+    ):
+        assert s3_cache.get_cache("key") == {"foo": "bar"}
+
+    assert (
+        mock_sync_client.get.call_args.kwargs["url"]
+        == "http://localhost:9000/test-bucket/key"
+    )
+
+
+def test_s3_cache_set_cache_checks_response_status(s3_cache):
+    mock_sync_client = MagicMock()
+    mock_sync_client.put.return_value = _get_response(
+        {"error": "AccessDenied"}, status_code=403
+    )
+    with patch(
+        "litellm.caching.s3_cache._get_httpx_client", return_value=mock_sync_client
+    ), patch("litellm.caching.s3_cache.print_verbose") as mock_print_verbose:
+        s3_cache.set_cache("key", {"foo": "bar"})
+
+    mock_sync_client.put.assert_called_once()
+    assert "Got exception from S3" in mock_print_verbose.call_args.args[0]
+    assert "403" in mock_print_verbose.call_args.args[0]
@@ -36,6 +36,11 @@ def setup_and_teardown():
         print(f"Error reloading litellm.proxy.proxy_server: {e}")
 
     litellm.in_memory_llm_clients_cache.flush_cache()
+    from litellm.llms.custom_httpx.connection_pool_manager import (
+        http_connection_pool_manager,
+    )
+
+    http_connection_pool_manager.flush()
 
     import asyncio
 
@@ -0,0 +1,311 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm.integrations.custom_batch_logger as custom_batch_logger_module
+from litellm.integrations.custom_batch_logger import (
+    BoundedLogQueue,
+    CustomBatchLogger,
+)
+
+
+class MockBatchLogger(CustomBatchLogger):
+    def __init__(self, fail_times: int = 0, send_delay: float = 0, **kwargs):
+        self.sent_batches = []
+        self.fail_times = fail_times
+        self.send_delay = send_delay
+        super().__init__(flush_lock=asyncio.Lock(), **kwargs)
+
+    async def async_send_batch(self, *args, **kwargs):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            self.log_queue.clear()
+            raise Exception("sink is down")
+        self.sent_batches.append(list(self.log_queue))
+        self.log_queue.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(CustomBatchLogger, "_get_retry_delay", staticmethod(lambda attempt: 0))
+
+
+def test_bounded_log_queue_drops_new_events_when_full():
+    log_queue = BoundedLogQueue(max_size=2)
+    for i in range(5):
+        log_queue.append(i)
+
+    assert log_queue == [0, 1]
+    assert log_queue.dropped_events == 3
+    assert log_queue.first_event_time is not None
+    log_queue.clear()
+    assert log_queue.first_event_time is None
+
+
+def test_log_queue_assignment_stays_bounded():
+    logger = MockBatchLogger(max_queue_size=2)
+    logger.log_queue = [1, 2]
+    assert isinstance(logger.log_queue, BoundedLogQueue)
+    logger.log_queue.append(3)
+
+    assert logger.get_batch_metrics()["dropped_events"] == 1
+    logger.log_queue = []
+    # drops on the replaced queue are kept
+    assert logger.get_batch_metrics()["dropped_events"] == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_does_not_block_producers_during_slow_send():
+    logger = MockBatchLogger(send_delay=0.2)
+    logger.log_queue.append("event-1")
+
+    flush_task = asyncio.create_task(logger.flush_queue())
+    await asyncio.sleep(0.05)
+    # appended while the first batch is being sent - goes to the next batch
+    logger.log_queue.append("event-2")
+    assert logger.get_batch_metrics()["in_flight_flushes"] == 1
+    await flush_task
+
+    assert logger.sent_batches == [["event-1"]]
+    assert logger.log_queue == ["event-2"]
+    await logger.flush_queue()
+    assert logger.sent_batches == [["event-1"], ["event-2"]]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_failed_batch():
+    logger = MockBatchLogger(fail_times=1)
+    logger.log_queue.append("event-1")
+
+    await logger.flush_queue()
+
+    assert logger.sent_batches == [["event-1"]]
+    assert logger.get_batch_metrics()["failed_flushes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_spills_and_resends_failed_batch(monkeypatch, tmp_path):
+    monkeypatch.setattr(custom_batch_logger_module, "BATCH_LOGGER_SPILL_DIR", str(tmp_path))
+    monkeypatch.setattr(custom_batch_logger_module, "BATCH_LOGGER_MAX_FLUSH_RETRIES", 1)
+    logger = MockBatchLogger(fail_times=2)
+    logger.log_queue.append({"id": "event-1"})
+
+    await logger.flush_queue()
+
+    metrics = logger.get_batch_metrics()
+    assert metrics["failed_flushes"] == 1
+    assert metrics["spilled_events"] == 1
+    assert len(os.listdir(tmp_path / "MockBatchLogger")) == 1
+    assert logger.sent_batches == []
+
+    # the next successful flush re-sends the spilled batch
+    logger.log_queue.append({"id": "event-2"})
+    await logger.flush_queue()
+
+    assert logger.sent_batches == [[{"id": "event-2"}], [{"id": "event-1"}]]
+    assert logger.get_batch_metrics()["spilled_events"] == 0
+    assert os.listdir(tmp_path / "MockBatchLogger") == []
+
+
+@pytest.mark.asyncio
+async def test_get_batch_metrics():
+    logger = MockBatchLogger(max_queue_size=10)
+    metrics = logger.get_batch_metrics()
+    assert metrics["logger"] == "MockBatchLogger"
+    assert metrics["queue_size"] == 0
+    assert metrics["max_queue_size"] == 10
+    assert metrics["lag_seconds"] is None
+
+    logger.log_queue.append("event-1")
+    metrics = logger.get_batch_metrics()
+    assert metrics["queue_size"] == 1
+    assert metrics["lag_seconds"] is not None
+
+
+def test_bounded_log_queue_bounds_every_mutator():
+    log_queue = BoundedLogQueue(max_size=3)
+    log_queue.extend([1, 2])
+    log_queue += [3, 4]
+    log_queue.insert(0, 5)
+
+    assert isinstance(log_queue, BoundedLogQueue)
+    assert log_queue == [1, 2, 3]
+    assert log_queue.dropped_events == 2
+
+
+class PartialFailureBatchLogger(MockBatchLogger):
+    """Fails to send events it hasn't seen before, and reports failure instead of raising"""
+
+    def __init__(self, **kwargs):
+        self.seen_events = set()
+        super().__init__(**kwargs)
+
+    async def async_send_batch(self, *args, **kwargs):
+        failed_events = [e for e in self.log_queue if e not in self.seen_events]
+        self.seen_events.update(self.log_queue)
+        self.sent_batches.append(
+            [e for e in self.log_queue if e not in failed_events]
+        )
+        self.log_queue = failed_events
+        if failed_events:
+            return False
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_only_events_left_in_batch_when_send_returns_false():
+    logger = PartialFailureBatchLogger()
+    logger.seen_events.add("event-1")
+    logger.log_queue.extend(["event-1", "event-2"])
+
+    await logger.flush_queue()
+
+    assert logger.sent_batches == [["event-1"], ["event-2"]]
+    assert logger.get_batch_metrics()["failed_flushes"] == 0
+
+
+async def _spill_and_resend(logger, monkeypatch, tmp_path, event):
+    """Spill `event` via a failed flush, then re-send it after a successful flush. Returns (spilled lines, re-sent batch)"""
+    monkeypatch.setattr(custom_batch_logger_module, "BATCH_LOGGER_SPILL_DIR", str(tmp_path))
+    monkeypatch.setattr(custom_batch_logger_module, "BATCH_LOGGER_MAX_FLUSH_RETRIES", 0)
+    sent_batches = []
+
+    async def _async_send_batch(*args, **kwargs):
+        if not sent_batches and logger.log_queue == [event]:
+            sent_batches.append(None)
+            return False
+        sent_batches.append(list(logger.log_queue))
+
+    monkeypatch.setattr(logger, "async_send_batch", _async_send_batch)
+    logger.log_queue.append(event)
+    await logger.flush_queue()
+
+    spill_dir = tmp_path / type(logger).__name__
+    (spill_file,) = os.listdir(spill_dir)
+    spilled = (spill_dir / spill_file).read_text()
+
+    logger.log_queue.append("next-event")
+    await logger.flush_queue()
+    return spilled, sent_batches[-1]
+
+
+@pytest.mark.asyncio
+async def test_s3_v2_spilled_events_round_trip(monkeypatch, tmp_path):
+    from litellm.integrations.s3_v2 import S3Logger
+    from litellm.types.integrations.s3_v2 import s3BatchLoggingElement
+
+    logger = S3Logger(s3_bucket_name="test-bucket", s3_region_name="us-east-1")
+    event = s3BatchLoggingElement(
+        payload={"id": "chatcmpl-1", "response_cost": 0.1},
+        s3_object_key="2025-01-01/chatcmpl-1.json",
+        s3_object_download_filename="chatcmpl-1.json",
+    )
+
+    _, resent_batch = await _spill_and_resend(logger, monkeypatch, tmp_path, event)
+
+    assert resent_batch == [event]
+    assert isinstance(resent_batch[0], s3BatchLoggingElement)
+
+
+@pytest.mark.asyncio
+async def test_langsmith_spilled_events_do_not_store_api_key(monkeypatch, tmp_path):
+    from litellm.integrations.langsmith import LangsmithLogger
+    from litellm.types.integrations.langsmith import (
+        LangsmithCredentialsObject,
+        LangsmithQueueObject,
+    )
+
+    logger = LangsmithLogger(langsmith_api_key="default-secret-key")
+    event = LangsmithQueueObject(
+        data={"id": "run-1", "name": "LLMRun"},
+        credentials=LangsmithCredentialsObject(
+            LANGSMITH_API_KEY="team-secret-key",
+            LANGSMITH_PROJECT="team-project",
+            LANGSMITH_BASE_URL="https://api.smith.langchain.com",
+        ),
+    )
+
+    spilled, resent_batch = await _spill_and_resend(
+        logger, monkeypatch, tmp_path, event
+    )
+
+    assert "secret-key" not in spilled
+    assert resent_batch == [event]
+
+    # after a restart, only spilled events of the default api key can be re-sent
+    restarted_logger = LangsmithLogger(langsmith_api_key="default-secret-key")
+    spilled_event = logger._get_spillable_event(event)
+    assert restarted_logger._restore_spilled_event(spilled_event) is None
+    default_event = LangsmithQueueObject(
+        data=event["data"], credentials=logger.default_credentials
+    )
+    assert (
+        restarted_logger._restore_spilled_event(
+            logger._get_spillable_event(default_event)
+        )
+        == default_event
+    )
+
+
+@pytest.mark.asyncio
+async def test_gcs_bucket_spilled_events_only_keep_what_is_sent(monkeypatch, tmp_path):
+    from litellm.integrations.gcs_bucket.gcs_bucket import GCSBucketLogger
+
+    monkeypatch.setattr("litellm.proxy.proxy_server.premium_user", True)
+    logger = GCSBucketLogger(bucket_name="test-bucket")
+    event = {
+        "payload": {"id": "chatcmpl-1", "error_str": None},
+        "kwargs": {
+            "api_key": "sk-secret-key",
+            "standard_callback_dynamic_params": {
+                "gcs_bucket_name": "team-bucket",
+                "langfuse_secret_key": "secret-key",
+            },
+            "litellm_params": {"metadata": {"gcs_log_id": "log-1"}},
+        },
+        "response_obj": {"id": "chatcmpl-1", "choices": []},
+    }
+
+    spilled, resent_batch = await _spill_and_resend(
+        logger, monkeypatch, tmp_path, event
+    )
+
+    assert "secret-key" not in spilled
+    (resent_event,) = resent_batch
+    assert resent_event["payload"] == event["payload"]
+    assert resent_event["kwargs"]["standard_callback_dynamic_params"] == {
+        "gcs_bucket_name": "team-bucket"
+    }
+    assert logger._get_object_name(
+        resent_event["kwargs"], resent_event["payload"], resent_event["response_obj"]
+    ) == "log-1"
+
+
+@pytest.mark.asyncio
+async def test_s3_v2_async_send_batch_keeps_failed_uploads():
+    from unittest.mock import AsyncMock
+
+    from litellm.integrations.s3_v2 import S3Logger
+    from litellm.types.integrations.s3_v2 import s3BatchLoggingElement
+
+    logger = S3Logger(s3_bucket_name="test-bucket", s3_region_name="us-east-1")
+    events = [
+        s3BatchLoggingElement(
+            payload={"id": f"chatcmpl-{i}"},
+            s3_object_key=f"chatcmpl-{i}.json",
+            s3_object_download_filename=f"chatcmpl-{i}.json",
+        )
+        for i in range(2)
+    ]
+    logger.log_queue.extend(events)
+    logger.async_upload_data_to_s3 = AsyncMock(side_effect=[True, False])
+
+    assert await logger.async_send_batch() is False
+    assert logger.log_queue == [events[1]]
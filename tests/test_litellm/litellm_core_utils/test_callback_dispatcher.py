@@ -0,0 +1,199 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatcher,
+    CallbackDispatchLane,
+)
+from litellm.types.litellm_core_utils.callback_dispatcher import (
+    CallbackDispatchLaneName,
+)
+
+
+def test_callback_dispatch_lane_runs_callbacks():
+    lane = CallbackDispatchLane(name="test", max_workers=2)
+    results = []
+
+    for i in range(10):
+        assert lane.submit(results.append, i) is True
+    assert lane.wait_until_empty(timeout=5) is True
+
+    assert sorted(results) == list(range(10))
+    metrics = lane.get_metrics()
+    assert metrics["submitted"] == 10
+    assert metrics["completed"] == 10
+    assert metrics["queue_depth"] == 0
+    assert metrics["workers"] <= 2
+
+
+def test_callback_dispatch_lane_records_failures():
+    lane = CallbackDispatchLane(name="test", max_workers=1)
+
+    def _failing_callback():
+        raise ValueError("sink is down")
+
+    lane.submit(_failing_callback)
+    lane.submit(lambda: None)
+    assert lane.wait_until_empty(timeout=5) is True
+    assert lane.get_metrics()["failed"] == 1
+    assert lane.get_metrics()["completed"] == 1
+
+
+@pytest.mark.parametrize(
+    "queue_full_policy, expected_results",
+    [("drop_oldest", ["blocker", 1, 2]), ("drop_newest", ["blocker", 0, 1])],
+)
+def test_callback_dispatch_lane_drop_policies(queue_full_policy, expected_results):
+    lane = CallbackDispatchLane(
+        name="test",
+        max_workers=1,
+        max_queue_size=2,
+        queue_full_policy=queue_full_policy,
+    )
+    release = threading.Event()
+    results = []
+
+    def _slow_callback():
+        release.wait(timeout=5)
+        results.append("blocker")
+
+    lane.submit(_slow_callback)
+    # wait for the worker to pick up the slow callback
+    while lane.get_metrics()["queue_depth"] > 0:
+        time.sleep(0.01)
+
+    submitted = [lane.submit(results.append, i) for i in range(3)]
+    assert submitted == [True, True, queue_full_policy == "drop_oldest"]
+    assert lane.get_metrics()["dropped"] == 1
+
+    release.set()
+    assert lane.wait_until_empty(timeout=5) is True
+    assert results == expected_results
+
+
+def test_callback_dispatch_lane_block_policy_times_out():
+    lane = CallbackDispatchLane(
+        name="test",
+        max_workers=1,
+        max_queue_size=1,
+        queue_full_policy="block",
+        timeout=0.1,
+    )
+    release = threading.Event()
+    lane.submit(release.wait, 5)
+    while lane.get_metrics()["queue_depth"] > 0:
+        time.sleep(0.01)
+    lane.submit(lambda: None)
+
+    start_time = time.perf_counter()
+    assert lane.submit(lambda: None) is False
+    assert time.perf_counter() - start_time >= 0.1
+    assert lane.get_metrics()["dropped"] == 1
+    release.set()
+    assert lane.wait_until_empty(timeout=5) is True
+
+
+@pytest.mark.asyncio
+async def test_callback_dispatch_lane_block_policy_does_not_block_event_loop():
+    """
+    On the event loop thread, a full `block` lane drops the oldest task instead of waiting - even with no timeout
+    """
+    lane = CallbackDispatchLane(
+        name="test", max_workers=1, max_queue_size=1, queue_full_policy="block"
+    )
+    release = threading.Event()
+    results = []
+    lane.submit(release.wait, 5)
+    while lane.get_metrics()["queue_depth"] > 0:
+        time.sleep(0.01)
+    lane.submit(results.append, "oldest")
+
+    start_time = time.perf_counter()
+    assert lane.submit(results.append, "newest") is True
+    assert time.perf_counter() - start_time < 1
+    assert lane.get_metrics()["dropped"] == 1
+
+    release.set()
+    assert lane.wait_until_empty(timeout=5) is True
+    assert results == ["newest"]
+
+
+def test_callback_dispatch_lane_drops_stale_callbacks():
+    lane = CallbackDispatchLane(name="test", max_workers=1, timeout=0.1)
+    release = threading.Event()
+    results = []
+
+    lane.submit(release.wait, 5)
+    lane.submit(results.append, "stale")
+    time.sleep(0.2)
+    release.set()
+
+    assert lane.wait_until_empty(timeout=5) is True
+    assert results == []
+    assert lane.get_metrics()["dropped"] == 1
+
+
+def test_callback_dispatch_lane_invalid_policy():
+    with pytest.raises(ValueError):
+        CallbackDispatchLane(name="test", queue_full_policy="drop_all")  # type: ignore
+
+
+@pytest.mark.parametrize("max_queue_size, max_workers", [(0, 1), (1, 0)])
+def test_callback_dispatch_lane_invalid_sizes(max_queue_size, max_workers):
+    with pytest.raises(ValueError):
+        CallbackDispatchLane(
+            name="test", max_queue_size=max_queue_size, max_workers=max_workers
+        )
+
+
+def test_callback_dispatcher_streaming_logging_lane_settings_override_default():
+    original_callback_dispatch_settings = litellm.callback_dispatch_settings
+    litellm.callback_dispatch_settings = {
+        "streaming_logging": {"queue_full_policy": "drop_newest", "max_workers": 2}
+    }
+    try:
+        lane = CallbackDispatcher().get_lane(CallbackDispatchLaneName.STREAMING_LOGGING)
+        assert lane.queue_full_policy == "drop_newest"
+        assert lane.max_workers == 2
+    finally:
+        litellm.callback_dispatch_settings = original_callback_dispatch_settings
+
+
+def test_callback_dispatcher_lane_settings():
+    original_callback_dispatch_settings = litellm.callback_dispatch_settings
+    litellm.callback_dispatch_settings = {
+        "success_handler": {"max_workers": 3, "queue_full_policy": "drop_newest"}
+    }
+    try:
+        dispatcher = CallbackDispatcher()
+        lane = dispatcher.get_lane(CallbackDispatchLaneName.SUCCESS_HANDLER)
+        assert lane is dispatcher.get_lane("success_handler")
+        assert lane.max_workers == 3
+        assert lane.queue_full_policy == "drop_newest"
+
+        # lanes without settings use the defaults - streaming logging applies backpressure instead of dropping
+        assert dispatcher.get_lane("streaming_logging").queue_full_policy == "block"
+        assert dispatcher.get_lane("pass_through_logging").queue_full_policy == (
+            "drop_oldest"
+        )
+
+        results = []
+        dispatcher.submit(CallbackDispatchLaneName.SUCCESS_HANDLER, results.append, 1)
+        assert dispatcher.wait_until_empty(timeout=5) is True
+        assert results == [1]
+        assert [metrics["lane"] for metrics in dispatcher.get_metrics()] == [
+            "success_handler",
+            "streaming_logging",
+            "pass_through_logging",
+        ]
+    finally:
+        litellm.callback_dispatch_settings = original_callback_dispatch_settings
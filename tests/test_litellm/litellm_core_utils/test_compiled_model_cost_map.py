@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.compiled_model_cost_map import (
+    CompiledModelCostMap,
+    get_model_cost_provider_items,
+    load_compiled_model_cost_map,
+)
+
+SAMPLE_MODEL_COST_MAP = {
+    "gpt-4o": {
+        "max_tokens": 16384,
+        "input_cost_per_token": 2.5e-06,
+        "output_cost_per_token": 1e-05,
+        "litellm_provider": "openai",
+        "mode": "chat",
+        "supports_vision": True,
+    },
+    "claude-3-5-sonnet-20240620": {
+        "max_tokens": 8192,
+        "input_cost_per_token": 3e-06,
+        "output_cost_per_token": 1.5e-05,
+        "litellm_provider": "anthropic",
+        "mode": "chat",
+    },
+    "sample_spec": {"max_tokens": "set to max_output_tokens if provider specifies it"},
+}
+
+
+@pytest.fixture
+def compiled_model_cost_map(tmp_path) -> CompiledModelCostMap:
+    return load_compiled_model_cost_map(
+        source=json.dumps(SAMPLE_MODEL_COST_MAP).encode("utf-8"),
+        cache_dir=str(tmp_path),
+    )
+
+
+def test_compiled_model_cost_map_matches_source(compiled_model_cost_map):
+    assert len(compiled_model_cost_map) == len(SAMPLE_MODEL_COST_MAP)
+    assert list(compiled_model_cost_map) == list(SAMPLE_MODEL_COST_MAP)
+    assert dict(compiled_model_cost_map) == SAMPLE_MODEL_COST_MAP
+    assert "gpt-4o" in compiled_model_cost_map
+    assert "gpt-5" not in compiled_model_cost_map
+    assert compiled_model_cost_map.get("gpt-5") is None
+    with pytest.raises(KeyError):
+        compiled_model_cost_map["gpt-5"]
+
+
+def test_compiled_model_cost_map_parses_lazily(compiled_model_cost_map):
+    """
+    Entries are only parsed on first access, and memoised
+    """
+    assert compiled_model_cost_map._entries == {}
+    entry = compiled_model_cost_map["gpt-4o"]
+    assert list(compiled_model_cost_map._entries) == ["gpt-4o"]
+    assert compiled_model_cost_map["gpt-4o"] is entry
+
+
+def test_compiled_model_cost_map_provider_items_without_parsing(
+    compiled_model_cost_map,
+):
+    provider_items = dict(get_model_cost_provider_items(compiled_model_cost_map))
+    assert provider_items["gpt-4o"] == {"litellm_provider": "openai", "mode": "chat"}
+    assert provider_items["sample_spec"] == {"litellm_provider": None, "mode": None}
+    assert compiled_model_cost_map._entries == {}
+
+
+def test_compiled_model_cost_map_writes(compiled_model_cost_map):
+    """
+    register_model-style writes are kept in memory, on top of the compiled file
+    """
+    compiled_model_cost_map.setdefault("gpt-4o", {}).update(
+        {"input_cost_per_token": 1e-06}
+    )
+    assert compiled_model_cost_map["gpt-4o"]["input_cost_per_token"] == 1e-06
+
+    compiled_model_cost_map["my-custom-model"] = {
+        "litellm_provider": "openai",
+        "mode": "chat",
+    }
+    assert "my-custom-model" in compiled_model_cost_map
+    assert len(compiled_model_cost_map) == 4
+
+    del compiled_model_cost_map["claude-3-5-sonnet-20240620"]
+    assert "claude-3-5-sonnet-20240620" not in compiled_model_cost_map
+    assert len(compiled_model_cost_map) == 3
+    assert list(compiled_model_cost_map) == [
+        "gpt-4o",
+        "sample_spec",
+        "my-custom-model",
+    ]
+    assert dict(get_model_cost_provider_items(compiled_model_cost_map))[
+        "my-custom-model"
+    ] == {"litellm_provider": "openai", "mode": "chat"}
+
+
+def test_load_compiled_model_cost_map_reuses_compiled_file(tmp_path):
+    source = json.dumps(SAMPLE_MODEL_COST_MAP).encode("utf-8")
+    first = load_compiled_model_cost_map(source=source, cache_dir=str(tmp_path))
+    second = load_compiled_model_cost_map(source=source, cache_dir=str(tmp_path))
+    assert first.path == second.path
+    assert len(os.listdir(tmp_path)) == 1
+
+    # a changed model cost map is compiled to a new file
+    changed = load_compiled_model_cost_map(
+        source=json.dumps({"gpt-4o": SAMPLE_MODEL_COST_MAP["gpt-4o"]}).encode("utf-8"),
+        cache_dir=str(tmp_path),
+    )
+    assert changed.path != first.path
+    assert len(changed) == 1
+
+
+def test_backup_model_cost_map_compiles(tmp_path):
+    """
+    The bundled model cost map should round trip through the compiled format
+    """
+    import importlib.resources
+
+    with importlib.resources.open_binary(
+        "litellm", "model_prices_and_context_window_backup.json"
+    ) as f:
+        source = f.read()
+
+    compiled = load_compiled_model_cost_map(source=source, cache_dir=str(tmp_path))
+    assert dict(compiled) == json.loads(source)
+
+
+@pytest.mark.parametrize("remote_body", [b'{"gpt-4o": {"max_tok', b"[]"])
+def test_bad_remote_model_cost_map_falls_back_to_backup(
+    tmp_path, monkeypatch, remote_body
+):
+    """
+    A partial / invalid remote model cost map should fall back to the bundled map, not fail to load
+    """
+    from unittest.mock import MagicMock, patch
+
+    from litellm.litellm_core_utils.get_model_cost_map import (
+        get_compiled_model_cost_map,
+    )
+
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+    monkeypatch.setenv("LITELLM_MODEL_COST_MAP_CACHE_DIR", str(tmp_path))
+    with patch(
+        "litellm.litellm_core_utils.get_model_cost_map.httpx.get",
+        return_value=MagicMock(content=remote_body),
+    ):
+        compiled = get_compiled_model_cost_map(url="https://example.com/map.json")
+    assert "gpt-4o" in compiled
+    assert compiled["gpt-4o"]["litellm_provider"] == "openai"
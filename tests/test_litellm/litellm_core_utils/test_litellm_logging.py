@@ -394,3 +394,220 @@ def test_get_masked_values():
         sensitive_object, unmasked_length=4, number_of_asterisks=4
     )
     assert masked_values["presidio_anonymizer_api_base"] is None
+
+
+def test_get_standard_logging_payload_fields(logging_obj, monkeypatch):
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.litellm_logging import (
+        get_standard_logging_payload_fields,
+    )
+
+    class CostLogger(CustomLogger):
+        standard_logging_payload_fields = {"model_group", "response_cost"}
+
+    class TokenLogger(CustomLogger):
+        standard_logging_payload_fields = {"model_group", "total_tokens"}
+
+    assert get_standard_logging_payload_fields(
+        callbacks=[CostLogger(), TokenLogger()]
+    ) == {"model_group", "response_cost", "total_tokens"}
+    class UndeclaredLogger(CustomLogger):
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            pass
+
+    # callbacks that don't declare their fields get the full payload
+    assert (
+        get_standard_logging_payload_fields(
+            callbacks=[CostLogger(), UndeclaredLogger()]
+        )
+        is None
+    )
+    # callbacks that only implement hooks read no fields
+    assert get_standard_logging_payload_fields(
+        callbacks=[CostLogger(), CustomLogger()]
+    ) == {"model_group", "response_cost"}
+    assert (
+        get_standard_logging_payload_fields(callbacks=[CostLogger(), "langfuse"])
+        is None
+    )
+
+    monkeypatch.setattr(litellm, "callbacks", [CostLogger()])
+    monkeypatch.setattr(litellm, "success_callback", [])
+    monkeypatch.setattr(litellm, "_async_success_callback", [TokenLogger()])
+    monkeypatch.setattr(litellm, "failure_callback", ["langfuse"])
+    assert logging_obj._get_standard_logging_payload_fields(status="success") == {
+        "model_group",
+        "response_cost",
+        "total_tokens",
+    }
+    assert logging_obj._get_standard_logging_payload_fields(status="failure") is None
+
+
+def test_get_standard_logging_object_payload_with_payload_fields(logging_obj):
+    from datetime import datetime
+
+    from litellm.litellm_core_utils.litellm_logging import (
+        get_standard_logging_object_payload,
+    )
+    from litellm.types.utils import ModelResponse, Usage
+
+    response = ModelResponse(
+        id="chatcmpl-123",
+        model="gpt-4o",
+        choices=[{"message": {"role": "assistant", "content": "hi"}}],
+        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+    kwargs = {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": "Hey"}],
+        "optional_params": {"temperature": 0.2},
+        "litellm_params": {"metadata": {"model_group": "gpt-4o-group"}},
+        "response_cost": 0.001,
+    }
+    start_time = datetime.now()
+
+    full_payload = get_standard_logging_object_payload(
+        kwargs=kwargs,
+        init_response_obj=response,
+        start_time=start_time,
+        end_time=start_time,
+        logging_obj=logging_obj,
+        status="success",
+    )
+    with patch.object(response, "model_dump") as mock_model_dump:
+        payload = get_standard_logging_object_payload(
+            kwargs=kwargs,
+            init_response_obj=response,
+            start_time=start_time,
+            end_time=start_time,
+            logging_obj=logging_obj,
+            status="success",
+            payload_fields={"model_group", "response_cost", "total_tokens"},
+        )
+    mock_model_dump.assert_not_called()
+
+    assert payload is not None and full_payload is not None
+    # the payload keeps its shape
+    assert payload.keys() == full_payload.keys()
+    for field in [
+        "id",
+        "model_group",
+        "response_cost",
+        "total_tokens",
+        "prompt_tokens",
+    ]:
+        assert payload[field] == full_payload[field]
+    assert full_payload["messages"] is kwargs["messages"]
+    assert full_payload["response"]["id"] == "chatcmpl-123"
+    assert full_payload["model_parameters"] == {"temperature": 0.2}
+    assert payload["messages"] is None
+    assert payload["response"] is None
+    assert payload["model_parameters"] == {}
+    assert payload["model_map_information"]["model_map_value"] is None
+
+
+@pytest.mark.parametrize("store_prompts_in_spend_logs", [False, True])
+def test_proxy_db_logger_payload_fields_projection(
+    logging_obj, monkeypatch, store_prompts_in_spend_logs
+):
+    """
+    When spend tracking is the only callback, the payload is built without the fields it doesn't read.
+    """
+    import litellm
+    import litellm.proxy.proxy_server as proxy_server
+    from litellm.proxy.hooks.proxy_track_cost_callback import _ProxyDBLogger
+    from litellm.types.utils import ModelResponse
+
+    monkeypatch.setattr(
+        proxy_server,
+        "general_settings",
+        {"store_prompts_in_spend_logs": store_prompts_in_spend_logs},
+    )
+    monkeypatch.setattr(litellm, "callbacks", [_ProxyDBLogger()])
+    monkeypatch.setattr(litellm, "success_callback", [])
+    monkeypatch.setattr(litellm, "_async_success_callback", [])
+
+    logging_obj.stream = False
+    logging_obj.model_call_details["litellm_params"] = {}
+    logging_obj._success_handler_helper_fn(
+        result=ModelResponse(id="chatcmpl-123", model="gpt-4o")
+    )
+    payload = logging_obj.model_call_details["standard_logging_object"]
+
+    assert payload["id"] == "chatcmpl-123"
+    assert payload["messages"] is None
+    assert payload["model_parameters"] == {}
+    if store_prompts_in_spend_logs:
+        assert payload["response"]["id"] == "chatcmpl-123"
+    else:
+        assert payload["response"] is None
+
+
+def test_get_standard_logging_payload_fields_with_router_callbacks(
+    logging_obj, monkeypatch
+):
+    """
+    The callbacks a Router registers declare their fields - so the payload is still projected when a Router is used
+    """
+    import litellm
+    from litellm import Router
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class CostLogger(CustomLogger):
+        standard_logging_payload_fields = {"response_cost"}
+
+    for callback_list in [
+        "callbacks",
+        "success_callback",
+        "_async_success_callback",
+        "failure_callback",
+        "_async_failure_callback",
+    ]:
+        monkeypatch.setattr(litellm, callback_list, [])
+    litellm.logging_callback_manager.add_litellm_callback(CostLogger())
+
+    Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "sk-test"},
+            }
+        ],
+        optional_pre_call_checks=["forward_client_headers_by_model_group"],
+    )
+
+    expected_fields = {"model_group", "model_id", "response_cost", "total_tokens"}
+    assert logging_obj._get_standard_logging_payload_fields(status="success") == (
+        expected_fields
+    )
+    assert logging_obj._get_standard_logging_payload_fields(status="failure") == (
+        expected_fields
+    )
+
+
+def test_get_standard_logging_payload_fields_resolves_string_callbacks():
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.litellm_logging import (
+        get_standard_logging_payload_fields,
+    )
+
+    class MetricsLogger(CustomLogger):
+        standard_logging_payload_fields = {"model_group", "total_tokens"}
+
+    with patch(
+        "litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class",
+        return_value=MetricsLogger(),
+    ):
+        assert get_standard_logging_payload_fields(callbacks=["prometheus"]) == {
+            "model_group",
+            "total_tokens",
+        }
+    # not initialized yet - full payload
+    with patch(
+        "litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class",
+        return_value=None,
+    ):
+        assert get_standard_logging_payload_fields(callbacks=["prometheus"]) is None
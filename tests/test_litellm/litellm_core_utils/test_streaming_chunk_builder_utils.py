@@ -8,7 +8,11 @@ sys.path.insert(
     0, os.path.abspath("../../..")
 )  # Adds the parent directory to the system path
 
-from litellm.litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+import litellm
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    ChunkProcessor,
+    StreamingChunkAccumulator,
+)
 from litellm.types.utils import (
     ChatCompletionDeltaToolCall,
     ChatCompletionMessageToolCall,
@@ -243,3 +247,86 @@ def test_cache_read_input_tokens_retained():
     assert usage.cache_creation_input_tokens == 4
     assert usage.cache_read_input_tokens == 11775
     assert usage.prompt_tokens_details.cached_tokens == 11775
+
+
+def _make_stream_chunk(
+    delta: Delta, finish_reason=None, usage=None
+) -> ModelResponseStream:
+    chunk = ModelResponseStream(
+        id="chatcmpl-123",
+        created=1745513206,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+        choices=[StreamingChoices(finish_reason=finish_reason, index=0, delta=delta)],
+    )
+    if usage is not None:
+        setattr(chunk, "usage", usage)
+    return chunk
+
+
+def test_streaming_chunk_accumulator_matches_stream_chunk_builder():
+    """
+    Building the response from the incremental accumulator should give the same result as replaying the chunks
+    """
+    chunks = [
+        _make_stream_chunk(Delta(role="assistant", reasoning_content="Let me ")),
+        _make_stream_chunk(Delta(reasoning_content="think.")),
+        _make_stream_chunk(Delta(content="Hello")),
+        _make_stream_chunk(Delta(content=" world")),
+        _make_stream_chunk(
+            Delta(
+                tool_calls=[
+                    ChatCompletionDeltaToolCall(
+                        id="call_1",
+                        function=Function(
+                            arguments='{"location": ', name="get_weather"
+                        ),
+                        type="function",
+                        index=0,
+                    )
+                ]
+            )
+        ),
+        _make_stream_chunk(
+            Delta(
+                tool_calls=[
+                    ChatCompletionDeltaToolCall(
+                        function=Function(arguments='"Paris"}'),
+                        index=0,
+                    )
+                ]
+            )
+        ),
+        _make_stream_chunk(
+            Delta(content=None),
+            finish_reason="tool_calls",
+            usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+        ),
+    ]
+
+    accumulator = StreamingChunkAccumulator()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+
+    expected = litellm.stream_chunk_builder(chunks=chunks)
+    result = litellm.stream_chunk_builder(chunks=chunks, chunk_accumulator=accumulator)
+
+    assert result.choices[0].message.content == "Hello world"
+    assert result.choices[0].message.reasoning_content == "Let me think."
+    assert result.choices[0].message.tool_calls[0].function.arguments == (
+        '{"location": "Paris"}'
+    )
+    assert result.choices[0].finish_reason == "tool_calls"
+    assert result.usage.prompt_tokens == 10
+    assert result.usage.completion_tokens == 20
+
+    result_dict = result.model_dump()
+    expected_dict = expected.model_dump()
+    for response_dict in (result_dict, expected_dict):
+        response_dict.pop("created")
+    assert result_dict == expected_dict
+
+
+def test_streaming_chunk_accumulator_empty():
+    accumulator = StreamingChunkAccumulator()
+    assert accumulator.build_model_response() is None
@@ -813,3 +813,104 @@ def test_optional_combine_thinking_block_with_none_content(
     assert final_response.choices[0].delta.content == "</think>The answer is 42"
     assert initialized_custom_stream_wrapper.sent_last_thinking_block is True
     assert not hasattr(final_response.choices[0].delta, "reasoning_content")
+
+
+def _get_bedrock_stream_wrapper(chunks: list) -> CustomStreamWrapper:
+    return CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=chunks),
+        model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+        custom_llm_provider="bedrock",
+        logging_obj=Logging(
+            model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+            messages=[{"role": "user", "content": "Hey"}],
+            stream=True,
+            call_type="completion",
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_handler_removes_usage_without_rebuilding_chunk():
+    usage = Usage(prompt_tokens=10, completion_tokens=3, total_tokens=13)
+    usage_chunk = ModelResponseStream(
+        choices=[StreamingChoices(index=0, delta=Delta(content=" there"))],
+        usage=usage,
+    )
+    response = _get_bedrock_stream_wrapper(
+        chunks=[bedrock_chunks[0], usage_chunk, bedrock_chunks[2]]
+    )
+
+    with patch.object(
+        response, "model_response_creator", wraps=response.model_response_creator
+    ) as mock_model_response_creator:
+        returned_chunks = [chunk async for chunk in response]
+
+    # one model response per provider chunk (in chunk_creator) + the final chunk, no rebuild to drop usage
+    assert mock_model_response_creator.call_count == 4
+    assert not any(hasattr(chunk, "usage") for chunk in returned_chunks)
+    assert returned_chunks[1].choices[0].delta.content == " there"
+    # the folded in chunk keeps its usage, for calculating the total usage
+    assert response._calculate_total_usage().total_tokens == 13
+    assert not hasattr(response, "chunks")
+    assert response.response_uptil_now == "I'm Claude there"
+
+
+def test_streaming_handler_runs_post_call_rules_on_changed_response():
+    checked_inputs = []
+
+    def _post_call_rule(input: str):
+        checked_inputs.append(input)
+        return "Claude, an AI" not in input
+
+    empty_chunk = bedrock_chunks[2].model_copy(deep=True)
+    empty_chunk.choices[0].finish_reason = None
+    response = _get_bedrock_stream_wrapper(
+        chunks=[bedrock_chunks[0], empty_chunk, bedrock_chunks[1]]
+    )
+
+    with patch.object(litellm, "post_call_rules", [_post_call_rule]):
+        with pytest.raises(litellm.APIResponseValidationError):
+            for _ in response:
+                pass
+
+    # the empty chunk didn't change the response - the rule isn't re-run on it
+    assert checked_inputs == ["I'm Claude", "I'm Claude, an AI"]
+
+
+def test_streaming_handler_skips_post_call_rules_if_none_set():
+    response = _get_bedrock_stream_wrapper(chunks=bedrock_chunks)
+
+    with patch.object(
+        response.rules, "post_call_rules", wraps=response.rules.post_call_rules
+    ) as mock_post_call_rules:
+        for _ in response:
+            pass
+
+    mock_post_call_rules.assert_not_called()
+    assert response.response_uptil_now == "I'm Claude, an AI"
+
+
+def test_streaming_handler_accumulation_error_does_not_break_stream():
+    bad_chunk = ModelResponseStream(
+        choices=[
+            StreamingChoices(
+                index=0,
+                delta=Delta(content=" there", thinking_blocks=["not-a-dict"]),
+            )
+        ],
+    )
+    response = _get_bedrock_stream_wrapper(
+        chunks=[bedrock_chunks[0], bad_chunk, bedrock_chunks[2]]
+    )
+
+    returned_chunks = [chunk for chunk in response]
+
+    assert len(returned_chunks) == 3
+    assert response.response_uptil_now == "I'm Claude there"
+    # only the logged response is degraded
+    complete_response = response._build_complete_streaming_response()
+    assert complete_response is not None
+    assert complete_response.choices[0].message.content == "I'm Claude there"
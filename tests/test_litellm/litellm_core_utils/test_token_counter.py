@@ -630,3 +630,49 @@ def test_bad_input_token_counter(model, messages):
         messages=messages,
         default_token_count=1000,
     )
+
+
+def test_token_counter_caches_per_message_counts():
+    """
+    Only the new turns of a multi-turn conversation should be tokenized
+    """
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    token_counter_module.token_counter_cache.flush_cache()
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "What is the capital of France?"},
+    ]
+    uncached_count = token_counter_new(model="gpt-3.5-turbo", messages=messages)
+
+    messages = messages + [
+        {"role": "assistant", "content": "The capital of France is Paris."},
+        {"role": "user", "content": "And of Germany?"},
+    ]
+    with patch.object(
+        token_counter_module,
+        "_count_message",
+        wraps=token_counter_module._count_message,
+    ) as mock_count_message:
+        cached_count = token_counter_new(model="gpt-3.5-turbo", messages=messages)
+    assert mock_count_message.call_count == 2
+
+    token_counter_module.token_counter_cache.flush_cache()
+    assert cached_count == token_counter_new(model="gpt-3.5-turbo", messages=messages)
+    assert cached_count > uncached_count
+
+
+def test_token_counter_batch_count_matches_count():
+    """
+    Batched encoding should return the same counts as encoding one string at a time
+    """
+    from litellm.litellm_core_utils.token_counter import (
+        _get_batch_count_function,
+        _get_count_function,
+    )
+
+    texts = ["hello world", "The capital of France is Paris.", "", "🙃 emoji"]
+    for model in ["gpt-3.5-turbo", "gpt-4o", "claude-2"]:
+        count_function = _get_count_function(model)
+        batch_count_function = _get_batch_count_function(model)
+        assert batch_count_function(texts) == [count_function(t) for t in texts]
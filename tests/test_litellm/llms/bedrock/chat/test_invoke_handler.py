@@ -167,3 +167,85 @@ def test_transform_tool_calls_index_with_optional_arg_func():
         tool_call_hunk_dict = tool_call_hunk.model_dump()
         for tool_call in tool_call_hunk_dict["choices"][0]["delta"]["tool_calls"]:
             assert tool_call["index"] == 0
+
+
+def test_check_empty_tool_call_args():
+    decoder = AWSEventStreamDecoder(model="test")
+    assert decoder.check_empty_tool_call_args() is False
+
+    decoder.converse_chunk_parser(
+        {
+            "start": {"toolUse": {"toolUseId": "tooluse_1", "name": "get_weather"}},
+            "contentBlockIndex": 1,
+        }
+    )
+    assert decoder.check_empty_tool_call_args() is False  # no deltas yet
+
+    decoder.converse_chunk_parser(
+        {"delta": {"toolUse": {"input": ""}}, "contentBlockIndex": 1}
+    )
+    assert decoder.check_empty_tool_call_args() is True
+
+    decoder.converse_chunk_parser(
+        {
+            "delta": {"toolUse": {"input": '{"location": "Boston"}'}},
+            "contentBlockIndex": 1,
+        }
+    )
+    assert decoder.check_empty_tool_call_args() is False
+
+    # text block
+    decoder.converse_chunk_parser({"start": {}, "contentBlockIndex": 2})
+    decoder.converse_chunk_parser({"delta": {"text": ""}, "contentBlockIndex": 2})
+    assert decoder.check_empty_tool_call_args() is False
+
+
+def test_iter_bytes_invoke_chunk_events():
+    import base64
+    import struct
+    import zlib
+
+    def _frame(headers: dict, payload: bytes) -> bytes:
+        encoded_headers = b""
+        for name, value in headers.items():
+            encoded_headers += (
+                struct.pack("!B", len(name))
+                + name.encode()
+                + struct.pack("!BH", 7, len(value))
+                + value.encode()
+            )
+        prelude = struct.pack(
+            "!II", 12 + len(encoded_headers) + len(payload) + 4, len(encoded_headers)
+        )
+        prelude += struct.pack("!I", zlib.crc32(prelude))
+        message = prelude + encoded_headers + payload
+        return message + struct.pack("!I", zlib.crc32(message))
+
+    model_chunk = {"outputText": "Hello world", "completionReason": "FINISH"}
+    stream = _frame(
+        headers={":event-type": "chunk", ":message-type": "event"},
+        payload=json.dumps(
+            {"bytes": base64.b64encode(json.dumps(model_chunk).encode()).decode()}
+        ).encode(),
+    )
+
+    decoder = AWSEventStreamDecoder(model="amazon.titan-text-express-v1")
+    with patch.object(
+        decoder, "_chunk_parser", side_effect=lambda chunk_data: chunk_data
+    ):
+        chunks = list(decoder.iter_bytes(iter([stream[:10], stream[10:]])))
+    assert chunks == [model_chunk]
+
+    error_stream = _frame(
+        headers={
+            ":message-type": "exception",
+            ":exception-type": "throttlingException",
+        },
+        payload=b'{"message": "Too many requests"}',
+    )
+    from litellm.llms.bedrock.common_utils import BedrockError
+
+    with pytest.raises(BedrockError) as e:
+        list(decoder.iter_bytes(iter([error_stream])))
+    assert e.value.status_code == 400
+    assert "throttlingException" in e.value.message
@@ -19,3 +19,74 @@ def test_deepseek_cris():
         model="bedrock/us.deepseek.r1-v1:0"
     )
     assert bedrock_route == "converse"
+
+
+def _encode_event_stream_frame(headers: dict, payload: bytes) -> bytes:
+    import struct
+    import zlib
+
+    encoded_headers = b""
+    for name, value in headers.items():
+        encoded_value = value.encode("utf-8")
+        encoded_headers += (
+            struct.pack("!B", len(name))
+            + name.encode("utf-8")
+            + struct.pack("!BH", 7, len(encoded_value))
+            + encoded_value
+        )
+    total_length = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack("!II", total_length, len(encoded_headers))
+    prelude += struct.pack("!I", zlib.crc32(prelude))
+    message = prelude + encoded_headers + payload
+    return message + struct.pack("!I", zlib.crc32(message))
+
+
+def test_aws_event_stream_frame_decoder_matches_botocore():
+    from botocore.eventstream import EventStreamBuffer
+
+    from litellm.llms.bedrock.common_utils import AWSEventStreamFrameDecoder
+
+    frames = [
+        _encode_event_stream_frame(
+            headers={
+                ":event-type": "contentBlockDelta",
+                ":content-type": "application/json",
+                ":message-type": "event",
+            },
+            payload=json.dumps(
+                {"contentBlockIndex": 0, "delta": {"text": "hello {}".format(i)}}
+            ).encode(),
+        )
+        for i in range(5)
+    ]
+    stream = b"".join(frames)
+
+    event_stream_buffer = EventStreamBuffer()
+    event_stream_buffer.add_data(stream)
+    expected = [(event.headers, event.payload) for event in event_stream_buffer]
+
+    # frames split across arbitrary chunk boundaries
+    decoder = AWSEventStreamFrameDecoder()
+    decoded = []
+    for i in range(0, len(stream), 7):
+        decoded.extend(decoder.decode(stream[i : i + 7]))
+
+    assert decoded == expected
+    assert len(decoder._buffer) == 0
+
+
+def test_aws_event_stream_frame_decoder_checksum_mismatch():
+    from litellm.llms.bedrock.common_utils import (
+        AWSEventStreamFrameDecoder,
+        BedrockError,
+    )
+
+    frame = bytearray(
+        _encode_event_stream_frame(
+            headers={":message-type": "event"}, payload=b'{"delta": {}}'
+        )
+    )
+    frame[-6] ^= 0xFF  # corrupt the payload
+
+    with pytest.raises(BedrockError, match="message checksum mismatch"):
+        AWSEventStreamFrameDecoder().decode(bytes(frame))
@@ -0,0 +1,243 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.llms.custom_httpx.aiohttp_transport import LiteLLMAiohttpTransport
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    HTTPConnectionPoolManager,
+    HTTPPoolStats,
+)
+from litellm.llms.custom_httpx.http_handler import (
+    AsyncHTTPHandler,
+    HTTPHandler,
+    _get_httpx_limits,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_http_pool_settings():
+    original_http_pool_settings = litellm.http_pool_settings
+    yield
+    litellm.http_pool_settings = original_http_pool_settings
+
+
+@pytest.mark.asyncio
+async def test_each_provider_gets_its_own_pool():
+    pool_manager = HTTPConnectionPoolManager()
+
+    openai_client = pool_manager.get_async_client(
+        llm_provider=litellm.LlmProviders.OPENAI, params={"ssl_verify": None}
+    )
+    anthropic_client = pool_manager.get_async_client(
+        llm_provider="anthropic", params={"ssl_verify": None}
+    )
+    assert openai_client is not anthropic_client
+    assert (
+        pool_manager.get_async_client(
+            llm_provider="openai", params={"ssl_verify": None}
+        )
+        is openai_client
+    )
+    assert len(pool_manager.pools) == 2
+    assert [
+        metrics["llm_providers"] for metrics in pool_manager.get_pool_metrics()
+    ] == [
+        ["anthropic"],
+        ["openai"],
+    ]
+
+    # different connection settings get their own pool
+    timeout_client = pool_manager.get_async_client(
+        llm_provider="anthropic", params={"timeout": httpx.Timeout(30.0)}
+    )
+    assert timeout_client is not anthropic_client
+    assert len(pool_manager.pools) == 3
+
+
+@pytest.mark.asyncio
+async def test_per_provider_pool_settings():
+    litellm.http_pool_settings = {
+        "default": {"max_connections": 50, "keepalive_expiry": 30},
+        "anthropic": {"max_connections": 10},
+    }
+    pool_manager = HTTPConnectionPoolManager()
+
+    assert pool_manager.get_pool_settings("anthropic") == {
+        "max_connections": 10,
+        "keepalive_expiry": 30,
+    }
+    assert pool_manager.get_pool_settings("openai") == {
+        "max_connections": 50,
+        "keepalive_expiry": 30,
+    }
+
+    anthropic_client = pool_manager.get_async_client(llm_provider="anthropic")
+    openai_client = pool_manager.get_async_client(llm_provider="openai")
+    assert anthropic_client is not openai_client
+
+    transport = anthropic_client.client._transport
+    assert isinstance(transport, LiteLLMAiohttpTransport)
+    session = transport._get_valid_client_session()
+    assert session.connector.limit == 10
+    await anthropic_client.close()
+    await openai_client.close()
+
+
+def test_get_httpx_limits():
+    limits = _get_httpx_limits(concurrent_limit=100)
+    assert limits.max_connections == 100
+    assert limits.max_keepalive_connections == 100
+
+    limits = _get_httpx_limits(
+        concurrent_limit=100,
+        pool_settings={"max_connections": 20, "keepalive_expiry": 60},
+    )
+    assert limits.max_connections == 20
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 60
+
+
+def test_sync_pools_are_bounded():
+    pool_manager = HTTPConnectionPoolManager(max_pools=2)
+
+    first_client = pool_manager.get_sync_client(params={"timeout": 1})
+    pool_manager.get_sync_client(params={"timeout": 2})
+    assert pool_manager.get_sync_client(params={"timeout": 1}) is first_client
+
+    # the least recently used pool is evicted - but not closed, callers may still hold its client
+    pool_manager.get_sync_client(params={"timeout": 3})
+    assert len(pool_manager.pools) == 2
+    pool_manager.get_sync_client(params={"timeout": 4})
+    assert len(pool_manager.pools) == 2
+    assert first_client.client.is_closed is False
+    new_client = pool_manager.get_sync_client(params={"timeout": 1})
+    assert isinstance(new_client, HTTPHandler)
+    assert new_client is not first_client
+
+
+@pytest.mark.asyncio
+async def test_evicted_async_pool_is_closed_once_idle(monkeypatch):
+    monkeypatch.setattr(
+        "litellm.llms.custom_httpx.connection_pool_manager.EVICTED_HTTP_POOL_CLOSE_CHECK_INTERVAL",
+        0.01,
+    )
+    pool_manager = HTTPConnectionPoolManager(max_pools=1)
+    openai_client = pool_manager.get_async_client(llm_provider="openai")
+    evicted_pool = next(iter(pool_manager.pools.values()))
+    session = openai_client.client._transport._get_valid_client_session()
+
+    # a request is still in flight on the evicted pool
+    active_connections = [1, 1, 0]
+    monkeypatch.setattr(
+        evicted_pool,
+        "get_connection_counts",
+        lambda: (active_connections.pop(0), 0, None),
+    )
+    pool_manager.get_async_client(llm_provider="anthropic")
+    assert len(pool_manager.pools) == 1
+
+    await asyncio.sleep(0.015)
+    assert session.closed is False
+    await asyncio.gather(*pool_manager._close_tasks)
+    assert active_connections == []
+    assert session.closed is True
+
+    # a caller that kept the client can still use it - it gets a new session
+    assert openai_client.client._transport._get_valid_client_session() is not session
+    await openai_client.close()
+
+
+def test_pools_are_keyed_by_event_loop():
+    pool_manager = HTTPConnectionPoolManager()
+
+    async def _get_client():
+        return pool_manager.get_async_client(llm_provider="openai")
+
+    first_loop = asyncio.new_event_loop()
+    first_client = first_loop.run_until_complete(_get_client())
+    assert first_loop.run_until_complete(_get_client()) is first_client
+    first_loop.close()
+
+    second_loop = asyncio.new_event_loop()
+    second_client = second_loop.run_until_complete(_get_client())
+    second_loop.close()
+    assert second_client is not first_client
+    # the pool bound to the closed loop is dropped
+    assert len(pool_manager.pools) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_from_aiohttp_trace_config():
+    pool_stats = HTTPPoolStats()
+    trace_config = pool_stats.get_aiohttp_trace_config()
+    trace_config.freeze()
+
+    ctx = trace_config.trace_config_ctx()
+    await trace_config.on_connection_queued_start.send(None, ctx, None)
+    await trace_config.on_connection_queued_end.send(None, ctx, None)
+    await trace_config.on_connection_create_start.send(None, ctx, None)
+    await trace_config.on_connection_create_end.send(None, ctx, None)
+
+    assert pool_stats.connection_wait_count == 1
+    assert pool_stats.connect_count == 1
+    assert pool_stats.connect_max_seconds >= 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_connection_pools():
+    litellm.http_pool_settings = {
+        "anthropic": {
+            "warmup_connections": 2,
+            "warmup_urls": ["https://api.anthropic.com/v1/messages"],
+        },
+    }
+    pool_manager = HTTPConnectionPoolManager()
+    model_list = [
+        {
+            "model_name": "claude",
+            "litellm_params": {
+                "model": "anthropic/claude-3-5-sonnet",
+                "api_base": "https://api.anthropic.com",
+            },
+        },
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {
+                "model": "openai/gpt-4o",
+                "api_base": "https://api.openai.com/v1",
+            },
+        },
+    ]
+
+    assert pool_manager._get_warmup_targets(model_list=model_list) == [
+        ("anthropic", "https://api.anthropic.com", None)
+    ]
+
+    warmed_urls = []
+
+    async def _mock_head(self, url, **kwargs):
+        warmed_urls.append(url)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(httpx.AsyncClient, "head", _mock_head)
+        assert (
+            await pool_manager.async_warm_up_connection_pools(model_list=model_list)
+            == 1
+        )
+
+    assert warmed_urls == ["https://api.anthropic.com"] * 2
+    # the llm http handler reuses the warmed pool
+    assert (
+        pool_manager.get_async_client(
+            llm_provider="anthropic", params={"ssl_verify": None}
+        )
+        is next(iter(pool_manager.pools.values())).client
+    )
@@ -685,3 +685,169 @@ async def test_metadata_prefix_handling_in_nested_fields():
     # Test 2: user.sub should work normally without metadata prefix
     jwt_handler.litellm_jwtauth = LiteLLM_JWTAuth(user_id_jwt_field="sub")
     assert jwt_handler.get_user_id(token, None) == "u123"
+
+
+def _get_jwt_handler_with_cache() -> JWTHandler:
+    from litellm.caching.dual_cache import DualCache
+
+    jwt_handler = JWTHandler()
+    jwt_handler.update_environment(
+        prisma_client=None,
+        user_api_key_cache=DualCache(),
+        litellm_jwtauth=LiteLLM_JWTAuth(),
+    )
+    return jwt_handler
+
+
+@pytest.mark.asyncio
+async def test_auth_jwt_caches_verified_tokens():
+    """Repeat tokens skip signature verification, until they expire"""
+    import time
+
+    jwt_handler = _get_jwt_handler_with_cache()
+    payload = {"sub": "u123", "exp": time.time() + 300}
+
+    with patch.object(
+        jwt_handler, "_verify_jwt", new_callable=AsyncMock, return_value=payload
+    ) as mock_verify_jwt:
+        assert await jwt_handler.auth_jwt(token="token-1") == payload
+        assert await jwt_handler.auth_jwt(token="token-1") == payload
+        assert mock_verify_jwt.call_count == 1
+
+        # a different token is verified
+        await jwt_handler.auth_jwt(token="token-2")
+        assert mock_verify_jwt.call_count == 2
+
+        # expired tokens are verified again
+        jwt_handler.verified_token_cache[
+            jwt_handler._get_token_cache_key("token-1")
+        ]["expires_at"] = (time.time() - 1)
+        await jwt_handler.auth_jwt(token="token-1")
+        assert mock_verify_jwt.call_count == 3
+
+    # cached claims were mapped with the old settings
+    jwt_handler.update_environment(
+        prisma_client=None,
+        user_api_key_cache=jwt_handler.user_api_key_cache,
+        litellm_jwtauth=LiteLLM_JWTAuth(),
+    )
+    assert len(jwt_handler.verified_token_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_auth_jwt_cache_bounded_by_exp():
+    import time
+
+    jwt_handler = _get_jwt_handler_with_cache()
+    exp = time.time() + 30
+    with patch.object(
+        jwt_handler,
+        "_verify_jwt",
+        new_callable=AsyncMock,
+        return_value={"sub": "u123", "exp": exp},
+    ):
+        await jwt_handler.auth_jwt(token="token-1")
+
+    verified_token = jwt_handler.get_verified_token(token="token-1")
+    assert verified_token is not None
+    assert verified_token["expires_at"] == exp
+
+
+@pytest.mark.asyncio
+async def test_get_verified_token_claims_computed_once():
+    import time
+
+    jwt_handler = _get_jwt_handler_with_cache()
+    jwt_handler.litellm_jwtauth = LiteLLM_JWTAuth(
+        user_id_jwt_field="sub", team_ids_jwt_field="groups"
+    )
+    with patch.object(
+        jwt_handler,
+        "_verify_jwt",
+        new_callable=AsyncMock,
+        return_value={"sub": "u123", "groups": ["team-1"], "exp": time.time() + 300},
+    ):
+        jwt_valid_token = await jwt_handler.auth_jwt(token="token-1")
+
+    with patch.object(
+        jwt_handler, "get_rbac_role", wraps=jwt_handler.get_rbac_role
+    ) as mock_get_rbac_role:
+        for _ in range(3):
+            claims = await JWTAuthManager.get_verified_token_claims(
+                jwt_handler=jwt_handler, token="token-1", jwt_valid_token=jwt_valid_token
+            )
+        assert mock_get_rbac_role.call_count == 1
+
+    assert claims["user_id"] == "u123"
+    assert claims["team_ids"] == {"team-1"}
+    assert claims["rbac_role"] == LitellmUserRoles.INTERNAL_USER
+
+
+@pytest.mark.asyncio
+async def test_get_public_key_kid_lookup_and_rotation(monkeypatch):
+    """Keys are fetched once, and refetched when a token has an unknown kid"""
+    from unittest.mock import MagicMock
+
+    import litellm.proxy.auth.handle_jwt as handle_jwt_module
+
+    monkeypatch.setenv("JWT_PUBLIC_KEY_URL", "https://example.com/jwks")
+    jwt_handler = _get_jwt_handler_with_cache()
+    jwks_responses = [
+        {"keys": [{"kid": "kid-1", "kty": "RSA"}, {"kid": "kid-2", "kty": "RSA"}]},
+        {"keys": [{"kid": "kid-2", "kty": "RSA"}, {"kid": "kid-3", "kty": "RSA"}]},
+    ]
+
+    async def _get(url, *args, **kwargs):
+        response = MagicMock()
+        response.json.return_value = jwks_responses.pop(0)
+        return response
+
+    with patch.object(
+        jwt_handler.http_handler, "get", new_callable=AsyncMock, side_effect=_get
+    ) as mock_get:
+        assert (await jwt_handler.get_public_key(kid="kid-1"))["kid"] == "kid-1"
+        assert (await jwt_handler.get_public_key(kid="kid-2"))["kid"] == "kid-2"
+        assert mock_get.call_count == 1
+
+        # unknown kid, within the refetch interval - not refetched
+        with pytest.raises(Exception, match="No matching public key found"):
+            await jwt_handler.get_public_key(kid="kid-3")
+        assert mock_get.call_count == 1
+
+        # unknown kid - keys were rotated, refetch
+        monkeypatch.setattr(
+            handle_jwt_module, "JWT_PUBLIC_KEY_MIN_REFETCH_INTERVAL_SECONDS", 0
+        )
+        assert (await jwt_handler.get_public_key(kid="kid-3"))["kid"] == "kid-3"
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_public_key_refreshes_in_background(monkeypatch):
+    import asyncio
+    import time
+    from unittest.mock import MagicMock
+
+    monkeypatch.setenv("JWT_PUBLIC_KEY_URL", "https://example.com/jwks")
+    jwt_handler = _get_jwt_handler_with_cache()
+    response = MagicMock()
+    response.json.return_value = {"keys": [{"kid": "kid-1", "kty": "RSA"}]}
+
+    with patch.object(
+        jwt_handler.http_handler, "get", new_callable=AsyncMock, return_value=response
+    ) as mock_get:
+        await jwt_handler.get_public_key(kid="kid-1")
+        assert mock_get.call_count == 1
+
+        # close to `public_key_ttl` - served from cache, refreshed in the background
+        jwt_handler.public_keys_fetched_at["https://example.com/jwks"] = (
+            time.time() - jwt_handler.litellm_jwtauth.public_key_ttl
+        )
+        jwt_handler.public_keys_last_fetch_attempt.clear()
+        assert (await jwt_handler.get_public_key(kid="kid-1"))["kid"] == "kid-1"
+        await asyncio.sleep(0.01)
+        assert mock_get.call_count == 2
+        assert (
+            time.time() - jwt_handler.public_keys_fetched_at["https://example.com/jwks"]
+            < 5
+        )
@@ -0,0 +1,76 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.auth.auth_checks import (
+    _cache_key_object,
+    _model_matches_any_wildcard_pattern_in_list,
+)
+from litellm.proxy.auth.model_access_matcher import (
+    ModelAccessMatcher,
+    get_model_access_matcher,
+)
+
+
+@pytest.mark.parametrize(
+    "model, allowed_models, expected",
+    [
+        ("bedrock/us.amazon.nova-micro-v1:0", ["bedrock/*"], True),
+        ("bedrock/us.amazon.nova-micro-v1:0", ["openai/*", "bedrock/us.*"], True),
+        ("bedrockzzzz/us.amazon.nova-micro-v1:0", ["bedrock/*"], False),
+        ("gpt-4o", ["openai/*"], True),  # matched via custom_llm_provider
+        ("gpt-4o", ["anthropic/*"], False),
+        ("gpt-4o", ["gpt-4o"], False),  # exact names aren't wildcard patterns
+        ("gpt-4o", ["gpt-(*"], False),  # invalid patterns never match
+    ],
+)
+def test_model_access_matcher_wildcard_patterns(model, allowed_models, expected):
+    assert ModelAccessMatcher(allowed_models).matches_any_wildcard_pattern(model) is (
+        expected
+    )
+    assert (
+        _model_matches_any_wildcard_pattern_in_list(
+            model=model, allowed_model_list=allowed_models
+        )
+        is expected
+    )
+
+
+def test_model_access_matcher_memoises_decisions():
+    matcher = ModelAccessMatcher(["anthropic/*", "openai/*", "bedrock/*"])
+
+    with patch(
+        "litellm.proxy.auth.model_access_matcher.get_llm_provider",
+        return_value=("gpt-4o", "openai", None, None),
+    ) as mock_get_llm_provider:
+        assert matcher.matches_any_wildcard_pattern("gpt-4o") is True
+        assert matcher.matches_any_wildcard_pattern("gpt-4o") is True
+
+    # once per model, not once per pattern per request
+    assert mock_get_llm_provider.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_object_recompiles_model_access_matcher():
+    models = ["openai/*", "gpt-4o-mini"]
+    matcher = get_model_access_matcher(models)
+    assert get_model_access_matcher(models) is matcher
+
+    await _cache_key_object(
+        hashed_token="hashed-token",
+        user_api_key_obj=UserAPIKeyAuth(token="hashed-token", models=models),
+        user_api_key_cache=DualCache(),
+        proxy_logging_obj=None,
+    )
+
+    new_matcher = get_model_access_matcher(models)
+    assert new_matcher is not matcher
+    assert new_matcher.models == frozenset(models)
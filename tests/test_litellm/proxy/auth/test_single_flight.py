@@ -0,0 +1,250 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.proxy._types import (
+    LiteLLM_TeamTableCachedObj,
+    LiteLLM_UserTable,
+    LiteLLM_VerificationTokenView,
+    UserAPIKeyAuth,
+)
+from litellm.proxy.auth import auth_checks
+from litellm.proxy.auth.auth_checks import (
+    get_key_object,
+    get_team_object,
+    get_user_object,
+)
+from litellm.proxy.auth.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    call_count = 0
+
+    async def _load():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.05)
+        return {"key": "value"}
+
+    results = await asyncio.gather(
+        *[single_flight.do(key="key-1", fn=_load) for _ in range(20)]
+    )
+
+    assert call_count == 1
+    assert all(result is results[0] for result in results)
+    assert single_flight.is_in_flight("key-1") is False
+
+    # a new call runs once the previous one finished
+    await single_flight.do(key="key-1", fn=_load)
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions():
+    single_flight = SingleFlight()
+    call_count = 0
+
+    async def _load():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.05)
+        raise ValueError("not found")
+
+    results = await asyncio.gather(
+        *[single_flight.do(key="key-1", fn=_load) for _ in range(5)],
+        return_exceptions=True,
+    )
+
+    assert call_count == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_caller_does_not_cancel_load():
+    single_flight = SingleFlight()
+
+    async def _load():
+        await asyncio.sleep(0.1)
+        return "value"
+
+    first_caller = asyncio.create_task(single_flight.do(key="key-1", fn=_load))
+    await asyncio.sleep(0.01)
+    second_caller = asyncio.create_task(single_flight.do(key="key-1", fn=_load))
+    await asyncio.sleep(0.01)
+    first_caller.cancel()
+
+    assert await second_caller == "value"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_do_in_background():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def _load():
+        await release.wait()
+        return "value"
+
+    assert single_flight.do_in_background(key="key-1", fn=_load) is True
+    # already in flight
+    assert single_flight.do_in_background(key="key-1", fn=_load) is False
+    assert single_flight.is_in_flight("key-1") is True
+
+    # a caller that misses the cache during the refresh joins it
+    caller = asyncio.create_task(single_flight.do(key="key-1", fn=_load))
+    release.set()
+    assert await caller == "value"
+
+
+def _get_mock_prisma_client(hashed_token: str, delay: float = 0.05):
+    async def _get_data(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return LiteLLM_VerificationTokenView(token=hashed_token, models=["gpt-4o"])
+
+    prisma_client = MagicMock()
+    prisma_client.get_data = AsyncMock(side_effect=_get_data)
+    return prisma_client
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_coalesces_db_lookups():
+    hashed_token = "hashed-token-single-flight"
+    prisma_client = _get_mock_prisma_client(hashed_token)
+    user_api_key_cache = DualCache()
+
+    results = await asyncio.gather(
+        *[
+            get_key_object(
+                hashed_token=hashed_token,
+                prisma_client=prisma_client,
+                user_api_key_cache=user_api_key_cache,
+            )
+            for _ in range(50)
+        ]
+    )
+
+    assert prisma_client.get_data.call_count == 1
+    assert all(result.token == hashed_token for result in results)
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_refreshes_hot_key_before_expiry():
+    hashed_token = "hashed-token-refresh-ahead"
+    prisma_client = _get_mock_prisma_client(hashed_token, delay=0)
+    user_api_key_cache = DualCache()
+    cached_key_obj = UserAPIKeyAuth(token=hashed_token, models=["gpt-4o"])
+    # cached just before its TTL expires
+    cached_key_obj.last_refreshed_at = time.time() - 55
+    user_api_key_cache.set_cache(key=hashed_token, value=cached_key_obj)
+
+    result = await get_key_object(
+        hashed_token=hashed_token,
+        prisma_client=prisma_client,
+        user_api_key_cache=user_api_key_cache,
+    )
+    # served from cache, refreshed in the background
+    assert result is cached_key_obj
+    await asyncio.sleep(0.05)
+
+    assert prisma_client.get_data.call_count == 1
+    refreshed_key_obj = user_api_key_cache.get_cache(key=hashed_token)
+    assert refreshed_key_obj is not cached_key_obj
+    assert refreshed_key_obj.last_refreshed_at > cached_key_obj.last_refreshed_at
+
+    # a fresh object isn't refreshed again
+    auth_checks.last_background_refresh_time.clear()
+    await get_key_object(
+        hashed_token=hashed_token,
+        prisma_client=prisma_client,
+        user_api_key_cache=user_api_key_cache,
+    )
+    await asyncio.sleep(0.05)
+    assert prisma_client.get_data.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_team_object_refresh_and_miss_share_single_flight_key():
+    team_id = "team-single-flight"
+    user_api_key_cache = DualCache()
+    single_flight = MagicMock()
+    single_flight.do = AsyncMock(
+        return_value=LiteLLM_TeamTableCachedObj(team_id=team_id)
+    )
+    single_flight.do_in_background.return_value = True
+    auth_checks.last_background_refresh_time.clear()
+
+    with patch.object(auth_checks, "auth_object_single_flight", single_flight):
+        # cache miss - loaded via single flight
+        await get_team_object(
+            team_id=team_id,
+            prisma_client=MagicMock(),
+            user_api_key_cache=user_api_key_cache,
+            team_id_upsert=True,
+        )
+
+        # cache hit, close to expiry - refreshed in the background
+        cached_team_obj = LiteLLM_TeamTableCachedObj(team_id=team_id)
+        cached_team_obj.last_refreshed_at = time.time() - 55
+        user_api_key_cache.set_cache(
+            key="team_id:{}".format(team_id), value=cached_team_obj
+        )
+        await get_team_object(
+            team_id=team_id,
+            prisma_client=MagicMock(),
+            user_api_key_cache=user_api_key_cache,
+            team_id_upsert=True,
+        )
+
+    miss_key = single_flight.do.call_args.kwargs["key"]
+    refresh_key = single_flight.do_in_background.call_args.kwargs["key"]
+    assert miss_key == refresh_key == ("team", team_id, True)
+
+
+@pytest.mark.asyncio
+async def test_get_user_object_refresh_and_miss_share_single_flight_key():
+    user_id = "user-single-flight"
+    user_api_key_cache = DualCache()
+    single_flight = MagicMock()
+    single_flight.do = AsyncMock(return_value=LiteLLM_UserTable(user_id=user_id))
+    single_flight.do_in_background.return_value = True
+    auth_checks.last_background_refresh_time.clear()
+
+    with patch.object(auth_checks, "auth_object_single_flight", single_flight):
+        # cache miss - loaded via single flight
+        await get_user_object(
+            user_id=user_id,
+            prisma_client=MagicMock(),
+            user_api_key_cache=user_api_key_cache,
+            user_id_upsert=True,
+            user_email="user@example.com",
+        )
+
+        # cache hit, close to expiry - refreshed in the background
+        cached_user_obj = LiteLLM_UserTable(user_id=user_id)
+        user_api_key_cache.set_cache(key=user_id, value=cached_user_obj)
+        auth_checks.last_db_access_time["user_id:{}".format(user_id)] = (
+            cached_user_obj,
+            time.time() - 55,
+        )
+        await get_user_object(
+            user_id=user_id,
+            prisma_client=MagicMock(),
+            user_api_key_cache=user_api_key_cache,
+            user_id_upsert=True,
+            user_email="user@example.com",
+        )
+
+    miss_key = single_flight.do.call_args.kwargs["key"]
+    refresh_key = single_flight.do_in_background.call_args.kwargs["key"]
+    assert miss_key == refresh_key
@@ -285,3 +285,104 @@ async def test_get_form_data():
     # Note: In a real MultiDict, both values would be present
     # But in our mock dictionary the second value overwrites the first
     assert "segment" in result["timestamp_granularities"]
+
+
+def _get_streaming_request(chunks, headers=None) -> Request:
+    """
+    A real starlette request, whose body is received in `chunks`.
+    """
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    raw_headers = [
+        (k.encode(), v.encode())
+        for k, v in (headers or {"content-type": "application/json"}).items()
+    ]
+    return Request(
+        scope={"type": "http", "method": "POST", "headers": raw_headers},
+        receive=receive,
+    )
+
+
+def _set_max_request_size_mb(monkeypatch, max_request_size_mb):
+    import litellm.proxy.proxy_server as proxy_server
+
+    monkeypatch.setattr(
+        proxy_server, "general_settings", {"max_request_size_mb": max_request_size_mb}
+    )
+    monkeypatch.setattr(proxy_server, "premium_user", True)
+
+
+@pytest.mark.asyncio
+async def test_read_request_body_streams_body_within_size_limit(monkeypatch):
+    _set_max_request_size_mb(monkeypatch, 1)
+    body = orjson.dumps({"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]})
+    request = _get_streaming_request([body[:10], body[10:]])
+
+    result = await _read_request_body(request)
+    assert result["model"] == "gpt-4o"
+    # later `request.body()` calls return the buffered body
+    assert await request.body() == body
+
+
+@pytest.mark.asyncio
+async def test_read_request_body_rejects_body_over_size_limit(monkeypatch):
+    _set_max_request_size_mb(monkeypatch, 0.001)  # ~1KB
+    chunks = [b'{"content": "' + b"a" * 600, b"a" * 600, b'"}']
+    request = _get_streaming_request(chunks)
+
+    with pytest.raises(ProxyException) as exc_info:
+        await _read_request_body(request)
+    assert exc_info.value.code == "400"
+    # stopped reading at the chunk that went over the limit
+    assert await request.receive() == {
+        "type": "http.request",
+        "body": b'"}',
+        "more_body": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_read_request_body_rejects_content_length_over_size_limit(monkeypatch):
+    _set_max_request_size_mb(monkeypatch, 0.001)  # ~1KB
+    request = _get_streaming_request(
+        [b"{}"],
+        headers={"content-type": "application/json", "content-length": "2000"},
+    )
+    request.stream = MagicMock()
+
+    with pytest.raises(ProxyException) as exc_info:
+        await _read_request_body(request)
+    assert exc_info.value.code == "400"
+    request.stream.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_request_body_rejects_form_body_over_size_limit(monkeypatch):
+    _set_max_request_size_mb(monkeypatch, 0.001)  # ~1KB
+    chunks = [b"model=gpt-4o&file=" + b"a" * 600, b"a" * 600, b"a"]
+    request = _get_streaming_request(
+        chunks, headers={"content-type": "application/x-www-form-urlencoded"}
+    )
+
+    with pytest.raises(ProxyException) as exc_info:
+        await _read_request_body(request)
+    assert exc_info.value.code == "400"
+    # stopped reading at the chunk that went over the limit
+    assert (await request.receive())["body"] == b"a"
+
+
+@pytest.mark.asyncio
+async def test_read_request_body_streams_form_body_within_size_limit(monkeypatch):
+    _set_max_request_size_mb(monkeypatch, 1)
+    request = _get_streaming_request(
+        [b"model=gpt-4o", b"&user=test"],
+        headers={"content-type": "application/x-www-form-urlencoded"},
+    )
+
+    assert await _read_request_body(request) == {"model": "gpt-4o", "user": "test"}
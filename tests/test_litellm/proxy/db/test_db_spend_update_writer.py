@@ -135,3 +135,117 @@ async def test_update_daily_spend_with_null_entity_id():
     assert create_data["api_requests"] == 1
     assert create_data["successful_requests"] == 1
     assert create_data["failed_requests"] == 0
+
+
+def _make_daily_spend_transaction(user_id: str) -> dict:
+    return {
+        "user_id": user_id,
+        "date": "2024-01-01",
+        "api_key": "test-api-key",
+        "model": "gpt-4",
+        "custom_llm_provider": "openai",
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "spend": 0.1,
+        "api_requests": 1,
+        "successful_requests": 1,
+        "failed_requests": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_daily_spend_writes_all_batches():
+    """
+    Transactions past the first batch should be written too, not dropped
+    """
+    mock_prisma_client = MagicMock()
+    mock_batcher = MagicMock()
+    mock_prisma_client.db.batch_.return_value.__aenter__.return_value = mock_batcher
+
+    daily_spend_transactions = {
+        f"key-{i}": _make_daily_spend_transaction(user_id=f"user-{i}")
+        for i in range(250)
+    }
+    await DBSpendUpdateWriter._update_daily_spend(
+        n_retry_times=1,
+        prisma_client=mock_prisma_client,
+        proxy_logging_obj=MagicMock(),
+        daily_spend_transactions=daily_spend_transactions,
+        entity_type="user",
+        entity_id_field="user_id",
+        table_name="litellm_dailyuserspend",
+        unique_constraint_name="user_id_date_api_key_model_custom_llm_provider",
+    )
+
+    assert mock_prisma_client.db.batch_.call_count == 3
+    assert mock_batcher.litellm_dailyuserspend.upsert.call_count == 250
+    assert daily_spend_transactions == {}
+
+
+def _make_spend_logs_prisma_client(num_logs: int) -> MagicMock:
+    mock_prisma_client = MagicMock()
+    mock_prisma_client.spend_log_transactions = [
+        {"request_id": f"request-{i}", "spend": 0.1} for i in range(num_logs)
+    ]
+    mock_prisma_client.jsonify_object = lambda entry: entry
+    mock_prisma_client.db.litellm_spendlogs.create_many = AsyncMock()
+    return mock_prisma_client
+
+
+@pytest.mark.asyncio
+async def test_batch_write_spend_logs_to_db():
+    """
+    The whole spend log queue is written, as multi-row inserts of SPEND_LOGS_INGESTION_BATCH_SIZE rows
+    """
+    mock_prisma_client = _make_spend_logs_prisma_client(num_logs=2500)
+    db_writer = DBSpendUpdateWriter()
+    with patch(
+        "litellm.proxy.db.db_spend_update_writer.SPEND_LOGS_INGESTION_BATCH_SIZE",
+        1000,
+    ):
+        await db_writer.batch_write_spend_logs_to_db(
+            prisma_client=mock_prisma_client,
+            n_retry_times=1,
+            proxy_logging_obj=MagicMock(),
+        )
+
+    create_many = mock_prisma_client.db.litellm_spendlogs.create_many
+    assert create_many.call_count == 3
+    assert sorted(len(call.kwargs["data"]) for call in create_many.call_args_list) == [
+        500,
+        1000,
+        1000,
+    ]
+    assert all(call.kwargs["skip_duplicates"] for call in create_many.call_args_list)
+    assert mock_prisma_client.spend_log_transactions == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("db_write_fails", [False, True])
+async def test_spend_logs_backpressure_when_queue_is_full(db_write_fails):
+    """
+    When the spend log queue is full, the request waits for the queue to be written.
+
+    If the write fails, the queue is still bounded.
+    """
+    mock_prisma_client = _make_spend_logs_prisma_client(num_logs=9)
+    if db_write_fails:
+        mock_prisma_client.db.litellm_spendlogs.create_many.side_effect = Exception(
+            "db unavailable"
+        )
+    db_writer = DBSpendUpdateWriter()
+    with patch(
+        "litellm.proxy.db.db_spend_update_writer.MAX_SPEND_LOG_TRANSACTIONS_QUEUE_SIZE",
+        10,
+    ), patch(
+        "litellm.proxy.proxy_server.general_settings",
+        {"use_batched_spend_log_ingestion": True},
+    ):
+        await db_writer._insert_spend_log_to_db(
+            payload={"request_id": "request-9", "spend": 0.1},
+            prisma_client=mock_prisma_client,
+            spend_logs_url=None,
+        )
+
+    assert mock_prisma_client.db.litellm_spendlogs.create_many.call_count == 1
+    assert len(mock_prisma_client.spend_log_transactions) < 10
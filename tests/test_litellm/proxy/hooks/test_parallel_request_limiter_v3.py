@@ -515,3 +515,258 @@ async def test_async_log_failure_event_v3():
     assert op["key"] == f"{{api_key:{_api_key}}}:max_parallel_requests"
     assert op["increment_value"] == -1
     assert op["ttl"] == 60  # default window size
+
+
+def _make_atomic_rate_limiter_script(store: Dict[str, Any]):
+    """
+    In-memory stand-in for ATOMIC_BATCH_RATE_LIMITER_SCRIPT
+    """
+
+    async def mock_atomic_rate_limiter(keys, args):
+        now, window_size = args[0], args[1]
+        pairs = []
+        over_limit = 0
+        for idx in range(len(keys) // 2):
+            window_key, counter_key = keys[2 * idx], keys[2 * idx + 1]
+            limit, counter_type = args[2 + 2 * idx], args[3 + 2 * idx]
+            if counter_type == "token_bucket":
+                bucket = store.get(counter_key) or {"tokens": limit, "ts": now}
+                value = min(
+                    limit,
+                    bucket["tokens"] + (now - bucket["ts"]) * limit / window_size,
+                )
+                if value <= 0:
+                    over_limit = 1
+                pairs.append((window_key, counter_key, counter_type, now, value))
+            else:
+                window_start = store.get(window_key)
+                counter = 0
+                if window_start is not None and now - window_start < window_size:
+                    counter = store.get(counter_key, 0)
+                else:
+                    window_start = now
+                if counter + 1 > limit:
+                    over_limit = 1
+                pairs.append(
+                    (window_key, counter_key, counter_type, window_start, counter)
+                )
+
+        results: List[Any] = []
+        for window_key, counter_key, counter_type, window_start, value in pairs:
+            if over_limit == 0:
+                if counter_type == "token_bucket":
+                    store[counter_key] = {"tokens": value, "ts": now}
+                else:
+                    store[window_key] = window_start
+                    store.setdefault(counter_key, 0)
+                    if counter_type == "increment":
+                        store[counter_key] = value = value + 1
+            results.extend([window_start, value])
+        results.append(over_limit)
+        return results
+
+    return mock_atomic_rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_atomic_rate_limiter_does_not_increment_on_rejection_v3(monkeypatch):
+    """
+    In atomic mode, a request rejected by one descriptor should not increment any other descriptor's counter
+    """
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key, rpm_limit=5, user_id="user-1", user_rpm_limit=1
+    )
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache)
+    )
+    store: Dict[str, Any] = {}
+    parallel_request_handler.atomic_rate_limiter_script = (
+        _make_atomic_rate_limiter_script(store)
+    )
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+    api_key_counter_key = f"{{api_key:{_api_key}}}:requests"
+    user_counter_key = "{user:user-1}:requests"
+    assert store[api_key_counter_key] == 1
+    assert store[user_counter_key] == 1
+
+    # clear the local cache, so the request reaches the script
+    local_cache.in_memory_cache.flush_cache()
+    with pytest.raises(HTTPException) as exc_info:
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+    assert exc_info.value.status_code == 429
+    assert store[api_key_counter_key] == 1
+    assert store[user_counter_key] == 1
+
+
+@pytest.mark.asyncio
+async def test_atomic_rate_limiter_tpm_token_bucket_v3(monkeypatch):
+    """
+    With LITELLM_TPM_RATE_LIMIT_ALGORITHM=token_bucket, TPM is checked against a token bucket, which is consumed on success
+    """
+    monkeypatch.setenv("LITELLM_TPM_RATE_LIMIT_ALGORITHM", "token_bucket")
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(api_key=_api_key, tpm_limit=10)
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache)
+    )
+    assert parallel_request_handler.tpm_rate_limit_algorithm == "token_bucket"
+    store: Dict[str, Any] = {}
+    parallel_request_handler.atomic_rate_limiter_script = (
+        _make_atomic_rate_limiter_script(store)
+    )
+
+    async def mock_token_bucket_consume(keys, args):
+        for key in keys:
+            if key in store:
+                store[key]["tokens"] -= args[0]
+        return 1
+
+    parallel_request_handler.token_bucket_consume_script = mock_token_bucket_consume
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+    bucket_key = f"{{api_key:{_api_key}}}:token_bucket"
+    assert store[bucket_key]["tokens"] == 10
+
+    # consume the whole bucket
+    store[bucket_key]["ts"] = int(datetime.now().timestamp()) + 5
+    await parallel_request_handler.async_log_success_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=ModelResponse(
+            usage=Usage(prompt_tokens=5, completion_tokens=15, total_tokens=20)
+        ),
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+    )
+    assert store[bucket_key]["tokens"] == -5
+
+    with pytest.raises(HTTPException) as exc_info:
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+    assert exc_info.value.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_not_rejected_by_tpm_window_v3(monkeypatch):
+    """
+    With the token bucket active, a burst the bucket allows should not be rejected by the ':tokens' window counter,
+    and the success path should not increment the ':tokens' window counters
+    """
+    monkeypatch.setenv("LITELLM_TPM_RATE_LIMIT_ALGORITHM", "token_bucket")
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(api_key=_api_key, tpm_limit=10)
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache)
+    )
+    store: Dict[str, Any] = {}
+    parallel_request_handler.atomic_rate_limiter_script = (
+        _make_atomic_rate_limiter_script(store)
+    )
+
+    async def mock_token_bucket_consume(keys, args):
+        return 1
+
+    parallel_request_handler.token_bucket_consume_script = mock_token_bucket_consume
+    assert parallel_request_handler.uses_token_bucket is True
+
+    # the window counter is already over the tpm limit - the bucket is full
+    tokens_counter_key = f"{{api_key:{_api_key}}}:tokens"
+    await local_cache.async_set_cache(key=tokens_counter_key, value=100, ttl=60)
+
+    for _ in range(3):
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+
+    captured_ops = []
+
+    async def mock_pipeline(increment_list, **kwargs):
+        captured_ops.extend(increment_list)
+
+    parallel_request_handler.internal_usage_cache.dual_cache.async_increment_cache_pipeline = (
+        mock_pipeline
+    )
+    await parallel_request_handler.async_log_success_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=ModelResponse(
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        ),
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+    )
+    assert captured_ops
+    assert not any(op["key"].endswith(":tokens") for op in captured_ops)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_scripts_run_per_hash_slot_on_redis_cluster_v3(monkeypatch):
+    """
+    On redis cluster, lua scripts should only be sent keys from one hash slot - one call per descriptor slot
+    """
+    from unittest.mock import patch
+
+    from litellm.caching.redis_cluster_cache import RedisClusterCache
+
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key, rpm_limit=5, user_id="user-1", user_rpm_limit=1
+    )
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache)
+    )
+    with patch("litellm._redis.init_redis_cluster"):
+        local_cache.redis_cache = RedisClusterCache(
+            startup_nodes=[{"host": "localhost", "port": 6379}]
+        )
+
+    store: Dict[str, Any] = {}
+    atomic_rate_limiter_script = _make_atomic_rate_limiter_script(store)
+    script_calls: List[List[str]] = []
+
+    async def mock_script(keys, args):
+        script_calls.append(keys)
+        return await atomic_rate_limiter_script(keys=keys, args=args)
+
+    parallel_request_handler.atomic_rate_limiter_script = mock_script
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+    assert len(script_calls) == 2
+    for keys in script_calls:
+        assert len({RedisClusterCache.get_hash_slot(key) for key in keys}) == 1
+    assert store[f"{{api_key:{_api_key}}}:requests"] == 1
+    assert store["{user:user-1}:requests"] == 1
+
+    # over the user limit - the request is rejected
+    local_cache.in_memory_cache.flush_cache()
+    with pytest.raises(HTTPException) as exc_info:
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+    assert exc_info.value.status_code == 429
+    assert store["{user:user-1}:requests"] == 1
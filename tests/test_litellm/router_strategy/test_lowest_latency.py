@@ -0,0 +1,147 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+
+def _get_kwargs(deployment_id: str, stream: bool = False, completion_start_time=None):
+    kwargs = {
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-4o"},
+            "model_info": {"id": deployment_id},
+        },
+    }
+    if stream:
+        kwargs["stream"] = True
+        kwargs["completion_start_time"] = completion_start_time
+    return kwargs
+
+
+def _get_deployment(deployment_id: str) -> dict:
+    return {
+        "model_name": "gpt-4o",
+        "litellm_params": {
+            "model": "openai/gpt-4o",
+            "api_base": f"https://{deployment_id}.example.com",
+        },
+        "model_info": {"id": deployment_id},
+    }
+
+
+def test_latency_stats_sliding_window():
+    test_cache = DualCache()
+    lowest_latency_logger = LowestLatencyLoggingHandler(
+        router_cache=test_cache,
+        model_list=[],
+        routing_args={"max_latency_list_size": 4, "ewma_alpha": 0.5},
+    )
+
+    for latency in [1.0, 2.0, 3.0, 4.0, 10.0]:
+        lowest_latency_logger.log_success_event(
+            response_obj={},
+            kwargs=_get_kwargs("1"),
+            start_time=0.0,
+            end_time=latency,
+        )
+
+    deployment_map = test_cache.get_cache(key="gpt-4o_map")["1"]
+    # oldest call dropped
+    assert deployment_map["latency"] == [2.0, 3.0, 4.0, 10.0]
+    stats = deployment_map["latency_stats"]
+    assert stats["mean"] == pytest.approx(4.75)
+    assert stats["p50"] == 3.0
+    assert stats["p95"] == 10.0
+    assert stats["ewma"] == pytest.approx(6.5625)
+    assert "time_to_first_token_stats" not in deployment_map
+
+
+@pytest.mark.asyncio
+async def test_time_to_first_token_stats_tracked_separately():
+    test_cache = DualCache()
+    lowest_latency_logger = LowestLatencyLoggingHandler(
+        router_cache=test_cache, model_list=[]
+    )
+
+    # latency is per completion token
+    response_obj = litellm.ModelResponse(
+        usage=litellm.Usage(prompt_tokens=10, completion_tokens=2, total_tokens=12)
+    )
+    await lowest_latency_logger.async_log_success_event(
+        response_obj=response_obj,
+        kwargs=_get_kwargs("1", stream=True, completion_start_time=0.5),
+        start_time=0.0,
+        end_time=4.0,
+    )
+
+    deployment_map = test_cache.get_cache(key="gpt-4o_map")["1"]
+    assert deployment_map["latency_stats"]["p50"] == 2.0
+    assert deployment_map["time_to_first_token_stats"]["p50"] == 0.25
+
+
+@pytest.mark.parametrize(
+    "latency_metric, expected_deployment_id",
+    [
+        ("mean", "2"),  # 1 outlier call on deployment 1
+        ("p50", "1"),
+    ],
+)
+def test_get_available_deployments_uses_latency_metric(
+    latency_metric, expected_deployment_id
+):
+    test_cache = DualCache()
+    lowest_latency_logger = LowestLatencyLoggingHandler(
+        router_cache=test_cache,
+        model_list=[],
+        routing_args={"latency_metric": latency_metric},
+    )
+    latencies = {"1": [1.0, 1.0, 1.0, 10.0], "2": [2.0, 2.0, 2.0, 2.0]}
+    for deployment_id, deployment_latencies in latencies.items():
+        for latency in deployment_latencies:
+            lowest_latency_logger.log_success_event(
+                response_obj={},
+                kwargs=_get_kwargs(deployment_id),
+                start_time=0.0,
+                end_time=latency,
+            )
+
+    request_kwargs: dict = {"metadata": {}}
+    deployment = lowest_latency_logger.get_available_deployments(
+        model_group="gpt-4o",
+        healthy_deployments=[_get_deployment("1"), _get_deployment("2")],
+        request_kwargs=request_kwargs,
+    )
+
+    assert deployment["model_info"]["id"] == expected_deployment_id
+    assert set(request_kwargs["metadata"]["_latency_per_deployment"].keys()) == {
+        "https://1.example.com",
+        "https://2.example.com",
+    }
+
+
+def test_get_available_deployments_reads_cached_latency_lists():
+    """
+    Maps cached before latency stats were recorded are still routed on
+    """
+    test_cache = DualCache()
+    test_cache.set_cache(
+        key="gpt-4o_map",
+        value={"1": {"latency": [3.0, 3.0]}, "2": {"latency": [1.0, 2.0]}},
+    )
+    lowest_latency_logger = LowestLatencyLoggingHandler(
+        router_cache=test_cache, model_list=[]
+    )
+
+    deployment = lowest_latency_logger.get_available_deployments(
+        model_group="gpt-4o",
+        healthy_deployments=[_get_deployment("1"), _get_deployment("2")],
+    )
+
+    assert deployment["model_info"]["id"] == "2"
@@ -0,0 +1,145 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm import Router
+from litellm.router_utils.routing_index import RouterDeploymentIndex
+
+
+def _build_model_list():
+    return [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "openai/gpt-4o"},
+            "model_info": {"id": "1", "access_groups": ["default"]},
+        },
+        {
+            "model_name": "team-gpt",
+            "litellm_params": {"model": "openai/gpt-4o-mini"},
+            "model_info": {
+                "id": "2",
+                "team_id": "team-1",
+                "team_public_model_name": "gpt-4o",
+            },
+        },
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "azure/gpt-4o"},
+            "model_info": {"id": "3", "access_groups": ["default", "azure"]},
+        },
+    ]
+
+
+def test_routing_index_lookups():
+    model_list = _build_model_list()
+    model_names = [m["model_name"] for m in model_list]
+    index = RouterDeploymentIndex(model_list=model_list, model_names=model_names)
+
+    assert [
+        m["model_info"]["id"] for m in index.get_deployments_by_model_name("gpt-4o")
+    ] == ["1", "3"]
+    # team deployments are merged in model list order
+    assert [
+        m["model_info"]["id"]
+        for m in index.get_deployments_by_model_name("gpt-4o", team_id="team-1")
+    ] == ["1", "2", "3"]
+    assert index.get_deployment_by_model_id("3") is model_list[2]
+    assert index.get_deployment_by_model_id("4") is None
+    assert index.get_model_ids() == ["1", "2", "3"]
+    assert index.get_model_ids(exclude_team_models=True) == ["1", "3"]
+    assert index.get_model_ids(model_name="team-gpt") == ["2"]
+    assert index.get_deployments_by_litellm_model("azure/gpt-4o") == [model_list[2]]
+    assert [
+        m["model_info"]["id"] for m in index.get_deployments_by_access_group("default")
+    ] == ["1", "3"]
+    assert index.get_team_model_name("gpt-4o", team_id="team-1") == "team-gpt"
+    assert index.get_team_model_name("gpt-4o", team_id="team-2") is None
+
+
+def test_routing_index_is_stale():
+    model_list = _build_model_list()
+    model_names = [m["model_name"] for m in model_list]
+    index = RouterDeploymentIndex(model_list=model_list, model_names=model_names)
+    assert index.is_stale(model_list=model_list, model_names=model_names) is False
+
+    model_list.pop()
+    assert index.is_stale(model_list=model_list, model_names=model_names) is True
+    assert (
+        index.is_stale(model_list=list(model_list), model_names=model_names) is True
+    )
+
+
+def test_router_routing_index_updates_on_deployment_changes():
+    """
+    Lookups should reflect add / delete deployment, and direct changes to router.model_list
+    """
+    from litellm.types.router import Deployment, LiteLLM_Params, ModelInfo
+
+    router = Router(model_list=_build_model_list())
+    assert router.get_model_ids(model_name="gpt-4o") == ["1", "3"]
+
+    router.add_deployment(
+        Deployment(
+            model_name="gpt-4o",
+            litellm_params=LiteLLM_Params(model="openai/gpt-4o", api_key="sk-1"),
+            model_info=ModelInfo(id="4"),
+        )
+    )
+    assert router.get_model_ids(model_name="gpt-4o") == ["1", "3", "4"]
+    assert router.get_deployment(model_id="4") is not None
+
+    router.delete_deployment(id="1")
+    assert router.get_model_ids(model_name="gpt-4o") == ["3", "4"]
+    assert router.get_deployment(model_id="1") is None
+
+    router.model_list.pop()
+    assert router.get_model_ids(model_name="gpt-4o") == ["3"]
+
+
+def test_pattern_router_combined_regex_matches_most_specific_pattern():
+    """
+    The single combined regex should pick the same pattern as trying the patterns in specificity order
+    """
+    from litellm.router_utils.pattern_match_deployments import PatternMatchRouter
+
+    pattern_router = PatternMatchRouter()
+    pattern_router.add_pattern(
+        "*", {"model_name": "*", "litellm_params": {"model": "*"}}
+    )
+    pattern_router.add_pattern(
+        "llmengine/*",
+        {"model_name": "llmengine/*", "litellm_params": {"model": "openai/*"}},
+    )
+    pattern_router.add_pattern(
+        "llmengine/fo::*::static::*",
+        {
+            "model_name": "llmengine/fo::*::static::*",
+            "litellm_params": {"model": "openai/fo::*::static::*"},
+        },
+    )
+
+    deployments = pattern_router.route("llmengine/fo::hi::static::there")
+    assert deployments is not None
+    assert deployments[0]["litellm_params"]["model"] == "openai/fo::hi::static::there"
+
+    deployments = pattern_router.route("llmengine/gpt-4o")
+    assert deployments is not None
+    assert deployments[0]["litellm_params"]["model"] == "openai/gpt-4o"
+
+    deployments = pattern_router.route("gpt-4o")
+    assert deployments is not None
+    assert deployments[0]["litellm_params"]["model"] == "gpt-4o"
+
+    # patterns added after routing are picked up
+    pattern_router.add_pattern(
+        "anthropic/*",
+        {"model_name": "anthropic/*", "litellm_params": {"model": "anthropic/*"}},
+    )
+    deployments = pattern_router.route("anthropic/claude-3")
+    assert deployments is not None
+    assert deployments[0]["model_name"] == "anthropic/*"
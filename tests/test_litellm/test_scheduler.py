@@ -0,0 +1,157 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.scheduler import (
+    AsyncioScheduler,
+    FlowItem,
+    RedisScheduler,
+    Scheduler,
+    get_scheduler,
+)
+
+
+@pytest.mark.asyncio
+async def test_asyncio_scheduler_prioritized_requests():
+    scheduler = AsyncioScheduler()
+
+    await scheduler.add_request(
+        FlowItem(priority=1, request_id="low", model_name="gpt-4")
+    )
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="high", model_name="gpt-4")
+    )
+
+    assert await scheduler.peek(id="high", model_name="gpt-4", health_deployments=[])
+    assert not await scheduler.poll(id="low", model_name="gpt-4", health_deployments=[])
+    assert await scheduler.poll(id="high", model_name="gpt-4", health_deployments=[])
+    assert await scheduler.poll(id="low", model_name="gpt-4", health_deployments=[])
+    assert await scheduler.get_queue(model_name="gpt-4") == []
+
+
+@pytest.mark.asyncio
+async def test_asyncio_scheduler_removes_request_when_healthy_deployments():
+    """
+    Requests served because healthy deployments are available don't stay in the queue
+    """
+    scheduler = AsyncioScheduler()
+
+    await scheduler.add_request(FlowItem(priority=0, request_id="1", model_name="m"))
+    await scheduler.add_request(FlowItem(priority=1, request_id="2", model_name="m"))
+
+    assert await scheduler.poll(id="2", model_name="m", health_deployments=[{}])
+    assert await scheduler.get_queue(model_name="m") == [(0, "1")]
+
+    # lazily removed item is skipped once it reaches the head
+    assert await scheduler.poll(id="1", model_name="m", health_deployments=[])
+    assert scheduler.queues["m"] == []
+
+
+@pytest.mark.asyncio
+async def test_asyncio_scheduler_wakes_up_waiters_on_head_change():
+    scheduler = AsyncioScheduler(polling_interval=10)
+
+    await scheduler.add_request(FlowItem(priority=0, request_id="1", model_name="m"))
+    await scheduler.add_request(FlowItem(priority=1, request_id="2", model_name="m"))
+
+    waiter = asyncio.create_task(scheduler.wait_for_next_poll(model_name="m"))
+    await asyncio.sleep(0)
+    assert await scheduler.poll(id="1", model_name="m", health_deployments=[])
+
+    # woken up well before the 10s polling interval
+    await asyncio.wait_for(waiter, timeout=1)
+    assert await scheduler.peek(id="2", model_name="m", health_deployments=[])
+
+
+@pytest.mark.asyncio
+async def test_asyncio_scheduler_remove_request():
+    scheduler = AsyncioScheduler()
+    item = FlowItem(priority=0, request_id="1", model_name="m")
+    await scheduler.add_request(item)
+    await scheduler.add_request(FlowItem(priority=1, request_id="2", model_name="m"))
+
+    await scheduler.remove_request(request=item)
+
+    assert await scheduler.peek(id="2", model_name="m", health_deployments=[])
+
+
+@pytest.mark.asyncio
+async def test_default_scheduler_remove_request():
+    scheduler = Scheduler()
+    item = FlowItem(priority=0, request_id="1", model_name="m")
+    await scheduler.add_request(item)
+    await scheduler.add_request(FlowItem(priority=1, request_id="2", model_name="m"))
+
+    await scheduler.remove_request(request=item)
+
+    assert await scheduler.get_queue(model_name="m") == [(1, "2")]
+
+
+def _get_mock_redis_cache():
+    redis_client = MagicMock()
+    redis_client.zadd = AsyncMock()
+    redis_client.zrem = AsyncMock()
+    redis_client.zrange = AsyncMock()
+
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    redis_cache.check_and_fix_namespace.side_effect = lambda key: key
+    redis_cache.async_register_script.return_value = AsyncMock()
+    return redis_cache, redis_client
+
+
+@pytest.mark.asyncio
+async def test_redis_scheduler_add_request_uses_sorted_set():
+    redis_cache, redis_client = _get_mock_redis_cache()
+    scheduler = RedisScheduler(redis_cache=redis_cache)
+
+    await scheduler.add_request(FlowItem(priority=3, request_id="1", model_name="m"))
+
+    redis_client.zadd.assert_awaited_once_with("scheduler:queue:m", {"1": 3})
+
+
+@pytest.mark.asyncio
+async def test_redis_scheduler_poll_pops_if_head():
+    redis_cache, redis_client = _get_mock_redis_cache()
+    scheduler = RedisScheduler(redis_cache=redis_cache)
+    scheduler.pop_if_head_script.return_value = 0
+
+    assert not await scheduler.poll(id="1", model_name="m", health_deployments=[])
+    scheduler.pop_if_head_script.assert_awaited_once_with(
+        keys=["scheduler:queue:m"], args=["1"]
+    )
+
+    scheduler.pop_if_head_script.return_value = 1
+    assert await scheduler.poll(id="1", model_name="m", health_deployments=[])
+
+    # healthy deployments -> request is removed from the queue and can be made
+    assert await scheduler.poll(id="2", model_name="m", health_deployments=[{}])
+    redis_client.zrem.assert_awaited_once_with("scheduler:queue:m", "2")
+
+
+@pytest.mark.asyncio
+async def test_redis_scheduler_get_queue():
+    redis_cache, redis_client = _get_mock_redis_cache()
+    scheduler = RedisScheduler(redis_cache=redis_cache)
+    redis_client.zrange.return_value = [(b"1", 0.0), (b"2", 1.0)]
+
+    assert await scheduler.get_queue(model_name="m") == [(0, "1"), (1, "2")]
+
+
+def test_get_scheduler():
+    assert type(get_scheduler()) is Scheduler
+    assert isinstance(get_scheduler(scheduler_type="asyncio"), AsyncioScheduler)
+
+    redis_cache, _ = _get_mock_redis_cache()
+    assert isinstance(
+        get_scheduler(scheduler_type="redis", redis_cache=redis_cache), RedisScheduler
+    )
+    with pytest.raises(ValueError):
+        get_scheduler(scheduler_type="redis")
@@ -2195,6 +2195,65 @@ def test_register_model_with_scientific_notation():
     assert registered_model["mode"] == "chat"
 
 
+def test_potential_model_names_memo_invalidated_on_register_model_and_provider_changes(
+    monkeypatch,
+):
+    from litellm.utils import _get_potential_model_names
+
+    monkeypatch.setattr(
+        litellm,
+        "open_ai_chat_completion_models",
+        list(litellm.open_ai_chat_completion_models),
+    )
+    monkeypatch.setattr(litellm, "provider_list", list(litellm.provider_list))
+    monkeypatch.setattr(litellm, "_custom_providers", list(litellm._custom_providers))
+
+    # register_model
+    model = "my-memoised-registered-model"
+    assert (
+        _get_potential_model_names(model=model, custom_llm_provider=None)[
+            "custom_llm_provider"
+        ]
+        is None
+    )
+    litellm.register_model(
+        {
+            model: {
+                "input_cost_per_token": 1e-07,
+                "output_cost_per_token": 2e-07,
+                "litellm_provider": "openai",
+                "mode": "chat",
+            }
+        }
+    )
+    assert (
+        _get_potential_model_names(model=model, custom_llm_provider=None)[
+            "custom_llm_provider"
+        ]
+        == "openai"
+    )
+
+    # new custom provider
+    model = "my-memoised-provider/my-model"
+    assert (
+        _get_potential_model_names(model=model, custom_llm_provider=None)[
+            "custom_llm_provider"
+        ]
+        is None
+    )
+    monkeypatch.setattr(
+        litellm,
+        "custom_provider_map",
+        [{"provider": "my-memoised-provider", "custom_handler": object()}],
+    )
+    litellm.utils.custom_llm_setup()
+    potential_model_names = _get_potential_model_names(
+        model=model, custom_llm_provider=None
+    )
+    assert potential_model_names["custom_llm_provider"] == "my-memoised-provider"
+    assert potential_model_names["split_model"] == "my-model"
+
+
 def test_reasoning_content_preserved_in_text_completion_wrapper():
     """Ensure reasoning_content is copied from delta to text_choices."""
     chunk = ModelResponseStream(